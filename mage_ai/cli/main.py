@@ -114,6 +114,9 @@ CLEAN_VARIABLES_PIPELINE_UUID_DEFAULT = typer.Option(
 CREATE_SPARK_CLUSTER_PROJECT_PATH_DEFAULT = typer.Argument(
     ..., help='path of the Mage project that contains the EMR config.'
 )
+START_QUEUE_WORKER_PROJECT_PATH_DEFAULT = typer.Argument(
+    ..., help='path of the Mage project that contains the queue config.'
+)
 
 
 @app.command()
@@ -330,5 +333,29 @@ def create_spark_cluster(
     create_cluster(project_path)
 
 
+@app.command()
+def start_queue_worker(
+    project_path: str = START_QUEUE_WORKER_PROJECT_PATH_DEFAULT,
+):
+    """
+    Start a worker running the jobs of the project's Redis queue.
+    """
+    from mage_ai.settings.repo import set_repo_path
+
+    project_path = os.path.abspath(project_path)
+    set_repo_path(project_path)
+
+    from mage_ai.data_preparation.repo_manager import get_repo_config
+    from mage_ai.orchestration.queue.config import QueueConfig, QueueType
+    from mage_ai.orchestration.queue.redis_queue import run_queue_worker
+
+    queue_config = QueueConfig.load(config=get_repo_config().queue_config or dict())
+    if queue_config.queue_type != QueueType.REDIS:
+        print('The queue_type of the project\'s queue_config is not redis.')
+        raise typer.Exit(code=1)
+
+    run_queue_worker(queue_config)
+
+
 if __name__ == '__main__':
     app()
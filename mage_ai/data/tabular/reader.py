@@ -563,6 +563,49 @@ async def scan_batch_datasets_async(source: Union[List[str], str], **kwargs) ->
         yield tagged_or_record_batch_or_deserialized
 
 
+def read_parquet_sample(
+    source: Any,
+    sample_count: int,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Read the first sample_count rows of a parquet file into a pandas DataFrame. Only the row
+    groups that have these rows and the columns requested (and the index columns) are read.
+
+    Args:
+        source: File path or file-like object of the parquet file.
+        sample_count (int): Number of rows to read.
+        columns (List[str], optional): Columns to read, all the columns if None.
+    """
+    parquet_file = pq.ParquetFile(source)
+
+    batches = []
+    number_of_rows = 0
+    if sample_count > 0:
+        for batch in parquet_file.iter_batches(
+            batch_size=min(sample_count, 64 * 1024),
+            columns=columns,
+            use_pandas_metadata=True,
+        ):
+            batches.append(batch)
+            number_of_rows += batch.num_rows
+            if number_of_rows >= sample_count:
+                break
+
+    if batches:
+        table = pa.Table.from_batches(batches).slice(0, sample_count)
+    else:
+        schema = parquet_file.schema_arrow
+        if columns is not None:
+            schema = pa.schema(
+                [schema.field(column) for column in columns],
+                metadata=schema.metadata,
+            )
+        table = schema.empty_table()
+
+    return table.to_pandas()
+
+
 def sample_batch_datasets(
     source: Union[List[str], str],
     sample_count: Optional[int] = None,
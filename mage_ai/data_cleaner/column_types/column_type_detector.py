@@ -1,10 +1,18 @@
 # flake8: noqa
+import hashlib
+import json
+import math
 import re
-from typing import Union
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import scipy
+from pandas.api.types import infer_dtype
 
 from mage_ai.data_cleaner.column_types.constants import NUMBER_TYPES, ColumnType
 from mage_ai.data_cleaner.transformer_actions.constants import (
@@ -21,6 +29,14 @@ MULTITHREAD_MAX_NUM_ENTRIES = 50000
 NUMBER_TYPE_MATCHES_THRESHOLD = 0.8
 STRING_TYPE_MATCHES_THRESHOLD = 0.3
 
+COLUMN_TYPES_CACHE_MAX_SIZE = 256
+# Number of rows, spread evenly across a dataframe, whose values are hashed in its fingerprint.
+FINGERPRINT_SAMPLE_ROWS = 1000
+# Match rates are first evaluated on a random sample of this many values, then on samples 4
+# times larger until the rate is on one side of its threshold with this probability of error.
+TYPE_INFERENCE_ERROR_PROBABILITY = 1e-3
+TYPE_INFERENCE_MIN_SAMPLE_SIZE = 1_000
+
 REGEX_DATETIME_PATTERN = r"^\d{2,4}-\d{1,2}-\d{1,2}$|^\d{2,4}-\d{1,2}-\d{1,2}[Tt ]{1}\d{1,2}:\d{1,2}[:]{0,1}\d{1,2}[\.]{0,1}\d*|^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$|^\d{1,4}[-\/]{1}\d{1,2}[-\/]{1}\d{1,2}$|^\d{1,2}[-\/]{1}\d{1,2}[-\/]{1}\d{1,4}$|^\d{1,2}[-\/]\d{1,2}[-\/]\d{2,4}[Tt ]{1}\d{1,2}:\d{1,2}[:]{0,1}\d{1,2}[\.]{0,1}\d*|(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{1,2})[\s,]+(\d{2,4})"
 REGEX_DATETIME = re.compile(REGEX_DATETIME_PATTERN)
 REGEX_EMAIL_PATTERN = r"^[a-zA-Z0-9_.+#-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
@@ -46,6 +62,158 @@ def str_in_set(string, string_set):
     return any(entry in string for entry in string_set)
 
 
+class ColumnTypesCache:
+    """
+    LRU cache of the column types inferred for a dataframe, keyed by the caller, e.g. by a
+    block output and the fingerprint of its dataframe.
+    """
+
+    def __init__(self, max_size: int = COLUMN_TYPES_CACHE_MAX_SIZE):
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.max_size = max_size
+
+    def get(self, key) -> Optional[Dict]:
+        with self.lock:
+            column_types = self.entries.get(key)
+            if column_types is None:
+                return None
+            self.entries.move_to_end(key)
+            return dict(column_types)
+
+    def set(self, key, column_types: Dict) -> None:
+        with self.lock:
+            self.entries[key] = dict(column_types)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+COLUMN_TYPES_CACHE = ColumnTypesCache()
+
+
+def dataframe_fingerprint(df: pd.DataFrame) -> Optional[str]:
+    """
+    Fingerprint a dataframe from its shape, its columns and their dtypes, and the values of
+    rows spread evenly across it, without hashing every value.
+
+    Returns:
+        Optional[str]: None if the values can't be hashed.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([
+        list(df.shape),
+        [str(column) for column in df.columns],
+        [str(dtype) for dtype in df.dtypes],
+    ]).encode())
+
+    if len(df) > FINGERPRINT_SAMPLE_ROWS:
+        df = df.iloc[np.linspace(0, len(df) - 1, FINGERPRINT_SAMPLE_ROWS).astype(int)]
+    try:
+        hashes = pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        # Values such as dictionaries and lists aren't hashable; their text is hashed instead.
+        try:
+            hashes = pd.util.hash_pandas_object(df.astype(str), index=False)
+        except (TypeError, ValueError):
+            return None
+    hasher.update(hashes.to_numpy().tobytes())
+
+    return hasher.hexdigest()
+
+
+class StringMatcher:
+    """
+    Matches the values of a string column against regular expressions with vectorized Arrow
+    string kernels, falling back to pandas if Arrow can't handle a pattern.
+
+    Match rates are evaluated on increasingly large random samples of the column, and are
+    decided as soon as the Hoeffding bound of the sample rate is on one side of the threshold.
+    """
+
+    def __init__(self, series: pd.Series):
+        self.length = len(series)
+        if self.length > TYPE_INFERENCE_MIN_SAMPLE_SIZE:
+            # Shuffle the values so that every prefix of the column is a random sample
+            series = series.sample(frac=1, random_state=0)
+        self.series = series.reset_index(drop=True)
+        try:
+            self.array = pa.array(self.series.to_numpy(dtype=object), type=pa.string())
+        except (pa.ArrowException, TypeError):
+            self.array = None
+
+    def all_match(self, pattern: re.Pattern) -> bool:
+        for start, end in self.__sample_ranges():
+            if self.__count_matches(pattern, start, end) < end - start:
+                return False
+        return True
+
+    def count_matches(self, pattern: re.Pattern) -> int:
+        return self.__count_matches(pattern, 0, self.length)
+
+    def match_rate_at_least(self, pattern: re.Pattern, threshold: float) -> bool:
+        matches = 0
+        for start, end in self.__sample_ranges():
+            matches += self.__count_matches(pattern, start, end)
+            if end == self.length:
+                break
+            error = math.sqrt(math.log(2 / TYPE_INFERENCE_ERROR_PROBABILITY) / (2 * end))
+            if matches / end - error >= threshold:
+                return True
+            if matches / end + error < threshold:
+                return False
+        return matches / self.length >= threshold
+
+    def max_word_count(self) -> int:
+        if self.array is not None:
+            return pc.max(pc.count_substring(self.array, " ")).as_py() + 1
+        return self.series.map(lambda x: len(str(x).split(" "))).max()
+
+    def __count_matches(self, pattern: re.Pattern, start: int, end: int) -> int:
+        if self.array is not None:
+            try:
+                matches = pc.match_substring_regex(
+                    self.array.slice(start, end - start),
+                    # re.match only anchors the match at the start of the string
+                    f"^(?:{pattern.pattern})",
+                )
+                return pc.sum(matches).as_py() or 0
+            except pa.ArrowException:
+                pass
+        return int(self.series.iloc[start:end].str.match(pattern).sum())
+
+    def __sample_ranges(self):
+        start, end = 0, min(TYPE_INFERENCE_MIN_SAMPLE_SIZE, self.length)
+        while start < self.length:
+            yield start, end
+            start, end = end, min(end * 4, self.length)
+
+
+def strip_values(series: pd.Series) -> pd.Series:
+    """
+    Strip whitespace and quotes around the string values, and drop the nulls and empty strings.
+    """
+    if infer_dtype(series, skipna=True) == "string":
+        try:
+            values = pc.utf8_trim(
+                pa.array(series, type=pa.string(), from_pandas=True),
+                " '\"",
+            ).to_numpy(zero_copy_only=False)
+            clean_series = pd.Series(values, index=series.index, dtype=object)
+        except (pa.ArrowException, TypeError):
+            clean_series = series.str.strip(" '\"")
+    else:
+        clean_series = series.apply(lambda x: x.strip(" '\"") if type(x) is str else x)
+    clean_series = clean_series.dropna()
+    if clean_series.dtype == object:
+        clean_series = clean_series[clean_series != ""]
+    return clean_series
+
+
 def find_syntax_errors(series, column_type):
     if len(series) == 0:
         return pd.Series([])
@@ -149,11 +317,7 @@ def infer_column_type(series, column_name, dtype, kwargs):
 
 
 def infer_object_type(series, column_name, kwargs):
-    clean_series = series.apply(lambda x: x.strip(" '\"") if type(x) is str else x)
-    clean_series = clean_series.map(
-        lambda x: x if (not isinstance(x, str) or x != "") else np.nan
-    )
-    clean_series = clean_series.dropna()
+    clean_series = strip_values(series)
 
     exact_dtype = type(clean_series.iloc[0]) if clean_series.count() else None
     if exact_dtype in [list, tuple, set]:
@@ -171,21 +335,22 @@ def infer_object_type(series, column_name, kwargs):
 
     clean_series = clean_series.astype(str)
     length = len(clean_series)
-    if all(clean_series.str.match(REGEX_NUMBER)):
-        if not all(clean_series.str.match(REGEX_INTEGER)):
+    matcher = StringMatcher(clean_series)
+    lowercase_column_name = column_name.lower()
+    if matcher.all_match(REGEX_NUMBER):
+        if not matcher.all_match(REGEX_INTEGER):
             return ColumnType.NUMBER_WITH_DECIMALS
         else:
-            lowercase_column_name = column_name.lower()
-            correct_phone_nums = clean_series.str.match(REGEX_PHONE_NUMBER).sum()
-            correct_zip_codes = clean_series.str.match(REGEX_ZIP_CODE).sum()
-            if (
-                correct_phone_nums / length >= NUMBER_TYPE_MATCHES_THRESHOLD
-                and str_in_set(lowercase_column_name, RESERVED_PHONE_NUMBER_WORDS)
+            if str_in_set(
+                lowercase_column_name, RESERVED_PHONE_NUMBER_WORDS
+            ) and matcher.match_rate_at_least(
+                REGEX_PHONE_NUMBER, NUMBER_TYPE_MATCHES_THRESHOLD
             ):
                 return ColumnType.PHONE_NUMBER
-            elif (
-                correct_zip_codes / length >= NUMBER_TYPE_MATCHES_THRESHOLD
-                and str_in_set(lowercase_column_name, RESERVED_ZIP_CODE_WORDS)
+            elif str_in_set(
+                lowercase_column_name, RESERVED_ZIP_CODE_WORDS
+            ) and matcher.match_rate_at_least(
+                REGEX_ZIP_CODE, NUMBER_TYPE_MATCHES_THRESHOLD
             ):
                 return ColumnType.ZIP_CODE
             else:
@@ -202,27 +367,20 @@ def infer_object_type(series, column_name, kwargs):
                         return ColumnType.CATEGORY_HIGH_CARDINALITY
 
     else:
-        matches = clean_series.str.match(REGEX_DATETIME).sum()
-        if matches / length >= DATETIME_MATCHES_THRESHOLD:
+        if matcher.match_rate_at_least(REGEX_DATETIME, DATETIME_MATCHES_THRESHOLD):
             return ColumnType.DATETIME
         # TODO: Refactor / Reduce cleaning logic
-        correct_emails = clean_series.str.match(REGEX_EMAIL).sum()
-        correct_phone_nums = clean_series.str.match(REGEX_PHONE_NUMBER).sum()
-        correct_zip_codes = clean_series.str.match(REGEX_ZIP_CODE).sum()
-        correct_lists = clean_series.str.match(REGEX_LIST).sum()
-        lowercase_column_name = column_name.lower()
-        if correct_emails / length >= STRING_TYPE_MATCHES_THRESHOLD:
+        if matcher.match_rate_at_least(REGEX_EMAIL, STRING_TYPE_MATCHES_THRESHOLD):
             return ColumnType.EMAIL
-        elif (
-            correct_phone_nums / length >= STRING_TYPE_MATCHES_THRESHOLD
-            and str_in_set(lowercase_column_name, RESERVED_PHONE_NUMBER_WORDS)
-        ):
+        elif str_in_set(
+            lowercase_column_name, RESERVED_PHONE_NUMBER_WORDS
+        ) and matcher.match_rate_at_least(REGEX_PHONE_NUMBER, STRING_TYPE_MATCHES_THRESHOLD):
             return ColumnType.PHONE_NUMBER
-        elif correct_zip_codes / length >= STRING_TYPE_MATCHES_THRESHOLD and str_in_set(
+        elif str_in_set(
             lowercase_column_name, RESERVED_ZIP_CODE_WORDS
-        ):
+        ) and matcher.match_rate_at_least(REGEX_ZIP_CODE, STRING_TYPE_MATCHES_THRESHOLD):
             return ColumnType.ZIP_CODE
-        elif correct_lists / length >= STRING_TYPE_MATCHES_THRESHOLD:
+        elif matcher.match_rate_at_least(REGEX_LIST, STRING_TYPE_MATCHES_THRESHOLD):
             return ColumnType.LIST
         elif series_nunique == 2:
             return ColumnType.TRUE_OR_FALSE
@@ -230,7 +388,7 @@ def infer_object_type(series, column_name, kwargs):
         if clean_series_nunique / length >= 0.8:
             return ColumnType.TEXT
 
-        word_count = clean_series.map(lambda x: len(str(x).split(" "))).max()
+        word_count = matcher.max_word_count()
         if word_count > MAXIMUM_WORD_LENGTH_FOR_CATEGORY_FEATURES:
             return ColumnType.TEXT
 
@@ -240,7 +398,23 @@ def infer_object_type(series, column_name, kwargs):
             return ColumnType.CATEGORY_HIGH_CARDINALITY
 
 
-def infer_column_types(df: Union[pd.DataFrame, scipy.sparse.csr_matrix], **kwargs):
+def infer_column_types(
+    df: Union[pd.DataFrame, scipy.sparse.csr_matrix],
+    cache_key: Optional[str] = None,
+    **kwargs,
+):
+    """
+    Args:
+        cache_key (Optional[str]): Identifies the data in the dataframe, e.g. a block output
+            and the fingerprint of its dataframe. The inferred column types
+            are cached with this key and returned for the next dataframe with the same key.
+    """
+    if cache_key is not None:
+        cache_key = (cache_key, json.dumps(kwargs, default=str, sort_keys=True))
+        ctypes = COLUMN_TYPES_CACHE.get(cache_key)
+        if ctypes is not None:
+            return ctypes
+
     column_types = kwargs.get("column_types", {})
 
     if isinstance(df, scipy.sparse.csr_matrix):
@@ -268,4 +442,7 @@ def infer_column_types(df: Union[pd.DataFrame, scipy.sparse.csr_matrix], **kwarg
         )
     for col, dtype in zip(new_cols, types):
         ctypes[col] = dtype
+
+    if cache_key is not None:
+        COLUMN_TYPES_CACHE.set(cache_key, ctypes)
     return ctypes
@@ -3,6 +3,7 @@ from mage_ai.data_cleaner.column_types import column_type_detector
 from mage_ai.data_cleaner.pipelines.base import DEFAULT_RULES, BasePipeline
 from mage_ai.data_cleaner.shared.utils import clean_dataframe
 from mage_ai.data_cleaner.statistics.calculator import StatisticsCalculator
+from mage_ai.settings.server import DATA_CLEANER_APPROXIMATE_THRESHOLD
 from mage_ai.shared.hash import merge_dict
 from mage_ai.shared.logger import timer, VerboseFunctionExec
 
@@ -20,11 +21,13 @@ def clean(
     rules=DEFAULT_RULES,
     rule_configs={},
     verbose=True,
+    column_types_cache_key=None,
 ):
     cleaner = DataCleaner(verbose=verbose)
     return cleaner.clean(
         df,
         column_types=column_types,
+        column_types_cache_key=column_types_cache_key,
         df_original=df_original,
         rules=rules,
         rule_configs=rule_configs,
@@ -33,19 +36,30 @@ def clean(
 
 
 class DataCleaner:
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, approximate_threshold=None):
+        """
+        Args:
+            approximate_threshold: Row count above which the statistics are estimated with
+                sketches. Defaults to DATA_CLEANER_APPROXIMATE_THRESHOLD; 0 calculates exact
+                statistics.
+        """
+        if approximate_threshold is None:
+            approximate_threshold = DATA_CLEANER_APPROXIMATE_THRESHOLD
+        self.approximate_threshold = approximate_threshold or None
         self.verbose = verbose
 
-    def analyze(self, df, column_types={}, df_original=None):
+    def analyze(self, df, column_types={}, df_original=None, column_types_cache_key=None):
         """Analyze a dataframe
-        1. Detect column types
+        1. Detect column types, reusing the ones cached with column_types_cache_key
         2. Calculate statisitics
         3. Calculate analysis
         """
         with timer('data_cleaner.infer_column_types'):
             with VerboseFunctionExec('Inferring variable type from dataset', verbose=self.verbose):
                 column_types = column_type_detector.infer_column_types(
-                    df, column_types=column_types
+                    df,
+                    cache_key=column_types_cache_key,
+                    column_types=column_types,
                 )
         with timer('data_cleaner.clean_series'):
             with VerboseFunctionExec(
@@ -54,9 +68,11 @@ class DataCleaner:
             ):
                 df = clean_dataframe(df, column_types, dropna=False)
         with timer('data_cleaner.calculate_statistics'):
-            statistics = StatisticsCalculator(column_types, verbose=self.verbose).process(
-                df, df_original=df_original, is_clean=True
-            )
+            statistics = StatisticsCalculator(
+                column_types,
+                verbose=self.verbose,
+                approximate_threshold=self.approximate_threshold,
+            ).process(df, df_original=df_original, is_clean=True)
         with timer('data_cleaner.calculate_insights'):
             analysis = AnalysisCalculator(
                 df, column_types, statistics, verbose=self.verbose
@@ -76,10 +92,20 @@ class DataCleaner:
         transform=True,
         rules=DEFAULT_RULES,
         rule_configs={},
+        column_types_cache_key=None,
     ):
-        df_stats = self.analyze(df, column_types=column_types, df_original=df_original)
+        df_stats = self.analyze(
+            df,
+            column_types=column_types,
+            column_types_cache_key=column_types_cache_key,
+            df_original=df_original,
+        )
         df = df_stats['cleaned_df']
-        pipeline = BasePipeline(rules=rules, verbose=self.verbose)
+        pipeline = BasePipeline(
+            rules=rules,
+            verbose=self.verbose,
+            approximate_threshold=self.approximate_threshold,
+        )
         if df_stats['statistics']['is_timeseries']:
             df = df.sort_values(by=df_stats['statistics']['timeseries_index'], axis=0)
         # TODO: Pass in both cleaned and uncleaned versions of dataset
@@ -37,14 +37,19 @@ DEFAULT_RULES = [
 
 
 class BasePipeline:
-    def __init__(self, actions=[], rules=DEFAULT_RULES, verbose=False):
+    def __init__(self, actions=[], rules=DEFAULT_RULES, verbose=False, approximate_threshold=None):
         self.actions = actions
+        self.approximate_threshold = approximate_threshold
         self.rules = rules
         self.verbose = verbose
 
     def create_actions(self, df, column_types, statistics, rule_configs={}):
         if not statistics or len(statistics) == 0:
-            calculator = StatisticsCalculator(column_types, self.verbose)
+            calculator = StatisticsCalculator(
+                column_types,
+                self.verbose,
+                approximate_threshold=self.approximate_threshold,
+            )
             statistics = calculator.calculate_statistics_overview(df, False)
         self.column_types = column_types
         all_suggestions = []
@@ -1,31 +1,83 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from mage_ai.data_cleaner.column_types.column_type_detector import find_syntax_errors
 from mage_ai.data_cleaner.column_types.constants import NUMBER_TYPES, ColumnType
 from mage_ai.data_cleaner.shared.utils import clean_dataframe
+from mage_ai.data_cleaner.statistics.sketches import HyperLogLog, TDigest
 from mage_ai.shared.constants import SAMPLE_SIZE
 from mage_ai.shared.custom_types import FrozenDict
 from mage_ai.shared.hash import merge_dict
 from mage_ai.shared.logger import timer, VerboseFunctionExec
+from typing import Dict, List
 import math
+import multiprocessing
 import numpy as np
+import os
 import pandas as pd
 import logging
+import threading
+import warnings
 
 
 EMAIL_DOMAIN_REGEX = r'\@([^\s]*)'
 INVALID_VALUE_SAMPLE_COUNT = 100
 OUTLIER_SAMPLE_COUNT = 100
 OUTLIER_ZSCORE_THRESHOLD = 3
+PARALLEL_COLUMN_TYPES = frozenset([ColumnType.EMAIL, ColumnType.TEXT])
+# Only use the process pool when there are enough string values for the speedup to outweigh
+# the cost of copying the columns to the workers.
+PARALLEL_MIN_CELL_COUNT = 1_000_000
 PUNCTUATION = r'[:;\.,\/\\&`"\'\(\)\[\]\{\}]'
 STOP_WORD_LIST = frozenset(['is', 'and', 'yet', 'but', 'a', 'or', 'nor', 'not', 'to', 'the'])
 VALUE_COUNT_LIMIT = 20
 
 logger = logging.getLogger(__name__)
 
+# Process pool shared by all calculators. The workers are spawned instead of forked so that
+# they don't inherit the state (threads, sockets, database connections) of the server.
+__process_pool = None
+__process_pool_lock = threading.Lock()
+__process_pool_max_workers = None
+
+
+def get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    global __process_pool
+    global __process_pool_max_workers
+
+    with __process_pool_lock:
+        if __process_pool is not None and __process_pool_max_workers != max_workers:
+            __process_pool.shutdown(wait=False)
+            __process_pool = None
+        if __process_pool is None:
+            __process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+            __process_pool_max_workers = max_workers
+        return __process_pool
+
+
+def reset_process_pool(process_pool: ProcessPoolExecutor) -> None:
+    global __process_pool
+
+    with __process_pool_lock:
+        if __process_pool is process_pool:
+            __process_pool.shutdown(wait=False)
+            __process_pool = None
+
 
 def increment(metric, tags):
     pass
 
 
+def calculate_column_statistics(column_types, series, col, approximate_threshold=None):
+    return StatisticsCalculator(
+        column_types,
+        approximate_threshold=approximate_threshold,
+    ).statistics_overview(series, col)
+
+
 class StatisticsCalculator:
     """
     Key Assumption: statistics are clean - all values of the correct exact type at this point
@@ -38,10 +90,25 @@ class StatisticsCalculator:
         # feature_set_version,
         column_types,
         verbose=False,
+        approximate_threshold=None,
+        max_workers=None,
         **kwargs,
     ):
+        """
+        Args:
+            column_types: Column type of each column.
+            verbose: Whether to print progress.
+            approximate_threshold: Row count above which distinct counts and quantiles are
+                estimated with sketches (HyperLogLog and t-digest) and value counts are
+                estimated from a sample of that many rows. Exact statistics are calculated
+                for all columns if it's None.
+            max_workers: Maximum number of processes used to calculate the statistics of
+                text and email columns. Defaults to the number of CPUs.
+        """
         self.column_types = column_types
         self.verbose = verbose
+        self.approximate_threshold = approximate_threshold
+        self.max_workers = max_workers
 
     @property
     def data_tags(self):
@@ -71,9 +138,23 @@ class StatisticsCalculator:
                 prev = 0
             yield prev
 
-    def statistics_overview(self, series, col):
+    def max_null_seq(self, arr):
+        """
+        Vectorized equivalent of max(self.null_seq_gen(arr)).
+        """
+        edges = np.diff(np.concatenate([[False], arr, [False]]).astype(np.int8))
+        starts = np.flatnonzero(edges == 1)
+        lengths = np.flatnonzero(edges == -1) - starts
+        if lengths.size == 0:
+            return 0
+        if starts[0] == 0:
+            # null_seq_gen counts the nulls at the start of the array from -1
+            lengths[0] -= 1
+        return max(lengths.max(), 0)
+
+    def statistics_overview(self, series, col, numeric_statistics=None):
         try:
-            return self.__statistics_overview(series, col)
+            return self.__statistics_overview(series, col, numeric_statistics=numeric_statistics)
         except Exception as err:
             increment(
                 'statistics.calculate_statistics_overview.column.failed',
@@ -97,13 +178,18 @@ class StatisticsCalculator:
                 count=len(df.index)
             )
 
-            arr_args_1 = ([df[col] for col in df.columns],)
-            arr_args_2 = ([col for col in df.columns],)
-
-            dicts = map(self.statistics_overview, *arr_args_1, *arr_args_2)
+            numeric_statistics = self.__calculate_numeric_statistics(df)
+            parallel_statistics = self.__calculate_parallel_statistics(df)
 
-            for d in dicts:
-                data.update(d)
+            for col in df.columns:
+                if col in parallel_statistics:
+                    data.update(parallel_statistics[col])
+                else:
+                    data.update(self.statistics_overview(
+                        df[col],
+                        col,
+                        numeric_statistics=numeric_statistics.get(col),
+                    ))
 
             # Aggregated stats
             column_count = len(df.columns)
@@ -172,10 +258,218 @@ class StatisticsCalculator:
     def __protected_division(self, dividend: float, divisor: float) -> float:
         return dividend / divisor if divisor != 0 else 0
 
-    def __statistics_overview(self, series, col):
+    def __is_approximate(self, series) -> bool:
+        return self.approximate_threshold is not None and \
+            len(series) > self.approximate_threshold
+
+    def __calculate_numeric_statistics(self, df) -> Dict[str, Dict]:
+        """
+        Calculate the statistics of all the number columns in one vectorized pass per dtype,
+        instead of one pass per column and statistic.
+        """
+        columns_by_dtype = dict()
+        for col in df.columns:
+            if self.column_types.get(col) not in NUMBER_TYPES:
+                continue
+            dtype = df[col].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in ('i', 'u', 'f'):
+                columns_by_dtype.setdefault(dtype, []).append(col)
+            else:
+                columns_by_dtype.setdefault(col, [col])
+
+        statistics = dict()
+        for columns in columns_by_dtype.values():
+            try:
+                statistics.update(self.__calculate_numeric_statistics_for_columns(df, columns))
+            except Exception as err:
+                # The statistics of these columns are calculated one column at a time instead
+                logger.warning(f'Failed to calculate statistics for columns {columns}: {err}')
+        return statistics
+
+    def __calculate_numeric_statistics_for_columns(
+        self,
+        df,
+        columns: List[str],
+    ) -> Dict[str, Dict]:
+        values = df[columns].to_numpy()
+        if values.dtype.kind not in ('i', 'u', 'f'):
+            values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        row_count = values.shape[0]
+
+        # The full size matrices are limited to the float values, a matrix reused for the
+        # deviations, their powers and the z-score outliers, and the IQR outliers; integer
+        # columns have no nulls.
+        floats = values.astype(np.float64, copy=False)
+        if values.dtype.kind == 'f':
+            is_null = np.isnan(floats)
+            counts = row_count - is_null.sum(axis=0)
+        else:
+            is_null = None
+            counts = np.full(len(columns), row_count)
+
+        with np.errstate(all='ignore'), warnings.catch_warnings():
+            # Columns without any values are skipped below
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            if is_null is not None:
+                maxs = np.nanmax(floats, axis=0, initial=-np.inf)
+                mins = np.nanmin(floats, axis=0, initial=np.inf)
+                sums = np.nansum(floats, axis=0)
+                averages = sums / counts
+            else:
+                maxs = values.max(axis=0, initial=np.iinfo(values.dtype).min)
+                mins = values.min(axis=0, initial=np.iinfo(values.dtype).max)
+                sums = values.sum(axis=0)
+                averages = floats.sum(axis=0) / counts
+
+            deviations = np.subtract(floats, averages)
+            powers = np.square(deviations)
+            squared_deviations = np.nansum(powers, axis=0)
+            stds = np.sqrt(squared_deviations / (counts - 1))
+            stds[counts < 2] = np.nan
+            m2 = squared_deviations / counts
+            np.multiply(powers, deviations, out=powers)
+            m3 = np.nansum(powers, axis=0) / counts
+            skews = np.sqrt(counts * (counts - 1)) / (counts - 2) * m3 / m2 ** 1.5
+            skews[m2 == 0] = 0
+            skews[counts < 3] = np.nan
+            del powers
+
+            # |deviation| / std >= threshold, compared without dividing the matrix
+            np.abs(deviations, out=deviations)
+            is_zscore_outlier = np.greater_equal(
+                deviations,
+                OUTLIER_ZSCORE_THRESHOLD * stds,
+            )
+            del deviations
+
+            if self.__is_approximate(df):
+                digests = [TDigest().update(floats[:, idx]) for idx in range(len(columns))]
+                medians = np.array([digest.quantile(0.5) for digest in digests])
+                quartiles = np.array([
+                    [digest.quantile(0.25) for digest in digests],
+                    [digest.quantile(0.75) for digest in digests],
+                ])
+            elif is_null is None or not is_null.any():
+                medians = np.median(floats, axis=0)
+                quartiles = np.quantile(floats, [0.25, 0.75], axis=0, method='nearest')
+            else:
+                medians = np.nanmedian(floats, axis=0)
+                quartiles = np.nanquantile(floats, [0.25, 0.75], axis=0, method='nearest')
+            first_quartiles, third_quartiles = quartiles
+            iqrs = third_quartiles - first_quartiles
+
+            is_iqr_outlier = np.less_equal(floats, first_quartiles - 1.5 * iqrs)
+            is_iqr_outlier |= np.greater_equal(floats, third_quartiles + 1.5 * iqrs)
+
+        statistics = dict()
+        for idx, col in enumerate(columns):
+            if counts[idx] == 0:
+                continue
+            col_values = values[:, idx]
+            data = {
+                f'{col}/average': averages[idx],
+                f'{col}/max': maxs[idx],
+                f'{col}/median': medians[idx],
+                f'{col}/min': mins[idx],
+                f'{col}/sum': sums[idx],
+                f'{col}/skew': skews[idx],
+                f'{col}/std': stds[idx],
+            }
+            # detect outliers
+            if stds[idx] == 0:
+                data[f'{col}/outlier_count'] = 0
+            else:
+                outlier_mask = is_zscore_outlier[:, idx]
+                data[f'{col}/outlier_count'] = np.count_nonzero(outlier_mask)
+                data[f'{col}/outlier_ratio'] = self.__protected_division(
+                    data[f'{col}/outlier_count'], row_count
+                )
+                data[f'{col}/outliers'] = col_values[outlier_mask][:OUTLIER_SAMPLE_COUNT].tolist()
+            # generate five number summary
+            outlier_mask = is_iqr_outlier[:, idx]
+            outliers = pd.unique(col_values[outlier_mask]).tolist()
+            data[f'{col}/box_plot_data'] = {
+                'outliers': outliers[:OUTLIER_SAMPLE_COUNT],
+                'min': data[f'{col}/min'],
+                'first_quartile': first_quartiles[idx],
+                'median': data[f'{col}/median'],
+                'third_quartile': third_quartiles[idx],
+                'max': data[f'{col}/max'],
+            }
+            if len(outliers) != 0:
+                not_outlier_mask = ~outlier_mask
+                if is_null is not None:
+                    not_outlier_mask &= ~is_null[:, idx]
+                not_outliers = col_values[not_outlier_mask]
+                data[f'{col}/box_plot_data']['min'] = (
+                    not_outliers.min() if not_outliers.size else np.nan
+                )
+                data[f'{col}/box_plot_data']['max'] = (
+                    not_outliers.max() if not_outliers.size else np.nan
+                )
+            statistics[col] = data
+        return statistics
+
+    def __calculate_parallel_statistics(self, df) -> Dict[str, Dict]:
+        """
+        Calculate the statistics of the text and email columns, which are dominated by regular
+        expressions and string operations, in a process pool.
+        """
+        columns = [
+            col for col in df.columns if self.column_types.get(col) in PARALLEL_COLUMN_TYPES
+        ]
+        max_workers = self.max_workers or os.cpu_count() or 1
+        if min(len(columns), max_workers) < 2 or \
+                len(df.index) * len(columns) < PARALLEL_MIN_CELL_COUNT:
+            return dict()
+
+        process_pool = None
+        try:
+            process_pool = get_process_pool(max_workers)
+            dicts = process_pool.map(
+                calculate_column_statistics,
+                repeat(self.column_types),
+                [df[col] for col in columns],
+                columns,
+                repeat(self.approximate_threshold),
+            )
+            return dict(zip(columns, dicts))
+        except BrokenProcessPool as err:
+            reset_process_pool(process_pool)
+            logger.warning(f'Failed to calculate statistics in parallel: {err}')
+            return dict()
+        except Exception as err:
+            # E.g. daemonic processes aren't allowed to have child processes
+            logger.warning(f'Failed to calculate statistics in parallel: {err}')
+            return dict()
+
+    def __value_counts(self, series, series_non_null):
+        """
+        Returns:
+            The value counts of the series, including nulls, and the number of distinct
+            non-null values.
+        """
+        if not self.__is_approximate(series):
+            df_value_counts = series.value_counts(dropna=False)
+            return df_value_counts, df_value_counts.index.notnull().sum()
+
+        try:
+            count_unique = HyperLogLog().update(series_non_null).count()
+        except TypeError:
+            # Values that can't be hashed, count them exactly
+            count_unique = series_non_null.nunique()
+        df_value_counts = series.sample(
+            n=self.approximate_threshold,
+            random_state=0,
+        ).value_counts(dropna=False)
+        df_value_counts = (df_value_counts * (len(series) / self.approximate_threshold)).round()
+        return df_value_counts.astype(np.int64), count_unique
+
+    def __statistics_overview(self, series, col, numeric_statistics=None):
         # The following regex based replace has high overheads
         # series = series.replace(r'^\s*$', np.nan, regex=True)
-        df_value_counts = series.value_counts(dropna=False)
+        series_non_null = series.dropna()
+        df_value_counts, count_unique = self.__value_counts(series, series_non_null)
 
         df_top_value_counts = df_value_counts.copy()
         if df_top_value_counts.shape[0] > VALUE_COUNT_LIMIT:
@@ -196,20 +490,18 @@ class StatisticsCalculator:
         #     return {}
 
         column_type = self.column_types.get(col)
-        series_non_null = series.dropna()
 
         # Fix json serialization issue
         df_top_value_counts.index = pd.Index(str(idx) for idx in df_top_value_counts.index)
 
-        df_value_counts_non_null = df_value_counts[df_value_counts.index.notnull()]
-        count_unique = len(df_value_counts_non_null)
-
         data = {
             f'{col}/count': series_non_null.size,
             f'{col}/count_distinct': count_unique,
             f'{col}/null_value_count': series.isnull().sum(),
             f'{col}/value_counts': df_top_value_counts.to_dict(),
         }
+        if self.__is_approximate(series):
+            data[f'{col}/is_approximate'] = True
 
         data[f'{col}/null_value_rate'] = self.__protected_division(
             data[f'{col}/null_value_count'], series.size
@@ -218,7 +510,7 @@ class StatisticsCalculator:
             data[f'{col}/count_distinct'], series.size
         )
         data[f'{col}/max_null_seq'] = (
-            max(self.null_seq_gen(series.isna().to_numpy()))
+            self.max_null_seq(series.isna().to_numpy())
             if data[f'{col}/count'] != 0
             else len(series)
         )
@@ -228,50 +520,12 @@ class StatisticsCalculator:
         dates = None
         if len(series_non_null) > 0:
             if column_type in NUMBER_TYPES:
-                data[f'{col}/average'] = series_non_null.mean()
-                data[f'{col}/max'] = series_non_null.max()
-                data[f'{col}/median'] = series_non_null.median()
-                data[f'{col}/min'] = series_non_null.min()
-                data[f'{col}/sum'] = series_non_null.sum()
-                data[f'{col}/skew'] = series_non_null.skew()
-                data[f'{col}/std'] = series_non_null.std()
-                # detect outliers
-                if data[f'{col}/std'] == 0:
-                    data[f'{col}/outlier_count'] = 0
-                else:
-                    series_z_score = (
-                        (series_non_null - data[f'{col}/average']) / data[f'{col}/std']
-                    ).abs()
-                    series_outliers = series_z_score[series_z_score >= OUTLIER_ZSCORE_THRESHOLD]
-                    data[f'{col}/outlier_count'] = series_outliers.count()
-                    data[f'{col}/outlier_ratio'] = self.__protected_division(
-                        data[f'{col}/outlier_count'], series.size
-                    )
-                    data[f'{col}/outliers'] = (
-                        series_non_null.loc[series_outliers.index]
-                        .iloc[:OUTLIER_SAMPLE_COUNT]
-                        .tolist()
-                    )
-                # generate five number summary
-                first_quartile = series_non_null.quantile(0.25, interpolation='nearest')
-                third_quartile = series_non_null.quantile(0.75, interpolation='nearest')
-                iqr = third_quartile - first_quartile
-                outlier_mask = (series_non_null <= first_quartile - 1.5 * iqr) | (
-                    series_non_null >= third_quartile + 1.5 * iqr
-                )
-                outliers = series_non_null[outlier_mask].unique().tolist()
-                data[f'{col}/box_plot_data'] = {
-                    'outliers': outliers[:OUTLIER_SAMPLE_COUNT],
-                    'min': data[f'{col}/min'],
-                    'first_quartile': first_quartile,
-                    'median': data[f'{col}/median'],
-                    'third_quartile': third_quartile,
-                    'max': data[f'{col}/max'],
-                }
-                if len(outliers) != 0:
-                    not_outliers = series_non_null[~outlier_mask]
-                    data[f'{col}/box_plot_data']['min'] = not_outliers.min()
-                    data[f'{col}/box_plot_data']['max'] = not_outliers.max()
+                if numeric_statistics is None:
+                    numeric_statistics = self.__calculate_numeric_statistics_for_columns(
+                        series.to_frame(name=col),
+                        [col],
+                    )[col]
+                data.update(numeric_statistics)
             elif column_type == ColumnType.DATETIME:
                 dates = pd.to_datetime(series_non_null, utc=True, errors='coerce').dropna()
                 data[f'{col}/max'] = dates.max().isoformat()
@@ -280,8 +534,12 @@ class StatisticsCalculator:
                 )
                 data[f'{col}/min'] = dates.min().isoformat()
             elif column_type == ColumnType.TEXT:
-                text_series = series_non_null
-                string_length = text_series.str.len()
+                # Run the string operations once per distinct value instead of once per row
+                codes, uniques = pd.factorize(series_non_null)
+                unique_counts = np.bincount(codes, minlength=len(uniques))
+                text_series = pd.Series(uniques, dtype=object)
+
+                string_length = text_series.str.len().to_numpy()[codes]
                 data[f'{col}/avg_string_length'] = string_length.mean()
                 data[f'{col}/min_character_count'] = string_length.min()
                 data[f'{col}/max_character_count'] = string_length.max()
@@ -289,14 +547,22 @@ class StatisticsCalculator:
                 text_series = text_series.str.lower().str.strip()
                 text_series = text_series.str.split(r'\s+')
 
-                word_count = text_series.map(len)
+                word_count = text_series.map(len).to_numpy()[codes]
                 data[f'{col}/max_word_count'] = word_count.max()
                 data[f'{col}/avg_word_count'] = word_count.mean()
                 data[f'{col}/min_word_count'] = word_count.min()
 
-                exploded_text_series = text_series.explode()
+                exploded_text_series = text_series.explode().dropna()
                 data[f'{col}/word_distribution'] = (
-                    exploded_text_series.value_counts().head(VALUE_COUNT_LIMIT).to_dict()
+                    pd.Series(
+                        unique_counts[exploded_text_series.index],
+                        index=exploded_text_series.to_numpy(),
+                    )
+                    .groupby(level=0, sort=False)
+                    .sum()
+                    .sort_values(ascending=False, kind='stable')
+                    .head(VALUE_COUNT_LIMIT)
+                    .to_dict()
                 )
                 # TODO: Calculate average word count excluding stopwords
                 # data[f'{col}/word_count_excl_stopwords'] = (
@@ -304,7 +570,12 @@ class StatisticsCalculator:
                 # )
             elif column_type == ColumnType.EMAIL:
                 valid_emails = series_non_null[~invalid_rows]
-                domains = valid_emails.str.extract(EMAIL_DOMAIN_REGEX, expand=False)
+                codes, uniques = pd.factorize(valid_emails)
+                domains = pd.Series(
+                    pd.Series(uniques, dtype=object)
+                    .str.extract(EMAIL_DOMAIN_REGEX, expand=False)
+                    .to_numpy()[codes],
+                )
                 data[f'{col}/domain_distribution'] = (
                     domains.value_counts().head(VALUE_COUNT_LIMIT).to_dict()
                 )
@@ -339,9 +610,11 @@ class StatisticsCalculator:
                 data[f'{col}/value_counts'] = string_df_value_counts.to_dict()
 
             mode, mode_idx = None, 0
-            while mode_idx < count_unique and df_value_counts.index[mode_idx] in [None, np.nan]:
+            mode_count_limit = min(count_unique, len(df_value_counts))
+            while mode_idx < mode_count_limit and \
+                    df_value_counts.index[mode_idx] in [None, np.nan]:
                 mode_idx += 1
-            if mode_idx < count_unique:
+            if mode_idx < mode_count_limit:
                 mode = df_value_counts.index[mode_idx]
 
             if column_type == ColumnType.DATETIME and mode is not None:
@@ -0,0 +1,136 @@
+import math
+import numpy as np
+import pandas as pd
+
+
+HLL_PRECISION = 14
+TDIGEST_COMPRESSION = 200
+
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """
+    Hash the values of a series into 64 bit unsigned integers in one vectorized pass.
+    """
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+
+
+def bit_length(values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized int.bit_length for an array of 64 bit unsigned integers.
+    """
+    values = values.astype(np.uint64, copy=True)
+    lengths = np.zeros(values.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values >= np.uint64(1 << shift)
+        lengths[mask] += shift
+        values[mask] >>= np.uint64(shift)
+    lengths += values > 0
+    return lengths
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch estimating the number of distinct values with a relative error of
+    about 1.04 / sqrt(2 ** precision), using 2 ** precision bytes of memory.
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, series: pd.Series) -> 'HyperLogLog':
+        return self.update_hashes(hash_values(series))
+
+    def update_hashes(self, hashes: np.ndarray) -> 'HyperLogLog':
+        if len(hashes) == 0:
+            return self
+        precision = self.precision
+        indices = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+        remaining_bits = hashes << np.uint64(precision)
+        ranks = np.minimum(64 - bit_length(remaining_bits) + 1, 64 - precision + 1)
+        np.maximum.at(self.registers, indices, ranks.astype(np.uint8))
+        return self
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zero_registers = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zero_registers > 0:
+            # Small range correction: linear counting
+            estimate = m * math.log(m / zero_registers)
+        return int(round(estimate))
+
+
+class TDigest:
+    """
+    Merging t-digest estimating quantiles, most accurately near the tails, with a number of
+    centroids bounded by the compression.
+    """
+
+    def __init__(self, compression: int = TDIGEST_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def count(self) -> float:
+        return self.weights.sum()
+
+    def update(self, values) -> 'TDigest':
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.__compress(
+            np.concatenate([self.means, values]),
+            np.concatenate([self.weights, np.ones(len(values))]),
+        )
+        return self
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        if len(other.means) == 0:
+            return self
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.__compress(
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+        )
+        return self
+
+    def quantile(self, q: float) -> float:
+        if len(self.means) == 0:
+            return np.nan
+        total = self.weights.sum()
+        centers = np.cumsum(self.weights) - self.weights / 2
+        return float(np.interp(
+            q * total,
+            np.concatenate([[0], centers, [total]]),
+            np.concatenate([[self.min], self.means, [self.max]]),
+        ))
+
+    def __compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        order = np.argsort(means, kind='mergesort')
+        means = means[order]
+        weights = weights[order]
+        total = weights.sum()
+
+        # Assign each point to a centroid using the k1 scale function, so that no centroid
+        # spans more than one unit of k: centroids are small at the tails and large at the
+        # median.
+        q_left = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(np.clip(2 * q_left - 1, -1, 1))
+        centroid_ids = np.floor(k - k[0]).astype(np.int64)
+        _, centroid_ids = np.unique(centroid_ids, return_inverse=True)
+
+        self.weights = np.bincount(centroid_ids, weights=weights)
+        self.means = np.bincount(centroid_ids, weights=means * weights) / self.weights
@@ -66,6 +66,12 @@ def get_batch_fetch_limit(source_config: Dict):
     return source_config.get(BATCH_FETCH_LIMIT_KEY, BATCH_FETCH_LIMIT)
 
 
+def get_record_batch_format(source_config: Dict) -> str:
+    from mage_integrations.utils.record_batch import RECORD_BATCH_FORMAT_KEY
+
+    return source_config.get(RECORD_BATCH_FORMAT_KEY)
+
+
 def get_catalog(block, variables: Dict = None, pipeline=None) -> Dict:
     return get_settings(block, variables or {}, pipeline=pipeline)['catalog']
 
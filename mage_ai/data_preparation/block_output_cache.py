@@ -0,0 +1,401 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import traceback
+import uuid
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from mage_ai.data_preparation.models.constants import (
+    VARIABLE_DIR,
+    BlockLanguage,
+    BlockType,
+    PipelineType,
+)
+from mage_ai.data_preparation.models.variables.constants import (
+    DATAFRAME_ARROW_FILE,
+    DATAFRAME_PARQUET_SAMPLE_FILE,
+    VariableAggregateDataType,
+)
+from mage_ai.settings.server import (
+    BLOCK_OUTPUT_CACHE,
+    BLOCK_OUTPUT_CACHE_MAX_AGE_SECONDS,
+    BLOCK_OUTPUT_CACHE_MAX_SIZE_MB,
+)
+from mage_ai.shared.utils import clean_name
+
+BLOCK_OUTPUT_CACHE_DIR = '.block_output_cache'
+# Changing how the keys are built invalidates the entries cached with the previous version.
+CACHE_KEY_VERSION = 2
+CONFIGURATION_KEY = 'output_cache'
+DIGEST_CHUNK_SIZE = 1024 * 1024
+ENTRY_FILE = 'entry.json'
+ENTRY_VARIABLES_DIR = 'variables'
+
+# Blocks of these types are cached when the cache is enabled for the project. Data loaders are
+# only cached when they opt in, since they read external sources that can change without their
+# inputs changing; data exporters too, since skipping them skips their side effects.
+DEFAULT_CACHED_BLOCK_TYPES = frozenset([
+    BlockType.CUSTOM,
+    BlockType.TRANSFORMER,
+])
+CACHEABLE_BLOCK_TYPES = DEFAULT_CACHED_BLOCK_TYPES | frozenset([
+    BlockType.DATA_EXPORTER,
+    BlockType.DATA_LOADER,
+])
+
+# Global variables that identify the run of the block rather than change its output.
+IGNORED_GLOBAL_VARIABLES = frozenset([
+    'context',
+    'execution_partition',
+    'pipeline_run_id',
+    'spark',
+])
+# Files written next to the data of a variable that are derived from the data or that change on
+# every run, e.g. the resource usage.
+IGNORED_VARIABLE_FILES = frozenset([
+    DATAFRAME_ARROW_FILE,
+    DATAFRAME_PARQUET_SAMPLE_FILE,
+] + [
+    # The names of the files, since formatting the enum gives its name on Python 3.11.
+    f'{data_type.value}.json'
+    for data_type in [
+        VariableAggregateDataType.INSIGHTS,
+        VariableAggregateDataType.METADATA,
+        VariableAggregateDataType.RESOURCE_USAGE,
+        VariableAggregateDataType.SAMPLE_DATA,
+        VariableAggregateDataType.STATISTICS,
+        VariableAggregateDataType.SUGGESTIONS,
+    ]
+])
+
+
+class BlockOutputCacheStats:
+    def __init__(self):
+        self.evictions = 0
+        self.hits = 0
+        self.lock = threading.Lock()
+        self.misses = 0
+        self.stores = 0
+
+    def increment(self, name: str) -> None:
+        with self.lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def to_dict(self) -> Dict:
+        return dict(
+            evictions=self.evictions,
+            hits=self.hits,
+            misses=self.misses,
+            stores=self.stores,
+        )
+
+
+# Metrics of the block output caches of this process.
+block_output_cache_stats = BlockOutputCacheStats()
+
+
+def encode_global_variable(value: Any) -> Any:
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    elif isinstance(value, Enum):
+        return value.value
+    elif isinstance(value, (frozenset, set)):
+        return sorted(value, key=str)
+
+    # Objects without a stable representation make the block not cacheable.
+    raise TypeError(f'Global variable of type {type(value).__name__} is not hashable.')
+
+
+def fingerprint_directory(dir_path: str) -> Optional[str]:
+    """
+    Fingerprint the variable files in a directory by their path and the digest of their content,
+    so that an upstream block executed again with the same output has the same fingerprint.
+    """
+    if not os.path.isdir(dir_path):
+        return None
+
+    sha256 = hashlib.sha256()
+    for root, dirs, files in os.walk(dir_path):
+        dirs.sort()
+        for filename in sorted(files):
+            if filename in IGNORED_VARIABLE_FILES or filename.endswith('.tmp'):
+                continue
+            file_path = os.path.join(root, filename)
+            sha256.update(f'{os.path.relpath(file_path, dir_path)}\n'.encode())
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(DIGEST_CHUNK_SIZE), b''):
+                    sha256.update(chunk)
+            sha256.update(b'\n')
+
+    return sha256.hexdigest()
+
+
+def size_of_directory(dir_path: str) -> int:
+    size = 0
+    for root, _dirs, files in os.walk(dir_path):
+        for filename in files:
+            size += os.path.getsize(os.path.join(root, filename))
+    return size
+
+
+class BlockOutputCache:
+    """
+    Cache of the output variables of blocks, keyed by their inputs.
+
+    A block is cached by the hash of its code, its configuration, its global variables and the
+    fingerprints of the output files of its upstream blocks. When a block is executed again with
+    the same inputs, e.g. when a pipeline run is retried or while developing the downstream
+    blocks in the notebook, its cached outputs are copied to its variables directory instead of
+    executing the block.
+
+    The entries expire max_age_seconds after they were cached, whether they were used or not.
+    The least recently used entries are evicted first while the size of the cache is larger
+    than max_size_bytes.
+    """
+
+    def __init__(
+        self,
+        variable_manager,
+        max_age_seconds: int = BLOCK_OUTPUT_CACHE_MAX_AGE_SECONDS,
+        max_size_bytes: int = int(BLOCK_OUTPUT_CACHE_MAX_SIZE_MB * 1024 * 1024),
+    ):
+        self.cache_dir = os.path.join(variable_manager.variables_dir, BLOCK_OUTPUT_CACHE_DIR)
+        self.max_age_seconds = max_age_seconds
+        self.max_size_bytes = max_size_bytes
+        self.variable_manager = variable_manager
+
+    def should_cache(self, block) -> bool:
+        configuration = block.configuration or {}
+        cache_setting = configuration.get(CONFIGURATION_KEY)
+        if cache_setting is None:
+            if not BLOCK_OUTPUT_CACHE or block.type not in DEFAULT_CACHED_BLOCK_TYPES:
+                return False
+        elif not cache_setting:
+            return False
+
+        if (
+            block.type not in CACHEABLE_BLOCK_TYPES
+            or block.language != BlockLanguage.PYTHON
+            or block.pipeline is None
+            or block.pipeline.type != PipelineType.PYTHON
+            or block.replicated_block
+        ):
+            return False
+
+        # The outputs of dynamic blocks and of their children are split into parts that are
+        # read and written differently.
+        from mage_ai.data_preparation.models.block.dynamic.utils import (
+            is_dynamic_block,
+            is_dynamic_block_child,
+            should_reduce_output,
+        )
+
+        for b in [block] + (block.upstream_blocks or []):
+            if is_dynamic_block(b) or is_dynamic_block_child(b) or should_reduce_output(b):
+                return False
+
+        return True
+
+    def build_key(
+        self,
+        block,
+        global_vars: Dict = None,
+        execution_partition: str = None,
+        custom_code: str = None,
+    ) -> Optional[str]:
+        global_vars_hashed = {
+            k: v for k, v in (global_vars or {}).items() if k not in IGNORED_GLOBAL_VARIABLES
+        }
+
+        upstream_hashes = {}
+        for upstream_block in block.upstream_blocks or []:
+            upstream_hashes[upstream_block.uuid] = fingerprint_directory(
+                self.block_variables_dir(upstream_block, execution_partition),
+            )
+
+        try:
+            key_data = json.dumps(
+                dict(
+                    block=dict(
+                        configuration=block.configuration,
+                        content=custom_code if custom_code is not None else block.content,
+                        language=block.language,
+                        type=block.type,
+                        upstream_blocks=block.upstream_block_uuids,
+                        uuid=block.uuid,
+                    ),
+                    global_vars=global_vars_hashed,
+                    upstream=upstream_hashes,
+                    version=CACHE_KEY_VERSION,
+                ),
+                default=encode_global_variable,
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            return None
+
+        return hashlib.sha256(key_data.encode()).hexdigest()
+
+    def block_variables_dir(self, block, execution_partition: str = None) -> str:
+        return os.path.join(
+            self.variable_manager.pipeline_path(block.pipeline_uuid),
+            VARIABLE_DIR,
+            execution_partition or '',
+            clean_name(block.uuid),
+        )
+
+    def restore(self, block, key: str, execution_partition: str = None) -> Optional[List[str]]:
+        """
+        Copy the outputs cached with the key to the variables directory of the block.
+
+        Returns:
+            Optional[List[str]]: The uuids of the restored variables, None if the key isn't
+                cached.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        entry = self.__read_entry(entry_dir)
+        if entry is None or self.__is_expired(entry):
+            block_output_cache_stats.increment('misses')
+            return None
+
+        variables_dir = self.block_variables_dir(block, execution_partition)
+        try:
+            if os.path.isdir(variables_dir):
+                shutil.rmtree(variables_dir)
+            shutil.copytree(os.path.join(entry_dir, ENTRY_VARIABLES_DIR), variables_dir)
+        except Exception:
+            # The entry was evicted while it was copied.
+            traceback.print_exc()
+            block_output_cache_stats.increment('misses')
+            return None
+
+        entry['accessed_at'] = datetime.utcnow().timestamp()
+        entry['hits'] = entry.get('hits', 0) + 1
+        try:
+            self.__write_entry(entry_dir, entry)
+        except OSError:
+            pass
+        block_output_cache_stats.increment('hits')
+
+        return entry.get('variable_uuids') or []
+
+    def store(
+        self,
+        block,
+        key: str,
+        variable_uuids: List[str],
+        execution_partition: str = None,
+    ) -> bool:
+        """
+        Copy the variables the block just wrote to the cache with the key. The other variables
+        in the variables directory of the block, e.g. left over by earlier runs, aren't cached.
+        """
+        variables_dir = self.block_variables_dir(block, execution_partition)
+        if not os.path.isdir(variables_dir):
+            return False
+
+        variable_uuids = set(variable_uuids)
+        filenames = sorted(
+            f for f in os.listdir(variables_dir) if f.split('.')[0] in variable_uuids
+        )
+        if not filenames:
+            return False
+
+        entry_dir = os.path.join(self.cache_dir, key)
+        if os.path.exists(os.path.join(entry_dir, ENTRY_FILE)):
+            return False
+
+        # The entry is written to a temporary directory first, so that it's never read before
+        # it's complete.
+        temp_dir = os.path.join(self.cache_dir, f'.{key}.{uuid.uuid4().hex}')
+        try:
+            entry_variables_dir = os.path.join(temp_dir, ENTRY_VARIABLES_DIR)
+            os.makedirs(entry_variables_dir)
+            for filename in filenames:
+                path = os.path.join(variables_dir, filename)
+                if os.path.isdir(path):
+                    shutil.copytree(path, os.path.join(entry_variables_dir, filename))
+                else:
+                    shutil.copy2(path, os.path.join(entry_variables_dir, filename))
+            now = datetime.utcnow().timestamp()
+            self.__write_entry(temp_dir, dict(
+                accessed_at=now,
+                block_uuid=block.uuid,
+                created_at=now,
+                hits=0,
+                pipeline_uuid=block.pipeline_uuid,
+                size=size_of_directory(temp_dir),
+                variable_uuids=sorted(variable_uuids),
+            ))
+            os.rename(temp_dir, entry_dir)
+        except OSError:
+            # Another process cached the same outputs at the same time.
+            return False
+        finally:
+            if os.path.isdir(temp_dir):
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+        block_output_cache_stats.increment('stores')
+        self.evict()
+
+        return True
+
+    def evict(self) -> int:
+        """
+        Remove the expired entries, then the least recently used entries while the cache is
+        larger than its maximum size.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        entries = []
+        evicted = 0
+        for key in os.listdir(self.cache_dir):
+            if key.startswith('.'):
+                continue
+            entry_dir = os.path.join(self.cache_dir, key)
+            entry = self.__read_entry(entry_dir)
+            if entry is None or self.__is_expired(entry):
+                evicted += self.__remove(entry_dir)
+            else:
+                entries.append((entry.get('accessed_at', 0), entry.get('size', 0), entry_dir))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _accessed_at, entry_size, entry_dir in sorted(entries):
+            if size <= self.max_size_bytes:
+                break
+            evicted += self.__remove(entry_dir)
+            size -= entry_size
+
+        return evicted
+
+    def __is_expired(self, entry: Dict) -> bool:
+        if not self.max_age_seconds:
+            return False
+        created_at = entry.get('created_at', 0)
+        return datetime.utcnow().timestamp() - created_at > self.max_age_seconds
+
+    def __read_entry(self, entry_dir: str) -> Optional[Dict]:
+        try:
+            with open(os.path.join(entry_dir, ENTRY_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def __remove(self, entry_dir: str) -> int:
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        block_output_cache_stats.increment('evictions')
+        return 1
+
+    def __write_entry(self, entry_dir: str, entry: Dict) -> None:
+        temp_file_path = os.path.join(entry_dir, f'{ENTRY_FILE}.{uuid.uuid4().hex}.tmp')
+        with open(temp_file_path, 'w') as f:
+            json.dump(entry, f)
+        os.replace(temp_file_path, os.path.join(entry_dir, ENTRY_FILE))
@@ -8,6 +8,9 @@ import pytz
 from mage_ai.data_preparation.executors.block_executor import BlockExecutor
 from mage_ai.data_preparation.logging.logger import DictLogger
 from mage_ai.data_preparation.logging.logger_manager_factory import LoggerManagerFactory
+from mage_ai.data_preparation.models.block.dynamic.child import (
+    create_next_dynamic_child_block_runs,
+)
 from mage_ai.data_preparation.models.pipeline import Pipeline
 from mage_ai.orchestration.db.models.schedules import BlockRun, PipelineRun
 from mage_ai.shared.hash import merge_dict
@@ -138,6 +141,11 @@ class PipelineExecutor:
         block_run_outputs_cache = dict()
 
         while not pipeline_run.all_blocks_completed(allow_blocks_to_fail):
+            create_next_dynamic_child_block_runs(
+                self.pipeline,
+                pipeline_run.block_runs,
+                execution_partition=self.execution_partition,
+            )
             # Update the statuses of the block runs to CONDITION_FAILED or UPSTREAM_FAILED.
             pipeline_run.update_block_run_statuses(pipeline_run.initial_block_runs)
             executable_block_runs = pipeline_run.executable_block_runs(
@@ -2,6 +2,7 @@ import asyncio
 import copy
 import logging
 import os
+import time
 import traceback
 from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime
@@ -24,6 +25,8 @@ from mage_ai.shared.hash import merge_dict
 from mage_ai.shared.retry import retry
 from mage_ai.usage_statistics.logger import UsageStatisticLogger
 
+COPY_METRICS_LOG_INTERVAL = 60
+
 
 class StreamingPipelineExecutor(PipelineExecutor):
     def __init__(self, pipeline: Pipeline, **kwargs):
@@ -31,6 +34,9 @@ class StreamingPipelineExecutor(PipelineExecutor):
         # TODO: Support custom log destination for streaming pipelines
         self.parse_and_validate_blocks()
         self.retry_metadata = dict(attempts=0)
+        # Time spent copying the input of each downstream block, keyed by block UUID
+        self.copy_metrics = dict()
+        self.copy_metrics_logged_at = time.time()
 
     def parse_and_validate_blocks(self):
         """
@@ -142,6 +148,7 @@ class StreamingPipelineExecutor(PipelineExecutor):
         pipeline_run_id: int = None,
 
     ):
+        from mage_ai.streaming.sinks.pipelined_writer import PipelinedSinkWriter
         from mage_ai.streaming.sinks.sink_factory import SinkFactory
         from mage_ai.streaming.sources.base import SourceConsumeMethod
         from mage_ai.streaming.sources.source_factory import SourceFactory
@@ -149,6 +156,12 @@ class StreamingPipelineExecutor(PipelineExecutor):
         if global_vars is None:
             global_vars = dict()
 
+        streaming_settings = self.pipeline.settings.streaming if self.pipeline.settings else None
+        copy_on_write = bool(streaming_settings and streaming_settings.copy_on_write)
+        pipelined_sink_writes = bool(
+            streaming_settings and streaming_settings.pipelined_sink_writes
+        )
+
         # Initialize source block
         if self.source_block.language == BlockLanguage.PYTHON:
             source = SourceFactory.get_python_source(
@@ -167,6 +180,7 @@ class StreamingPipelineExecutor(PipelineExecutor):
                     self.pipeline.pipeline_variables_dir,
                     'streaming_checkpoint',
                 ),
+                commit_offsets_on_ack=pipelined_sink_writes,
             )
 
         # Initialize destination blocks
@@ -180,6 +194,22 @@ class StreamingPipelineExecutor(PipelineExecutor):
                 ),
             )
 
+        if pipelined_sink_writes and not source.supports_commit_offsets_on_ack:
+            # Writing asynchronously would acknowledge the messages before they're written.
+            self.logger.warning(
+                f'{type(source).__name__} doesn\'t support committing offsets after the sinks '
+                'acknowledge a batch, sinks are written synchronously.',
+                **self.logging_tags,
+            )
+            pipelined_sink_writes = False
+
+        sink_writer = None
+        if pipelined_sink_writes:
+            sink_writer = PipelinedSinkWriter(
+                sinks_by_uuid,
+                max_in_flight_batches=streaming_settings.max_in_flight_batches,
+            )
+
         def __deepcopy(data):
             if data is None:
                 return data
@@ -193,13 +223,35 @@ class StreamingPipelineExecutor(PipelineExecutor):
             except Exception:
                 return copy.copy(data)
 
-        def handle_batch_events_recursively(curr_block, outputs_by_block: Dict, **kwargs):
+        def __input_for(block_uuid: str, data, readonly_input: bool):
+            # In copy on write mode, the output of a block is shared by the downstream blocks
+            # that declare they only read their input, so no block (or sink thread still writing
+            # the batch) sees the changes made by another. Every other block gets a deep copy.
+            if copy_on_write and readonly_input:
+                return data
+
+            start_time = time.time()
+            data_copy = __deepcopy(data)
+            self.__record_copy(block_uuid, data, time.time() - start_time)
+
+            return data_copy
+
+        def handle_batch_events_recursively(
+            curr_block,
+            outputs_by_block: Dict,
+            sink_writes: List = None,
+            **kwargs,
+        ):
             curr_block_output = outputs_by_block[curr_block.uuid]
             for downstream_block in curr_block.downstream_blocks:
                 if downstream_block.type == BlockType.TRANSFORMER:
                     execute_block_kwargs = dict(
                         global_vars=kwargs,
-                        input_args=[__deepcopy(curr_block_output)],
+                        input_args=[__input_for(
+                            downstream_block.uuid,
+                            curr_block_output,
+                            (downstream_block.configuration or {}).get('readonly_input', False),
+                        )],
                         logger=self.logger,
                     )
                     if build_block_output_stdout:
@@ -210,46 +262,50 @@ class StreamingPipelineExecutor(PipelineExecutor):
                             **execute_block_kwargs,
                     )['output']
                 elif downstream_block.type == BlockType.DATA_EXPORTER:
-                    sinks_by_uuid[downstream_block.uuid].batch_write(
-                        __deepcopy(curr_block_output))
+                    sink = sinks_by_uuid[downstream_block.uuid]
+                    data = __input_for(
+                        downstream_block.uuid,
+                        curr_block_output,
+                        not sink.mutates_messages,
+                    )
+                    if sink_writes is not None:
+                        sink_writes.append((downstream_block.uuid, data))
+                    else:
+                        sink.batch_write(data)
                 if downstream_block.downstream_blocks:
                     handle_batch_events_recursively(
                         downstream_block,
                         outputs_by_block,
+                        sink_writes=sink_writes,
                         **kwargs,
                     )
 
-        def handle_batch_events(messages: List[Union[Dict, str]], **kwargs):
+        def handle_messages(messages: List[Union[Dict, str]], **kwargs):
             # Handle the events with DFS
-
             outputs_by_block = dict()
             outputs_by_block[self.source_block.uuid] = messages
+            sink_writes = [] if sink_writer else None
 
             handle_batch_events_recursively(
                 self.source_block,
                 outputs_by_block,
+                sink_writes=sink_writes,
                 **merge_dict(global_vars, kwargs),
             )
+            self.__log_copy_metrics()
 
-        async def handle_event_async(message, **kwargs):
-            outputs_by_block = dict()
-            outputs_by_block[self.source_block.uuid] = [message]
+            if sink_writer:
+                # The source commits the offsets of the batch once the future is resolved.
+                return sink_writer.submit(sink_writes)
 
-            handle_batch_events_recursively(
-                self.source_block,
-                outputs_by_block,
-                **merge_dict(global_vars, kwargs),
-            )
+        def handle_batch_events(messages: List[Union[Dict, str]], **kwargs):
+            return handle_messages(messages, **kwargs)
 
-        def handle_event(message, **kwargs):
-            outputs_by_block = dict()
-            outputs_by_block[self.source_block.uuid] = [message]
+        async def handle_event_async(message, **kwargs):
+            return handle_messages([message], **kwargs)
 
-            handle_batch_events_recursively(
-                self.source_block,
-                outputs_by_block,
-                **merge_dict(global_vars, kwargs),
-            )
+        def handle_event(message, **kwargs):
+            return handle_messages([message], **kwargs)
 
         # Long running method
         try:
@@ -263,11 +319,39 @@ class StreamingPipelineExecutor(PipelineExecutor):
                     asyncio.run(source.read_async(handler=handle_event_async))
             elif source.consume_method == SourceConsumeMethod.READ:
                 source.read(handler=handle_event)
+
+            if sink_writer:
+                sink_writer.flush()
         finally:
+            if sink_writer:
+                # Wait for the batches in flight so that their offsets can be committed.
+                sink_writer.close()
             source.destroy()
             for sink in sinks_by_uuid.values():
                 sink.destroy()
 
+    def __record_copy(self, block_uuid: str, data, duration: float) -> None:
+        metrics = self.copy_metrics.get(block_uuid)
+        if metrics is None:
+            metrics = dict(copies=0, copied_messages=0, copy_time=0.0)
+            self.copy_metrics[block_uuid] = metrics
+        metrics['copies'] += 1
+        metrics['copied_messages'] += len(data) if type(data) is list else 1
+        metrics['copy_time'] += duration
+
+    def __log_copy_metrics(self) -> None:
+        if not self.copy_metrics or \
+                time.time() - self.copy_metrics_logged_at < COPY_METRICS_LOG_INTERVAL:
+            return
+        self.copy_metrics_logged_at = time.time()
+        self.logger.info(
+            'Time spent copying block inputs: ' + ', '.join(
+                f'{block_uuid}={round(m["copy_time"], 3)}s ({m["copied_messages"]} messages)'
+                for block_uuid, m in self.copy_metrics.items()
+            ),
+            **merge_dict(self.logging_tags, dict(copy_metrics=self.copy_metrics)),
+        )
+
     @safe_db_query
     def __update_pipeline_run_status(
         self,
@@ -1544,27 +1544,58 @@ class Block(
                         pipeline_uuid=self.pipeline_uuid,
                     )
 
-                output = self.execute_block(
-                    block_run_outputs_cache=block_run_outputs_cache,
-                    build_block_output_stdout=build_block_output_stdout,
-                    custom_code=custom_code,
-                    execution_partition=execution_partition,
-                    from_notebook=from_notebook,
-                    global_vars=global_vars,
-                    logger=logger,
-                    logging_tags=logging_tags,
-                    input_from_output=input_from_output,
-                    runtime_arguments=runtime_arguments,
-                    dynamic_block_index=dynamic_block_index,
-                    dynamic_block_indexes=dynamic_block_indexes,
-                    dynamic_upstream_block_uuids=dynamic_upstream_block_uuids,
-                    run_settings=run_settings,
-                    data_integration_runtime_settings=data_integration_runtime_settings,
-                    execution_partition_previous=execution_partition_previous,
-                    metadata=metadata,
-                    override_outputs=override_outputs,
-                    **kwargs,
-                )
+                # Blocks whose code, global variables and upstream outputs didn't change since
+                # their outputs were cached aren't executed again.
+                output_cache = None
+                output_cache_key = None
+                if (
+                    store_variables
+                    and input_from_output is None
+                    and dynamic_block_index is None
+                    and self.variable_manager is not None
+                ):
+                    output_cache = self.variable_manager.block_output_cache
+                if output_cache is not None and output_cache.should_cache(self):
+                    output_cache_key = output_cache.build_key(
+                        self,
+                        custom_code=custom_code,
+                        execution_partition=execution_partition,
+                        global_vars=global_vars,
+                    )
+
+                output = None
+                if output_cache_key:
+                    output = self.__restore_cached_output(
+                        output_cache,
+                        output_cache_key,
+                        execution_partition=execution_partition,
+                        logger=logger,
+                        logging_tags=logging_tags,
+                    )
+                output_restored = output is not None
+
+                if not output_restored:
+                    output = self.execute_block(
+                        block_run_outputs_cache=block_run_outputs_cache,
+                        build_block_output_stdout=build_block_output_stdout,
+                        custom_code=custom_code,
+                        execution_partition=execution_partition,
+                        from_notebook=from_notebook,
+                        global_vars=global_vars,
+                        logger=logger,
+                        logging_tags=logging_tags,
+                        input_from_output=input_from_output,
+                        runtime_arguments=runtime_arguments,
+                        dynamic_block_index=dynamic_block_index,
+                        dynamic_block_indexes=dynamic_block_indexes,
+                        dynamic_upstream_block_uuids=dynamic_upstream_block_uuids,
+                        run_settings=run_settings,
+                        data_integration_runtime_settings=data_integration_runtime_settings,
+                        execution_partition_previous=execution_partition_previous,
+                        metadata=metadata,
+                        override_outputs=override_outputs,
+                        **kwargs,
+                    )
 
                 if self.configuration and self.configuration.get('disable_query_preprocessing'):
                     output = dict(output=None)
@@ -1604,11 +1635,21 @@ class Block(
                                 __uuid='store_variables',
                             )
 
-                            if self._store_variables_in_block_function and isinstance(
-                                variable_mapping, dict
+                            if (
+                                self._store_variables_in_block_function
+                                and isinstance(variable_mapping, dict)
+                                and not output_restored
                             ):
                                 self._store_variables_in_block_function(variable_mapping)
 
+                                if output_cache_key:
+                                    output_cache.store(
+                                        self,
+                                        output_cache_key,
+                                        list(variable_mapping.keys()),
+                                        execution_partition=execution_partition,
+                                    )
+
                         except ValueError as e:
                             if str(e) == 'Circular reference detected':
                                 raise ValueError(
@@ -1667,6 +1708,52 @@ class Block(
                 return __execute()
         return __execute()
 
+    def __restore_cached_output(
+        self,
+        output_cache,
+        output_cache_key: str,
+        execution_partition: str = None,
+        logger: Logger = None,
+        logging_tags: Dict = None,
+    ) -> Optional[Dict]:
+        variable_uuids = output_cache.restore(
+            self,
+            output_cache_key,
+            execution_partition=execution_partition,
+        )
+        if variable_uuids is None:
+            return None
+
+        # The data of the outputs is read in the order of the outputs, like the outputs returned
+        # by executing the block, since they're passed to the downstream blocks and the tests.
+        variable_uuids = set(variable_uuids)
+        outputs = [
+            self.variable_manager.get_variable_object(
+                self.pipeline_uuid,
+                self.uuid,
+                variable_uuid,
+                partition=execution_partition,
+            ).read_data()
+            for variable_uuid in self.get_variables_by_block(
+                self.uuid,
+                partition=execution_partition,
+            )
+            if variable_uuid in variable_uuids
+            and is_output_variable(variable_uuid, include_df=False)
+        ]
+
+        message = f'Block {self.uuid} was not executed, its outputs were restored from the cache.'
+        if isinstance(logger, DictLogger):
+            logger.info(message, **merge_dict(logging_tags or {}, dict(
+                block_output_cache_key=output_cache_key,
+            )))
+        elif logger is not None:
+            logger.info(message)
+        else:
+            print(message)
+
+        return dict(output=outputs)
+
     def post_process_output(self, output: Dict) -> List:
         return output['output'] or []
 
@@ -3380,6 +3467,7 @@ class Block(
 
                     analysis = clean_data(
                         data_for_analysis,
+                        column_types_cache_key=self.__column_types_cache_key(uuid, data),
                         df_original=data,
                         transform=False,
                         verbose=False,
@@ -3419,6 +3507,21 @@ class Block(
                     disable_variable_type_inference=True,
                 )
 
+    def __column_types_cache_key(self, variable_uuid: str, data: pd.DataFrame) -> Optional[str]:
+        """
+        Key the column types inferred for a block output by the output and the fingerprint of
+        its dataframe in memory, so that analyzing the same data again skips inferring the
+        column types whether or not the output was written to a file.
+        """
+        from mage_ai.data_cleaner.column_types.column_type_detector import (
+            dataframe_fingerprint,
+        )
+
+        fingerprint = dataframe_fingerprint(data)
+        if fingerprint is None:
+            return None
+        return f'{self.pipeline_uuid}:{self.uuid}:{variable_uuid}:{fingerprint}'
+
     def set_global_vars(self, global_vars: Dict) -> None:
         self.global_vars = global_vars
         for upstream_block in self.upstream_blocks:
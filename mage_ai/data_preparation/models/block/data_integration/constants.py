@@ -49,11 +49,13 @@ CONFIG_KEY_CLEAN_UP_INPUT_FILE = 'clean_up_input_file'
 EXECUTION_PARTITION_FROM_NOTEBOOK = '_from_notebook'
 
 OUTPUT_TYPE_RECORD = 'RECORD'
+OUTPUT_TYPE_RECORD_BATCH = 'RECORD_BATCH'
 OUTPUT_TYPE_SCHEMA = 'SCHEMA'
 OUTPUT_TYPE_STATE = 'STATE'
 TYPE_OBJECT = 'object'
 
 KEY_BOOKMARK_PROPERTIES = 'bookmark_properties'
+KEY_DATA = 'data'
 KEY_DESTINATION_TABLE = 'destination_table'
 KEY_DISABLE_COLUMN_TYPE_CHECK = 'disable_column_type_check'
 KEY_KEY_PROPERTIES = 'key_properties'
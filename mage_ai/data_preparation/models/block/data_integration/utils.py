@@ -13,11 +13,15 @@ from mage_ai.data_integrations.logger.utils import (
     print_log_from_line,
     print_logs_from_output,
 )
-from mage_ai.data_integrations.utils.config import get_batch_fetch_limit
+from mage_ai.data_integrations.utils.config import (
+    get_batch_fetch_limit,
+    get_record_batch_format,
+)
 from mage_ai.data_integrations.utils.parsers import parse_logs_and_json
 from mage_ai.data_preparation.models.block.data_integration.constants import (
     EXECUTION_PARTITION_FROM_NOTEBOOK,
     KEY_BOOKMARK_PROPERTIES,
+    KEY_DATA,
     KEY_DESTINATION_TABLE,
     KEY_DISABLE_COLUMN_TYPE_CHECK,
     KEY_KEY_PROPERTIES,
@@ -35,6 +39,7 @@ from mage_ai.data_preparation.models.block.data_integration.constants import (
     KEY_VALUE,
     MAX_QUERY_STRING_SIZE,
     OUTPUT_TYPE_RECORD,
+    OUTPUT_TYPE_RECORD_BATCH,
     OUTPUT_TYPE_SCHEMA,
     OUTPUT_TYPE_STATE,
     REPLICATION_METHOD_INCREMENTAL,
@@ -144,6 +149,63 @@ def source_module_file_path(data_integration_uuid: str) -> str:
             return absolute_path
 
 
+def destination_record_batch_formats(data_integration_uuid: str) -> List[str]:
+    from mage_integrations.destinations.base import Destination
+
+    mod = destination_module(data_integration_uuid)
+    destination_classes = [
+        v for v in vars(mod).values()
+        if isinstance(v, type) and issubclass(v, Destination) and v.__module__ == mod.__name__
+    ]
+    if not destination_classes:
+        return []
+
+    return list(destination_classes[0].record_batch_formats)
+
+
+def negotiate_record_batch_format(block, config: Dict) -> Union[str, None]:
+    """
+    A source only writes its records in RECORD_BATCH messages when its config has a
+    record_batch_format and every destination block downstream supports that format.
+    Other blocks read the source output with convert_outputs_to_data, which decodes the batches.
+    """
+    record_batch_format = get_record_batch_format(config or {})
+    if not record_batch_format:
+        return None
+
+    for downstream_block in block.downstream_blocks:
+        if not downstream_block.is_destination():
+            continue
+
+        settings = downstream_block.get_data_integration_settings(
+            data_integration_uuid_only=True,
+        ) or {}
+        data_integration_uuid = settings.get('data_integration_uuid')
+
+        try:
+            record_batch_formats = destination_record_batch_formats(data_integration_uuid)
+        except Exception:
+            record_batch_formats = []
+
+        if record_batch_format not in record_batch_formats:
+            return None
+
+    return record_batch_format
+
+
+def get_records_from_output_row(row: Dict) -> List[Dict]:
+    row_type = row.get(KEY_TYPE)
+
+    if OUTPUT_TYPE_RECORD == row_type and KEY_RECORD in row:
+        return [row[KEY_RECORD]]
+    elif OUTPUT_TYPE_RECORD_BATCH == row_type:
+        from mage_integrations.utils.record_batch import decode_record_batch
+
+        return decode_record_batch(row[KEY_DATA])
+
+    return []
+
+
 def extract_stream_ids_from_streams(streams: List[Dict]) -> List[str]:
     return [x['tap_stream_id'] for x in streams]
 
@@ -340,11 +402,12 @@ def get_state_data(
                     row_type = row.get(KEY_TYPE)
 
                     if include_record and \
-                            OUTPUT_TYPE_RECORD == row_type and \
-                            KEY_RECORD in row and \
+                            row_type in [OUTPUT_TYPE_RECORD, OUTPUT_TYPE_RECORD_BATCH] and \
                             (not stream_id or stream_id == row.get(KEY_STREAM)):
 
-                        record = row[KEY_RECORD]
+                        records = get_records_from_output_row(row)
+                        if records:
+                            record = records[-1]
                     elif OUTPUT_TYPE_STATE == row_type and KEY_VALUE in row:
                         # If it finds a state again even before it find a record, break.
                         if state_data is not None:
@@ -533,6 +596,13 @@ def execute_data_integration(
                 ),
             ]
 
+        record_batch_format = negotiate_record_batch_format(block, config)
+        if record_batch_format:
+            args += [
+                '--record_batch_format',
+                record_batch_format,
+            ]
+
         if len(selected_streams) >= 1:
             args += [
                 '--selected_streams_json',
@@ -1132,10 +1202,18 @@ def convert_outputs_to_data(
                                 break
 
                             row = json.loads(line)
-                            record = row.get('record')
-                            if record and stream_id == row.get('stream'):
-                                rows.append([record.get(col) for col in columns_to_select])
-                                row_count += 1
+                            if stream_id != row.get('stream'):
+                                continue
+
+                            if OUTPUT_TYPE_RECORD_BATCH == row.get(KEY_TYPE):
+                                records = get_records_from_output_row(row)
+                            else:
+                                records = [row.get('record')]
+
+                            for record in records:
+                                if record:
+                                    rows.append([record.get(col) for col in columns_to_select])
+                                    row_count += 1
                         except json.JSONDecodeError:
                             pass
 
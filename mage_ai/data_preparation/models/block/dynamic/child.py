@@ -5,24 +5,37 @@ from typing import Dict, List
 import pandas as pd
 
 from mage_ai.data_preparation.models.block.dynamic.utils import (
-    build_combinations_for_dynamic_child,
+    count_combinations,
+    get_dynamic_counts_for_dynamic_child,
     is_dynamic_block,
     is_dynamic_block_child,
+    iter_combinations_for_dynamic_child,
 )
 from mage_ai.data_preparation.models.block.dynamic.variables import (
     get_outputs_for_dynamic_block,
     get_outputs_for_dynamic_child,
 )
-from mage_ai.orchestration.db.models.schedules import BlockRun
+from mage_ai.orchestration.db.models.schedules import BlockRun, BlockRunUnitOfWork
+from mage_ai.settings.server import DYNAMIC_CHILD_BLOCK_RUN_WINDOW
+from mage_ai.shared.hash import merge_dict
+
+UNFINISHED_STATUSES = [
+    BlockRun.BlockRunStatus.INITIAL,
+    BlockRun.BlockRunStatus.QUEUED,
+    BlockRun.BlockRunStatus.RUNNING,
+]
 
 
 class DynamicChildController:
-    def __init__(self, block, block_run_id: int):
+    def __init__(self, block, block_run_id: int, block_run: BlockRun = None):
         self.block = block
         self.block_run_id = block_run_id
-        self._block_run = None
+        self._block_run = block_run
         self._block_runs = None
         self._pipeline_run = None
+        self._counts_by_upstream_block_uuid = {}
+        self._lazy_variables_by_upstream_block_uuid = {}
+        self._metadata_by_upstream_block_uuid = {}
 
     def __getattr__(self, name):
         val = getattr(self.block, name)
@@ -70,20 +83,96 @@ class DynamicChildController:
         logger: Logger = None,
         logging_tags: Dict = None,
         **kwargs,
-    ) -> List[Dict]:
-        pipeline = self.block.pipeline
-        upstream_blocks = self.block.upstream_blocks
+    ) -> List[BlockRun]:
+        """
+        Create the block runs of the dynamic child block. When DYNAMIC_CHILD_BLOCK_RUN_WINDOW
+        is set, only the first window of block runs is created; the scheduler creates the
+        others with create_next_block_runs as they finish.
+        """
+        self.__load_upstream_outputs(
+            execution_partition=execution_partition,
+            logging_tags=logging_tags,
+        )
 
-        block_runs_by_block_uuid = {}
-        for block_run in self.block_runs():
-            block = pipeline.get_block(block_run.block_uuid)
-            if block.uuid not in block_runs_by_block_uuid:
-                block_runs_by_block_uuid[block.uuid] = []
-            block_runs_by_block_uuid[block.uuid].append(block_run)
-
-        counts_by_upstream_block_uuid = {}
-        metadata_by_upstream_block_uuid = {}
-        for upstream_block in upstream_blocks:
+        tries = 0
+        dynamic_counts = None
+        while dynamic_counts is None:
+            try:
+                dynamic_counts = get_dynamic_counts_for_dynamic_child(
+                    self.block,
+                    execution_partition=execution_partition,
+                )
+            except Exception as err:
+                tries += 1
+                if tries >= 12:
+                    raise err
+                time.sleep(10)
+
+        total = count_combinations(dynamic_counts)
+        stop = total
+        if DYNAMIC_CHILD_BLOCK_RUN_WINDOW > 0:
+            stop = min(total, DYNAMIC_CHILD_BLOCK_RUN_WINDOW)
+
+        return self.__create_block_runs(dynamic_counts, 0, stop)
+
+    def create_next_block_runs(
+        self,
+        execution_partition: str = None,
+        logging_tags: Dict = None,
+    ) -> List[BlockRun]:
+        """
+        Create the next block runs of the dynamic child block, up to the number of block runs
+        that finished since the last ones were created.
+        """
+        block_run = self.block_run()
+        counter = (block_run.metrics or {}).get('dynamic_children') or {}
+        created = counter.get('created') or 0
+        total = counter.get('total') or 0
+        if created >= total:
+            return []
+
+        stop = total
+        if DYNAMIC_CHILD_BLOCK_RUN_WINDOW > 0:
+            prefix = f'{self.block.uuid}:'
+            unfinished_count = len([
+                br for br in self.block_runs()
+                if br.id != block_run.id and
+                br.block_uuid.startswith(prefix) and
+                br.status in UNFINISHED_STATUSES
+            ])
+            capacity = DYNAMIC_CHILD_BLOCK_RUN_WINDOW - unfinished_count
+            if capacity <= 0:
+                return []
+            stop = min(total, created + capacity)
+
+        # The upstream blocks completed before the dynamic child block ran, so their outputs
+        # are read without waiting.
+        self.__load_upstream_outputs(
+            execution_partition=execution_partition,
+            logging_tags=logging_tags,
+            max_tries=1,
+        )
+
+        return self.__create_block_runs(
+            counter.get('dynamic_counts') or get_dynamic_counts_for_dynamic_child(
+                self.block,
+                execution_partition=execution_partition,
+            ),
+            created,
+            stop,
+        )
+
+    def __load_upstream_outputs(
+        self,
+        execution_partition: str = None,
+        logging_tags: Dict = None,
+        max_tries: int = 12,
+    ) -> None:
+        self._counts_by_upstream_block_uuid = {}
+        self._lazy_variables_by_upstream_block_uuid = {}
+        self._metadata_by_upstream_block_uuid = {}
+
+        for upstream_block in self.block.upstream_blocks:
             is_dynamic_child = is_dynamic_block_child(upstream_block)
             is_dynamic = is_dynamic_block(upstream_block)
 
@@ -92,7 +181,7 @@ class DynamicChildController:
 
                 tries = 0
                 count = 0
-                while tries < 12 and count == 0:
+                while tries < max_tries and count == 0:
                     # If this block tries to get the data too soon, it’ll return empty.
                     lazy_variable_controller = get_outputs_for_dynamic_child(
                         upstream_block,
@@ -104,19 +193,22 @@ class DynamicChildController:
                         count = len(lazy_variable_controller)
 
                     if count == 0:
-                        time.sleep(10)
                         tries += 1
+                        if tries < max_tries:
+                            time.sleep(10)
 
-                counts_by_upstream_block_uuid[upstream_block.uuid] = count
+                self._counts_by_upstream_block_uuid[upstream_block.uuid] = count
 
-                if is_dynamic:
-                    metadata_by_upstream_block_uuid[upstream_block.uuid] = [
-                        lazy_var_set.read_metadata() for lazy_var_set in lazy_variable_controller
-                    ]
+                if is_dynamic and lazy_variable_controller is not None:
+                    # The metadata is read for the block runs being created.
+                    self._lazy_variables_by_upstream_block_uuid[upstream_block.uuid] = \
+                        lazy_variable_controller
+                    self._metadata_by_upstream_block_uuid[upstream_block.uuid] = {}
             elif is_dynamic:
                 tries = 0
                 count = 0
-                while tries < 12 and count == 0:
+                metadata = None
+                while tries < max_tries and count == 0:
                     # If this block tries to get the data too soon, it’ll return empty.
                     values, metadata = get_outputs_for_dynamic_block(
                         upstream_block,
@@ -129,60 +221,96 @@ class DynamicChildController:
                             count = len(values)
 
                     if count == 0:
-                        time.sleep(10)
                         tries += 1
+                        if tries < max_tries:
+                            time.sleep(10)
+
+                self._counts_by_upstream_block_uuid[upstream_block.uuid] = count
+                if metadata:
+                    self._metadata_by_upstream_block_uuid[upstream_block.uuid] = \
+                        dict(enumerate(metadata))
+
+    def __upstream_metadata(self, upstream_block_uuid: str, parent_index: int) -> Dict:
+        metadata = self._metadata_by_upstream_block_uuid.get(upstream_block_uuid)
+        if metadata is None:
+            return None
+
+        if parent_index not in metadata:
+            lazy_variable_controller = self._lazy_variables_by_upstream_block_uuid.get(
+                upstream_block_uuid,
+            )
+            if lazy_variable_controller is None or \
+                    parent_index >= len(lazy_variable_controller):
+                return None
+            metadata[parent_index] = lazy_variable_controller[parent_index].read_metadata()
 
-                counts_by_upstream_block_uuid[upstream_block.uuid] = count
-                metadata_by_upstream_block_uuid[upstream_block.uuid] = metadata
-
-        tries = 0
-        combos = None
-        while tries < 12 and combos is None:
-            try:
-                combos = build_combinations_for_dynamic_child(
-                    self.block,
-                    execution_partition=execution_partition,
-                )
-            except Exception:
-                time.sleep(10)
-                tries += 1
-
-        block_run_dicts = []
-
-        for combo in combos:
-            dynamic_block_index = combo.get('dynamic_block_index')
-
-            block_run_block_uuid = dynamic_block_index
-            dynamic_upstream_block_uuids = []
-            upstream_blocks_from_metadata = []
+        return metadata.get(parent_index)
 
-            for upstream_block in upstream_blocks:
-                is_dynamic_child = is_dynamic_block_child(upstream_block)
-                is_dynamic = is_dynamic_block(upstream_block)
+    def __create_block_runs(
+        self,
+        dynamic_counts: List[int],
+        start: int,
+        stop: int,
+    ) -> List[BlockRun]:
+        pipeline = self.block.pipeline
+        upstream_blocks = self.block.upstream_blocks
+        block_run = self.block_run()
+        pipeline_run = self.pipeline_run()
 
-                if is_dynamic_child or is_dynamic:
-                    count = counts_by_upstream_block_uuid.get(upstream_block.uuid)
+        upstream_dynamic_child_uuids = set(
+            b.uuid for b in upstream_blocks if is_dynamic_block_child(b)
+        )
+        block_runs_by_block_uuid = {}
+        for br in sorted(self.block_runs(), key=lambda br: br.id):
+            block = pipeline.get_block(br.block_uuid)
+            if block is None or block.uuid not in upstream_dynamic_child_uuids:
+                continue
+            if br.block_uuid != block.uuid:
+                if block.uuid not in block_runs_by_block_uuid:
+                    block_runs_by_block_uuid[block.uuid] = []
+                block_runs_by_block_uuid[block.uuid].append(br)
+
+        block_runs_by_uuid = {br.block_uuid: br for br in self.block_runs()}
+        block_runs = []
 
-                    if count is not None and count >= 1:
-                        parent_index = dynamic_block_index % count
+        with BlockRunUnitOfWork() as unit_of_work:
+            for combo in iter_combinations_for_dynamic_child(
+                self.block,
+                dynamic_counts=dynamic_counts,
+                start=start,
+                stop=stop,
+            ):
+                dynamic_block_index = combo.get('dynamic_block_index')
+
+                block_run_block_uuid = dynamic_block_index
+                dynamic_upstream_block_uuids = []
+                upstream_blocks_from_metadata = []
+
+                for upstream_block in upstream_blocks:
+                    is_dynamic_child = is_dynamic_block_child(upstream_block)
+                    is_dynamic = is_dynamic_block(upstream_block)
+
+                    if is_dynamic_child or is_dynamic:
+                        count = self._counts_by_upstream_block_uuid.get(upstream_block.uuid)
+
+                        if count is not None and count >= 1:
+                            parent_index = dynamic_block_index % count
+
+                            if is_dynamic_child:
+                                upstream_block_runs = block_runs_by_block_uuid.get(
+                                    upstream_block.uuid,
+                                ) or []
+                                # This errors list index out of range
+                                if parent_index < len(upstream_block_runs):
+                                    dynamic_upstream_block_uuids.append(
+                                        upstream_block_runs[parent_index].block_uuid
+                                    )
 
-                        if is_dynamic_child:
-                            block_runs = block_runs_by_block_uuid[upstream_block.uuid]
-                            block_runs = sorted(
-                                [br for br in block_runs if br.block_uuid != upstream_block.uuid],
-                                key=lambda br: br.id,
+                            metadata = self.__upstream_metadata(
+                                upstream_block.uuid,
+                                parent_index,
                             )
-                            # This errors list index out of range
-                            if parent_index < len(block_runs):
-                                dynamic_upstream_block_uuids.append(
-                                    block_runs[parent_index].block_uuid
-                                )
-
-                        if metadata_by_upstream_block_uuid.get(upstream_block.uuid):
-                            metadata = metadata_by_upstream_block_uuid[upstream_block.uuid]
-                            if parent_index < len(metadata):
-                                metadata = metadata[parent_index]
-
+                            if metadata:
                                 if metadata.get('block_uuid'):
                                     block_run_block_uuid = metadata.get('block_uuid')
 
@@ -191,30 +319,65 @@ class DynamicChildController:
                                         metadata.get('upstream_blocks'),
                                     )
 
-            block_run_dict = dict(
-                dynamic_block_index=dynamic_block_index,
-                dynamic_upstream_block_uuids=dynamic_upstream_block_uuids,
-            )
-
-            if upstream_blocks_from_metadata:
-                block_run_dict['upstream_blocks'] = upstream_blocks_from_metadata
-
-            block_run_dicts.append((
-                f'{self.block.uuid}:{block_run_block_uuid}',
-                block_run_dict,
-            ))
+                block_run_dict = dict(
+                    dynamic_block_index=dynamic_block_index,
+                    dynamic_upstream_block_uuids=dynamic_upstream_block_uuids,
+                )
 
-        block_runs = []
-        pipeline_run = self.pipeline_run()
-        for block_uuid, block_run_dict in block_run_dicts:
-            block_run = pipeline_run.create_block_run(
-                block_uuid,
-                metrics=block_run_dict,
-                skip_if_exists=True,
+                if upstream_blocks_from_metadata:
+                    block_run_dict['upstream_blocks'] = upstream_blocks_from_metadata
+
+                block_uuid = f'{self.block.uuid}:{block_run_block_uuid}'
+                if block_uuid in block_runs_by_uuid:
+                    block_runs.append(block_runs_by_uuid[block_uuid])
+                    continue
+
+                block_runs_by_uuid[block_uuid] = None
+                unit_of_work.create(pipeline_run.id, block_uuid, metrics=block_run_dict)
+
+            unit_of_work.update(
+                block_run,
+                metrics=merge_dict(block_run.metrics or {}, dict(
+                    dynamic_children=dict(
+                        created=stop,
+                        dynamic_counts=dynamic_counts,
+                        total=count_combinations(dynamic_counts),
+                    ),
+                )),
             )
-            block_runs.append(block_run)
 
-        return block_runs
+        self._block_runs = None
+
+        return [br for br in block_runs if br is not None] + unit_of_work.created_block_runs
 
     def run_tests(self, **kwargs):
         pass
+
+
+def create_next_dynamic_child_block_runs(
+    pipeline,
+    block_runs: List[BlockRun],
+    execution_partition: str = None,
+    logging_tags: Dict = None,
+) -> List[BlockRun]:
+    """
+    Create the next block runs of the dynamic child blocks of a pipeline run that completed
+    and still have block runs to create.
+    """
+    created = []
+    for block_run in block_runs:
+        if BlockRun.BlockRunStatus.COMPLETED != block_run.status or \
+                not block_run.dynamic_children_pending:
+            continue
+
+        block = pipeline.get_block(block_run.block_uuid)
+        if block is None:
+            continue
+
+        controller = DynamicChildController(block, block_run_id=block_run.id, block_run=block_run)
+        created.extend(controller.create_next_block_runs(
+            execution_partition=execution_partition,
+            logging_tags=logging_tags,
+        ))
+
+    return created
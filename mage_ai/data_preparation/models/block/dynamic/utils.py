@@ -2,7 +2,8 @@ import json
 import os
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import reduce
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 import polars as pl
@@ -557,31 +558,15 @@ def create_combinations(combinations: List[Any]) -> List[Any]:
     return [combo for combo in arr if len(combo) == count]
 
 
-def build_combinations_for_dynamic_child(
+def get_dynamic_counts_for_dynamic_child(
     block,
     execution_partition: str = None,
     origin_block: Optional[Any] = None,
-    **kwargs,
-):
-    """
-    kwargs (if from output_display.py)
-        custom_code
-        execution_uuid
-        from_notebook
-        global_vars
-        logger
-        output_messages_to_logs
-        run_settings
-        update_status
-    """
-
+) -> List[int]:
     """
-    A list for each upstream block
-    [
-        [0, 1, 2],
-        [0],
-        [0, 1],
-    ]
+    The number of values for each upstream block, 1 for the upstream blocks that aren't
+    dynamic:
+    [3, 1, 2]
     """
     if origin_block is None:
         origin_block = block
@@ -607,13 +592,13 @@ def build_combinations_for_dynamic_child(
                 """
                 # e.g. 3 combinations aka children were made for the upstream dynamic child block
                 arr = []
-                children_created = build_combinations_for_dynamic_child(
+                children_count = count_combinations_for_dynamic_child(
                     upstream_block,
                     execution_partition=execution_partition,
                     origin_block=origin_block,
                 )
                 if is_dynamic:
-                    for dynamic_block_index in range(len(children_created)):
+                    for dynamic_block_index in range(children_count):
                         count, is_partial_data_readable = get_dynamic_children_count(
                             upstream_block,
                             execution_partition=execution_partition,
@@ -633,7 +618,7 @@ def build_combinations_for_dynamic_child(
                             else:
                                 arr.append(0)
                 else:
-                    arr.extend([idx for idx in range(len(children_created))])
+                    arr.extend([idx for idx in range(children_count)])
             else:
                 count, is_partial_data_readable = get_dynamic_children_count(
                     upstream_block,
@@ -648,43 +633,116 @@ def build_combinations_for_dynamic_child(
                         origin_block=origin_block,
                     )
             if arr is not None and hasattr(arr, '__len__') and len(arr) > 0:
-                dynamic_counts.append([idx for idx in range(len(arr))])
+                dynamic_counts.append(len(arr))
             else:
-                dynamic_counts.append([0])
+                dynamic_counts.append(1)
         else:
-            dynamic_counts.append([0])
+            dynamic_counts.append(1)
 
-    # [[0], [1], [2]]
-    combinations = create_combinations(dynamic_counts)
+    return dynamic_counts
 
-    settings = []
-    for dynamic_block_index, _arr in enumerate(combinations):
-        # dynamic_block_index = 0
-        # arr = [1, 2, 3, 4]
 
-        # dynamic_block_indexes = { 'dynamic_parent': 1 }
-        dynamic_block_indexes = {}
-        for idx, upstream_block in enumerate(block.upstream_blocks):
-            is_dynamic_child = is_dynamic_block_child(upstream_block)
-            is_dynamic = is_dynamic_block(upstream_block)
+def count_combinations(dynamic_counts: List[int]) -> int:
+    """
+    The number of combinations create_combinations returns for a list of ranges with these
+    lengths, without creating them.
+    """
+    if not dynamic_counts:
+        return 0
 
-            # 0 % 3 = 0
-            # 1 % 3 = 1
-            # 2 % 3 = 2
+    return reduce(lambda total, count: total * count, dynamic_counts, 1)
 
-            parent_index = dynamic_block_index % len(dynamic_counts[idx])
 
-            if is_dynamic_child or is_dynamic:
-                dynamic_block_indexes[upstream_block.uuid] = parent_index
+def count_combinations_for_dynamic_child(
+    block,
+    execution_partition: str = None,
+    origin_block: Optional[Any] = None,
+) -> int:
+    return count_combinations(
+        get_dynamic_counts_for_dynamic_child(
+            block,
+            execution_partition=execution_partition,
+            origin_block=origin_block,
+        )
+    )
 
-        settings.append(
-            dict(
-                dynamic_block_index=dynamic_block_index,
-                dynamic_block_indexes=dynamic_block_indexes,
-            )
+
+def iter_combinations_for_dynamic_child(
+    block,
+    execution_partition: str = None,
+    origin_block: Optional[Any] = None,
+    dynamic_counts: Optional[List[int]] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Iterator[Dict]:
+    """
+    Generate the settings of the dynamic child block runs with an index from start to stop,
+    without creating the combinations before them.
+
+    Args:
+        dynamic_counts (List[int], optional): The result of
+            get_dynamic_counts_for_dynamic_child, if it was already read.
+        start (int): The index of the first setting.
+        stop (int, optional): The index after the last setting. Defaults to the number of
+            combinations.
+    """
+    if dynamic_counts is None:
+        dynamic_counts = get_dynamic_counts_for_dynamic_child(
+            block,
+            execution_partition=execution_partition,
+            origin_block=origin_block,
+        )
+
+    total = count_combinations(dynamic_counts)
+    if stop is None or stop > total:
+        stop = total
+
+    upstream_blocks = [
+        (idx, upstream_block.uuid)
+        for idx, upstream_block in enumerate(block.upstream_blocks)
+        if is_dynamic_block_child(upstream_block) or is_dynamic_block(upstream_block)
+    ]
+
+    for dynamic_block_index in range(start, stop):
+        # dynamic_block_indexes = { 'dynamic_parent': 1 }
+        # 0 % 3 = 0
+        # 1 % 3 = 1
+        # 2 % 3 = 2
+        dynamic_block_indexes = {
+            upstream_block_uuid: dynamic_block_index % dynamic_counts[idx]
+            for idx, upstream_block_uuid in upstream_blocks
+        }
+
+        yield dict(
+            dynamic_block_index=dynamic_block_index,
+            dynamic_block_indexes=dynamic_block_indexes,
         )
 
-    return settings
+
+def build_combinations_for_dynamic_child(
+    block,
+    execution_partition: str = None,
+    origin_block: Optional[Any] = None,
+    **kwargs,
+):
+    """
+    kwargs (if from output_display.py)
+        custom_code
+        execution_uuid
+        from_notebook
+        global_vars
+        logger
+        output_messages_to_logs
+        run_settings
+        update_status
+    """
+    return list(
+        iter_combinations_for_dynamic_child(
+            block,
+            execution_partition=execution_partition,
+            origin_block=origin_block,
+        )
+    )
 
 
 @dataclass
@@ -1066,7 +1124,7 @@ def check_all_dynamic_upstreams_completed(
 
         is_dynamic_child = is_dynamic_block_child(upstream_block)
         if is_dynamic_child:
-            combos = build_combinations_for_dynamic_child(
+            combos_count = count_combinations_for_dynamic_child(
                 upstream_block,
                 execution_partition=execution_partition,
             )
@@ -1081,7 +1139,7 @@ def check_all_dynamic_upstreams_completed(
                 and br.status == BlockRun.BlockRunStatus.COMPLETED
             ]
 
-            if len(list(selected)) < len(combos) + 1:
+            if len(list(selected)) < combos_count + 1:
                 return False
 
         return all([
@@ -255,7 +255,7 @@ def get_dynamic_child_block_indexes(
     execution_partition: Optional[str] = None,
 ) -> List[int]:
     from mage_ai.data_preparation.models.block.dynamic.utils import (
-        build_combinations_for_dynamic_child,
+        count_combinations_for_dynamic_child,
     )
 
     """
@@ -264,11 +264,9 @@ def get_dynamic_child_block_indexes(
         1/
         2/
     """
-    count = len(
-        build_combinations_for_dynamic_child(
-            block,
-            execution_partition=execution_partition,
-        )
+    count = count_combinations_for_dynamic_child(
+        block,
+        execution_partition=execution_partition,
     )
 
     return [i for i in range(count)]
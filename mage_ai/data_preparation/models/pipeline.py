@@ -49,6 +49,7 @@ from mage_ai.data_preparation.models.errors import (
     SerializationError,
 )
 from mage_ai.data_preparation.models.file import File
+from mage_ai.data_preparation.models.pipelines.index import get_pipeline_index
 from mage_ai.data_preparation.models.pipelines.models import PipelineSettings
 from mage_ai.data_preparation.models.project import Project
 from mage_ai.data_preparation.models.project.constants import FeatureUUID
@@ -75,12 +76,18 @@ from mage_ai.orchestration.notification.sender import NotificationSender
 from mage_ai.settings.platform import build_repo_path_for_all_projects
 from mage_ai.settings.platform.constants import project_platform_activated
 from mage_ai.settings.repo import get_repo_path
+from mage_ai.settings.server import PIPELINE_INDEX
 from mage_ai.shared.array import find
 from mage_ai.shared.hash import extract, ignore_keys, index_by, merge_dict
 from mage_ai.shared.io import safe_write, safe_write_async
 from mage_ai.shared.path_fixer import remove_base_repo_path
 from mage_ai.shared.strings import format_enum
 from mage_ai.shared.utils import clean_name
+from mage_ai.shared.yaml import (
+    invalidate_yaml_file,
+    load_yaml_file,
+    load_yaml_file_async,
+)
 
 CYCLE_DETECTION_ERR_MESSAGE = 'A cycle was detected in this pipeline'
 
@@ -295,7 +302,8 @@ class Pipeline:
         # Copy pipeline files from template folder
         copy_template_directory('pipeline', pipeline_path)
         # Update metadata.yaml with pipeline config
-        with open(os.path.join(pipeline_path, PIPELINE_CONFIG_FILE), 'w') as fp:
+        config_path = os.path.join(pipeline_path, PIPELINE_CONFIG_FILE)
+        with open(config_path, 'w') as fp:
             yaml.dump(
                 dict(
                     created_at=str(datetime.now(tz=pytz.UTC)),
@@ -307,6 +315,7 @@ class Pipeline:
                 ),
                 fp,
             )
+        invalidate_yaml_file(config_path)
 
         pipeline = Pipeline(
             uuid,
@@ -314,6 +323,7 @@ class Pipeline:
             repo_path=repo_path,
             tags=tags or [],
         )
+        pipeline.__refresh_index()
 
         return pipeline
 
@@ -496,9 +506,7 @@ class Pipeline:
         if not os.path.exists(metadata_path):
             return None
 
-        with open(metadata_path) as fp:
-            config = yaml.full_load(fp) or {}
-        return config
+        return load_yaml_file(metadata_path) or {}
 
     @classmethod
     def _get_config_path(
@@ -554,9 +562,7 @@ class Pipeline:
             if not os.path.exists(config_path):
                 raise Exception(f'Pipeline {uuid} does not exist.')
 
-            config = None
-            async with aiofiles.open(config_path, mode='r') as f:
-                config = yaml.safe_load(await f.read()) or {}
+            config = await load_yaml_file_async(config_path, safe=True) or {}
         except Exception as e:
             if raise_exception:
                 raise e
@@ -597,8 +603,7 @@ class Pipeline:
 
         if not config_path or not os.path.exists(config_path):
             raise Exception(f'Pipeline {uuid} does not exist.')
-        async with aiofiles.open(config_path, mode='r', encoding='utf-8') as f:
-            config = yaml.safe_load(await f.read()) or {}
+        config = await load_yaml_file_async(config_path, safe=True) or {}
 
         if PipelineType.INTEGRATION == config.get('type'):
             from mage_ai.data_preparation.models.pipelines.integration_pipeline import (
@@ -680,11 +685,14 @@ class Pipeline:
                     pipelines_folder_exists = True
 
             if pipelines_folder_exists:
-                arr.extend([
-                    (d, path) if include_repo_path else d
-                    for d in os.listdir(pipelines_folder)
-                    if self.is_valid_pipeline(os.path.join(pipelines_folder, d))
-                ])
+                if PIPELINE_INDEX:
+                    pipeline_uuids = get_pipeline_index(path).pipeline_uuids()
+                else:
+                    pipeline_uuids = [
+                        d for d in os.listdir(pipelines_folder)
+                        if self.is_valid_pipeline(os.path.join(pipelines_folder, d))
+                    ]
+                arr.extend([(d, path) if include_repo_path else d for d in pipeline_uuids])
 
         return arr
 
@@ -695,16 +703,25 @@ class Pipeline:
         warn_for_repo_path(repo_path)
         repo_path = repo_path or get_repo_path()
         pipelines_folder = os.path.join(repo_path, PIPELINES_FOLDER)
+        if PIPELINE_INDEX:
+            # Only load the pipelines whose metadata.yaml lists the block.
+            pipeline_uuids = get_pipeline_index(repo_path).pipeline_uuids_by_block(
+                block.uuid,
+                widget=widget,
+            )
+        else:
+            pipeline_uuids = [
+                entry.name for entry in os.scandir(pipelines_folder) if entry.is_dir()
+            ]
         pipelines = []
-        for entry in os.scandir(pipelines_folder):
-            if entry.is_dir():
-                try:
-                    p = Pipeline(entry.name, repo_path=repo_path)
-                    mapping = p.widgets_by_uuid if widget else p.blocks_by_uuid
-                    if block.uuid in mapping:
-                        pipelines.append(p)
-                except Exception:
-                    pass
+        for pipeline_uuid in pipeline_uuids:
+            try:
+                p = Pipeline(pipeline_uuid, repo_path=repo_path)
+                mapping = p.widgets_by_uuid if widget else p.blocks_by_uuid
+                if block.uuid in mapping:
+                    pipelines.append(p)
+            except Exception:
+                pass
         return pipelines
 
     @classmethod
@@ -814,9 +831,7 @@ class Pipeline:
     def get_config_from_yaml(self):
         if not os.path.exists(self.config_path):
             raise Exception(f'Pipeline {self.uuid} does not exist in repo_path {self.repo_path}.')
-        with open(self.config_path, encoding='utf-8') as fp:
-            config = yaml.full_load(fp) or {}
-        return config
+        return load_yaml_file(self.config_path) or {}
 
     def get_catalog_from_json(self):
         if not os.path.exists(self.catalog_config_path):
@@ -1222,6 +1237,7 @@ class Pipeline:
             # Force updating the config path
             self._config_path = None
             await self.save_async()
+            self.__refresh_index(old_uuid)
             transfer_related_models_for_pipeline(old_uuid, new_uuid)
 
             # Update pipeline secrets directory.
@@ -2173,6 +2189,7 @@ class Pipeline:
 
         if os.path.exists(self.dir_path):
             shutil.rmtree(self.dir_path)
+        self.__refresh_index()
 
         # Delete secret directory when deleting pipeline
         try:
@@ -2324,6 +2341,8 @@ class Pipeline:
         content = yaml.dump(pipeline_dict, allow_unicode=True)
 
         safe_write(self.config_path, content)
+        invalidate_yaml_file(self.config_path)
+        self.__refresh_index()
 
         File.create(
             PIPELINE_CONFIG_FILE,
@@ -2333,6 +2352,15 @@ class Pipeline:
             file_version_only=True,
         )
 
+    def __refresh_index(self, pipeline_uuid: str = None) -> None:
+        if not PIPELINE_INDEX:
+            return
+
+        try:
+            get_pipeline_index(self.repo_path).refresh(pipeline_uuid or self.uuid)
+        except Exception as err:
+            print(f'[WARNING] Pipeline.refresh_index: {err}')
+
     def should_save_trigger_in_code_automatically(self) -> bool:
         from mage_ai.data_preparation.models.project import Project
 
@@ -2421,6 +2449,8 @@ class Pipeline:
                 raise Exception('Invalid pipeline metadata.yaml content, please try saving again.')
 
         await safe_write_async(self.config_path, content)
+        invalidate_yaml_file(self.config_path)
+        self.__refresh_index()
 
         await File.create_async(
             PIPELINE_CONFIG_FILE,
@@ -0,0 +1,347 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from mage_ai.cache.constants import (
+    MAGE_CACHE_DIRECTORY_DEFAULT,
+    MAGE_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE_NAME,
+)
+from mage_ai.data_preparation.models.constants import (
+    PIPELINE_CONFIG_FILE,
+    PIPELINES_FOLDER,
+)
+from mage_ai.data_preparation.models.triggers import TRIGGER_FILE_NAME
+from mage_ai.settings.repo import get_variables_dir
+
+PIPELINE_INDEX_FILENAME = 'pipeline_index.sqlite3'
+PIPELINE_INDEX_VERSION = 1
+
+# (mtime in nanoseconds, size in bytes) of a file, None if the file doesn't exist.
+Fingerprint = Optional[Tuple[int, int]]
+
+
+@dataclass
+class PipelineIndexEntry:
+    uuid: str
+    metadata_fingerprint: Fingerprint
+    metadata_hash: str
+    block_uuids: List[str] = field(default_factory=list)
+    name: str = None
+    tags: List[str] = field(default_factory=list)
+    trigger_names: List[str] = field(default_factory=list)
+    triggers_fingerprint: Fingerprint = None
+    triggers_hash: str = None
+    type: str = None
+    widget_uuids: List[str] = field(default_factory=list)
+
+
+class PipelineIndex:
+    """
+    Index of the pipelines of a project, with the names, types, tags, block UUIDs and trigger
+    names read from their metadata.yaml and triggers.yaml files.
+
+    Each pipeline is stored with the fingerprint (mtime and size) and the content hash of its
+    files; only the files whose fingerprint changed are read again, and only the files whose
+    content changed are parsed again. The index is persisted in a SQLite database in the cache
+    directory of the project, so that a new process doesn't parse every pipeline either.
+
+    When the pipelines folder is watched by the file observer of the server, the index is kept up
+    to date by the file events and listing the pipelines doesn't check the files of every
+    pipeline; otherwise, every listing checks the fingerprints of the files.
+    """
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self.pipelines_folder = os.path.join(repo_path, PIPELINES_FOLDER)
+        self.entries: Dict[str, PipelineIndexEntry] = None
+        self.folder_fingerprint = None
+        self.lock = threading.RLock()
+        self.watched = False
+        self._db_path = None
+
+    @property
+    def db_path(self) -> Optional[str]:
+        if self._db_path is None:
+            cache_dir = os.getenv(MAGE_CACHE_DIRECTORY_ENVIRONMENT_VARIABLE_NAME) or os.path.join(
+                get_variables_dir(repo_path=self.repo_path),
+                MAGE_CACHE_DIRECTORY_DEFAULT,
+            )
+            # The index is only persisted on the local file system.
+            if cache_dir.startswith('s3') or cache_dir.startswith('gs'):
+                self._db_path = ''
+            else:
+                self._db_path = os.path.join(cache_dir, PIPELINE_INDEX_FILENAME)
+
+        return self._db_path or None
+
+    def pipeline_uuids(self) -> List[str]:
+        with self.lock:
+            self.sync()
+            return list(self.entries.keys())
+
+    def get(self, pipeline_uuid: str) -> Optional[PipelineIndexEntry]:
+        with self.lock:
+            self.sync()
+            return self.entries.get(pipeline_uuid)
+
+    def pipeline_uuids_by_block(self, block_uuid: str, widget: bool = False) -> List[str]:
+        with self.lock:
+            self.sync()
+            return [
+                entry.uuid for entry in self.entries.values()
+                if block_uuid in (entry.widget_uuids if widget else entry.block_uuids)
+            ]
+
+    def sync(self, force: bool = False) -> None:
+        """
+        Update the entries of the pipelines whose files changed since they were indexed.
+
+        Args:
+            force (bool): Check the files of every pipeline even if the pipelines folder is
+                watched by the file observer.
+        """
+        with self.lock:
+            self.__load()
+
+            folder_fingerprint = self.__fingerprint(self.pipelines_folder)
+            if self.watched and not force and \
+                    folder_fingerprint is not None and \
+                    folder_fingerprint == self.folder_fingerprint:
+                return
+
+            updated = []
+            deleted = set(self.entries.keys())
+            if folder_fingerprint is not None:
+                with os.scandir(self.pipelines_folder) as it:
+                    for dir_entry in it:
+                        if not dir_entry.is_dir():
+                            continue
+                        deleted.discard(dir_entry.name)
+                        changed, entry = self.__refresh_entry(dir_entry.name)
+                        if changed:
+                            updated.append(entry)
+                        if entry is None:
+                            deleted.add(dir_entry.name)
+
+            for pipeline_uuid in deleted:
+                self.entries.pop(pipeline_uuid, None)
+            self.folder_fingerprint = folder_fingerprint
+            self.__persist(updated=[e for e in updated if e is not None], deleted=deleted)
+
+    def refresh(self, pipeline_uuid: str) -> None:
+        """
+        Update the entry of a pipeline after its files were written or deleted.
+        """
+        with self.lock:
+            self.__load()
+            changed, entry = self.__refresh_entry(pipeline_uuid)
+            if entry is None:
+                self.entries.pop(pipeline_uuid, None)
+                self.__persist(deleted=[pipeline_uuid])
+            elif changed:
+                self.__persist(updated=[entry])
+
+    def refresh_path(self, path: str) -> bool:
+        """
+        Update the entry of the pipeline a file or directory belongs to.
+
+        Returns:
+            bool: Whether the path belongs to a pipeline.
+        """
+        if not path:
+            return False
+
+        relative_path = os.path.relpath(os.path.abspath(path), self.pipelines_folder)
+        parts = relative_path.split(os.sep)
+        if relative_path.startswith('..') or relative_path == '.':
+            return False
+        if len(parts) == 2 and parts[1] not in [PIPELINE_CONFIG_FILE, TRIGGER_FILE_NAME]:
+            return False
+        if len(parts) > 2:
+            return False
+
+        self.refresh(parts[0])
+
+        return True
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries = None
+            self.folder_fingerprint = None
+            self.__execute(lambda conn: conn.execute(
+                'DELETE FROM pipelines WHERE repo_path = ?',
+                (self.repo_path,),
+            ))
+
+    def __refresh_entry(self, pipeline_uuid: str) -> Tuple[bool, Optional[PipelineIndexEntry]]:
+        pipeline_path = os.path.join(self.pipelines_folder, pipeline_uuid)
+        metadata_path = os.path.join(pipeline_path, PIPELINE_CONFIG_FILE)
+        triggers_path = os.path.join(pipeline_path, TRIGGER_FILE_NAME)
+
+        entry = self.entries.get(pipeline_uuid)
+        metadata_fingerprint = self.__fingerprint(metadata_path)
+        if metadata_fingerprint is None:
+            return entry is not None, None
+
+        triggers_fingerprint = self.__fingerprint(triggers_path)
+        if entry is not None and \
+                entry.metadata_fingerprint == metadata_fingerprint and \
+                entry.triggers_fingerprint == triggers_fingerprint:
+            return False, entry
+
+        try:
+            metadata_content = self.__read(metadata_path)
+            triggers_content = self.__read(triggers_path) if triggers_fingerprint else None
+        except FileNotFoundError:
+            return entry is not None, None
+
+        metadata_hash = self.__hash(metadata_content)
+        triggers_hash = self.__hash(triggers_content)
+
+        if entry is None or entry.metadata_hash != metadata_hash:
+            config = self.__parse(metadata_content)
+            blocks = config.get('blocks') or []
+            widgets = config.get('widgets') or []
+            entry = PipelineIndexEntry(
+                uuid=pipeline_uuid,
+                metadata_fingerprint=metadata_fingerprint,
+                metadata_hash=metadata_hash,
+                block_uuids=[b.get('uuid') for b in blocks if isinstance(b, dict)],
+                name=config.get('name'),
+                tags=config.get('tags') or [],
+                trigger_names=entry.trigger_names if entry else [],
+                triggers_fingerprint=entry.triggers_fingerprint if entry else None,
+                triggers_hash=entry.triggers_hash if entry else None,
+                type=config.get('type'),
+                widget_uuids=[w.get('uuid') for w in widgets if isinstance(w, dict)],
+            )
+        entry.metadata_fingerprint = metadata_fingerprint
+
+        if entry.triggers_hash != triggers_hash:
+            triggers = self.__parse(triggers_content).get('triggers') or []
+            entry.trigger_names = [t.get('name') for t in triggers if isinstance(t, dict)]
+            entry.triggers_hash = triggers_hash
+        entry.triggers_fingerprint = triggers_fingerprint
+
+        self.entries[pipeline_uuid] = entry
+
+        return True, entry
+
+    def __load(self) -> None:
+        if self.entries is not None:
+            return
+
+        self.entries = dict()
+
+        def select(conn: sqlite3.Connection) -> List[Tuple]:
+            return conn.execute(
+                'SELECT data FROM pipelines WHERE repo_path = ?',
+                (self.repo_path,),
+            ).fetchall()
+
+        for (data,) in self.__execute(select) or []:
+            try:
+                entry = PipelineIndexEntry(**json.loads(data))
+            except (TypeError, ValueError):
+                continue
+            for key in ['metadata_fingerprint', 'triggers_fingerprint']:
+                value = getattr(entry, key)
+                if value is not None:
+                    setattr(entry, key, tuple(value))
+            self.entries[entry.uuid] = entry
+
+    def __persist(
+        self,
+        updated: List[PipelineIndexEntry] = None,
+        deleted: List[str] = None,
+    ) -> None:
+        if not updated and not deleted:
+            return
+
+        def write(conn: sqlite3.Connection) -> None:
+            if deleted:
+                conn.executemany(
+                    'DELETE FROM pipelines WHERE repo_path = ? AND uuid = ?',
+                    [(self.repo_path, uuid) for uuid in deleted],
+                )
+            if updated:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO pipelines (repo_path, uuid, data) VALUES (?, ?, ?)',
+                    [(self.repo_path, e.uuid, json.dumps(asdict(e))) for e in updated],
+                )
+
+        self.__execute(write)
+
+    def __execute(self, func):
+        db_path = self.db_path
+        if not db_path:
+            return None
+
+        # The index is a cache of the files: if the database can't be used, e.g. because
+        # another process holds a lock for too long, the entries are only kept in memory.
+        try:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            conn = sqlite3.connect(db_path, timeout=5)
+            try:
+                with conn:
+                    conn.execute(
+                        'CREATE TABLE IF NOT EXISTS pipelines ('
+                        'repo_path TEXT NOT NULL, '
+                        'uuid TEXT NOT NULL, '
+                        'data TEXT NOT NULL, '
+                        'PRIMARY KEY (repo_path, uuid))',
+                    )
+                    version = conn.execute('PRAGMA user_version').fetchone()[0]
+                    if version != PIPELINE_INDEX_VERSION:
+                        conn.execute('DELETE FROM pipelines')
+                        conn.execute(f'PRAGMA user_version = {PIPELINE_INDEX_VERSION}')
+                    return func(conn)
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as err:
+            print(f'[WARNING] PipelineIndex: failed to use {db_path}: {err}')
+
+        return None
+
+    def __fingerprint(self, path: str) -> Fingerprint:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def __hash(self, content: Optional[bytes]) -> Optional[str]:
+        if content is None:
+            return None
+        return hashlib.md5(content).hexdigest()
+
+    def __parse(self, content: Optional[bytes]) -> Dict:
+        if not content:
+            return dict()
+        try:
+            config = yaml.full_load(content)
+        except yaml.YAMLError:
+            return dict()
+        return config if isinstance(config, dict) else dict()
+
+    def __read(self, path: str) -> bytes:
+        with open(path, 'rb') as f:
+            return f.read()
+
+
+pipeline_indexes: Dict[str, PipelineIndex] = dict()
+pipeline_indexes_lock = threading.Lock()
+
+
+def get_pipeline_index(repo_path: str) -> PipelineIndex:
+    repo_path = os.path.abspath(repo_path)
+    with pipeline_indexes_lock:
+        if repo_path not in pipeline_indexes:
+            pipeline_indexes[repo_path] = PipelineIndex(repo_path)
+        return pipeline_indexes[repo_path]
@@ -3,6 +3,19 @@ from dataclasses import dataclass
 from mage_ai.shared.models import BaseDataClass
 
 
+@dataclass
+class PipelineSettingsStreaming(BaseDataClass):
+    # Share the output of a block with the downstream blocks that only read it instead of deep
+    # copying it for each of them. Blocks still get a copy unless they set
+    # `readonly_input: true` in their configuration; sinks that don't mutate the messages share
+    # them.
+    copy_on_write: bool = None
+    # Write to the sinks on background threads while the source keeps consuming messages. At
+    # most max_in_flight_batches batches are waiting to be written at a time.
+    max_in_flight_batches: int = None
+    pipelined_sink_writes: bool = None
+
+
 @dataclass
 class PipelineSettingsTriggers(BaseDataClass):
     save_in_code_automatically: bool = None
@@ -10,7 +23,9 @@ class PipelineSettingsTriggers(BaseDataClass):
 
 @dataclass
 class PipelineSettings(BaseDataClass):
+    streaming: PipelineSettingsStreaming = None
     triggers: PipelineSettingsTriggers = None
 
     def __post_init__(self):
+        self.serialize_attribute_class('streaming', PipelineSettingsStreaming)
         self.serialize_attribute_class('triggers', PipelineSettingsTriggers)
@@ -3,7 +3,7 @@ import os
 import traceback
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import yaml
 from croniter import croniter
@@ -14,9 +14,13 @@ from mage_ai.shared.config import BaseConfig
 from mage_ai.shared.constants import VALID_ENVS
 from mage_ai.shared.hash import index_by
 from mage_ai.shared.io import safe_write
+from mage_ai.shared.yaml import invalidate_yaml_file, load_yaml_file
 
 TRIGGER_FILE_NAME = 'triggers.yaml'
 
+# Functions called with the pipeline UUID whenever a triggers.yaml file is written.
+triggers_file_listeners: List[Callable[[str], None]] = []
+
 
 class ScheduleStatus(str, enum.Enum):
     ACTIVE = 'active'
@@ -125,6 +129,24 @@ def get_triggers_file_path(
     return trigger_file_path
 
 
+def register_triggers_file_listener(listener: Callable[[str], None]) -> None:
+    if listener not in triggers_file_listeners:
+        triggers_file_listeners.append(listener)
+
+
+def invalidate_triggers_file(pipeline_uuid: str, trigger_file_path: str = None) -> None:
+    """
+    Drop the cached content of the triggers.yaml file of a pipeline and notify the listeners
+    (e.g. the scheduler index) that the triggers of the pipeline changed.
+    """
+    invalidate_yaml_file(trigger_file_path or get_triggers_file_path(pipeline_uuid))
+    for listener in triggers_file_listeners:
+        try:
+            listener(pipeline_uuid)
+        except Exception:
+            traceback.print_exc()
+
+
 def load_triggers_file_content(
     pipeline_uuid: str,
     repo_path: str = None,
@@ -139,14 +161,12 @@ def load_triggers_file_content(
     return content
 
 
-def load_triggers_file_data(pipeline_uuid: str) -> Dict:
-    data = {}
-
-    content = load_triggers_file_content(pipeline_uuid)
-    if content:
-        data = yaml.safe_load(content) or {}
+def load_triggers_file_data(pipeline_uuid: str, repo_path: str = None) -> Dict:
+    trigger_file_path = get_triggers_file_path(pipeline_uuid, repo_path=repo_path)
+    if not os.path.exists(trigger_file_path):
+        return {}
 
-    return data
+    return load_yaml_file(trigger_file_path, safe=True) or {}
 
 
 def get_triggers_by_pipeline(
@@ -162,14 +182,11 @@ def get_triggers_by_pipeline(
         return []
 
     try:
-        content = load_triggers_file_content(
+        yaml_config = load_triggers_file_data(pipeline_uuid, repo_path=repo_path)
+        triggers = build_triggers(
+            yaml_config.get('triggers') or {},
             pipeline_uuid,
-            repo_path=repo_path,
-        )
-        triggers = load_trigger_configs(
-            content,
-            pipeline_uuid=pipeline_uuid,
-            repo_path=repo_path,
+            repo_path=repo_path or get_repo_path(),
         )
     except Exception:
         traceback.print_exc()
@@ -263,6 +280,7 @@ def add_or_update_trigger_for_pipeline_and_persist(
     content = yaml.safe_dump(yaml_config)
     trigger_file_path = get_triggers_file_path(pipeline_uuid)
     safe_write(trigger_file_path, content)
+    invalidate_triggers_file(pipeline_uuid, trigger_file_path)
 
     return trigger_configs_by_name
 
@@ -280,6 +298,7 @@ def update_triggers_for_pipeline_and_persist(
     content = yaml.safe_dump(yaml_config)
     trigger_file_path = get_triggers_file_path(pipeline_uuid)
     safe_write(trigger_file_path, content)
+    invalidate_triggers_file(pipeline_uuid, trigger_file_path)
 
     return trigger_configs
 
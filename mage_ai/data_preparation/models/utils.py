@@ -100,20 +100,40 @@ def cast_column_types_polars(df: pl.DataFrame, column_types: Dict):
     return df
 
 
+def deserialize_value(val: Any, column_type: str) -> Any:
+    if val is not None and isinstance(val, str):
+        return simplejson.loads(val)
+    elif val is not None and isinstance(val, np.ndarray) and column_type == list.__name__:
+        return list(val)
+
+    return val
+
+
 def deserialize_columns(row: pd.Series, column_types: Dict) -> pd.Series:
     for column, column_type in column_types.items():
         if column_type not in JSON_SERIALIZABLE_COLUMN_TYPES:
             continue
 
-        val = row[column]
-        if val is not None and isinstance(val, str):
-            row[column] = simplejson.loads(val)
-        elif val is not None and isinstance(val, np.ndarray) and column_type == list.__name__:
-            row[column] = list(val)
+        row[column] = deserialize_value(row[column], column_type)
 
     return row
 
 
+def deserialize_columns_pandas(df: pd.DataFrame, column_types: Dict) -> pd.DataFrame:
+    """
+    Deserialize the JSON serializable columns of a DataFrame one column at a time, instead of
+    one row at a time, so that the other columns keep their types. Columns that aren't in the
+    DataFrame (e.g. not read) are skipped.
+    """
+    for column, column_type in column_types.items():
+        if column_type not in JSON_SERIALIZABLE_COLUMN_TYPES or column not in df.columns:
+            continue
+
+        df[column] = df[column].map(lambda val: deserialize_value(val, column_type))
+
+    return df
+
+
 def dask_from_pandas(df: pd.DataFrame) -> dd:
     ddf = dd.from_pandas(df, npartitions=1)
     npartitions = 1 + ddf.memory_usage(deep=True).sum().compute() // MAX_PARTITION_BYTE_SIZE
@@ -4,11 +4,12 @@ import os
 import traceback
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import scipy
 from pandas.api.types import infer_dtype, is_object_dtype
 from pandas.core.indexes.range import RangeIndex
@@ -33,7 +34,7 @@ from mage_ai.data_preparation.models.utils import (  # dask_from_pandas,
     apply_transform_pandas,
     cast_column_types,
     cast_column_types_polars,
-    deserialize_columns,
+    deserialize_columns_pandas,
     deserialize_complex,
     infer_variable_type,
     is_basic_iterable,
@@ -49,6 +50,7 @@ from mage_ai.data_preparation.models.variables.cache import (
 )
 from mage_ai.data_preparation.models.variables.constants import (
     DATA_TYPE_FILENAME,
+    DATAFRAME_ARROW_FILE,
     DATAFRAME_COLUMN_TYPES_FILE,
     DATAFRAME_CSV_FILE,
     DATAFRAME_PARQUET_FILE,
@@ -62,14 +64,19 @@ from mage_ai.data_preparation.models.variables.constants import (
     VariableAggregateSummaryGroupType,
     VariableType,
 )
+from mage_ai.data_preparation.models.variables.memory_cache import (
+    variable_memory_cache,
+)
 from mage_ai.data_preparation.models.variables.utils import is_output_variable
 from mage_ai.data_preparation.storage.base_storage import BaseStorage
 from mage_ai.data_preparation.storage.local_storage import LocalStorage
+from mage_ai.data_preparation.storage.remote import run_in_storage_executor
 from mage_ai.settings.repo import get_variables_dir
 from mage_ai.settings.server import (
     MEMORY_MANAGER_PANDAS_V2,
     MEMORY_MANAGER_POLARS_V2,
     MEMORY_MANAGER_V2,
+    VARIABLE_ARROW_HANDOFF,
 )
 from mage_ai.shared.array import is_iterable
 from mage_ai.shared.environments import is_debug
@@ -81,6 +88,11 @@ from mage_ai.system.memory.manager import MemoryManager
 from mage_ai.system.models import ResourceUsage
 from mage_ai.system.storage.utils import size_of_path
 
+MEMORY_CACHE_VARIABLE_TYPES = frozenset([
+    VariableType.DATAFRAME,
+    VariableType.POLARS_DATAFRAME,
+])
+
 
 class Variable:
     def __init__(
@@ -288,7 +300,7 @@ class Variable:
                 traceback.print_exc()
 
         if self.variable_type is None and self.storage.path_exists(
-            os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE)
+            self.__dataframe_file_path()
         ):
             # If parquet file exists for given variable, set the variable type to DATAFRAME
             self.variable_type = VariableType.DATAFRAME
@@ -321,8 +333,10 @@ class Variable:
         """
         Delete the variable data.
         """
+        variable_memory_cache.evict(self.variable_path)
+
         if self.variable_type is None and self.storage.path_exists(
-            os.path.join(self.variable_dir_path, f'{self.uuid}', DATAFRAME_PARQUET_FILE)
+            self.__dataframe_file_path()
         ):
             # If parquet file exists for given variable, set the variable type to DATAFRAME
             self.variable_type = VariableType.DATAFRAME
@@ -616,9 +630,14 @@ class Variable:
             self.variable_type == VariableType.DATAFRAME
             or self.variable_type == VariableType.SERIES_PANDAS
         ):
-            return self.__read_parquet(sample=sample, sample_count=sample_count)
+            return await self.__run_storage_read_async(
+                self.__read_parquet,
+                sample=sample,
+                sample_count=sample_count,
+            )
         elif self.variable_type == VariableType.POLARS_DATAFRAME:
-            return self.__read_polars_parquet(
+            return await self.__run_storage_read_async(
+                self.__read_polars_parquet,
                 sample=sample,
                 sample_count=sample_count,
             )
@@ -645,6 +664,15 @@ class Variable:
 
             return data
 
+    async def __run_storage_read_async(self, read_func, **kwargs) -> Any:
+        """
+        Reads from a remote storage are run in the threads of the remote storages, so that
+        loading the outputs of many blocks doesn't block the event loop while they download.
+        """
+        if isinstance(self.storage, LocalStorage):
+            return read_func(**kwargs)
+        return await run_in_storage_executor(read_func, **kwargs)
+
     def __read_complex_object(self, data: Union[Dict, List]) -> Union[Dict, List]:
         column_types_filename = os.path.join(self.variable_path, DATAFRAME_COLUMN_TYPES_FILE)
         if self.storage.path_exists(column_types_filename):
@@ -952,6 +980,9 @@ class Variable:
         Used by:
             VariableManager
         """
+        # The dataframe writers cache the new data; any other data replaces the cached one.
+        variable_memory_cache.evict(self.variable_path)
+
         if self.data_manager and self.data_manager.writeable(data):
             metadata = self.data_manager.write_sync(data)
             if metadata:
@@ -1047,6 +1078,9 @@ class Variable:
         Used by:
             VariableManager
         """
+        # The dataframe writers cache the new data; any other data replaces the cached one.
+        variable_memory_cache.evict(self.variable_path)
+
         if self.data_manager and self.data_manager.writeable(data):
             metadata = await self.data_manager.write_async(data)
             if metadata:
@@ -1122,6 +1156,45 @@ class Variable:
                 )
             )
 
+    def __memory_cache_version(self) -> Optional[Tuple[int, int]]:
+        # Only the outputs written to the local disk are cached; the modification time and size
+        # of the data file tell whether the variable was written again since it was cached.
+        if not variable_memory_cache.enabled or not isinstance(self.storage, LocalStorage):
+            return None
+
+        try:
+            stat = os.stat(self.__dataframe_file_path())
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def __read_memory_cache(self, dataframe_class: type) -> Optional[Any]:
+        if self.variable_type not in MEMORY_CACHE_VARIABLE_TYPES:
+            return None
+
+        version = self.__memory_cache_version()
+        if version is None:
+            return None
+
+        data = variable_memory_cache.get(self.variable_path, version)
+        if not isinstance(data, dataframe_class):
+            return None
+
+        return data
+
+    def __update_memory_cache(self, data: Union[pd.DataFrame, pl.DataFrame]) -> None:
+        """
+        Cache the dataframe as it was written to the data file, so that the readers convert its
+        column types the same way as the dataframe read from the file.
+        """
+        if self.variable_type not in MEMORY_CACHE_VARIABLE_TYPES:
+            return
+
+        version = self.__memory_cache_version()
+        if version is not None:
+            variable_memory_cache.put(self.variable_path, data, version)
+
     def write_metadata(self) -> None:
         """
         Write metadata to the persistent storage.
@@ -1164,7 +1237,7 @@ class Variable:
             self.storage.remove_dir(self.variable_path)
 
     def __delete_parquet(self) -> None:
-        file_path = os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE)
+        file_path = self.__dataframe_file_path()
 
         if self.storage.path_exists(file_path):
             self.storage.remove(file_path)
@@ -1302,29 +1375,41 @@ class Variable:
         file_path = os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE)
         sample_file_path = os.path.join(self.variable_path, DATAFRAME_PARQUET_SAMPLE_FILE)
 
+        df = None
         read_sample_success = False
         if sample:
+            sample_count = sample_count or DATAFRAME_SAMPLE_COUNT
             try:
-                df = self.storage.read_parquet(sample_file_path, engine='pyarrow')
+                df = self.storage.read_parquet_sample(sample_file_path, sample_count)
                 read_sample_success = True
             except Exception as ex:
                 if raise_exception:
                     raise Exception(f'Failed to read parquet file: {sample_file_path}') from ex
                 else:
                     traceback.print_exc()
-        if not read_sample_success:
+        else:
+            df = self.__read_memory_cache(pd.DataFrame)
+        if not read_sample_success and df is None:
+            table = self.__read_arrow_table()
+            if table is not None:
+                if sample:
+                    table = table.slice(0, sample_count)
+                # Pandas can't modify the columns of a zero-copy conversion, so the columns are
+                # copied once from the mapped file.
+                df = table.to_pandas()
+        if not read_sample_success and df is None:
             try:
-                df = self.storage.read_parquet(file_path, engine='pyarrow')
+                if sample:
+                    # Only the row groups with the first rows of the data are read.
+                    df = self.storage.read_parquet_sample(file_path, sample_count)
+                else:
+                    df = self.storage.read_parquet(file_path, engine='pyarrow')
             except Exception as ex:
                 if raise_exception:
                     raise Exception(f'Failed to read parquet file: {file_path}') from ex
                 else:
                     traceback.print_exc()
                 df = pd.DataFrame()
-        if sample:
-            sample_count = sample_count or DATAFRAME_SAMPLE_COUNT
-            if df.shape[0] > sample_count:
-                df = df.iloc[:sample_count]
 
         column_types_raw = None
         column_types_filename = os.path.join(self.variable_path, DATAFRAME_COLUMN_TYPES_FILE)
@@ -1339,12 +1424,8 @@ class Variable:
             else:
                 column_types = column_types_raw
 
-            # ddf = dask_from_pandas(df)
             if should_deserialize_pandas(column_types):
-                df = apply_transform_pandas(
-                    df,
-                    lambda row: deserialize_columns(row, column_types),
-                )
+                df = deserialize_columns_pandas(df, column_types)
             df = cast_column_types(df, column_types)
 
         if self.variable_type == VariableType.SERIES_PANDAS:
@@ -1406,6 +1487,7 @@ class Variable:
         file_path = os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE)
         sample_file_path = os.path.join(self.variable_path, DATAFRAME_PARQUET_SAMPLE_FILE)
 
+        df = None
         read_sample_success = False
         if sample:
             try:
@@ -1416,7 +1498,14 @@ class Variable:
                     raise Exception(f'Failed to read parquet file: {sample_file_path}') from ex
                 else:
                     traceback.print_exc()
-        if not read_sample_success:
+        else:
+            df = self.__read_memory_cache(pl.DataFrame)
+        if not read_sample_success and df is None:
+            table = self.__read_arrow_table()
+            if table is not None:
+                # The columns of the dataframe are views of the mapped file.
+                df = pl.from_arrow(table)
+        if not read_sample_success and df is None:
             try:
                 df = self.storage.read_polars_parquet(file_path, use_pyarrow=True)
             except Exception as ex:
@@ -1580,10 +1669,12 @@ class Variable:
         else:
             df_output_serialized = df_output
 
-        self.storage.write_parquet(
+        self.__write_dataframe_file(
             df_output_serialized,
-            os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE),
+            lambda file_path: self.storage.write_parquet(df_output_serialized, file_path),
         )
+        if self.variable_type == VariableType.DATAFRAME:
+            self.__update_memory_cache(df_output_serialized)
 
         try:
             df_sample_output = df_output_serialized.iloc[
@@ -1616,10 +1707,12 @@ class Variable:
     def __write_polars_dataframe(self, data: pl.DataFrame) -> None:
         self.storage.makedirs(self.variable_path, exist_ok=True)
 
-        self.storage.write_polars_dataframe(
+        self.__write_dataframe_file(
             data,
-            os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE),
+            lambda file_path: self.storage.write_polars_dataframe(data, file_path),
         )
+        if self.variable_type == VariableType.POLARS_DATAFRAME:
+            self.__update_memory_cache(data)
 
         try:
             sample_columns = data.columns[:DATAFRAME_SAMPLE_MAX_COLUMNS]
@@ -1636,6 +1729,74 @@ class Variable:
             print(f'Sample output error: {err}.')
             traceback.print_exc()
 
+    def __dataframe_file_path(self) -> str:
+        """
+        The path of the file with the full dataframe: the Arrow IPC file if the variable was
+        written with the Arrow handoff, otherwise the parquet file.
+        """
+        file_path = os.path.join(self.variable_path, DATAFRAME_ARROW_FILE)
+        if isinstance(self.storage, LocalStorage) and self.storage.path_exists(file_path):
+            return file_path
+        return os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE)
+
+    def __write_dataframe_file(
+        self,
+        data: Union[pd.DataFrame, pl.DataFrame],
+        write_parquet: Callable[[str], None],
+    ) -> None:
+        """
+        Write the full dataframe either as an Arrow IPC file, if the Arrow handoff is enabled, or
+        as a parquet file, and remove the file of the other format written by a previous run.
+        """
+        arrow_file_path = os.path.join(self.variable_path, DATAFRAME_ARROW_FILE)
+        parquet_file_path = os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE)
+
+        if self.__write_arrow_table(data, arrow_file_path):
+            stale_file_path = parquet_file_path
+        else:
+            write_parquet(parquet_file_path)
+            stale_file_path = arrow_file_path
+
+        if self.storage.path_exists(stale_file_path):
+            self.storage.remove(stale_file_path)
+
+    def __read_arrow_table(self) -> Optional[Any]:
+        file_path = os.path.join(self.variable_path, DATAFRAME_ARROW_FILE)
+        if not isinstance(self.storage, LocalStorage) or not self.storage.path_exists(file_path):
+            return None
+
+        try:
+            return self.storage.read_arrow_table(file_path)
+        except Exception as err:
+            print(f'Failed to read Arrow file {file_path}: {err}.')
+            return None
+
+    def __write_arrow_table(
+        self,
+        data: Union[pd.DataFrame, pl.DataFrame],
+        file_path: str,
+    ) -> bool:
+        """
+        Write the dataframe as an Arrow IPC file that the downstream blocks memory-map instead
+        of decoding a parquet file.
+
+        Returns:
+            bool: Whether the file was written.
+        """
+        if not VARIABLE_ARROW_HANDOFF or not isinstance(self.storage, LocalStorage):
+            return False
+
+        try:
+            if isinstance(data, pl.DataFrame):
+                table = data.to_arrow()
+            else:
+                table = pa.Table.from_pandas(data)
+            self.storage.write_arrow_table(table, file_path)
+            return True
+        except Exception as err:
+            print(f'Failed to write Arrow file {file_path}: {err}.')
+            return False
+
     def __write_spark_parquet(self, data) -> None:
         (data.write.option('header', 'True').mode('overwrite').parquet(self.variable_path))
 
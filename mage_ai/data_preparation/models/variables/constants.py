@@ -1,6 +1,7 @@
 from enum import Enum
 
 CONFIG_JSON_FILE = 'config.json'
+DATAFRAME_ARROW_FILE = 'data.arrow'
 DATAFRAME_COLUMN_TYPES_FILE = 'data_column_types.json'
 DATAFRAME_CSV_FILE = 'data.csv'
 DATAFRAME_PARQUET_FILE = 'data.parquet'
@@ -0,0 +1,124 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import pandas as pd
+import polars as pl
+
+from mage_ai.settings.server import VARIABLE_MEMORY_CACHE_SIZE_MB
+
+# Number of values of an object column used to estimate the size of its values.
+OBJECT_SIZE_SAMPLE_COUNT = 1000
+
+
+def estimate_size(data: Any) -> Optional[int]:
+    """
+    Estimate the number of bytes used by a dataframe without visiting every value.
+    """
+    if isinstance(data, pl.DataFrame):
+        return int(data.estimated_size())
+
+    if not isinstance(data, pd.DataFrame):
+        return None
+
+    size = int(data.memory_usage(index=True, deep=False).sum())
+    for column in data.columns[data.dtypes == object]:
+        values = data[column]
+        if not isinstance(values, pd.Series) or len(values) == 0:
+            continue
+        sample = values.iloc[:OBJECT_SIZE_SAMPLE_COUNT]
+        average_size = sum(sys.getsizeof(value) for value in sample) / len(sample)
+        size += int(average_size * len(values))
+
+    return size
+
+
+class VariableMemoryCache:
+    """
+    LRU cache of the dataframe block outputs recently written by this process, so that the
+    downstream blocks running in the same process read them without reading the files again.
+
+    The outputs are keyed by their variable path, which includes the execution partition of the
+    pipeline run, the block and the variable. Each output is stored with the version of its
+    file when it was written; it's only returned if the file still has the same version, in case
+    another process wrote the variable since.
+
+    The cache keeps the dataframe it's given without copying it, so the writer must not modify
+    it afterwards; each reader gets its own copy.
+    """
+
+    def __init__(self, max_bytes: int = 0):
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.size = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: str, version: Any) -> Optional[Any]:
+        if not self.enabled:
+            return None
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            data, _size, entry_version = entry
+            if entry_version != version:
+                self.__remove(key)
+                return None
+
+            self.entries.move_to_end(key)
+
+        return self.__copy(data)
+
+    def put(self, key: str, data: Any, version: Any) -> bool:
+        if not self.enabled:
+            return False
+
+        size = estimate_size(data)
+        if size is None or size > self.max_bytes:
+            self.evict(key)
+            return False
+
+        entry = (data, size, version)
+        with self.lock:
+            self.__remove(key)
+            self.entries[key] = entry
+            self.size += size
+
+            while self.size > self.max_bytes:
+                self.__remove(next(iter(self.entries)))
+
+        return True
+
+    def evict(self, key: str) -> None:
+        with self.lock:
+            self.__remove(key)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def __copy(self, data: Any) -> Any:
+        # Downstream blocks can modify their inputs in place; polars dataframes are immutable
+        # and clone their columns lazily.
+        if isinstance(data, pl.DataFrame):
+            return data.clone()
+        return data.copy()
+
+    def __remove(self, key: str) -> Optional[Tuple[Any, int, Any]]:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+        return entry
+
+
+variable_memory_cache = VariableMemoryCache(
+    max_bytes=int(VARIABLE_MEMORY_CACHE_SIZE_MB * 1024 * 1024),
+)
@@ -56,6 +56,19 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def read_parquet_sample(
+        self,
+        file_path: str,
+        sample_count: int,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read the first sample_count rows of a parquet file with file path and return a pandas
+        DataFrame, without reading the rest of the rows.
+        """
+        pass
+
     @abstractmethod
     def read_polars_parquet(self, file_path: str, **kwargs) -> pl.DataFrame:
         """
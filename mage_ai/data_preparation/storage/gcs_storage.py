@@ -1,15 +1,23 @@
 import io
 import json
 from contextlib import contextmanager
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pandas as pd
 import polars as pl
 import simplejson
 from google.cloud import storage
 
+from mage_ai.data.tabular.reader import read_parquet_sample
 from mage_ai.data_preparation.storage.base_storage import BaseStorage
+from mage_ai.data_preparation.storage.remote import (
+    CHUNK_SIZE,
+    RangeReader,
+    read_ranges_concurrently,
+    run_in_storage_executor,
+)
 from mage_ai.shared.constants import GCS_PREFIX
+from mage_ai.shared.environments import is_debug
 from mage_ai.shared.parsers import encode_complex
 from mage_ai.shared.urls import gcs_url_path
 
@@ -107,11 +115,12 @@ class GCSStorage(BaseStorage):
         default_value=None,
         raise_exception: bool = False,
     ) -> Dict:
-        """
-        TODO: Implement async http call.
-        """
-        return self.read_json_file(
-            file_path, default_value=default_value, raise_exception=raise_exception)
+        return await run_in_storage_executor(
+            self.read_json_file,
+            file_path,
+            default_value=default_value,
+            raise_exception=raise_exception,
+        )
 
     def write_json_file(self, file_path: str, data) -> None:
         blob = self.bucket.blob(gcs_url_path(file_path))
@@ -123,32 +132,39 @@ class GCSStorage(BaseStorage):
         blob.upload_from_string(data=data, content_type='application/json')
 
     async def write_json_file_async(self, file_path: str, data) -> None:
-        """
-        TODO: Implement async http call.
-        """
-        return self.write_json_file(file_path, data)
+        return await run_in_storage_executor(self.write_json_file, file_path, data)
 
     def read_parquet(self, file_path: str, **kwargs) -> pd.DataFrame:
-        buffer = io.BytesIO(self.bucket.blob(gcs_url_path(file_path)).download_as_bytes())
-        return pd.read_parquet(buffer, **kwargs)
+        return pd.read_parquet(self.__download(file_path), **kwargs)
+
+    def read_parquet_sample(
+        self,
+        file_path: str,
+        sample_count: int,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        # Only the footer and the first row groups of the file are read with range requests.
+        blob = self.__get_blob(file_path)
+        reader = RangeReader(
+            lambda start, end: self.__read_range(blob, start, end),
+            blob.size,
+        )
+        return read_parquet_sample(reader, sample_count, columns=columns)
 
     def read_polars_parquet(self, file_path: str, **kwargs) -> pl.DataFrame:
-        buffer = io.BytesIO(self.bucket.blob(gcs_url_path(file_path)).download_as_bytes())
-        return pl.read_parquet(buffer, **kwargs)
+        return pl.read_parquet(self.__download(file_path), **kwargs)
 
     def write_parquet(self, df: pd.DataFrame, file_path: str) -> None:
         buffer = io.BytesIO()
         df.to_parquet(buffer)
         buffer.seek(0)
-        blob = self.bucket.blob(gcs_url_path(file_path))
-        blob.upload_from_string(buffer.getvalue())
+        self.__upload(file_path, buffer)
 
     def write_polars_dataframe(self, df: pl.DataFrame, file_path: str) -> None:
         buffer = io.BytesIO()
         df.write_parquet(buffer)
         buffer.seek(0)
-        blob = self.bucket.blob(gcs_url_path(file_path))
-        blob.upload_from_string(buffer.getvalue())
+        self.__upload(file_path, buffer)
 
     @contextmanager
     def open_to_write(self, file_path: str) -> None:
@@ -161,4 +177,43 @@ class GCSStorage(BaseStorage):
             stream.close()
 
     async def read_async(self, file_path: str) -> str:
-        pass
+        try:
+            content = await run_in_storage_executor(
+                self.bucket.blob(gcs_url_path(file_path)).download_as_bytes,
+            )
+            return content.decode('utf-8')
+        except Exception as err:
+            if is_debug():
+                print(f'[ERROR] GCSStorage.read_async: {err}')
+
+    def __get_blob(self, file_path: str):
+        blob = self.bucket.get_blob(gcs_url_path(file_path))
+        if blob is None:
+            raise FileNotFoundError(f'File {file_path} does not exist.')
+        return blob
+
+    def __read_range(self, blob, start: int, end: int) -> bytes:
+        # The generation is pinned so that all the ranges are read from the same version of
+        # the object.
+        return blob.download_as_bytes(
+            start=start,
+            end=end - 1,
+            if_generation_match=blob.generation,
+        )
+
+    def __download(self, file_path: str) -> io.BytesIO:
+        # Objects larger than a chunk are downloaded in parts with concurrent range requests.
+        blob = self.__get_blob(file_path)
+        if blob.size is None or blob.size <= CHUNK_SIZE:
+            return io.BytesIO(blob.download_as_bytes())
+
+        return io.BytesIO(read_ranges_concurrently(
+            lambda start, end: self.__read_range(blob, start, end),
+            blob.size,
+        ))
+
+    def __upload(self, file_path: str, buffer: io.BytesIO) -> None:
+        # Objects larger than a chunk are uploaded with a resumable upload in chunks, so that a
+        # failed request only sends its chunk again.
+        blob = self.bucket.blob(gcs_url_path(file_path), chunk_size=CHUNK_SIZE)
+        blob.upload_from_file(buffer, size=buffer.getbuffer().nbytes)
@@ -7,8 +7,10 @@ from typing import Dict, List, Optional, Union
 import aiofiles
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import simplejson
 
+from mage_ai.data.tabular.reader import read_parquet_sample
 from mage_ai.data_preparation.models.file import File
 from mage_ai.data_preparation.storage.base_storage import BaseStorage
 from mage_ai.settings.server import DEBUG_FILE_IO
@@ -120,9 +122,24 @@ class LocalStorage(BaseStorage):
     def read_parquet(self, file_path: str, **kwargs) -> pd.DataFrame:
         return pd.read_parquet(file_path, engine='pyarrow')
 
+    def read_parquet_sample(
+        self,
+        file_path: str,
+        sample_count: int,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        return read_parquet_sample(file_path, sample_count, columns=columns)
+
     def read_polars_parquet(self, file_path: str, **kwargs) -> pl.DataFrame:
         return pl.read_parquet(file_path, use_pyarrow=True)
 
+    def read_arrow_table(self, file_path: str) -> pa.Table:
+        """
+        Memory-map an Arrow IPC file. The columns of the table are views of the mapped file, so
+        only the pages that are accessed are read from the disk.
+        """
+        return pa.ipc.open_file(pa.memory_map(file_path, 'r')).read_all()
+
     def write_csv(self, df: pd.DataFrame, file_path: str) -> None:
         File.create_parent_directories(file_path)
         df.to_csv(file_path, index=False)
@@ -135,6 +152,16 @@ class LocalStorage(BaseStorage):
         File.create_parent_directories(file_path)
         df.write_parquet(file_path)
 
+    def write_arrow_table(self, table: pa.Table, file_path: str) -> None:
+        File.create_parent_directories(file_path)
+        # The file is replaced atomically, so that the tables already mapped from the previous
+        # file stay valid.
+        temp_file_path = f'{file_path}.tmp'
+        with pa.OSFile(temp_file_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temp_file_path, file_path)
+
     @contextmanager
     def open_to_write(
         self,
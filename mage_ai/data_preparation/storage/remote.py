@@ -0,0 +1,130 @@
+import asyncio
+import functools
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from mage_ai.settings.server import (
+    REMOTE_STORAGE_CHUNK_SIZE_MB,
+    REMOTE_STORAGE_MAX_CONCURRENCY,
+)
+
+# GCS requires the chunks of resumable uploads to be multiples of 256 KB.
+CHUNK_SIZE = max(int(REMOTE_STORAGE_CHUNK_SIZE_MB * 4), 4) * 256 * 1024
+MAX_CONCURRENCY = max(REMOTE_STORAGE_MAX_CONCURRENCY, 1)
+# The parquet footer is at the end of the file; reading this many bytes at once from the end
+# usually reads the whole footer with one request instead of one request for its length and
+# another for its content.
+FOOTER_READ_SIZE = 64 * 1024
+
+# Threads running the blocking requests of the remote storages for the async methods. The
+# number of threads bounds the number of requests run at the same time, so that loading many
+# block outputs doesn't take all the threads of the default executor of the event loop.
+storage_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENCY,
+    thread_name_prefix='remote_storage',
+)
+
+
+async def run_in_storage_executor(func: Callable, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        storage_executor,
+        functools.partial(func, *args, **kwargs),
+    )
+
+
+def read_ranges_concurrently(
+    read_range: Callable[[int, int], bytes],
+    size: int,
+    chunk_size: int = CHUNK_SIZE,
+) -> bytes:
+    """
+    Download an object with concurrent range requests.
+
+    Args:
+        read_range (Callable[[int, int], bytes]): Read the bytes of the object from a start
+            offset to an end offset, excluded.
+        size (int): The size of the object in bytes.
+        chunk_size (int): The number of bytes read by each request.
+
+    Returns:
+        bytes: The content of the object.
+    """
+    if size <= chunk_size:
+        return read_range(0, size)
+
+    ranges = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(ranges))) as pool:
+        chunks: List[bytes] = list(pool.map(lambda r: read_range(*r), ranges))
+
+    return b''.join(chunks)
+
+
+class RangeReader(io.RawIOBase):
+    """
+    Read-only file over an object of a remote storage that reads the bytes at the current
+    position with a range request, so that reading the footer and a few row groups of a parquet
+    file doesn't download the rest of the file.
+    """
+
+    def __init__(
+        self,
+        read_range: Callable[[int, int], bytes],
+        size: int,
+        footer_read_size: int = FOOTER_READ_SIZE,
+    ):
+        self.position = 0
+        self.read_range = read_range
+        self.size = size
+        self.tail = None
+        self.tail_start = max(size - footer_read_size, 0)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f'Invalid whence: {whence}')
+
+        if position < 0:
+            raise ValueError(f'Negative seek position: {position}')
+        self.position = position
+
+        return self.position
+
+    def read(self, size: int = -1) -> bytes:
+        start = self.position
+        end = self.size if size is None or size < 0 else min(start + size, self.size)
+        if start >= end:
+            return b''
+
+        if start >= self.tail_start:
+            if self.tail is None:
+                self.tail = self.read_range(self.tail_start, self.size)
+            data = self.tail[start - self.tail_start:end - self.tail_start]
+        else:
+            data = self.read_range(start, end)
+        self.position = end
+
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
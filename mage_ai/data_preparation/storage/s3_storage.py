@@ -1,15 +1,21 @@
 import io
 import json
 from contextlib import contextmanager
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pandas as pd
 import polars as pl
 import simplejson
 
+from mage_ai.data.tabular.reader import read_parquet_sample
 from mage_ai.data_preparation.storage.base_storage import BaseStorage
+from mage_ai.data_preparation.storage.remote import (
+    RangeReader,
+    run_in_storage_executor,
+)
 from mage_ai.services.aws.s3 import s3
 from mage_ai.shared.constants import S3_PREFIX
+from mage_ai.shared.environments import is_debug
 from mage_ai.shared.parsers import encode_complex
 from mage_ai.shared.urls import s3_url_path
 
@@ -76,11 +82,12 @@ class S3Storage(BaseStorage):
         default_value=None,
         raise_exception: bool = False,
     ) -> Dict:
-        """
-        TODO: Implement async http call.
-        """
-        return self.read_json_file(
-            file_path, default_value=default_value, raise_exception=raise_exception)
+        return await run_in_storage_executor(
+            self.read_json_file,
+            file_path,
+            default_value=default_value,
+            raise_exception=raise_exception,
+        )
 
     def write_json_file(self, file_path: str, data) -> None:
         self.client.upload(
@@ -93,18 +100,27 @@ class S3Storage(BaseStorage):
         )
 
     async def write_json_file_async(self, file_path: str, data) -> None:
-        """
-        TODO: Implement async http call.
-        """
-        return self.write_json_file(file_path, data)
+        return await run_in_storage_executor(self.write_json_file, file_path, data)
 
     def read_parquet(self, file_path: str, **kwargs) -> pd.DataFrame:
-        buffer = io.BytesIO(self.client.get_object(s3_url_path(file_path)).read())
-        return pd.read_parquet(buffer, **kwargs)
+        return pd.read_parquet(self.__download(file_path), **kwargs)
+
+    def read_parquet_sample(
+        self,
+        file_path: str,
+        sample_count: int,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        # Only the footer and the first row groups of the file are read with range requests.
+        object_key = s3_url_path(file_path)
+        reader = RangeReader(
+            lambda start, end: self.client.read_range(object_key, start, end),
+            self.client.get_object_size(object_key),
+        )
+        return read_parquet_sample(reader, sample_count, columns=columns)
 
     def read_polars_parquet(self, file_path: str, **kwargs) -> pl.DataFrame:
-        buffer = io.BytesIO(self.client.get_object(s3_url_path(file_path)).read())
-        return pl.read_parquet(buffer, **kwargs)
+        return pl.read_parquet(self.__download(file_path), **kwargs)
 
     def write_parquet(self, df: pd.DataFrame, file_path: str) -> None:
         buffer = io.BytesIO()
@@ -128,4 +144,16 @@ class S3Storage(BaseStorage):
             stream.close()
 
     async def read_async(self, file_path: str) -> str:
-        pass
+        try:
+            content = await run_in_storage_executor(self.client.read, s3_url_path(file_path))
+            return content.decode('utf-8')
+        except Exception as err:
+            if is_debug():
+                print(f'[ERROR] S3Storage.read_async: {err}')
+
+    def __download(self, file_path: str) -> io.BytesIO:
+        # Objects larger than a chunk are downloaded in parts with concurrent range requests.
+        buffer = io.BytesIO()
+        self.client.download_fileobj(s3_url_path(file_path), buffer)
+        buffer.seek(0)
+        return buffer
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 from mage_ai.data.constants import InputDataType
 from mage_ai.data.models.generator import DataGenerator
 from mage_ai.data.tabular.models import BatchSettings
+from mage_ai.data_preparation.block_output_cache import BlockOutputCache
 from mage_ai.data_preparation.models.block.settings.variables.models import (
     ChunkKeyTypeUnion,
 )
@@ -43,7 +44,7 @@ class VariableManager:
         else:
             self.variables_dir = variables_dir
         self.storage = LocalStorage()
-        # TODO: implement caching logic
+        self._block_output_cache = None
 
     @classmethod
     def get_manager(
@@ -62,6 +63,17 @@ class VariableManager:
         else:
             return VariableManager(**manager_args)
 
+    @property
+    def block_output_cache(self) -> Optional[BlockOutputCache]:
+        """
+        Cache of the block outputs, only available for the local variables directories.
+        """
+        if type(self.storage) is not LocalStorage:
+            return None
+        if self._block_output_cache is None:
+            self._block_output_cache = BlockOutputCache(self)
+        return self._block_output_cache
+
     def add_variable(
         self,
         pipeline_uuid: str,
@@ -1,9 +1,17 @@
 from enum import Enum
-from typing import Callable, Dict, List, Mapping
+from typing import Any, Callable, Dict, List, Mapping
 
+import numpy as np
+import simplejson
 from pandas import DataFrame, Series
-from pandas.api.types import infer_dtype
+from pandas.api.types import (
+    infer_dtype,
+    is_complex_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
 
+from mage_ai.shared.parsers import encode_complex
 from mage_ai.shared.utils import clean_name
 
 """
@@ -100,6 +108,154 @@ def clean_df_for_export(
     return copy_df
 
 
+def serialize_value(value: Any, list_serializer: Callable[[List], Any] = None) -> Any:
+    """
+    Serializes a single value that cannot be written to a database column as is.
+
+    Args:
+        value (Any): Value to serialize.
+        list_serializer (Callable[[List], Any], optional): Function used to serialize lists
+        that don't contain dictionaries. Lists are left untouched if not provided.
+
+    Returns:
+        Any: JSON string for dictionaries, arrays and lists of dictionaries, the serialized
+        list if a list serializer is provided, else the value unchanged.
+    """
+    value_type = type(value)
+    if value_type is dict or value_type is np.ndarray:
+        return _json_dumps(value)
+    elif value_type is list:
+        if len(value) >= 1 and type(value[0]) is dict:
+            return _json_dumps(value)
+        elif list_serializer is not None:
+            return list_serializer(value)
+    return value
+
+
+def serialize_column(
+    column: Series,
+    complex_to_string: bool = False,
+    list_serializer: Callable[[List], Any] = None,
+    null_to_none: bool = False,
+    strip_quotes: bool = False,
+) -> Series:
+    """
+    Serializes a data frame column for export in a single pass. The kind of values in the
+    column is detected once so that columns that only contain strings or only contain
+    dictionaries or arrays don't need to be checked value by value.
+
+    Args:
+        column (Series): Column to serialize.
+        complex_to_string (bool): Whether to convert complex numbers to strings.
+        list_serializer (Callable[[List], Any], optional): Function used to serialize lists
+        that don't contain dictionaries.
+        null_to_none (bool): Whether to replace null values (NaN, NaT, NA) with None.
+        strip_quotes (bool): Whether to remove surrounding double quotes from strings.
+
+    Returns:
+        Series: The serialized column, or the column itself if nothing had to change.
+    """
+    if complex_to_string and is_complex_dtype(column.dtype):
+        column = column.astype('string')
+
+    if is_object_dtype(column.dtype):
+        null_mask = column.isna()
+        values = column.to_numpy()
+        non_null_values = values[~null_mask.to_numpy()]
+        value_types = set(map(type, non_null_values))
+
+        if value_types and value_types != {str}:
+            if value_types <= {dict, np.ndarray}:
+                encoded = [v if n else _json_dumps(v) for v, n in zip(values, null_mask)]
+            else:
+                encoded = [
+                    v if n else serialize_value(v, list_serializer=list_serializer)
+                    for v, n in zip(values, null_mask)
+                ]
+            column = Series(encoded, index=column.index, name=column.name, dtype=object)
+            value_types = set(map(type, column[~null_mask].to_numpy()))
+
+        if strip_quotes and str in value_types:
+            column = Series(
+                [v.strip('"') if v and type(v) is str else v for v in column.to_numpy()],
+                index=column.index,
+                name=column.name,
+                dtype=object,
+            )
+    elif strip_quotes and is_string_dtype(column.dtype):
+        column = column.str.strip('"')
+
+    if null_to_none:
+        null_mask = column.isna()
+        if null_mask.any():
+            column = column.astype(object).where(~null_mask, None)
+
+    return column
+
+
+def serialize_columns(
+    df: DataFrame,
+    columns: List[str] = None,
+    complex_to_string: bool = False,
+    list_serializer: Callable[[List], Any] = None,
+    null_to_none: bool = False,
+    strip_quotes: bool = False,
+) -> DataFrame:
+    """
+    Serializes the columns of a data frame for export with `serialize_column`. Columns that
+    don't need to change are shared with the original data frame instead of being copied.
+
+    Args:
+        df (DataFrame): Data frame to serialize.
+        columns (List[str], optional): Columns to serialize. Defaults to all columns.
+        complex_to_string (bool): Whether to convert complex numbers to strings.
+        list_serializer (Callable[[List], Any], optional): Function used to serialize lists
+        that don't contain dictionaries.
+        null_to_none (bool): Whether to replace null values (NaN, NaT, NA) with None.
+        strip_quotes (bool): Whether to remove surrounding double quotes from strings.
+
+    Returns:
+        DataFrame: Data frame with serialized columns.
+    """
+    if columns is None:
+        columns = df.columns
+
+    encoded_columns = {}
+    for idx, col in enumerate(df.columns):
+        if col not in columns:
+            continue
+        column = df.iloc[:, idx]
+        encoded_column = serialize_column(
+            column,
+            complex_to_string=complex_to_string,
+            list_serializer=list_serializer,
+            null_to_none=null_to_none,
+            strip_quotes=strip_quotes,
+        )
+        if encoded_column is not column:
+            encoded_columns[idx] = encoded_column
+
+    if not encoded_columns:
+        return df
+
+    df_encoded = DataFrame(
+        {idx: encoded_columns.get(idx, df.iloc[:, idx]) for idx in range(len(df.columns))},
+        index=df.index,
+        copy=False,
+    )
+    df_encoded.columns = df.columns
+
+    return df_encoded
+
+
+def _json_dumps(value: Any) -> str:
+    return simplejson.dumps(
+        value,
+        default=encode_complex,
+        ignore_nan=True,
+    )
+
+
 def gen_table_creation_query(
     dtypes: Mapping[str, str],
     schema_name: str,
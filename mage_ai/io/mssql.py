@@ -4,7 +4,6 @@ from typing import IO, Any, List, Union
 
 import numpy as np
 import pyodbc
-import simplejson
 from pandas import DataFrame, Series
 from sqlalchemy import create_engine
 from sqlalchemy.engine import URL
@@ -12,9 +11,8 @@ from sqlalchemy.engine import URL
 from mage_ai.io.base import QUERY_ROW_LIMIT, ExportWritePolicy
 from mage_ai.io.config import BaseConfigLoader, ConfigKey
 from mage_ai.io.constants import UNIQUE_CONFLICT_METHOD_UPDATE
-from mage_ai.io.export_utils import PandasTypes
+from mage_ai.io.export_utils import PandasTypes, serialize_columns
 from mage_ai.io.sql import BaseSQL
-from mage_ai.shared.parsers import encode_complex
 
 MERGE_TABLE_SQL = '''MERGE {table_name} AS t
 USING (VALUES
@@ -135,42 +133,14 @@ class MSSQL(BaseSQL):
         buffer: Union[IO, None] = None,
         **kwargs,
     ) -> None:
-        def serialize_obj(val):
-            if type(val) is dict or type(val) is np.ndarray:
-                return simplejson.dumps(
-                    val,
-                    default=encode_complex,
-                    ignore_nan=True,
-                )
-            elif type(val) is list and len(val) >= 1 and type(val[0]) is dict:
-                return simplejson.dumps(
-                    val,
-                    default=encode_complex,
-                    ignore_nan=True,
-                )
-            return val
-
         values_placeholder = ', '.join(["?" for i in range(len(df.columns))])
         values = []
-        df_ = df.copy()
-        columns = df_.columns
-        for col in columns:
-            dtype = df_[col].dtype
-            if dtype == PandasTypes.OBJECT:
-                df_[col] = df_[col].apply(lambda x: serialize_obj(x))
-            elif dtype in (
-                PandasTypes.MIXED,
-                PandasTypes.UNKNOWN_ARRAY,
-                PandasTypes.COMPLEX,
-            ):
-                df_[col] = df_[col].astype('string')
-
-            # Remove extraneous surrounding double quotes
-            # that get added while performing conversion to string.
-            df_[col] = df_[col].apply(
-                lambda x: x.strip('"') if x and isinstance(x, str) else x
-            )
-        df_.replace({np.NaN: None}, inplace=True)
+        df_ = serialize_columns(
+            df,
+            complex_to_string=True,
+            null_to_none=True,
+            strip_quotes=True,
+        )
         for _, row in df_.iterrows():
             values.append(tuple(row))
 
@@ -2,16 +2,14 @@ from typing import IO, Dict, List, Mapping, Union
 
 import numpy as np
 import pandas as pd
-import simplejson
 from mysql.connector import connect
 from mysql.connector.cursor import MySQLCursor
 from pandas import DataFrame, Series
 
 from mage_ai.io.config import BaseConfigLoader, ConfigKey
 from mage_ai.io.constants import UNIQUE_CONFLICT_METHOD_UPDATE
-from mage_ai.io.export_utils import PandasTypes
+from mage_ai.io.export_utils import PandasTypes, serialize_columns
 from mage_ai.io.sql import BaseSQL
-from mage_ai.shared.parsers import encode_complex
 from mage_ai.shared.utils import clean_name
 
 QUERY_ROW_LIMIT = 10_000_000
@@ -113,39 +111,15 @@ class MySQL(BaseSQL):
         unique_conflict_method: str = None,
         **kwargs,
     ) -> None:
-        def serialize_obj(val):
-            if type(val) is dict or type(val) is np.ndarray:
-                return simplejson.dumps(
-                    val,
-                    default=encode_complex,
-                    ignore_nan=True,
-                )
-            elif type(val) is list and len(val) >= 1 and type(val[0]) is dict:
-                return simplejson.dumps(
-                    val,
-                    default=encode_complex,
-                    ignore_nan=True,
-                )
-            return val
         values_placeholder = ', '.join(["%s" for i in range(len(df.columns))])
         values = []
-        df_ = df.copy()
+        df_ = serialize_columns(
+            df,
+            complex_to_string=True,
+            null_to_none=True,
+            strip_quotes=True,
+        )
         columns = df_.columns
-        for col in columns:
-            dtype = df_[col].dtype
-            if dtype == PandasTypes.OBJECT:
-                df_[col] = df_[col].apply(lambda x: serialize_obj(x))
-            elif dtype in (
-                PandasTypes.MIXED,
-                PandasTypes.UNKNOWN_ARRAY,
-                PandasTypes.COMPLEX,
-            ):
-                df_[col] = df_[col].astype('string')
-
-            # Remove extraneous surrounding double quotes
-            # that get added while performing conversion to string.
-            df_[col] = df_[col].apply(lambda x: x.strip('"') if x and isinstance(x, str) else x)
-        df_.replace({np.NaN: None}, inplace=True)
 
         for _, row in df_.iterrows():
             values.append(tuple([str(val) if type(val) is pd.Timestamp else val for val in row]))
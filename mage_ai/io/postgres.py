@@ -1,5 +1,7 @@
 import traceback
-from typing import IO, List, Union
+import uuid
+from io import StringIO
+from typing import IO, Iterator, List, Mapping, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -10,11 +12,18 @@ from sshtunnel import SSHTunnelForwarder
 
 from mage_ai.io.config import BaseConfigLoader, ConfigKey
 from mage_ai.io.constants import UNIQUE_CONFLICT_METHOD_UPDATE
-from mage_ai.io.export_utils import BadConversionError, PandasTypes
+from mage_ai.io.export_utils import (
+    BadConversionError,
+    PandasTypes,
+    serialize_columns,
+)
 from mage_ai.io.sql import BaseSQL
 from mage_ai.shared.parsers import encode_complex
 from mage_ai.shared.utils import is_port_in_use
 
+STAGING_TABLE_CHUNK_SIZE = 100_000
+STAGING_TABLE_ROW_NUMBER_COLUMN = '_mage_staging_row_number'
+
 
 class Postgres(BaseSQL):
     """
@@ -289,10 +298,18 @@ class Postgres(BaseSQL):
         case_sensitive: bool = False,
         unique_conflict_method: str = None,
         unique_constraints: List[str] = None,
+        upsert_with_staging_table: bool = False,
+        staging_table_chunk_size: int = STAGING_TABLE_CHUNK_SIZE,
         **kwargs,
     ) -> None:
+        use_staging_table = False
         if unique_constraints and unique_conflict_method:
-            use_insert_command = True
+            if upsert_with_staging_table:
+                # Use COPY command into a staging table and merge it into the table
+                use_insert_command = False
+                use_staging_table = True
+            else:
+                use_insert_command = True
         else:
             # Use COPY command
             use_insert_command = False
@@ -304,43 +321,38 @@ class Postgres(BaseSQL):
                 return '{' + val[1:-1] + '}'
             return val
 
-        def serialize_obj(val):
-            if type(val) is dict or type(val) is np.ndarray:
-                return simplejson.dumps(
-                    val,
-                    default=encode_complex,
-                    ignore_nan=True,
-                )
-            elif type(val) is list and len(val) >= 1 and type(val[0]) is dict:
-                return simplejson.dumps(
-                    val,
-                    default=encode_complex,
-                    ignore_nan=True,
-                )
-            elif not use_insert_command and type(val) is list:
-                return clean_array_value(simplejson.dumps(
-                    val,
-                    default=encode_complex,
-                    ignore_nan=True,
-                ))
-            return val
-
-        df_ = df.copy()
+        def serialize_list(val):
+            return clean_array_value(simplejson.dumps(
+                val,
+                default=encode_complex,
+                ignore_nan=True,
+            ))
+
+        # The COPY command writes lists as PostgreSQL array literals and null values as empty
+        # strings, while the INSERT command relies on psycopg2 to adapt lists and None.
+        df_ = serialize_columns(
+            df,
+            list_serializer=None if use_insert_command else serialize_list,
+            null_to_none=use_insert_command,
+        )
         columns = df_.columns
 
-        for col in columns:
-            df_col_dropna = df_[col].dropna()
-            if df_col_dropna.count() == 0:
-                continue
-            if dtypes[col] == PandasTypes.OBJECT \
-                    or (df_[col].dtype == PandasTypes.OBJECT and not
-                        isinstance(df_col_dropna.iloc[0], str)):
-                df_[col] = df_[col].apply(lambda x: serialize_obj(x))
-        df_.replace({np.NaN: None}, inplace=True)
-
         insert_columns = ', '.join([f'"{col}"'for col in columns])
 
-        if use_insert_command:
+        if use_staging_table:
+            self.__upsert_with_staging_table(
+                cursor,
+                df_,
+                full_table_name,
+                allow_reserved_words=allow_reserved_words,
+                auto_clean_name=auto_clean_name,
+                buffer=buffer,
+                case_sensitive=case_sensitive,
+                chunk_size=staging_table_chunk_size,
+                unique_conflict_method=unique_conflict_method,
+                unique_constraints=unique_constraints,
+            )
+        elif use_insert_command:
             # Use INSERT command
             values_placeholder = ', '.join(["%s" for i in range(len(columns))])
             values = []
@@ -382,14 +394,26 @@ class Postgres(BaseSQL):
             cursor.executemany('\n'.join(commands), values)
         else:
             # Use COPY command
-            df_.to_csv(
-                buffer,
-                header=False,
-                index=False,
-                na_rep='',
-            )
-            buffer.seek(0)
-            cursor.copy_expert(f"""
+            self.__copy_dataframe(cursor, df_, full_table_name, insert_columns, buffer)
+
+    def __copy_dataframe(
+        self,
+        cursor: _psycopg.cursor,
+        df: DataFrame,
+        full_table_name: str,
+        insert_columns: str,
+        buffer: Union[IO, None] = None,
+    ) -> None:
+        if buffer is None:
+            buffer = StringIO()
+        df.to_csv(
+            buffer,
+            header=False,
+            index=False,
+            na_rep='',
+        )
+        buffer.seek(0)
+        cursor.copy_expert(f"""
 COPY {full_table_name} ({insert_columns}) FROM STDIN (
     FORMAT csv
     , DELIMITER \',\'
@@ -398,6 +422,100 @@ COPY {full_table_name} ({insert_columns}) FROM STDIN (
 );
         """, buffer)
 
+    def __upsert_with_staging_table(
+        self,
+        cursor: _psycopg.cursor,
+        df: DataFrame,
+        full_table_name: str,
+        allow_reserved_words: bool = False,
+        auto_clean_name: bool = True,
+        buffer: Union[IO, None] = None,
+        case_sensitive: bool = False,
+        chunk_size: int = STAGING_TABLE_CHUNK_SIZE,
+        unique_conflict_method: str = None,
+        unique_constraints: List[str] = None,
+    ) -> None:
+        """
+        Upsert the data frame by copying it, chunk by chunk, into a temporary staging table with
+        the COPY command and merging each chunk into the table with a single
+        INSERT ... SELECT ... ON CONFLICT statement. The staging table is dropped once every
+        chunk is merged.
+
+        Rows with the same unique constraint values within a chunk are deduplicated the same
+        way the row by row INSERT command resolves them: the last row wins when updating and
+        the first row wins when ignoring conflicts.
+        """
+        def __clean_column(col: str) -> str:
+            cleaned_col = self._clean_column_name(
+                col,
+                allow_reserved_words=allow_reserved_words,
+                auto_clean_name=auto_clean_name,
+                case_sensitive=case_sensitive,
+            )
+            return f'"{cleaned_col}"'
+
+        insert_columns = ', '.join([f'"{col}"' for col in df.columns])
+        cleaned_columns = [__clean_column(col) for col in df.columns]
+        cleaned_unique_constraints = [__clean_column(col) for col in unique_constraints]
+        unique_columns = ', '.join(cleaned_unique_constraints)
+
+        staging_table_name = f'mage_staging_{uuid.uuid4().hex[:16]}'
+        cursor.execute(
+            f'CREATE TEMPORARY TABLE {staging_table_name} ON COMMIT DROP AS '
+            f'SELECT {insert_columns} FROM {full_table_name} WITH NO DATA',
+        )
+        cursor.execute(
+            f'ALTER TABLE {staging_table_name} '
+            f'ADD COLUMN "{STAGING_TABLE_ROW_NUMBER_COLUMN}" BIGSERIAL',
+        )
+
+        if UNIQUE_CONFLICT_METHOD_UPDATE == unique_conflict_method:
+            row_number_order = 'DESC'
+            update_command = [f'{col} = EXCLUDED.{col}' for col in cleaned_columns]
+            conflict_command = f"DO UPDATE SET {', '.join(update_command)}"
+        else:
+            row_number_order = 'ASC'
+            conflict_command = 'DO NOTHING'
+
+        # Rows with a NULL value in any unique constraint column never conflict,
+        # so they are inserted as is instead of being deduplicated.
+        keys_not_null = ' AND '.join([f'{col} IS NOT NULL' for col in cleaned_unique_constraints])
+        keys_null = ' OR '.join([f'{col} IS NULL' for col in cleaned_unique_constraints])
+        merge_command = '\n'.join([
+            f'INSERT INTO {full_table_name} ({insert_columns})',
+            f'SELECT {insert_columns} FROM (',
+            f'    SELECT DISTINCT ON ({unique_columns}) {insert_columns}',
+            f'    FROM {staging_table_name}',
+            f'    WHERE {keys_not_null}',
+            f'    ORDER BY {unique_columns}, '
+            f'"{STAGING_TABLE_ROW_NUMBER_COLUMN}" {row_number_order}',
+            ') AS deduplicated',
+            'UNION ALL',
+            f'SELECT {insert_columns} FROM {staging_table_name} WHERE {keys_null}',
+            f'ON CONFLICT ({unique_columns})',
+            conflict_command,
+        ])
+
+        chunk_size = max(int(chunk_size or STAGING_TABLE_CHUNK_SIZE), 1)
+        for start in range(0, len(df.index), chunk_size):
+            if start > 0:
+                cursor.execute(f'TRUNCATE {staging_table_name}')
+            if buffer is not None:
+                buffer.seek(0)
+                buffer.truncate(0)
+            self.__copy_dataframe(
+                cursor,
+                df.iloc[start:start + chunk_size],
+                staging_table_name,
+                insert_columns,
+                buffer,
+            )
+            cursor.execute(merge_command)
+
+        # The staging table is dropped right away instead of on commit, so that exporting many
+        # data frames in a single transaction doesn't accumulate staging tables.
+        cursor.execute(f'DROP TABLE {staging_table_name}')
+
     def execute(self, query_string: str, **query_vars) -> None:
         """
         Sends query to the connected database.
@@ -410,3 +528,34 @@ COPY {full_table_name} ({insert_columns}) FROM STDIN (
             query_string = self._clean_query(query_string)
             with self.conn.cursor() as cur:
                 cur.execute(query_string, query_vars)
+
+    def _fetch_batches(
+        self,
+        query_string: str,
+        batch_size: int,
+        params: Union[List, Mapping, None] = None,
+    ) -> Iterator[Tuple[List[str], List[tuple]]]:
+        # A named cursor is a server-side cursor: rows are sent over by the database in batches
+        # of itersize rows instead of all at once when the query is executed.
+        cursor = self.conn.cursor(name=f'mage_cursor_{uuid.uuid4().hex}')
+        completed = False
+        try:
+            cursor.itersize = batch_size
+            cursor.execute(query_string, params)
+            rows = cursor.fetchmany(batch_size)
+            yield [d[0] for d in cursor.description], rows
+            while rows:
+                rows = cursor.fetchmany(batch_size)
+                if rows:
+                    yield [d[0] for d in cursor.description], rows
+            completed = True
+        finally:
+            # End the transaction the server-side cursor was declared in. If the batches weren't
+            # all consumed (e.g. the generator was closed early) or the query failed, roll it
+            # back, which also closes the cursor on the server.
+            if completed:
+                cursor.close()
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+                cursor.close()
@@ -1,15 +1,16 @@
 import json
+import uuid
 import warnings
-from typing import Dict, Union
+from typing import IO, Dict, Iterator, List, Mapping, Tuple, Union
 
-from pandas import DataFrame
+from pandas import DataFrame, Series
 from redshift_connector import connect
 
 from mage_ai.io.base import QUERY_ROW_LIMIT, ExportWritePolicy
 from mage_ai.io.config import BaseConfigLoader, ConfigKey
 from mage_ai.io.export_utils import clean_df_for_export, infer_dtypes
 from mage_ai.io.sql import BaseSQL
-from mage_ai.io.utils import format_value
+from mage_ai.io.utils import format_column_values
 from mage_ai.shared.utils import (
     convert_pandas_dtype_to_python_type,
     convert_python_type_to_redshift_type,
@@ -122,6 +123,39 @@ class Redshift(BaseSQL):
             except json.JSONDecodeError:
                 raise e
 
+    def _fetch_batches(
+        self,
+        query_string: str,
+        batch_size: int,
+        params: Union[List, Mapping, None] = None,
+    ) -> Iterator[Tuple[List[str], List[tuple]]]:
+        # redshift_connector doesn't support named cursors, so declare the server-side cursor
+        # explicitly. Cursors can only be used inside a transaction block.
+        cursor_name = f'mage_cursor_{uuid.uuid4().hex}'
+        cur = self.conn.cursor()
+        completed = False
+        try:
+            cur.execute(f'DECLARE {cursor_name} CURSOR FOR {query_string}', params)
+            fetch_query = f'FETCH FORWARD {batch_size} FROM {cursor_name}'
+            cur.execute(fetch_query)
+            rows = [tuple(row) for row in cur.fetchall()]
+            yield [d[0] for d in cur.description], rows
+            while rows:
+                cur.execute(fetch_query)
+                rows = [tuple(row) for row in cur.fetchall()]
+                if rows:
+                    yield [d[0] for d in cur.description], rows
+            cur.execute(f'CLOSE {cursor_name}')
+            completed = True
+        finally:
+            # If the batches weren't all consumed (e.g. the generator was closed early) or the
+            # query failed, rolling back the transaction also closes the cursor on the server.
+            if completed:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+            cur.close()
+
     def export(
         self,
         df: DataFrame,
@@ -141,7 +175,8 @@ class Redshift(BaseSQL):
         Exports a Pandas data frame to a Redshift cluster given table name.
 
         Args:
-            df (DataFrame): Data frame to export to a Redshift cluster.
+            df (DataFrame): Data frame to export to a Redshift cluster. An iterator of data
+                frames or Arrow record batches is exported in chunks, see `export_batches`.
             table_name (str): Name of the table to export the data to.
             Table must already exist.
         """
@@ -171,6 +206,20 @@ class Redshift(BaseSQL):
                 schema_name = 'public'
                 full_table_name = table_name
 
+        if isinstance(df, Iterator):
+            return self.export_batches(
+                df,
+                schema_name=schema_name,
+                table_name=table_name,
+                if_exists=if_exists,
+                index=index,
+                verbose=verbose,
+                auto_clean_name=False,
+                cascade_on_drop=cascade_on_drop,
+                drop_table_on_replace=drop_table_on_replace,
+                overwrite_types=overwrite_types,
+            )
+
         if not query_string:
             if index:
                 df = df.reset_index()
@@ -239,14 +288,7 @@ class Redshift(BaseSQL):
                         col_with_types = ', '.join(col_with_types)
                         query = f'CREATE TABLE IF NOT EXISTS {full_table_name} ({col_with_types})'
                         cur.execute(query)
-                    if df.shape[0] > 0:
-                        columns = ', '.join([t[0] for t in columns_with_type])
-                        values = [f"""({', '.join([format_value(x) for x in v])})"""
-                                  for v in df.values]
-                        values = ', '.join(values)
-                        query = f'INSERT INTO {full_table_name} ({columns})\nVALUES {values}'
-
-                        cur.execute(query)
+                    self.upload_dataframe(cur, df, None, None, full_table_name)
 
                 self.conn.commit()
 
@@ -266,6 +308,37 @@ class Redshift(BaseSQL):
             except json.JSONDecodeError:
                 raise e
 
+    def get_type(self, column: Series, dtype: str) -> str:
+        return convert_python_type_to_redshift_type(
+            convert_pandas_dtype_to_python_type(column.dtype),
+        )
+
+    def upload_dataframe(
+        self,
+        cursor,
+        df: DataFrame,
+        db_dtypes: List[str],
+        dtypes: List[str],
+        full_table_name: str,
+        buffer: Union[IO, None] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Inserts the rows of the data frame with a single INSERT statement. Used by `export` and
+        by `export_batches` for each chunk.
+        """
+        if df.shape[0] == 0:
+            return
+
+        columns = ', '.join(df.columns)
+        column_values = [
+            format_column_values(df.iloc[:, idx])
+            for idx in range(len(df.columns))
+        ]
+        values = [f"""({', '.join(row)})""" for row in zip(*column_values)]
+        values = ', '.join(values)
+        cursor.execute(f'INSERT INTO {full_table_name} ({columns})\nVALUES {values}')
+
     @classmethod
     def with_config(
         cls,
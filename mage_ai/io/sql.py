@@ -1,7 +1,11 @@
+import time
 import warnings
 from io import StringIO
-from typing import IO, Any, Dict, List, Mapping, Union
+from typing import IO, Any, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pandas import DataFrame, Series, read_sql
 
 from mage_ai.io.base import QUERY_ROW_LIMIT, BaseSQLConnection, ExportWritePolicy
@@ -13,6 +17,36 @@ from mage_ai.io.export_utils import (
     infer_dtypes,
 )
 
+LOAD_BATCH_SIZE = 100_000
+
+# Pandas types of the integer columns of the batches loaded with load_batches.
+NULLABLE_INTEGER_TYPES = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.uint8(): pd.UInt8Dtype(),
+    pa.uint16(): pd.UInt16Dtype(),
+    pa.uint32(): pd.UInt32Dtype(),
+    pa.uint64(): pd.UInt64Dtype(),
+}
+
+
+def rows_to_record_batch(columns: List[str], rows: List[tuple]) -> pa.RecordBatch:
+    """
+    Builds a record batch from the rows returned by a cursor, column by column, so that integer
+    columns with nulls keep their integer type and values instead of being converted to floats.
+    """
+    arrays = []
+    for i in range(len(columns)):
+        values = [row[i] for row in rows]
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Values PyArrow can't convert by itself, e.g. mixed types
+            arrays.append(pa.Array.from_pandas(Series(values, dtype=object)))
+    return pa.RecordBatch.from_arrays(arrays, names=columns)
+
 
 class BaseSQL(BaseSQLConnection):
     @classmethod
@@ -217,6 +251,149 @@ class BaseSQL(BaseSQLConnection):
                 **kwargs,
             )
 
+    def load_batches(
+        self,
+        query_string: str,
+        batch_size: int = LOAD_BATCH_SIZE,
+        limit: Union[int, None] = None,
+        return_type: str = 'pandas',
+        verbose: bool = True,
+        params: Union[List, Mapping, None] = None,
+    ) -> Iterator[Union[DataFrame, pa.RecordBatch]]:
+        """
+        Streams the result of the query from the connected database in batches, without ever
+        holding the whole result set in memory. Rows are read with a server-side cursor where
+        the database supports it and with `fetchmany` otherwise.
+
+        In a generator block, `yield from loader.load_batches(...)` stores each batch as its own
+        output variable, so the full result is never materialized in the block either.
+
+        Integer columns use the nullable integer types, so that a column has the same type in
+        every batch whether or not a batch contains nulls. If the query returns no rows, a single
+        empty batch with the columns of the result is yielded.
+
+        Args:
+            query_string (str): Query to execute on the database.
+            batch_size (int, Optional): The number of rows in each batch. Defaults to 100,000.
+            limit (int, Optional): The number of rows to limit the result to. Defaults to no
+                limit.
+            return_type (str, Optional): Either `'pandas'` to yield data frames or `'arrow'` to
+                yield PyArrow record batches. Defaults to `'pandas'`.
+            params (Union[List, Mapping], Optional): The parameters of the query, passed to the
+                cursor when the query is executed.
+
+        Returns:
+            Iterator[Union[DataFrame, pa.RecordBatch]]: The batches returned by the query.
+        """
+        if return_type not in ('arrow', 'pandas'):
+            raise ValueError(f'Unsupported return type \'{return_type}\' for load_batches.')
+
+        # Server-side cursors wrap the query, so it can't end with a semicolon.
+        query_string = self._clean_query(query_string).rstrip(' \n\t;')
+        if limit is not None:
+            query_string = self._enforce_limit(query_string, limit)
+
+        num_rows = 0
+        start_time = time.time()
+
+        for columns, rows in self._fetch_batches(query_string, batch_size, params=params):
+            batch = rows_to_record_batch(columns, rows)
+            num_rows += len(rows)
+            del rows
+
+            if return_type == 'arrow':
+                yield batch
+            else:
+                yield batch.to_pandas(types_mapper=NULLABLE_INTEGER_TYPES.get)
+
+        if verbose:
+            duration = max(time.time() - start_time, 1e-6)
+            self.printer.print_info(
+                f'Loaded {num_rows} rows in {duration:.2f}s '
+                f'({round(num_rows / duration)} rows/sec)'
+            )
+
+    def load_to_parquet(
+        self,
+        query_string: str,
+        file_path: str,
+        batch_size: int = LOAD_BATCH_SIZE,
+        limit: Union[int, None] = None,
+        verbose: bool = True,
+        params: Union[List, Mapping, None] = None,
+    ) -> int:
+        """
+        Streams the result of the query into a parquet file, one row group per batch, so that
+        peak memory is bounded by the batch size. If the query returns no rows, an empty file
+        with the columns of the result is written.
+
+        Args:
+            query_string (str): Query to execute on the database.
+            file_path (str): Path of the parquet file to write, e.g. the block's variable file.
+            batch_size (int, Optional): The number of rows in each batch. Defaults to 100,000.
+            limit (int, Optional): The number of rows to limit the result to. Defaults to no
+                limit.
+            params (Union[List, Mapping], Optional): The parameters of the query, passed to the
+                cursor when the query is executed.
+
+        Returns:
+            int: The number of rows written.
+        """
+        num_rows = 0
+        writer = None
+        try:
+            for batch in self.load_batches(
+                query_string,
+                batch_size=batch_size,
+                limit=limit,
+                return_type='arrow',
+                verbose=verbose,
+                params=params,
+            ):
+                if writer is None:
+                    # The type of a column that is all null in the first batch can't be
+                    # inferred, store it as a string column.
+                    schema = pa.schema([
+                        f.with_type(pa.string()) if pa.types.is_null(f.type) else f
+                        for f in batch.schema
+                    ])
+                    writer = pq.ParquetWriter(file_path, schema)
+                if batch.num_rows == 0:
+                    continue
+                if batch.schema != writer.schema:
+                    batch = pa.Table.from_batches([batch]).cast(writer.schema)
+                writer.write(batch)
+                num_rows += batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return num_rows
+
+    def _fetch_batches(
+        self,
+        query_string: str,
+        batch_size: int,
+        params: Union[List, Mapping, None] = None,
+    ) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """
+        Executes the query and yields the column names and rows of each batch; a single empty
+        batch is yielded if the query returns no rows. Subclasses override this method to stream
+        with a server-side cursor.
+        """
+        with self.conn.cursor() as cursor:
+            if params is None:
+                cursor.execute(query_string)
+            else:
+                cursor.execute(query_string, params)
+            columns = [d[0] for d in cursor.description]
+            rows = cursor.fetchmany(batch_size)
+            yield columns, rows
+            while rows:
+                rows = cursor.fetchmany(batch_size)
+                if rows:
+                    yield columns, rows
+
     def export(
         self,
         df: DataFrame,
@@ -245,6 +422,8 @@ class BaseSQL(BaseSQLConnection):
         also created.
 
         Args:
+            df (DataFrame): Data frame to export. An iterator of data frames or Arrow record
+                batches is exported in chunks, see `export_batches`.
             schema_name (str): Name of the schema of the table to export data to.
             table_name (str): Name of the table to insert rows from this data frame into.
             if_exists (ExportWritePolicy): Specifies export policy if table exists. Either
@@ -263,6 +442,26 @@ class BaseSQL(BaseSQLConnection):
         if schema_name is None:
             schema_name = self.default_schema()
 
+        if isinstance(df, Iterator):
+            return self.export_batches(
+                df,
+                schema_name=schema_name,
+                table_name=table_name,
+                if_exists=if_exists,
+                index=index,
+                verbose=verbose,
+                allow_reserved_words=allow_reserved_words,
+                auto_clean_name=auto_clean_name,
+                case_sensitive=case_sensitive,
+                cascade_on_drop=cascade_on_drop,
+                drop_table_on_replace=drop_table_on_replace,
+                overwrite_types=overwrite_types,
+                unique_conflict_method=unique_conflict_method,
+                unique_constraints=unique_constraints,
+                skip_semicolon_at_end=skip_semicolon_at_end,
+                **kwargs,
+            )
+
         if type(df) is dict:
             df = DataFrame([df])
         elif type(df) is list:
@@ -274,22 +473,13 @@ class BaseSQL(BaseSQLConnection):
             full_table_name = table_name
 
         if not query_string:
-            if index:
-                df = df.reset_index()
-
-            # Clean dataframe
-            dtypes = infer_dtypes(df)
-            df = clean_df_for_export(df, self.clean, dtypes)
-
-            # Clean column names
-            if auto_clean_name:
-                col_mapping = {col: self._clean_column_name(
-                                            col,
-                                            allow_reserved_words=allow_reserved_words,
-                                            case_sensitive=case_sensitive)
-                               for col in df.columns}
-                df = df.rename(columns=col_mapping)
-            dtypes = infer_dtypes(df)
+            df, dtypes = self._prepare_dataframe_for_export(
+                df,
+                allow_reserved_words=allow_reserved_words,
+                auto_clean_name=auto_clean_name,
+                case_sensitive=case_sensitive,
+                index=index,
+            )
 
         def __process():
             if not query_string and kwargs.get('fast_execute', True) and \
@@ -305,29 +495,16 @@ class BaseSQL(BaseSQLConnection):
                 return
 
             buffer = StringIO()
-            table_exists = self.table_exists(schema_name, table_name)
 
             with self.conn.cursor() as cur:
-                if schema_name:
-                    query = self.build_create_schema_command(schema_name)
-                    cur.execute(query)
-
-                should_create_table = not table_exists
-
-                if table_exists:
-                    if ExportWritePolicy.FAIL == if_exists:
-                        raise ValueError(
-                            f'Table \'{full_table_name}\' already exists in database.'
-                        )
-                    elif ExportWritePolicy.REPLACE == if_exists:
-                        if drop_table_on_replace:
-                            cmd = f'DROP TABLE {full_table_name}'
-                            if cascade_on_drop:
-                                cmd = f'{cmd} CASCADE'
-                            cur.execute(cmd)
-                            should_create_table = True
-                        else:
-                            cur.execute(f'DELETE FROM {full_table_name}')
+                should_create_table, table_exists = self._prepare_table_for_export(
+                    cur,
+                    schema_name,
+                    table_name,
+                    cascade_on_drop=cascade_on_drop,
+                    drop_table_on_replace=drop_table_on_replace,
+                    if_exists=if_exists,
+                )
 
                 if query_string:
                     query = self.build_create_table_as_command(
@@ -380,6 +557,228 @@ class BaseSQL(BaseSQLConnection):
         else:
             __process()
 
+    def export_batches(
+        self,
+        batches: Iterable[Union[DataFrame, pa.RecordBatch, pa.Table]],
+        schema_name: str = None,
+        table_name: str = None,
+        if_exists: ExportWritePolicy = ExportWritePolicy.REPLACE,
+        index: bool = False,
+        verbose: bool = True,
+        allow_reserved_words: bool = False,
+        auto_clean_name: bool = True,
+        case_sensitive: bool = False,
+        cascade_on_drop: bool = False,
+        drop_table_on_replace: bool = False,
+        overwrite_types: Dict = None,
+        unique_conflict_method: str = None,
+        unique_constraints: List[str] = None,
+        skip_semicolon_at_end: bool = False,
+        **kwargs,
+    ) -> int:
+        """
+        Exports a stream of data frames or Arrow record batches to the connected database, one
+        chunk at a time, so that peak memory is bounded by the size of a single chunk instead of
+        the whole dataset. The export policy is applied before the first chunk is read, the
+        table is created from the first non-empty chunk (or from the columns of the first chunk
+        if every chunk is empty) and every chunk is written through `upload_dataframe` in a
+        single transaction: either all the chunks are exported or none of them are.
+
+        Args:
+            batches (Iterable): Chunks to export. Each chunk can be a Pandas data frame, a
+                PyArrow record batch or table, or a record batch yielded by
+                `mage_ai.data.tabular.reader.scan_batch_datasets_generator`.
+            schema_name (str): Name of the schema of the table to export data to.
+            table_name (str): Name of the table to insert rows from the chunks into.
+            if_exists (ExportWritePolicy): Specifies export policy if table exists, see `export`.
+            index (bool): If true, the data frame index is also exported alongside the table.
+                            Defaults to False.
+            **kwargs: Additional query parameters.
+
+        Returns:
+            int: The number of rows exported.
+        """
+        if table_name is None:
+            raise Exception('Please provide a table_name argument in the export method.')
+
+        if schema_name is None:
+            schema_name = self.default_schema()
+
+        if schema_name:
+            full_table_name = f'{schema_name}.{table_name}'
+        else:
+            full_table_name = table_name
+
+        num_rows = 0
+        start_time = time.time()
+
+        def __create_table(cur, df: DataFrame, dtypes: Dict[str, str]) -> Dict[str, str]:
+            db_dtypes = {col: self.get_type(df[col], dtypes[col]) for col in dtypes}
+            cur.execute(self.build_create_table_command(
+                db_dtypes,
+                schema_name,
+                table_name,
+                auto_clean_name=auto_clean_name,
+                case_sensitive=case_sensitive,
+                unique_constraints=unique_constraints,
+                overwrite_types=overwrite_types,
+                skip_semicolon_at_end=skip_semicolon_at_end,
+            ))
+            return db_dtypes
+
+        def __process():
+            nonlocal num_rows
+
+            db_dtypes = None
+            empty_chunk = None
+            with self.conn.cursor() as cur:
+                try:
+                    # The export policy applies even if every chunk is empty.
+                    should_create_table, _ = self._prepare_table_for_export(
+                        cur,
+                        schema_name,
+                        table_name,
+                        cascade_on_drop=cascade_on_drop,
+                        drop_table_on_replace=drop_table_on_replace,
+                        if_exists=if_exists,
+                    )
+
+                    for batch in batches:
+                        df = _batch_to_dataframe(batch)
+                        if df is None:
+                            continue
+
+                        df, dtypes = self._prepare_dataframe_for_export(
+                            df,
+                            allow_reserved_words=allow_reserved_words,
+                            auto_clean_name=auto_clean_name,
+                            case_sensitive=case_sensitive,
+                            index=index,
+                        )
+                        if df.empty:
+                            if empty_chunk is None:
+                                empty_chunk = (df, dtypes)
+                            continue
+
+                        if db_dtypes is None:
+                            if should_create_table:
+                                db_dtypes = __create_table(cur, df, dtypes)
+                            else:
+                                db_dtypes = {
+                                    col: self.get_type(df[col], dtypes[col]) for col in dtypes
+                                }
+
+                        self.upload_dataframe(
+                            cur,
+                            df,
+                            db_dtypes,
+                            dtypes,
+                            full_table_name,
+                            allow_reserved_words=allow_reserved_words,
+                            buffer=StringIO(),
+                            case_sensitive=case_sensitive,
+                            auto_clean_name=auto_clean_name,
+                            unique_conflict_method=unique_conflict_method,
+                            unique_constraints=unique_constraints,
+                            **kwargs,
+                        )
+                        num_rows += len(df.index)
+
+                    # Every chunk was empty: create the table from the columns of the first one.
+                    if db_dtypes is None and should_create_table and empty_chunk is not None:
+                        __create_table(cur, *empty_chunk)
+                except Exception:
+                    self.conn.rollback()
+                    raise
+            self.conn.commit()
+
+        if verbose:
+            with self.printer.print_msg(
+                f'Exporting data in chunks to \'{full_table_name}\''
+            ):
+                __process()
+
+            duration = max(time.time() - start_time, 1e-6)
+            self.printer.print_info(
+                f'Exported {num_rows} rows in {duration:.2f}s '
+                f'({round(num_rows / duration)} rows/sec)'
+            )
+        else:
+            __process()
+
+        return num_rows
+
+    def _prepare_dataframe_for_export(
+        self,
+        df: DataFrame,
+        allow_reserved_words: bool = False,
+        auto_clean_name: bool = True,
+        case_sensitive: bool = False,
+        index: bool = False,
+    ) -> Tuple[DataFrame, Dict[str, str]]:
+        if index:
+            df = df.reset_index()
+
+        # Clean dataframe
+        dtypes = infer_dtypes(df)
+        df = clean_df_for_export(df, self.clean, dtypes)
+
+        # Clean column names
+        if auto_clean_name:
+            col_mapping = {col: self._clean_column_name(
+                                        col,
+                                        allow_reserved_words=allow_reserved_words,
+                                        case_sensitive=case_sensitive)
+                           for col in df.columns}
+            df = df.rename(columns=col_mapping)
+
+        return df, infer_dtypes(df)
+
+    def _prepare_table_for_export(
+        self,
+        cursor,
+        schema_name: str,
+        table_name: str,
+        cascade_on_drop: bool = False,
+        drop_table_on_replace: bool = False,
+        if_exists: ExportWritePolicy = ExportWritePolicy.REPLACE,
+    ) -> Tuple[bool, bool]:
+        """
+        Creates the schema and applies the export policy to the existing table.
+
+        Returns:
+            Tuple[bool, bool]: Whether the table needs to be created and whether it existed.
+        """
+        if schema_name:
+            full_table_name = f'{schema_name}.{table_name}'
+        else:
+            full_table_name = table_name
+
+        table_exists = self.table_exists(schema_name, table_name)
+
+        if schema_name:
+            query = self.build_create_schema_command(schema_name)
+            cursor.execute(query)
+
+        should_create_table = not table_exists
+
+        if table_exists:
+            if ExportWritePolicy.FAIL == if_exists:
+                raise ValueError(
+                    f'Table \'{full_table_name}\' already exists in database.'
+                )
+            elif ExportWritePolicy.REPLACE == if_exists:
+                if drop_table_on_replace:
+                    cmd = f'DROP TABLE {full_table_name}'
+                    if cascade_on_drop:
+                        cmd = f'{cmd} CASCADE'
+                    cursor.execute(cmd)
+                    should_create_table = True
+                else:
+                    cursor.execute(f'DELETE FROM {full_table_name}')
+
+        return should_create_table, table_exists
+
     def clean(self, column: Series, dtype: str) -> Series:
         """
         Cleans column in order to write data frame to PostgreSQL database
@@ -397,3 +796,16 @@ class BaseSQL(BaseSQLConnection):
             return column.view(int)
         else:
             return column
+
+
+def _batch_to_dataframe(batch: Any) -> DataFrame:
+    if batch is None or isinstance(batch, DataFrame):
+        return batch
+    if isinstance(batch, (pa.RecordBatch, pa.Table)):
+        return batch.to_pandas()
+    # pyarrow.dataset.TaggedRecordBatch and mage_ai.data.models.pyarrow.record_batch.Batch
+    if hasattr(batch, 'record_batch'):
+        return batch.record_batch.to_pandas()
+    if isinstance(batch, dict):
+        return DataFrame([batch])
+    return DataFrame(batch)
@@ -1,4 +1,7 @@
+from typing import List
+
 import pandas as pd
+from pandas.api.types import is_bool_dtype
 
 
 def format_value(value):
@@ -22,6 +25,22 @@ def format_value(value):
     return f"'{value}'"
 
 
+def format_column_values(column: pd.Series) -> List[str]:
+    """
+    Formats all the values of a column as SQL literals, the same way `format_value` formats a
+    single value, without going through each value of numeric and boolean columns in Python.
+    """
+    if is_bool_dtype(column.dtype) and not column.hasnans:
+        return column.map({True: 'TRUE', False: 'FALSE'}).tolist()
+    elif column.dtype.kind in ('i', 'u', 'f'):
+        formatted = column.astype(str)
+        if column.hasnans:
+            formatted = formatted.where(column.notna(), 'NULL')
+        return formatted.tolist()
+
+    return [format_value(v) for v in column.astype(object).tolist()]
+
+
 def escape_quotes(line: str, single: bool = True, double: bool = True) -> str:
     new_line = str(line)
     if single:
@@ -1,6 +1,7 @@
 import asyncio
 import collections
 import enum
+import json
 import traceback
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -23,9 +24,12 @@ from sqlalchemy import (
     String,
     Table,
     Text,
+    insert,
     or_,
 )
-from sqlalchemy.orm import joinedload, relationship, validates
+from sqlalchemy.orm import joinedload, relationship, scoped_session, validates
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.sql import func, text
 from sqlalchemy.sql.functions import coalesce
 
@@ -75,6 +79,9 @@ from mage_ai.shared.dates import compare
 from mage_ai.shared.hash import ignore_keys, index_by, merge_dict
 from mage_ai.shared.utils import clean_name
 
+# Maximum number of block runs written by a single bulk statement.
+BLOCK_RUN_BATCH_SIZE = 500
+
 pipeline_schedule_event_matcher_association_table = Table(
     'pipeline_schedule_event_matcher_association',
     Base.metadata,
@@ -1263,8 +1270,8 @@ class PipelineRun(PipelineRunProjectPlatformMixin, BaseModel):
         * If there is a match, the block run's status is updated accordingly.
         * If no updates are made for a block run, it is added to the list of not updated block runs.
 
-        The method refreshes the pipeline run and continues iterating through block runs until no
-        more updates can be made.
+        The updates of each pass are written with one bulk UPDATE per status, and the method
+        continues iterating through block runs until no more updates can be made.
 
         Args:
             block_runs (List[BlockRun]): A list of block runs to update.
@@ -1297,6 +1304,7 @@ class PipelineRun(PipelineRunProjectPlatformMixin, BaseModel):
             BlockRun.BlockRunStatus.UPSTREAM_FAILED: failed_block_uuids,
         }
         not_updated_block_runs = []
+        updated_statuses = dict()
         for block_run in block_runs:
             updated_status = False
             dynamic_upstream_block_uuids = block_run.metrics and block_run.metrics.get(
@@ -1320,17 +1328,38 @@ class PipelineRun(PipelineRunProjectPlatformMixin, BaseModel):
                                 for block_inner in block_uuids
                             ]
                 if any(b in block_uuids for b in upstream_block_uuids):
-                    block_run.update(status=status)
+                    updated_statuses[block_run] = status
                     updated_status = True
 
             if not updated_status:
                 not_updated_block_runs.append(block_run)
 
-        self.refresh()
+        if updated_statuses:
+            # The updated block runs hold their new status, which the next pass reads from
+            # self.block_runs.
+            with BlockRunUnitOfWork() as unit_of_work:
+                for block_run, status in updated_statuses.items():
+                    unit_of_work.update(block_run, status=status)
+
         # keep iterating through block runs until no more updates can be made
         if len(block_runs) != len(not_updated_block_runs):
             self.update_block_run_statuses(not_updated_block_runs)
 
+    @safe_db_query
+    def refresh_block_runs(self) -> List['BlockRun']:
+        """
+        Reload all the block runs of the pipeline run with a single query, including the block
+        runs created since they were loaded.
+        """
+        block_runs = (
+            BlockRun.query.filter(BlockRun.pipeline_run_id == self.id)
+            .order_by(BlockRun.id)
+            .populate_existing()
+            .all()
+        )
+        set_committed_value(self, 'block_runs', block_runs)
+        return block_runs
+
     @classmethod
     @safe_db_query
     def active_runs_for_pipelines(
@@ -1349,7 +1378,9 @@ class PipelineRun(PipelineRunProjectPlatformMixin, BaseModel):
             self.pipeline_schedule_id.in_(schedule_ids),
         )
         if include_block_runs:
-            query = query.options(joinedload(PipelineRun.block_runs))
+            # Reload the runs and block runs already in the session as well, so that the
+            # scheduler doesn't need to refresh them one by one.
+            query = query.options(joinedload(PipelineRun.block_runs)).populate_existing()
         return query.all()
 
     @classmethod
@@ -1555,10 +1586,11 @@ class PipelineRun(PipelineRunProjectPlatformMixin, BaseModel):
             block_arr,
         )
 
-        return [
-            self.create_block_run(block_uuid, **options)
-            for block_uuid, options in block_arr
-        ]
+        with BlockRunUnitOfWork() as unit_of_work:
+            for block_uuid, options in block_arr:
+                unit_of_work.create(self.id, block_uuid, **options)
+
+        return unit_of_work.created_block_runs
 
     def any_blocks_failed(self) -> bool:
         return any(b.status == BlockRun.BlockRunStatus.FAILED for b in self.block_runs)
@@ -1575,7 +1607,12 @@ class PipelineRun(PipelineRunProjectPlatformMixin, BaseModel):
                     BlockRun.BlockRunStatus.UPSTREAM_FAILED,
                 ]
             )
-        return all(b.status in statuses for b in self.block_runs)
+        block_runs = self.block_runs
+        # The dynamic child blocks with block runs left to create aren't completed.
+        return all(b.status in statuses for b in block_runs) and not any(
+            BlockRun.BlockRunStatus.COMPLETED == b.status and b.dynamic_children_pending
+            for b in block_runs
+        )
 
     def get_variables(
         self, extra_variables: Dict = None, pipeline_uuid: str = None
@@ -1742,6 +1779,15 @@ class BlockRun(BlockRunProjectPlatformMixin, BaseModel):
 
     pipeline_run = relationship(PipelineRun, back_populates='block_runs')
 
+    @property
+    def dynamic_children_pending(self) -> int:
+        """
+        The number of block runs of a dynamic child block that aren't created yet, from the
+        counter the controller block run keeps in its metrics.
+        """
+        counter = (self.metrics or {}).get('dynamic_children') or {}
+        return max((counter.get('total') or 0) - (counter.get('created') or 0), 0)
+
     @property
     def logs(self):
         pipeline = self.pipeline_run.pipeline_schedule.pipeline
@@ -1774,6 +1820,77 @@ class BlockRun(BlockRunProjectPlatformMixin, BaseModel):
         )
         db_connection.session.commit()
 
+    @classmethod
+    def batch_update(self, block_runs: List['BlockRun'], commit: bool = True, **values) -> None:
+        """
+        Update the block runs with UPDATE ... WHERE id IN statements, and set the values on the
+        loaded block runs without marking them as modified.
+        """
+        block_run_ids = [b.id for b in block_runs]
+        for i in range(0, len(block_run_ids), BLOCK_RUN_BATCH_SIZE):
+            BlockRun.query.filter(
+                BlockRun.id.in_(block_run_ids[i:i + BLOCK_RUN_BATCH_SIZE]),
+            ).update(
+                {getattr(BlockRun, key): value for key, value in values.items()},
+                synchronize_session=False,
+            )
+        for block_run in block_runs:
+            for key, value in values.items():
+                set_committed_value(block_run, key, value)
+            # Reloaded when accessed, since the database sets it.
+            db_connection.session.expire(block_run, ['updated_at'])
+        if commit:
+            db_connection.session.commit()
+
+    @classmethod
+    def batch_create(self, rows: List[Dict], commit: bool = True) -> List['BlockRun']:
+        """
+        Create the block runs with multi-row INSERT statements, then load them with a single
+        query.
+
+        Args:
+            rows (List[Dict]): The column values of each block run, including pipeline_run_id
+                and block_uuid.
+
+        Returns:
+            List[BlockRun]: The created block runs, in the order of the rows.
+        """
+        if not rows:
+            return []
+
+        # All the rows of a multi-row INSERT have the same columns.
+        columns = set(k for row in rows for k in row.keys())
+        defaults = dict(status=BlockRun.BlockRunStatus.INITIAL)
+        values = [
+            {c: row.get(c, defaults.get(c)) for c in columns}
+            for row in rows
+        ]
+        for i in range(0, len(values), BLOCK_RUN_BATCH_SIZE):
+            db_connection.session.execute(
+                insert(BlockRun.__table__).values(values[i:i + BLOCK_RUN_BATCH_SIZE]),
+            )
+
+        keys = [(row['pipeline_run_id'], row['block_uuid']) for row in rows]
+        block_runs_by_key = collections.defaultdict(list)
+        for block_run in BlockRun.query.filter(
+            BlockRun.pipeline_run_id.in_(set(k[0] for k in keys)),
+            BlockRun.block_uuid.in_(set(k[1] for k in keys)),
+        ).order_by(BlockRun.id.desc()):
+            block_runs_by_key[(block_run.pipeline_run_id, block_run.block_uuid)].append(
+                block_run,
+            )
+
+        # The newest block runs with the same pipeline run and block UUID are the created ones.
+        created = []
+        for key in reversed(keys):
+            created.append(block_runs_by_key[key].pop(0))
+        created.reverse()
+
+        if commit:
+            db_connection.session.commit()
+
+        return created
+
     @classmethod
     @safe_db_query
     def batch_delete(self, block_run_ids: List[int]):
@@ -1884,6 +2001,94 @@ class BlockRun(BlockRunProjectPlatformMixin, BaseModel):
         )
 
 
+class BlockRunUnitOfWork:
+    """
+    Collects block run updates and creations, then writes them in a single transaction with one
+    UPDATE ... WHERE id IN statement per set of updated values and multi-row INSERT statements
+    for the created block runs.
+
+    Example:
+        with BlockRunUnitOfWork() as unit_of_work:
+            for block_run in block_runs:
+                unit_of_work.update(block_run, status=BlockRun.BlockRunStatus.QUEUED)
+
+    The loaded block runs hold the written values after the commit, so the commit doesn't
+    expire the objects of the session, which would reload each of them on its next access.
+    """
+
+    def __init__(self):
+        self.updates = dict()
+        self.creations = []
+        self.created_block_runs = []
+
+    def __enter__(self) -> 'BlockRunUnitOfWork':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def update(self, block_run: BlockRun, **values) -> None:
+        if block_run.id in self.updates:
+            self.updates[block_run.id][1].update(values)
+        else:
+            self.updates[block_run.id] = (block_run, values)
+
+    def create(self, pipeline_run_id: int, block_uuid: str, **kwargs) -> None:
+        self.creations.append(dict(
+            block_uuid=block_uuid,
+            pipeline_run_id=pipeline_run_id,
+            **kwargs,
+        ))
+
+    @safe_db_query
+    def commit(self) -> List[BlockRun]:
+        """
+        Write the collected changes.
+
+        Returns:
+            List[BlockRun]: The created block runs, in the order they were added.
+        """
+        if not self.updates and not self.creations:
+            return []
+
+        groups = dict()
+        for block_run, values in self.updates.values():
+            key = json.dumps(values, default=str, sort_keys=True)
+            groups.setdefault(key, (values, []))[1].append(block_run)
+
+        session = db_connection.session
+        if isinstance(session, scoped_session):
+            session = session()
+
+        try:
+            for values, block_runs in groups.values():
+                BlockRun.batch_update(block_runs, commit=False, **values)
+            created_block_runs = BlockRun.batch_create(self.creations, commit=False)
+
+            expire_on_commit = session.expire_on_commit
+            session.expire_on_commit = False
+            try:
+                session.commit()
+            finally:
+                session.expire_on_commit = expire_on_commit
+        except Exception as err:
+            session.rollback()
+            raise err
+
+        # The pipeline runs loaded in the session reload their block runs on the next access.
+        for pipeline_run_id in set(row['pipeline_run_id'] for row in self.creations):
+            pipeline_run = session.identity_map.get(identity_key(PipelineRun, pipeline_run_id))
+            if pipeline_run is not None:
+                session.expire(pipeline_run, ['block_runs'])
+
+        self.created_block_runs = created_block_runs
+        self.updates = dict()
+        self.creations = []
+
+        return self.created_block_runs
+
+
 class EventMatcher(BaseModel):
     class EventType(str, enum.Enum):
         AWS_EVENT = 'aws_event'
@@ -1,6 +1,6 @@
 import traceback
 from enum import Enum
-from typing import Callable, Dict, Union
+from typing import Callable, Dict, List, Union
 
 from mage_ai.orchestration.queue.queue_factory import QueueFactory
 
@@ -43,6 +43,39 @@ class JobManager:
             logging_tags=logging_tags,
         )
 
+    def has_block_run_jobs(
+        self,
+        block_run_ids: List[int],
+        logger=None,
+        logging_tags: Dict = None,
+        logging_tags_by_block_run_id: Dict[int, Dict] = None,
+    ) -> Dict[int, bool]:
+        """
+        Check the jobs of many block runs at once.
+
+        Args:
+            logging_tags_by_block_run_id (Dict[int, Dict], optional): Tags logged for each block
+                run instead of logging_tags.
+
+        Returns:
+            Dict[int, bool]: Whether each block run has a job, by block run ID.
+        """
+        job_ids = {
+            self.__job_id(JobType.BLOCK_RUN, block_run_id): block_run_id
+            for block_run_id in block_run_ids
+        }
+        has_jobs = self.queue.has_jobs(
+            list(job_ids.keys()),
+            logger=logger,
+            logging_tags=logging_tags,
+            logging_tags_by_job_id={
+                job_id: logging_tags_by_block_run_id[block_run_id]
+                for job_id, block_run_id in job_ids.items()
+                if block_run_id in (logging_tags_by_block_run_id or dict())
+            },
+        )
+        return {block_run_id: has_jobs[job_id] for job_id, block_run_id in job_ids.items()}
+
     def has_pipeline_run_job(
         self,
         pipeline_run_id: int,
@@ -70,6 +103,30 @@ class JobManager:
             logging_tags=logging_tags,
         )
 
+    def has_integration_stream_jobs(
+        self,
+        pipeline_run_id: int,
+        streams: List[str],
+        logger=None,
+        logging_tags: Dict = None,
+    ) -> Dict[str, bool]:
+        """
+        Check the jobs of many streams of an integration pipeline run at once.
+
+        Returns:
+            Dict[str, bool]: Whether each stream has a job, by stream.
+        """
+        job_ids = {
+            self.__job_id(JobType.PIPELINE_RUN, f'{pipeline_run_id}_{stream}'): stream
+            for stream in streams
+        }
+        has_jobs = self.queue.has_jobs(
+            list(job_ids.keys()),
+            logger=logger,
+            logging_tags=logging_tags,
+        )
+        return {stream: has_jobs[job_id] for job_id, stream in job_ids.items()}
+
     def kill_block_run_job(self, block_run_id):
         print(f'Kill block run id: {block_run_id}')
         job_id = self.__job_id(JobType.BLOCK_RUN, block_run_id)
@@ -17,6 +17,9 @@ from mage_ai.data_integrations.utils.scheduler import (
 from mage_ai.data_preparation.executors.executor_factory import ExecutorFactory
 from mage_ai.data_preparation.logging.logger import DictLogger
 from mage_ai.data_preparation.logging.logger_manager_factory import LoggerManagerFactory
+from mage_ai.data_preparation.models.block.dynamic.child import (
+    create_next_dynamic_child_block_runs,
+)
 from mage_ai.data_preparation.models.constants import ExecutorType, PipelineType
 from mage_ai.data_preparation.models.pipeline import Pipeline
 from mage_ai.data_preparation.models.triggers import (
@@ -32,6 +35,7 @@ from mage_ai.orchestration.db import db_connection, safe_db_query
 from mage_ai.orchestration.db.models.schedules import (
     Backfill,
     BlockRun,
+    BlockRunUnitOfWork,
     EventMatcher,
     PipelineRun,
     PipelineSchedule,
@@ -44,11 +48,12 @@ from mage_ai.orchestration.metrics.pipeline_run import (
 )
 from mage_ai.orchestration.notification.config import NotificationConfig
 from mage_ai.orchestration.notification.sender import NotificationSender
+from mage_ai.orchestration.scheduler_index import scheduler_index
 from mage_ai.orchestration.utils.distributed_lock import DistributedLock
 from mage_ai.orchestration.utils.git import log_git_sync, run_git_sync
 from mage_ai.orchestration.utils.resources import get_compute, get_memory
 from mage_ai.server.logger import Logger
-from mage_ai.settings import HOSTNAME
+from mage_ai.settings import HOSTNAME, SCHEDULER_INCREMENTAL_MODE
 from mage_ai.settings.platform import (
     project_platform_activated,
     repo_path_from_database_query_to_project_repo_path,
@@ -206,8 +211,7 @@ class PipelineScheduler:
 
         self.__run_heartbeat()
 
-        for b in self.pipeline_run.block_runs:
-            b.refresh()
+        self.pipeline_run.refresh_block_runs()
 
         if PipelineType.STREAMING == self.pipeline.type:
             self.__schedule_pipeline()
@@ -592,6 +596,12 @@ class PipelineScheduler:
         Returns:
             None
         """
+        create_next_dynamic_child_block_runs(
+            self.pipeline,
+            self.pipeline_run.block_runs,
+            execution_partition=self.pipeline_run.execution_partition,
+            logging_tags=self.build_tags(),
+        )
         self.pipeline_run.update_block_run_statuses(self.pipeline_run.initial_block_runs)
         if block_runs is None:
             block_runs_to_schedule = self.pipeline_run.executable_block_runs(
@@ -610,16 +620,17 @@ class PipelineScheduler:
             if block_run_quota <= 0:
                 return
 
-        for b in block_runs_to_schedule[:block_run_quota]:
+        block_runs_to_schedule = block_runs_to_schedule[:block_run_quota]
+        with BlockRunUnitOfWork() as unit_of_work:
+            for b in block_runs_to_schedule:
+                unit_of_work.update(b, status=BlockRun.BlockRunStatus.QUEUED)
+
+        for b in block_runs_to_schedule:
             tags = dict(
                 block_run_id=b.id,
                 block_uuid=b.block_uuid,
             )
 
-            b.update(
-                status=BlockRun.BlockRunStatus.QUEUED,
-            )
-
             job_manager.add_job(
                 JobType.BLOCK_RUN,
                 b.id,
@@ -694,16 +705,16 @@ class PipelineScheduler:
 
             # Filter parallel streams so that we are only left with block runs for streams
             # that do not have a corresponding integration stream job.
-            parallel_streams_to_schedule = []
-            for stream in parallel_streams:
-                tap_stream_id = stream.get('tap_stream_id')
-                if not job_manager.has_integration_stream_job(
-                    self.pipeline_run.id,
-                    tap_stream_id,
-                    logger=self.logger,
-                    logging_tags=tags,
-                ):
-                    parallel_streams_to_schedule.append(stream)
+            has_stream_jobs = job_manager.has_integration_stream_jobs(
+                self.pipeline_run.id,
+                [stream.get('tap_stream_id') for stream in parallel_streams],
+                logger=self.logger,
+                logging_tags=tags,
+            )
+            parallel_streams_to_schedule = [
+                stream for stream in parallel_streams
+                if not has_stream_jobs[stream.get('tap_stream_id')]
+            ]
 
             # Stop scheduling if there are no streams to schedule.
             if (not sequential_streams or
@@ -842,22 +853,26 @@ class PipelineScheduler:
         Returns:
             List[BlockRun]: A list of crashed block runs.
         """
-        for b in self.pipeline_run.block_runs:
-            b.refresh()
+        self.pipeline_run.refresh_block_runs()
         running_or_queued_block_runs = [b for b in self.pipeline_run.block_runs if b.status in [
             BlockRun.BlockRunStatus.RUNNING,
             BlockRun.BlockRunStatus.QUEUED,
         ]]
 
-        crashed_runs = []
-        for br in running_or_queued_block_runs:
-            if not job_manager.has_block_run_job(
-                    br.id,
-                    logger=self.logger,
-                    logging_tags=self.build_tags(block_run=br),
-            ):
-                br.update(status=BlockRun.BlockRunStatus.INITIAL)
-                crashed_runs.append(br)
+        if not running_or_queued_block_runs:
+            return []
+
+        has_jobs = job_manager.has_block_run_jobs(
+            [br.id for br in running_or_queued_block_runs],
+            logger=self.logger,
+            logging_tags_by_block_run_id={
+                br.id: self.build_tags(block_run=br) for br in running_or_queued_block_runs
+            },
+        )
+        crashed_runs = [br for br in running_or_queued_block_runs if not has_jobs[br.id]]
+        with BlockRunUnitOfWork() as unit_of_work:
+            for br in crashed_runs:
+                unit_of_work.update(br, status=BlockRun.BlockRunStatus.INITIAL)
 
         return crashed_runs
 
@@ -1442,23 +1457,30 @@ def schedule_all():
 
     The current limit checks can potentially run into race conditions with api or event triggered
     schedules, so that needs to be addressed at some point.
+
+    If SCHEDULER_INCREMENTAL_MODE is enabled, steps 1 and 4 only sync the trigger files that
+    changed and only evaluate the pipeline schedules that are due or affected by a change,
+    as tracked by the scheduler index, which only reloads the objects that changed.
     """
-    db_connection.session.expire_all()
+    if SCHEDULER_INCREMENTAL_MODE:
+        repo_pipelines, active_pipeline_schedules = scheduler_index.refresh()
+    else:
+        db_connection.session.expire_all()
 
-    repo_pipelines = set(Pipeline.get_all_pipelines_all_projects(
-        get_repo_path(),
-        disable_pipelines_folder_creation=True,
-    ))
+        repo_pipelines = set(Pipeline.get_all_pipelines_all_projects(
+            get_repo_path(),
+            disable_pipelines_folder_creation=True,
+        ))
 
-    # Sync schedules from yaml file to DB
-    try:
-        sync_schedules(list(repo_pipelines))
-    except Exception:
-        logger.exception('Failed to sync schedules')
+        # Sync schedules from yaml file to DB
+        try:
+            sync_schedules(list(repo_pipelines))
+        except Exception:
+            logger.exception('Failed to sync schedules')
 
-    active_pipeline_schedules = list(PipelineSchedule.active_schedules(
-        pipeline_uuids=repo_pipelines,
-    ))
+        active_pipeline_schedules = list(PipelineSchedule.active_schedules(
+            pipeline_uuids=repo_pipelines,
+        ))
 
     backfills = Backfill.filter(pipeline_schedule_ids=[ps.id for ps in active_pipeline_schedules])
 
@@ -1524,6 +1546,7 @@ def schedule_all():
             if trigger_pipeline_run_limit is not None:
                 trigger_pipeline_run_limit = int(trigger_pipeline_run_limit)
 
+            should_schedule = False
             try:
                 previous_runtimes = []
                 if pipeline_schedule.id in active_pipeline_schedule_ids_with_landing_time_enabled:
@@ -1618,6 +1641,11 @@ def schedule_all():
                     )
             finally:
                 lock.release_lock(lock_key)
+                if SCHEDULER_INCREMENTAL_MODE:
+                    scheduler_index.update_next_execution_date(
+                        pipeline_schedule,
+                        scheduled=should_schedule,
+                    )
 
         pipeline_run_limit = concurrency_config.pipeline_run_limit_all_triggers
         if pipeline_run_limit is not None:
@@ -1656,6 +1684,9 @@ def schedule_all():
                 )
                 r.update(status=PipelineRun.PipelineRunStatus.CANCELLED)
 
+    if SCHEDULER_INCREMENTAL_MODE:
+        scheduler_index.finish_tick()
+
     # Schedule active pipeline runs
     active_pipeline_runs = PipelineRun.active_runs_for_pipelines(
         pipeline_uuids=repo_pipelines,
@@ -1665,7 +1696,6 @@ def schedule_all():
 
     for r in active_pipeline_runs:
         try:
-            r.refresh()
             PipelineScheduler(r).schedule()
         except Exception:
             logger.exception(f'Failed to schedule {r}')
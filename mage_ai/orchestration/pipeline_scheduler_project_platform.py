@@ -17,6 +17,9 @@ from mage_ai.data_integrations.utils.scheduler import (
 from mage_ai.data_preparation.executors.executor_factory import ExecutorFactory
 from mage_ai.data_preparation.logging.logger import DictLogger
 from mage_ai.data_preparation.logging.logger_manager_factory import LoggerManagerFactory
+from mage_ai.data_preparation.models.block.dynamic.child import (
+    create_next_dynamic_child_block_runs,
+)
 from mage_ai.data_preparation.models.constants import ExecutorType, PipelineType
 from mage_ai.data_preparation.models.pipeline import Pipeline
 from mage_ai.data_preparation.models.triggers import (
@@ -32,6 +35,7 @@ from mage_ai.orchestration.db import db_connection, safe_db_query
 from mage_ai.orchestration.db.models.schedules import (
     Backfill,
     BlockRun,
+    BlockRunUnitOfWork,
     EventMatcher,
     PipelineRun,
     PipelineSchedule,
@@ -204,8 +208,7 @@ class PipelineScheduler:
 
         self.__run_heartbeat()
 
-        for b in self.pipeline_run.block_runs:
-            b.refresh()
+        self.pipeline_run.refresh_block_runs()
 
         if PipelineType.STREAMING == self.pipeline.type:
             self.__schedule_pipeline()
@@ -565,6 +568,12 @@ class PipelineScheduler:
         Returns:
             None
         """
+        create_next_dynamic_child_block_runs(
+            self.pipeline,
+            self.pipeline_run.block_runs,
+            execution_partition=self.pipeline_run.execution_partition,
+            logging_tags=self.build_tags(),
+        )
         self.pipeline_run.update_block_run_statuses(self.pipeline_run.initial_block_runs)
         if block_runs is None:
             block_runs_to_schedule = self.pipeline_run.executable_block_runs(
@@ -583,16 +592,17 @@ class PipelineScheduler:
             if block_run_quota <= 0:
                 return
 
-        for b in block_runs_to_schedule[:block_run_quota]:
+        block_runs_to_schedule = block_runs_to_schedule[:block_run_quota]
+        with BlockRunUnitOfWork() as unit_of_work:
+            for b in block_runs_to_schedule:
+                unit_of_work.update(b, status=BlockRun.BlockRunStatus.QUEUED)
+
+        for b in block_runs_to_schedule:
             tags = dict(
                 block_run_id=b.id,
                 block_uuid=b.block_uuid,
             )
 
-            b.update(
-                status=BlockRun.BlockRunStatus.QUEUED,
-            )
-
             job_manager.add_job(
                 JobType.BLOCK_RUN,
                 b.id,
@@ -667,11 +677,14 @@ class PipelineScheduler:
 
             # Filter parallel streams so that we are only left with block runs for streams
             # that do not have a corresponding integration stream job.
-            parallel_streams_to_schedule = []
-            for stream in parallel_streams:
-                tap_stream_id = stream.get('tap_stream_id')
-                if not job_manager.has_integration_stream_job(self.pipeline_run.id, tap_stream_id):
-                    parallel_streams_to_schedule.append(stream)
+            has_stream_jobs = job_manager.has_integration_stream_jobs(
+                self.pipeline_run.id,
+                [stream.get('tap_stream_id') for stream in parallel_streams],
+            )
+            parallel_streams_to_schedule = [
+                stream for stream in parallel_streams
+                if not has_stream_jobs[stream.get('tap_stream_id')]
+            ]
 
             # Stop scheduling if there are no streams to schedule.
             if (not sequential_streams or job_manager.has_pipeline_run_job(self.pipeline_run.id)) \
@@ -804,11 +817,14 @@ class PipelineScheduler:
             BlockRun.BlockRunStatus.QUEUED,
         ]]
 
-        crashed_runs = []
-        for br in running_or_queued_block_runs:
-            if not job_manager.has_block_run_job(br.id):
-                br.update(status=BlockRun.BlockRunStatus.INITIAL)
-                crashed_runs.append(br)
+        if not running_or_queued_block_runs:
+            return []
+
+        has_jobs = job_manager.has_block_run_jobs([br.id for br in running_or_queued_block_runs])
+        crashed_runs = [br for br in running_or_queued_block_runs if not has_jobs[br.id]]
+        with BlockRunUnitOfWork() as unit_of_work:
+            for br in crashed_runs:
+                unit_of_work.update(br, status=BlockRun.BlockRunStatus.INITIAL)
 
         return crashed_runs
 
@@ -1650,7 +1666,6 @@ def schedule_all():
 
     for r in active_pipeline_runs:
         try:
-            r.refresh()
             PipelineScheduler(r).schedule()
         except Exception:
             logger.exception(f'Failed to schedule {r}')
@@ -5,13 +5,48 @@ from mage_ai.shared.config import BaseConfig
 
 
 class QueueType(str, Enum):
-    CELERY = 'celery'
     PROCESS = 'process'
+    REDIS = 'redis'
+
+
+class WorkerMode(str, Enum):
+    # Start a new worker process for each job.
+    FORK = 'fork'
+    # Keep long-lived worker processes that run one job after another.
+    PREFORK = 'prefork'
 
 
 @dataclass
 class ProcessQueueConfig(BaseConfig):
     redis_url: str = None
+    worker_mode: WorkerMode = WorkerMode.FORK
+    # Settings of the prefork worker mode. A worker exits after running max_jobs_per_worker
+    # jobs, after its memory usage exceeds max_worker_memory_mb or after waiting for a job for
+    # worker_idle_timeout seconds; 0 disables the limit.
+    max_jobs_per_worker: int = 500
+    max_worker_memory_mb: int = 0
+    worker_idle_timeout: int = 300
+
+
+@dataclass
+class RedisQueueConfig(BaseConfig):
+    redis_url: str = None
+    # Name of the queue; projects sharing a Redis use different names.
+    queue_name: str = 'default'
+    # Number of seconds after which a running job whose worker stopped renewing its lease is
+    # requeued.
+    visibility_timeout: int = 300
+    # Number of seconds between the heartbeats of a worker; a worker without a heartbeat for
+    # worker_timeout seconds is considered dead and its jobs are requeued.
+    heartbeat_interval: int = 10
+    worker_timeout: int = 60
+    # Maximum number of times a job is run after its worker died; 0 disables the limit.
+    max_attempts: int = 3
+    # Maximum number of jobs running at the same time across all workers; 0 disables the limit.
+    # The number of jobs run by each worker is limited by the concurrency of the queue config.
+    max_running_jobs: int = 0
+    # Run a worker in the scheduler's process tree in addition to the standalone workers.
+    run_local_worker: bool = True
 
 
 @dataclass
@@ -19,3 +54,4 @@ class QueueConfig(BaseConfig):
     queue_type: QueueType = QueueType.PROCESS
     concurrency: int = 20
     process_queue_config: ProcessQueueConfig = None
+    redis_queue_config: RedisQueueConfig = None
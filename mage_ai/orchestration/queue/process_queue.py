@@ -2,9 +2,12 @@ import multiprocessing as mp
 import os
 import signal
 import time
+import traceback
 from enum import Enum
-from multiprocessing import Manager
-from typing import Callable, Dict
+from multiprocessing.connection import wait
+from multiprocessing.managers import MakeProxyType, SyncManager
+from queue import Empty
+from typing import Callable, Dict, Iterable, List
 
 import newrelic.agent
 import psutil
@@ -12,7 +15,11 @@ import sentry_sdk
 from sentry_sdk import capture_exception
 
 from mage_ai.orchestration.db.process import start_session_and_run
-from mage_ai.orchestration.queue.config import QueueConfig
+from mage_ai.orchestration.queue.config import (
+    ProcessQueueConfig,
+    QueueConfig,
+    WorkerMode,
+)
 from mage_ai.orchestration.queue.queue import Queue
 from mage_ai.services.newrelic import initialize_new_relic
 from mage_ai.services.redis.redis import init_redis_client
@@ -27,6 +34,8 @@ from mage_ai.settings import (
 from mage_ai.shared.logger import set_logging_format
 
 LIVENESS_TIMEOUT_SECONDS = 300
+# How often the prefork worker pool checks whether it needs to start workers.
+WORKER_POOL_POLL_INTERVAL_SECONDS = 0.05
 
 
 class JobStatus(str, Enum):
@@ -41,6 +50,40 @@ class QueueStatus(str, Enum):
     INACTIVE = 'inactive'
 
 
+class JobTable(dict):
+    """
+    The shared job dictionary, hosted by the manager process. Besides the dict methods, it reads
+    and removes many jobs in a single call, since each call from another process is a round trip
+    to the manager process.
+    """
+
+    def get_many(self, job_ids: Iterable[str]) -> Dict:
+        return {job_id: self.get(job_id) for job_id in job_ids}
+
+    def remove_unchanged(self, jobs: Dict) -> None:
+        """
+        Remove the jobs whose value didn't change since the given snapshot, so that a job
+        re-enqueued in the meantime isn't removed.
+        """
+        for job_id, value in jobs.items():
+            if job_id in self and self[job_id] == value:
+                del self[job_id]
+
+
+JobTableProxy = MakeProxyType('JobTableProxy', (
+    '__contains__', '__delitem__', '__getitem__', '__iter__', '__len__', '__setitem__',
+    'clear', 'copy', 'get', 'get_many', 'items', 'keys', 'pop', 'remove_unchanged', 'values',
+))
+JobTableProxy._method_to_typeid_ = {'__iter__': 'Iterator'}
+
+
+class ProcessQueueManager(SyncManager):
+    pass
+
+
+ProcessQueueManager.register('JobTable', JobTable, JobTableProxy)
+
+
 class ProcessQueue(Queue):
     def __init__(self, queue_config: QueueConfig):
         """
@@ -54,8 +97,8 @@ class ProcessQueue(Queue):
             queue_config (QueueConfig): The configuration for the process queue.
             queue (mp.Queue): A multiprocessing queue for storing the jobs.
             size (int): The size of the worker pool (defaults to the number of CPUs).
-            mp_manager (Manager): A multiprocessing manager for maintaining a shared dictionary for
-                jobs.
+            mp_manager (ProcessQueueManager): A multiprocessing manager for maintaining a shared
+                table of jobs.
 
         """
         self.status = QueueStatus.INACTIVE
@@ -63,8 +106,9 @@ class ProcessQueue(Queue):
         self.process_queue_config = self.queue_config.process_queue_config
         self.queue = mp.Queue()
         self.size = queue_config.concurrency or os.cpu_count()
-        self.mp_manager = Manager()
-        self.job_dict = self.mp_manager.dict()
+        self.mp_manager = ProcessQueueManager()
+        self.mp_manager.start()
+        self.job_dict = self.mp_manager.JobTable()
 
         # Initialize redis client to track jobs across multiple replicas
         if self.process_queue_config and self.process_queue_config.redis_url:
@@ -85,13 +129,16 @@ class ProcessQueue(Queue):
         1. Cleans up completed jobs from the job dictionary.
         2. Check whether there're jobs need to be killed.
         """
-        job_ids = self.job_dict.keys()
-        for job_id in job_ids:
-            if job_id in self.job_dict:
-                if not self.has_job(job_id):
-                    del self.job_dict[job_id]
-                elif self.__should_kill_job(job_id):
-                    self.kill_job(job_id)
+        jobs = self.job_dict.copy()
+        if not jobs:
+            return
+
+        has_jobs = self.__has_jobs(jobs)
+        self.job_dict.remove_unchanged(
+            {job_id: job for job_id, job in jobs.items() if not has_jobs[job_id]},
+        )
+        for job_id in self.__jobs_to_kill([job_id for job_id in jobs if has_jobs[job_id]]):
+            self.kill_job(job_id)
 
     def enqueue(self, job_id: str, target: Callable, *args, **kwargs):
         """
@@ -112,9 +159,10 @@ class ProcessQueue(Queue):
             return
         self._print(f'Enqueue job {job_id}')
         if self.redis_client:
-            self.redis_client.set(job_id, self.client_id)
-        if self.redis_client:
-            self.redis_client.set(self.client_id, '1', ex=LIVENESS_TIMEOUT_SECONDS)
+            pipe = self.redis_client.pipeline()
+            pipe.set(job_id, self.client_id)
+            pipe.set(self.client_id, '1', ex=LIVENESS_TIMEOUT_SECONDS)
+            pipe.execute()
         self.queue.put([job_id, target, args, kwargs])
         self.job_dict[job_id] = JobStatus.QUEUED
         if not self.is_worker_pool_alive():
@@ -131,31 +179,37 @@ class ProcessQueue(Queue):
             bool: True if the job exists, False otherwise.
 
         """
-        if self.redis_client:
-            job_client_id = self.redis_client.get(job_id)
-            if not job_client_id:
-                return False
-            if job_client_id != self.client_id and self.redis_client.get(job_client_id):
-                return True
-        job = self.job_dict.get(job_id)
-        if job is None:
-            return False
-        if job == JobStatus.QUEUED and not self.queue.empty():
-            # Job is in queue
-            return True
-        if isinstance(job, int):
-            # Job is being processed
-            if self.__is_process_alive(job):
-                return True
-            else:
-                # Process is dead
-                if logger is not None:
-                    logger.info(
-                        f'Process {job} is dead for job {job_id}',
-                        **(logging_tags or dict()))
-                return False
-        # Return False if job is in other statuses
-        return False
+        return self.has_jobs([job_id], logger=logger, logging_tags=logging_tags)[job_id]
+
+    def has_jobs(
+        self,
+        job_ids: Iterable[str],
+        logger=None,
+        logging_tags: Dict = None,
+        logging_tags_by_job_id: Dict[str, Dict] = None,
+    ) -> Dict[str, bool]:
+        """
+        Checks which of the jobs exist in the queue or are currently being executed, with a
+        constant number of Redis and job dictionary round trips.
+
+        Args:
+            job_ids (Iterable[str]): The IDs of the jobs.
+            logging_tags_by_job_id (Dict[str, Dict], optional): Tags logged for each job
+                instead of logging_tags.
+
+        Returns:
+            Dict[str, bool]: Whether each job exists, by job ID.
+
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return dict()
+        return self.__has_jobs(
+            self.job_dict.get_many(job_ids),
+            logger=logger,
+            logging_tags=logging_tags,
+            logging_tags_by_job_id=logging_tags_by_job_id,
+        )
 
     def kill_job(self, job_id: str):
         """
@@ -185,16 +239,24 @@ class ProcessQueue(Queue):
         """
         Starts the worker pool by creating a new process for executing jobs.
         """
-        self.worker_pool_proc = mp.Process(
-            target=poll_job_and_execute,
-            args=[
-                self.queue,
-                self.size,
-                self.job_dict,
-                self.redis_client,
-                self.client_id,
-            ],
-        )
+        args = [
+            self.queue,
+            self.size,
+            self.job_dict,
+            self.redis_client,
+            self.client_id,
+        ]
+        if self.process_queue_config and \
+                self.process_queue_config.worker_mode == WorkerMode.PREFORK:
+            self.worker_pool_proc = mp.Process(
+                target=run_worker_pool,
+                args=args + [self.process_queue_config],
+            )
+        else:
+            self.worker_pool_proc = mp.Process(
+                target=poll_job_and_execute,
+                args=args,
+            )
         self.worker_pool_proc.start()
 
     def start(self):
@@ -253,11 +315,68 @@ class ProcessQueue(Queue):
         if self.redis_client.get(key):
             self.redis_client.delete(key)
 
-    def __should_kill_job(self, job_id):
-        if not self.redis_client:
-            return False
-        value = self.redis_client.get(self.__redis_key_kill_job(job_id))
-        return value is not None
+    def __jobs_to_kill(self, job_ids: List[str]) -> List[str]:
+        if not self.redis_client or not job_ids:
+            return []
+        values = self.redis_client.mget([self.__redis_key_kill_job(job_id) for job_id in job_ids])
+        return [job_id for job_id, value in zip(job_ids, values) if value is not None]
+
+    def __has_jobs(
+        self,
+        jobs: Dict,
+        logger=None,
+        logging_tags: Dict = None,
+        logging_tags_by_job_id: Dict[str, Dict] = None,
+    ) -> Dict[str, bool]:
+        """
+        Checks which of the jobs exist, given their values in the job dictionary.
+        """
+        has_jobs = dict()
+        local_jobs = jobs
+        if self.redis_client:
+            # Jobs enqueued by other replicas are tracked by their client ID, which is alive
+            # while the replica's worker pool sends heartbeats.
+            job_ids = list(jobs.keys())
+            job_client_ids = self.redis_client.mget(job_ids)
+            other_client_ids = list(set(
+                c for c in job_client_ids if c and c != self.client_id
+            ))
+            alive_client_ids = set(
+                c for c, alive in zip(
+                    other_client_ids,
+                    self.redis_client.mget(other_client_ids) if other_client_ids else [],
+                ) if alive
+            )
+            local_jobs = dict()
+            for job_id, job_client_id in zip(job_ids, job_client_ids):
+                if not job_client_id:
+                    has_jobs[job_id] = False
+                elif job_client_id in alive_client_ids:
+                    has_jobs[job_id] = True
+                else:
+                    local_jobs[job_id] = jobs[job_id]
+
+        queue_empty = None
+        for job_id, job in local_jobs.items():
+            has_jobs[job_id] = False
+            if job == JobStatus.QUEUED:
+                if queue_empty is None:
+                    queue_empty = self.queue.empty()
+                # Job is in queue
+                has_jobs[job_id] = not queue_empty
+            elif isinstance(job, int):
+                # Job is being processed
+                if self.__is_process_alive(job):
+                    has_jobs[job_id] = True
+                elif logger is not None:
+                    # Process is dead
+                    logger.info(
+                        f'Process {job} is dead for job {job_id}',
+                        **((logging_tags_by_job_id or dict()).get(job_id, logging_tags) or dict()),
+                    )
+            # Return False if job is in other statuses
+
+        return has_jobs
 
 
 class Worker(mp.Process):
@@ -353,3 +472,179 @@ def poll_job_and_execute(
         time.sleep(1)
         if redis_client and client_id:
             redis_client.set(client_id, '1', ex=LIVENESS_TIMEOUT_SECONDS)
+
+
+class PoolWorker(mp.Process):
+    def __init__(
+        self,
+        queue: mp.Queue,
+        job_dict,
+        idle_workers,
+        process_queue_config: ProcessQueueConfig,
+    ):
+        """
+        A long-lived worker process of the prefork worker pool, which runs the jobs of the process
+        queue one after another.
+
+        Args:
+            queue (mp.Queue): The multiprocessing queue from which jobs are fetched.
+            job_dict: The shared job dictionary.
+            idle_workers: The shared number of workers waiting for a job.
+            process_queue_config (ProcessQueueConfig): The limits of the worker.
+
+        Attributes:
+            queue (mp.Queue): The multiprocessing queue from which jobs are fetched.
+            job_dict: The shared job dictionary.
+            idle_workers: The shared number of workers waiting for a job.
+            ready (mp.Event): Set once the worker is initialized and waits for its first job.
+            dsn (str): The Sentry DSN for error reporting.
+            max_jobs (int): The number of jobs after which the worker exits.
+            max_memory_mb (int): The memory usage, in MB, after which the worker exits.
+            idle_timeout (int): The number of seconds after which an idle worker exits.
+
+        """
+        super().__init__()
+        self.queue = queue
+        self.job_dict = job_dict
+        self.idle_workers = idle_workers
+        self.ready = mp.Event()
+        self.dsn = SENTRY_DSN
+        self.max_jobs = process_queue_config.max_jobs_per_worker
+        self.max_memory_mb = process_queue_config.max_worker_memory_mb
+        self.idle_timeout = process_queue_config.worker_idle_timeout
+
+    def run(self):
+        """
+        The entry point for the worker process.
+
+        Initializes the worker once, then runs jobs until the worker reaches one of its limits.
+
+        """
+        from mage_ai.orchestration.db import engine
+
+        if self.dsn:
+            sentry_sdk.init(
+                self.dsn,
+                traces_sample_rate=SENTRY_TRACES_SAMPLE_RATE,
+            )
+        initialize_new_relic()
+
+        set_logging_format(
+            logging_format=SERVER_LOGGING_FORMAT,
+            level=SERVER_VERBOSITY,
+        )
+
+        # Open new DB connections in this process and reuse them for all the jobs, without
+        # closing the connections inherited from the parent process.
+        engine.dispose(close=False)
+
+        jobs_count = 0
+        while not self.max_jobs or jobs_count < self.max_jobs:
+            args = self.__get_job()
+            if args is None:
+                break
+            job_id = args[0]
+            if self.job_dict.get(job_id) != JobStatus.QUEUED:
+                continue
+
+            self.__run_job(job_id, args)
+            jobs_count += 1
+
+            if self.__memory_limit_exceeded():
+                break
+
+    def __get_job(self):
+        with self.idle_workers.get_lock():
+            self.idle_workers.value += 1
+        self.ready.set()
+        try:
+            return self.queue.get(timeout=self.idle_timeout or None)
+        except Empty:
+            return None
+        finally:
+            with self.idle_workers.get_lock():
+                self.idle_workers.value -= 1
+
+    @newrelic.agent.background_task(name='worker-run', group='Task')
+    def __run_job(self, job_id: str, args):
+        print(f'Run worker {self.pid} for job {job_id}')
+        self.job_dict[job_id] = self.pid
+
+        try:
+            start_session_and_run(args[1], *args[2], **args[3])
+        except Exception as e:
+            if self.dsn:
+                capture_exception(e)
+            traceback.print_exc()
+        finally:
+            self.job_dict[job_id] = JobStatus.COMPLETED
+
+    def __memory_limit_exceeded(self) -> bool:
+        if not self.max_memory_mb:
+            return False
+        memory_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+        if memory_mb <= self.max_memory_mb:
+            return False
+        print(f'Worker {self.pid} uses {memory_mb:.0f} MB of memory, recycling.')
+        return True
+
+
+def run_worker_pool(
+    queue: mp.Queue,
+    size: int,
+    job_dict,
+    redis_client,
+    client_id: str,
+    process_queue_config: ProcessQueueConfig,
+):
+    """
+    Keeps a pool of long-lived worker processes that wait for jobs on the queue.
+
+    A worker is started when jobs are waiting and no worker is idle or starting, up to the size of
+    the pool.
+    Workers exit when they reach their job or memory limit, or after being idle for too long;
+    the pool exits when all its workers exited and the queue is empty.
+
+    Args:
+        queue: The multiprocessing queue from which jobs are fetched.
+        size: The maximum number of workers.
+        job_dict: The shared job dictionary.
+        process_queue_config: The limits of the workers.
+
+    """
+    from mage_ai.orchestration.db import engine
+
+    # The workers open their own DB connections.
+    engine.dispose()
+
+    pid = os.getpid()
+    idle_workers = mp.Value('i', 0)
+    workers = []
+    last_heartbeat_at = 0
+    while True:
+        workers_count = len(workers)
+        workers = [w for w in workers if w.is_alive()]
+        if workers_count != len(workers):
+            print(f'[Process {pid}] Worker pool size: {len(workers)}')
+        if not workers and queue.empty():
+            break
+
+        if len(workers) < size and \
+                idle_workers.value == 0 and \
+                all(w.ready.is_set() for w in workers) and \
+                not queue.empty():
+            worker = PoolWorker(queue, job_dict, idle_workers, process_queue_config)
+            worker.start()
+            workers.append(worker)
+            print(f'[Process {pid}] Worker pool size: {len(workers)}')
+
+        now = time.time()
+        if redis_client and client_id and now - last_heartbeat_at >= 1:
+            redis_client.set(client_id, '1', ex=LIVENESS_TIMEOUT_SECONDS)
+            last_heartbeat_at = now
+
+        # Wake up early when a worker exits.
+        wait(
+            [w.sentinel for w in workers],
+            timeout=WORKER_POOL_POLL_INTERVAL_SECONDS,
+        )
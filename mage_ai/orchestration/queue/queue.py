@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Dict, Iterable
 
 
 class Queue(ABC):
@@ -15,6 +15,34 @@ class Queue(ABC):
     def has_job(self, job_id: str, logger=None):
         pass
 
+    def has_jobs(
+        self,
+        job_ids: Iterable[str],
+        logger=None,
+        logging_tags: Dict = None,
+        logging_tags_by_job_id: Dict[str, Dict] = None,
+    ) -> Dict[str, bool]:
+        """
+        Checks which of the jobs exist in the queue or are currently being executed.
+
+        Queues override this method to check all the jobs at once.
+
+        Args:
+            logging_tags_by_job_id (Dict[str, Dict], optional): Tags logged for each job
+                instead of logging_tags.
+
+        Returns:
+            Dict[str, bool]: Whether each job exists, by job ID.
+        """
+        return {
+            job_id: self.has_job(
+                job_id,
+                logger=logger,
+                logging_tags=(logging_tags_by_job_id or dict()).get(job_id, logging_tags),
+            )
+            for job_id in job_ids
+        }
+
     @abstractmethod
     def kill_job(self, job_id: str):
         pass
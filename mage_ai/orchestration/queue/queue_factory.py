@@ -1,5 +1,9 @@
 from mage_ai.data_preparation.repo_manager import get_repo_config
-from mage_ai.orchestration.queue.config import QueueConfig, QueueType
+from mage_ai.orchestration.queue.config import (
+    QueueConfig,
+    QueueType,
+    RedisQueueConfig,
+)
 
 
 class QueueFactory:
@@ -11,10 +15,16 @@ class QueueFactory:
             return self.queue
 
         queue_config = QueueConfig.load(config=get_repo_config().queue_config or dict())
-        if queue_config.queue_type == QueueType.CELERY:
-            from mage_ai.orchestration.queue.celery_queue import CeleryQueue
-            self.queue = CeleryQueue(queue_config)
-        else:
-            from mage_ai.orchestration.queue.process_queue import ProcessQueue
-            self.queue = ProcessQueue(queue_config)
+        if queue_config.queue_type == QueueType.REDIS:
+            from mage_ai.orchestration.queue.redis_queue import RedisQueue, build_broker
+
+            broker = build_broker(queue_config.redis_queue_config or RedisQueueConfig())
+            if broker is not None:
+                self.queue = RedisQueue(queue_config, broker=broker)
+                return self.queue
+            print('[QueueFactory] Redis queue requires a reachable redis_url. '
+                  'Fall back to the process queue.')
+
+        from mage_ai.orchestration.queue.process_queue import ProcessQueue
+        self.queue = ProcessQueue(queue_config)
         return self.queue
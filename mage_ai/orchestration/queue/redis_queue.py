@@ -0,0 +1,672 @@
+import importlib
+import json
+import multiprocessing as mp
+import os
+import signal
+import socket
+import time
+import traceback
+import uuid
+from datetime import date, datetime
+from enum import Enum
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from redis.exceptions import WatchError
+
+from mage_ai.orchestration.db.process import start_session_and_run
+from mage_ai.orchestration.queue.config import QueueConfig, RedisQueueConfig
+from mage_ai.orchestration.queue.queue import Queue
+from mage_ai.services.redis.redis import init_redis_client
+from mage_ai.settings import REDIS_URL
+
+# How long the status of a finished job is kept.
+FINISHED_JOB_TTL_SECONDS = 24 * 60 * 60
+# How often a worker checks whether its running jobs were cancelled.
+CANCEL_CHECK_INTERVAL_SECONDS = 1
+# How long a worker waits for a job or for one of its jobs to finish in each iteration.
+WORKER_POLL_INTERVAL_SECONDS = 0.05
+
+# The functions the jobs of the queue can run. A job only stores the name of its function and
+# its JSON encoded arguments, so that a worker never runs code that isn't part of Mage.
+JOB_TARGETS = set([
+    'mage_ai.orchestration.pipeline_scheduler_original.run_block',
+    'mage_ai.orchestration.pipeline_scheduler_original.run_integration_stream',
+    'mage_ai.orchestration.pipeline_scheduler_original.run_integration_streams',
+    'mage_ai.orchestration.pipeline_scheduler_original.run_pipeline',
+])
+# The key of the JSON objects encoding the argument values JSON doesn't support.
+JOB_VALUE_TYPE_KEY = '__mage_type__'
+
+
+class RedisJobStatus(str, Enum):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+
+class RedisQueueBroker:
+    """
+    The Redis data structures of a distributed queue shared by the schedulers enqueueing jobs
+    and the workers running them:
+        - {prefix}:pending: list of the IDs of the jobs waiting for a worker.
+        - {prefix}:job:{job_id}: hash with the payload, status and worker of a job.
+        - {prefix}:processing:{worker_id}: list of the jobs claimed by a worker. A job is moved
+          atomically from the pending list to this list, so that the jobs of a worker that died
+          right after claiming them are requeued.
+        - {prefix}:leases: sorted set of the running jobs scored by the time their lease
+          expires. Workers renew the leases of the jobs they run; a job whose lease expired
+          (its visibility timeout passed) is requeued.
+        - {prefix}:workers: sorted set of the registered workers scored by their last heartbeat.
+        - {prefix}:worker:{worker_id}: hash with the host, PID and concurrency of a worker.
+    """
+
+    def __init__(self, redis_client, queue_name: str = 'default'):
+        self.redis_client = redis_client
+        self.prefix = f'mage_queue:{queue_name}'
+
+    @property
+    def pending_key(self) -> str:
+        return f'{self.prefix}:pending'
+
+    @property
+    def leases_key(self) -> str:
+        return f'{self.prefix}:leases'
+
+    @property
+    def workers_key(self) -> str:
+        return f'{self.prefix}:workers'
+
+    def job_key(self, job_id: str) -> str:
+        return f'{self.prefix}:job:{job_id}'
+
+    def processing_key(self, worker_id: str) -> str:
+        return f'{self.prefix}:processing:{worker_id}'
+
+    def worker_key(self, worker_id: str) -> str:
+        return f'{self.prefix}:worker:{worker_id}'
+
+    def push(self, job_id: str, payload: str) -> None:
+        pipe = self.redis_client.pipeline()
+        pipe.delete(self.job_key(job_id))
+        pipe.hset(self.job_key(job_id), mapping=dict(
+            attempts=0,
+            enqueued_at=time.time(),
+            payload=payload,
+            status=RedisJobStatus.QUEUED.value,
+        ))
+        pipe.lpush(self.pending_key, job_id)
+        pipe.execute()
+
+    def claim(
+        self,
+        worker_id: str,
+        lease_seconds: float,
+        timeout: int = 0,
+        max_running_jobs: int = 0,
+    ) -> Optional[str]:
+        """
+        Move the oldest pending job to the processing list of the worker and lease it.
+
+        Args:
+            worker_id (str): The ID of the worker claiming the job.
+            lease_seconds (float): The number of seconds the job is leased to the worker.
+            timeout (int): The number of seconds to wait for a job; 0 doesn't wait. Ignored
+                if max_running_jobs is set.
+            max_running_jobs (int): The maximum number of jobs running across all the workers;
+                0 means no limit.
+
+        Returns:
+            Optional[str]: The ID of the claimed job.
+        """
+        if max_running_jobs:
+            return self.__claim_within_limit(worker_id, lease_seconds, max_running_jobs)
+
+        if timeout:
+            job_id = self.redis_client.brpoplpush(
+                self.pending_key,
+                self.processing_key(worker_id),
+                timeout=timeout,
+            )
+        else:
+            job_id = self.redis_client.rpoplpush(
+                self.pending_key,
+                self.processing_key(worker_id),
+            )
+        if job_id is None:
+            return None
+
+        pipe = self.redis_client.pipeline()
+        self.__lease(pipe, job_id, worker_id, lease_seconds)
+        pipe.execute()
+
+        return job_id
+
+    def __claim_within_limit(
+        self,
+        worker_id: str,
+        lease_seconds: float,
+        max_running_jobs: int,
+    ) -> Optional[str]:
+        # The number of running jobs is checked and the job is claimed and leased in the same
+        # transaction, which is retried if another worker changed the leases or the pending
+        # jobs in between, so that workers claiming jobs at the same time can't exceed the
+        # limit.
+        with self.redis_client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(self.leases_key, self.pending_key)
+                    if pipe.zcard(self.leases_key) >= max_running_jobs:
+                        return None
+                    job_id = pipe.lindex(self.pending_key, -1)
+                    if job_id is None:
+                        return None
+
+                    pipe.multi()
+                    pipe.rpop(self.pending_key)
+                    pipe.lpush(self.processing_key(worker_id), job_id)
+                    self.__lease(pipe, job_id, worker_id, lease_seconds)
+                    pipe.execute()
+
+                    return job_id
+                except WatchError:
+                    continue
+
+    def __lease(self, pipe, job_id: str, worker_id: str, lease_seconds: float) -> None:
+        pipe.zadd(self.leases_key, {job_id: time.time() + lease_seconds})
+        pipe.hset(self.job_key(job_id), mapping=dict(
+            started_at=time.time(),
+            status=RedisJobStatus.RUNNING.value,
+            worker_id=worker_id,
+        ))
+        pipe.hincrby(self.job_key(job_id), 'attempts', 1)
+
+    def get_job(self, job_id: str) -> Dict:
+        return self.redis_client.hgetall(self.job_key(job_id)) or dict()
+
+    def set_job_pid(self, job_id: str, pid: int) -> None:
+        self.redis_client.hset(self.job_key(job_id), 'pid', pid)
+
+    def renew_leases(self, job_ids: List[str], lease_seconds: float) -> None:
+        if job_ids:
+            deadline = time.time() + lease_seconds
+            self.redis_client.zadd(
+                self.leases_key,
+                {job_id: deadline for job_id in job_ids},
+                xx=True,
+            )
+
+    def lease_deadline(self, job_id: str) -> Optional[float]:
+        return self.redis_client.zscore(self.leases_key, job_id)
+
+    def get_job_states(
+        self,
+        job_ids: List[str],
+    ) -> List[Tuple[Optional[str], Optional[str], Optional[float]]]:
+        """
+        Get the status, worker and lease deadline of many jobs in a single round trip.
+        """
+        pipe = self.redis_client.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.hget(self.job_key(job_id), 'status')
+            pipe.hget(self.job_key(job_id), 'worker_id')
+            pipe.zscore(self.leases_key, job_id)
+        results = pipe.execute()
+        return [tuple(results[i:i + 3]) for i in range(0, len(results), 3)]
+
+    def running_count(self) -> int:
+        return self.redis_client.zcard(self.leases_key)
+
+    def finish(self, job_id: str, worker_id: str, status: RedisJobStatus) -> None:
+        pipe = self.redis_client.pipeline()
+        pipe.lrem(self.processing_key(worker_id), 0, job_id)
+        pipe.zrem(self.leases_key, job_id)
+        pipe.hset(self.job_key(job_id), mapping=dict(
+            finished_at=time.time(),
+            status=status.value,
+        ))
+        pipe.hdel(self.job_key(job_id), 'payload')
+        pipe.expire(self.job_key(job_id), FINISHED_JOB_TTL_SECONDS)
+        pipe.execute()
+
+    def cancel(self, job_id: str) -> None:
+        """
+        Remove the job from the pending list if it didn't start, otherwise flag it so that the
+        worker running it kills it.
+        """
+        removed = self.redis_client.lrem(self.pending_key, 0, job_id)
+        if removed:
+            self.redis_client.hset(self.job_key(job_id), mapping=dict(
+                finished_at=time.time(),
+                status=RedisJobStatus.CANCELLED.value,
+            ))
+            self.redis_client.expire(self.job_key(job_id), FINISHED_JOB_TTL_SECONDS)
+        elif self.redis_client.exists(self.job_key(job_id)):
+            self.redis_client.hset(self.job_key(job_id), 'cancel', 1)
+
+    def is_cancelled(self, job_id: str) -> bool:
+        return bool(self.redis_client.hget(self.job_key(job_id), 'cancel'))
+
+    def requeue(self, job_id: str, worker_id: str = None, max_attempts: int = 0) -> None:
+        """
+        Put a job whose worker died or whose lease expired back in the pending list, unless it
+        was cancelled or already ran max_attempts times.
+        """
+        if worker_id is None:
+            worker_id = self.redis_client.hget(self.job_key(job_id), 'worker_id')
+
+        # Only the first of the workers recovering the same job requeues it.
+        pipe = self.redis_client.pipeline()
+        pipe.zrem(self.leases_key, job_id)
+        if worker_id:
+            pipe.lrem(self.processing_key(worker_id), 0, job_id)
+        if not any(pipe.execute()):
+            return
+
+        job = self.get_job(job_id)
+        attempts = int(job.get('attempts') or 0)
+        if not job.get('payload') or job.get('cancel') or \
+                (max_attempts and attempts >= max_attempts):
+            status = RedisJobStatus.CANCELLED if job.get('cancel') else RedisJobStatus.FAILED
+            self.finish(job_id, worker_id, status)
+            return
+
+        pipe = self.redis_client.pipeline()
+        pipe.hset(self.job_key(job_id), 'status', RedisJobStatus.QUEUED.value)
+        pipe.hdel(self.job_key(job_id), 'pid', 'worker_id')
+        pipe.rpush(self.pending_key, job_id)
+        pipe.execute()
+
+    def register_worker(self, worker_id: str, info: Dict) -> None:
+        pipe = self.redis_client.pipeline()
+        pipe.hset(self.worker_key(worker_id), mapping=info)
+        pipe.zadd(self.workers_key, {worker_id: time.time()})
+        pipe.execute()
+
+    def heartbeat(self, worker_id: str) -> None:
+        self.redis_client.zadd(self.workers_key, {worker_id: time.time()})
+
+    def unregister_worker(self, worker_id: str) -> None:
+        pipe = self.redis_client.pipeline()
+        pipe.zrem(self.workers_key, worker_id)
+        pipe.delete(self.worker_key(worker_id))
+        pipe.delete(self.processing_key(worker_id))
+        pipe.execute()
+
+    def workers(self) -> List[str]:
+        return self.redis_client.zrangebyscore(self.workers_key, '-inf', '+inf')
+
+    def recover(self, worker_timeout: float, max_attempts: int = 0) -> List[str]:
+        """
+        Requeue the jobs whose lease expired and the jobs claimed by workers that stopped sending
+        heartbeats, and unregister these workers.
+
+        Returns:
+            List[str]: The IDs of the requeued jobs.
+        """
+        now = time.time()
+        job_ids = []
+
+        for job_id in self.redis_client.zrangebyscore(self.leases_key, '-inf', now):
+            self.requeue(job_id, max_attempts=max_attempts)
+            job_ids.append(job_id)
+
+        dead_workers = self.redis_client.zrangebyscore(
+            self.workers_key,
+            '-inf',
+            now - worker_timeout,
+        )
+        for worker_id in dead_workers:
+            for job_id in self.redis_client.lrange(self.processing_key(worker_id), 0, -1):
+                self.requeue(job_id, worker_id=worker_id, max_attempts=max_attempts)
+                job_ids.append(job_id)
+            self.unregister_worker(worker_id)
+
+        return job_ids
+
+    def clear(self) -> None:
+        pipe = self.redis_client.pipeline()
+        for job_id in self.redis_client.lrange(self.pending_key, 0, -1):
+            pipe.delete(self.job_key(job_id))
+        pipe.delete(self.pending_key)
+        pipe.execute()
+
+
+def register_job_target(target: Callable) -> None:
+    """
+    Allow the jobs of the queue to run the function.
+    """
+    JOB_TARGETS.add(__target_name(target))
+
+
+def encode_job(target: Callable, args, kwargs) -> str:
+    target_name = __target_name(target)
+    if target_name not in JOB_TARGETS:
+        raise ValueError(f'Function {target_name} can\'t be run by the jobs of the Redis queue.')
+
+    return json.dumps(
+        dict(args=args, kwargs=kwargs, target=target_name),
+        default=__encode_value,
+    )
+
+
+def execute_job(payload: str) -> None:
+    job = json.loads(payload, object_hook=__decode_value)
+    target_name = job['target']
+    if target_name not in JOB_TARGETS:
+        raise ValueError(f'Function {target_name} can\'t be run by the jobs of the Redis queue.')
+
+    module_name, function_name = target_name.rsplit('.', 1)
+    target = getattr(importlib.import_module(module_name), function_name)
+    start_session_and_run(target, *job['args'], **job['kwargs'])
+
+
+def __target_name(target: Callable) -> str:
+    return f'{target.__module__}.{target.__qualname__}'
+
+
+def __encode_value(value: Any) -> Dict:
+    # datetime is a subclass of date, so it's checked first.
+    if isinstance(value, datetime):
+        return {JOB_VALUE_TYPE_KEY: 'datetime', 'value': value.isoformat()}
+    if isinstance(value, date):
+        return {JOB_VALUE_TYPE_KEY: 'date', 'value': value.isoformat()}
+    if isinstance(value, (set, frozenset)):
+        return {JOB_VALUE_TYPE_KEY: 'set', 'value': list(value)}
+    raise TypeError(
+        f'Job argument of type {type(value).__name__} can\'t be sent to the Redis queue.',
+    )
+
+
+def __decode_value(obj: Dict) -> Any:
+    value_type = obj.get(JOB_VALUE_TYPE_KEY)
+    if value_type == 'datetime':
+        return datetime.fromisoformat(obj['value'])
+    if value_type == 'date':
+        return date.fromisoformat(obj['value'])
+    if value_type == 'set':
+        return set(obj['value'])
+    return obj
+
+
+def build_broker(redis_queue_config: RedisQueueConfig):
+    redis_client = init_redis_client(redis_queue_config.redis_url or REDIS_URL)
+    if redis_client is None:
+        return None
+    return RedisQueueBroker(redis_client, queue_name=redis_queue_config.queue_name)
+
+
+class RedisQueue(Queue):
+    def __init__(self, queue_config: QueueConfig, broker: RedisQueueBroker = None):
+        """
+        A distributed queue storing the jobs in Redis, so that the jobs enqueued by the
+        scheduler are run by the workers of any host connected to the same Redis.
+
+        Args:
+            queue_config (QueueConfig): The configuration for the queue.
+            broker (RedisQueueBroker): The Redis data structures of the queue. Built from the
+                redis_queue_config of the queue config if not provided.
+
+        Attributes:
+            queue_config (QueueConfig): The configuration for the queue.
+            redis_queue_config (RedisQueueConfig): The configuration of the Redis queue.
+            broker (RedisQueueBroker): The Redis data structures of the queue.
+            worker_proc (mp.Process): The process running a worker on the scheduler's host.
+        """
+        self.queue_config = queue_config
+        self.redis_queue_config = queue_config.redis_queue_config or RedisQueueConfig()
+        self.broker = broker or build_broker(self.redis_queue_config)
+        if self.broker is None:
+            raise Exception('Redis queue requires a reachable redis_url.')
+        self.active = False
+        self.worker_proc = None
+
+    def clean_up_jobs(self):
+        """
+        Requeue the jobs of the workers that died or whose lease expired.
+        """
+        self.broker.recover(
+            self.redis_queue_config.worker_timeout,
+            max_attempts=self.redis_queue_config.max_attempts,
+        )
+        if self.active and self.redis_queue_config.run_local_worker and \
+                not self.is_worker_alive():
+            self.start_worker()
+
+    def enqueue(self, job_id: str, target: Callable, *args, **kwargs):
+        if not self.active:
+            self._print('Cannot enqueue a job to an inactive queue.')
+            return
+        if self.has_job(job_id):
+            self._print(f'Job {job_id} exists. Skip enqueue.')
+            return
+        self._print(f'Enqueue job {job_id}')
+        self.broker.push(job_id, encode_job(target, args, kwargs))
+
+    def has_job(self, job_id: str, logger=None, logging_tags: Dict = None) -> bool:
+        return self.has_jobs([job_id], logger=logger, logging_tags=logging_tags)[job_id]
+
+    def has_jobs(
+        self,
+        job_ids: Iterable[str],
+        logger=None,
+        logging_tags: Dict = None,
+        logging_tags_by_job_id: Dict[str, Dict] = None,
+    ) -> Dict[str, bool]:
+        """
+        A job exists while it's queued, or running with an unexpired lease.
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return dict()
+
+        now = time.time()
+        has_jobs = dict()
+        for job_id, (status, worker_id, deadline) in zip(
+            job_ids,
+            self.broker.get_job_states(job_ids),
+        ):
+            has_jobs[job_id] = False
+            if status == RedisJobStatus.QUEUED:
+                has_jobs[job_id] = True
+            elif status == RedisJobStatus.RUNNING:
+                if deadline is not None and deadline >= now:
+                    has_jobs[job_id] = True
+                elif logger is not None:
+                    logger.info(
+                        f'Lease of job {job_id} on worker {worker_id} expired',
+                        **((logging_tags_by_job_id or dict()).get(job_id, logging_tags) or dict()),
+                    )
+        return has_jobs
+
+    def kill_job(self, job_id: str):
+        self._print(f'Kill job {job_id}')
+        self.broker.cancel(job_id)
+
+    def start(self):
+        self.active = True
+        if self.redis_queue_config.run_local_worker:
+            self.start_worker()
+
+    def stop(self):
+        """
+        Stop enqueueing new jobs and stop the worker of this host. The jobs of the other
+        workers keep running.
+        """
+        self.active = False
+        if self.is_worker_alive():
+            self.worker_proc.terminate()
+            self.worker_proc.join(timeout=30)
+        self.worker_proc = None
+
+    def start_worker(self):
+        from mage_ai.orchestration.db import engine
+
+        engine.dispose()
+        self.worker_proc = mp.Process(
+            target=run_queue_worker,
+            args=[self.queue_config],
+        )
+        self.worker_proc.start()
+
+    def is_worker_alive(self) -> bool:
+        return self.worker_proc is not None and self.worker_proc.is_alive()
+
+
+class QueueWorker:
+    def __init__(
+        self,
+        broker: RedisQueueBroker,
+        concurrency: int,
+        redis_queue_config: RedisQueueConfig,
+    ):
+        """
+        A worker registered to a Redis queue, which claims jobs from the queue and runs each job
+        in its own process.
+
+        Args:
+            broker (RedisQueueBroker): The Redis data structures of the queue.
+            concurrency (int): The maximum number of jobs run at the same time by this worker.
+            redis_queue_config (RedisQueueConfig): The configuration of the Redis queue.
+
+        Attributes:
+            worker_id (str): The unique ID of the worker.
+            running (Dict[str, mp.Process]): The processes of the running jobs by job ID.
+        """
+        self.broker = broker
+        self.concurrency = concurrency
+        self.config = redis_queue_config
+        self.worker_id = f'{socket.gethostname()}_{os.getpid()}_{uuid.uuid4().hex[:8]}'
+        self.running: Dict[str, mp.Process] = dict()
+        self.stopped = False
+
+    def run(self) -> None:
+        """
+        Run jobs until the worker is stopped.
+        """
+        self.broker.register_worker(self.worker_id, dict(
+            concurrency=self.concurrency,
+            host=socket.gethostname(),
+            pid=os.getpid(),
+            started_at=time.time(),
+        ))
+        print(f'[QueueWorker] Worker {self.worker_id} started.')
+
+        last_heartbeat_at = 0
+        last_cancel_check_at = 0
+        try:
+            while not self.stopped:
+                self.__reap_finished_jobs()
+
+                now = time.time()
+                if now - last_heartbeat_at >= self.config.heartbeat_interval:
+                    self.__heartbeat()
+                    last_heartbeat_at = now
+                if self.running and now - last_cancel_check_at >= CANCEL_CHECK_INTERVAL_SECONDS:
+                    self.__kill_cancelled_jobs()
+                    last_cancel_check_at = now
+
+                if not self.__claim_job():
+                    wait(
+                        [p.sentinel for p in self.running.values()],
+                        timeout=WORKER_POLL_INTERVAL_SECONDS,
+                    )
+        finally:
+            self.__shutdown()
+
+    def stop(self, *args) -> None:
+        self.stopped = True
+
+    def __claim_job(self) -> bool:
+        if len(self.running) >= self.concurrency:
+            return False
+
+        # Block while waiting for the first job; poll while jobs are running so that their
+        # completion is noticed quickly.
+        job_id = self.broker.claim(
+            self.worker_id,
+            self.config.visibility_timeout,
+            timeout=0 if self.running else 1,
+            max_running_jobs=self.config.max_running_jobs,
+        )
+        if job_id is None:
+            return False
+
+        payload = self.broker.get_job(job_id).get('payload')
+        if not payload:
+            self.broker.finish(job_id, self.worker_id, RedisJobStatus.FAILED)
+            return True
+
+        print(f'[QueueWorker] Run job {job_id}')
+        proc = mp.Process(target=execute_job, args=[payload])
+        proc.start()
+        self.broker.set_job_pid(job_id, proc.pid)
+        self.running[job_id] = proc
+
+        return True
+
+    def __reap_finished_jobs(self) -> None:
+        for job_id, proc in list(self.running.items()):
+            if proc.is_alive():
+                continue
+            proc.join()
+            status = RedisJobStatus.COMPLETED if proc.exitcode == 0 else RedisJobStatus.FAILED
+            if proc.exitcode == -signal.SIGKILL and self.broker.is_cancelled(job_id):
+                status = RedisJobStatus.CANCELLED
+            self.broker.finish(job_id, self.worker_id, status)
+            del self.running[job_id]
+
+    def __heartbeat(self) -> None:
+        try:
+            self.broker.heartbeat(self.worker_id)
+            self.broker.renew_leases(list(self.running.keys()), self.config.visibility_timeout)
+            self.broker.recover(
+                self.config.worker_timeout,
+                max_attempts=self.config.max_attempts,
+            )
+        except Exception:
+            traceback.print_exc()
+
+    def __kill_cancelled_jobs(self) -> None:
+        for job_id, proc in list(self.running.items()):
+            if self.broker.is_cancelled(job_id) and proc.is_alive():
+                print(f'[QueueWorker] Kill cancelled job {job_id}')
+                try:
+                    os.kill(proc.pid, signal.SIGKILL)
+                except Exception as err:
+                    print(err)
+
+    def __shutdown(self) -> None:
+        for job_id, proc in list(self.running.items()):
+            if proc.is_alive():
+                proc.kill()
+            proc.join()
+            self.broker.requeue(
+                job_id,
+                worker_id=self.worker_id,
+                max_attempts=self.config.max_attempts,
+            )
+        self.running = dict()
+        self.broker.unregister_worker(self.worker_id)
+        print(f'[QueueWorker] Worker {self.worker_id} stopped.')
+
+
+def run_queue_worker(queue_config: QueueConfig) -> None:
+    """
+    Run a worker of the Redis queue until the process receives SIGTERM or SIGINT.
+    """
+    redis_queue_config = queue_config.redis_queue_config or RedisQueueConfig()
+    broker = build_broker(redis_queue_config)
+    if broker is None:
+        raise Exception('Redis queue worker requires a reachable redis_url.')
+
+    worker = QueueWorker(
+        broker,
+        concurrency=queue_config.concurrency or os.cpu_count(),
+        redis_queue_config=redis_queue_config,
+    )
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run()
@@ -0,0 +1,375 @@
+import heapq
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pytz
+from sqlalchemy.orm.util import identity_key
+
+from mage_ai.data_preparation.models.pipeline import Pipeline
+from mage_ai.data_preparation.models.triggers import (
+    ScheduleInterval,
+    ScheduleStatus,
+    ScheduleType,
+    get_triggers_file_path,
+    register_triggers_file_listener,
+)
+from mage_ai.orchestration.db import db_connection, safe_db_query
+from mage_ai.orchestration.db.models.schedules import PipelineRun, PipelineSchedule
+from mage_ai.server.logger import Logger
+from mage_ai.settings import SCHEDULER_FULL_RESYNC_INTERVAL
+from mage_ai.settings.repo import get_repo_path
+
+logger = Logger().new_server_logger(__name__)
+
+ACTIVE_PIPELINE_RUN_STATUSES = [
+    PipelineRun.PipelineRunStatus.INITIAL,
+    PipelineRun.PipelineRunStatus.RUNNING,
+]
+
+
+class SchedulerIndex:
+    """
+    In-memory index of pipeline schedules used by `schedule_all` in incremental mode.
+
+    The index keeps track of:
+        - The pipelines whose triggers.yaml file changed since the last tick, so that only those
+          trigger files are synced to the DB. The file of every indexed pipeline is stat'ed on
+          each tick and compared with the fingerprint (mtime, size and inode) of the last sync,
+          which catches the files written by the server, the file editor or git sync. Writes
+          made in the same process are also reported by `invalidate_triggers_file`.
+        - The version (updated_at and values) of each pipeline schedule, so that only the
+          schedules updated since the last tick are read from the DB.
+        - A priority queue of pipeline schedule IDs keyed on their next execution date, so
+          that time based schedules are only evaluated when they are due.
+        - A snapshot of the active pipeline runs, so that run status transitions (e.g. a run
+          completing or a new run created by the API or an event) mark the affected schedules
+          as dirty.
+
+    On each tick, only the schedules that are due, dirty, landing time enabled or that have
+    pipeline runs waiting to be started are loaded and evaluated. The whole index is rebuilt
+    every `full_resync_interval` seconds, which lists the pipelines and syncs every trigger
+    file again, to pick up any missed change.
+    """
+
+    def __init__(self, full_resync_interval: float = SCHEDULER_FULL_RESYNC_INTERVAL):
+        self.full_resync_interval = full_resync_interval
+        self.changed_pipeline_uuids = set()
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.last_full_resync_at = None
+        self.active_pipeline_runs = dict()
+        self.active_schedule_ids = set()
+        self.dirty_schedule_ids = set()
+        self.landing_time_schedule_ids = set()
+        self.next_execution_queue = []
+        self.next_execution_times = dict()
+        self.pending_schedule_ids = set()
+        self.repo_pipelines = set()
+        self.schedule_versions = dict()
+        self.schedules_updated_at = None
+        self.triggers_file_fingerprints = dict()
+
+    def mark_dirty(self, pipeline_schedule_id: int) -> None:
+        if pipeline_schedule_id is not None:
+            self.dirty_schedule_ids.add(pipeline_schedule_id)
+
+    def mark_triggers_changed(self, pipeline_uuid: str) -> None:
+        with self.lock:
+            self.changed_pipeline_uuids.add(pipeline_uuid)
+
+    def refresh(self) -> Tuple[Set[str], List[PipelineSchedule]]:
+        """
+        Sync the changed trigger files, apply the pipeline schedules and runs that changed since
+        the last tick to the index and return the pipeline schedules that need to be evaluated
+        in this tick.
+
+        Returns:
+            Tuple[Set[str], List[PipelineSchedule]]: The UUIDs of the pipelines in the repo and
+                the active pipeline schedules to evaluate.
+        """
+        now = datetime.now(tz=pytz.UTC).timestamp()
+        if self.last_full_resync_at is None or \
+                now - self.last_full_resync_at >= self.full_resync_interval:
+            self.__full_resync(now)
+        else:
+            self.__sync_changed_triggers()
+            self.__diff_changed_schedules()
+
+        initial_schedule_ids = self.__diff_active_pipeline_runs()
+
+        candidate_ids = self.__pop_due_schedule_ids(now)
+        candidate_ids.update(self.dirty_schedule_ids)
+        candidate_ids.update(initial_schedule_ids)
+        candidate_ids.update(self.landing_time_schedule_ids)
+        self.dirty_schedule_ids = set()
+
+        candidates = self.__load_schedules(candidate_ids & self.active_schedule_ids)
+        self.pending_schedule_ids = set(s.id for s in candidates)
+
+        logger.debug(
+            f'Incremental scheduler evaluating {len(candidates)} of '
+            f'{len(self.active_schedule_ids)} active pipeline schedules.',
+        )
+
+        return self.repo_pipelines, candidates
+
+    def update_next_execution_date(
+        self,
+        pipeline_schedule: PipelineSchedule,
+        scheduled: bool = False,
+    ) -> None:
+        """
+        Push the next time the pipeline schedule needs to be evaluated into the priority queue.
+
+        Args:
+            pipeline_schedule (PipelineSchedule): The pipeline schedule that was evaluated.
+            scheduled (bool): Whether a pipeline run was scheduled for the pipeline schedule
+                in this tick. If so, the schedule is evaluated again in the next tick so that
+                schedules creating multiple runs (e.g. streaming executors) are not delayed.
+        """
+        self.pending_schedule_ids.discard(pipeline_schedule.id)
+
+        if scheduled:
+            self.mark_dirty(pipeline_schedule.id)
+
+        next_execution_date = self.__next_execution_date(pipeline_schedule)
+        if next_execution_date is None:
+            self.next_execution_times.pop(pipeline_schedule.id, None)
+            return
+
+        timestamp = next_execution_date.timestamp()
+        self.next_execution_times[pipeline_schedule.id] = timestamp
+        heapq.heappush(self.next_execution_queue, (timestamp, pipeline_schedule.id))
+
+    def finish_tick(self) -> None:
+        # Schedules that were selected but never evaluated (e.g. the pipeline failed to load or
+        # the lock was held by another scheduler) are retried in the next tick.
+        self.dirty_schedule_ids.update(self.pending_schedule_ids)
+        self.pending_schedule_ids = set()
+
+    def __full_resync(self, now: float) -> None:
+        from mage_ai.orchestration.pipeline_scheduler_original import sync_schedules
+
+        self.reset()
+        self.last_full_resync_at = now
+        with self.lock:
+            self.changed_pipeline_uuids = set()
+
+        # Objects changed by other processes since they were loaded are reloaded as well.
+        db_connection.session.expire_all()
+
+        self.repo_pipelines = self.__list_pipelines()
+        self.triggers_file_fingerprints = self.__triggers_file_fingerprints(self.repo_pipelines)
+        try:
+            sync_schedules(list(self.repo_pipelines))
+        except Exception:
+            logger.exception('Failed to sync schedules')
+
+        self.__apply_schedules(self.__query_schedules(
+            PipelineSchedule.repo_query.filter(
+                PipelineSchedule.pipeline_uuid.in_(self.repo_pipelines),
+            ),
+        ))
+
+    def __sync_changed_triggers(self) -> None:
+        from mage_ai.orchestration.pipeline_scheduler_original import sync_schedules
+
+        with self.lock:
+            changed_pipeline_uuids = self.changed_pipeline_uuids
+            self.changed_pipeline_uuids = set()
+
+        if not changed_pipeline_uuids.issubset(self.repo_pipelines):
+            self.repo_pipelines = self.__list_pipelines()
+
+        fingerprints = self.__triggers_file_fingerprints(self.repo_pipelines)
+        changed_pipeline_uuids.update(
+            pipeline_uuid for pipeline_uuid, fingerprint in fingerprints.items()
+            if self.triggers_file_fingerprints.get(pipeline_uuid) != fingerprint
+        )
+        self.triggers_file_fingerprints = fingerprints
+
+        changed_pipeline_uuids &= self.repo_pipelines
+        if changed_pipeline_uuids:
+            logger.debug(f'Sync trigger configs for changed pipelines: {changed_pipeline_uuids}.')
+            try:
+                sync_schedules(list(changed_pipeline_uuids))
+            except Exception:
+                logger.exception('Failed to sync schedules')
+
+    def __triggers_file_fingerprints(
+        self,
+        pipeline_uuids: Iterable[str],
+    ) -> Dict[str, Optional[Tuple[int, int, int]]]:
+        fingerprints = dict()
+        for pipeline_uuid in pipeline_uuids:
+            try:
+                stat = os.stat(get_triggers_file_path(pipeline_uuid))
+                fingerprints[pipeline_uuid] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            except OSError:
+                fingerprints[pipeline_uuid] = None
+        return fingerprints
+
+    def __diff_changed_schedules(self) -> None:
+        query = PipelineSchedule.repo_query
+        if self.schedules_updated_at is not None:
+            # Rows updated in the same second as the last change are read again (some DBs only
+            # store whole seconds), but they are only applied if one of their values changed.
+            query = query.filter(
+                PipelineSchedule.updated_at >= self.schedules_updated_at - timedelta(seconds=1),
+            )
+
+        pipeline_schedules = [
+            s for s in self.__query_schedules(query)
+            if self.schedule_versions.get(s.id) != self.__version(s)
+        ]
+
+        # Schedules created for a pipeline created since the pipelines were listed.
+        if any(
+            s.pipeline_uuid not in self.repo_pipelines and s.status == ScheduleStatus.ACTIVE
+            for s in pipeline_schedules
+        ):
+            self.repo_pipelines = self.__list_pipelines()
+
+        self.__apply_schedules(pipeline_schedules)
+
+    @safe_db_query
+    def __query_schedules(self, query) -> List[PipelineSchedule]:
+        return query.populate_existing().all()
+
+    def __apply_schedules(self, pipeline_schedules: Iterable[PipelineSchedule]) -> None:
+        for pipeline_schedule in pipeline_schedules:
+            pipeline_schedule_id = pipeline_schedule.id
+            self.schedule_versions[pipeline_schedule_id] = self.__version(pipeline_schedule)
+            if pipeline_schedule.updated_at is not None and (
+                self.schedules_updated_at is None or
+                pipeline_schedule.updated_at > self.schedules_updated_at
+            ):
+                self.schedules_updated_at = pipeline_schedule.updated_at
+
+            if pipeline_schedule.status != ScheduleStatus.ACTIVE or \
+                    pipeline_schedule.pipeline_uuid not in self.repo_pipelines:
+                self.__remove_schedule(pipeline_schedule_id)
+                continue
+
+            self.active_schedule_ids.add(pipeline_schedule_id)
+            self.mark_dirty(pipeline_schedule_id)
+            if pipeline_schedule.landing_time_enabled():
+                self.landing_time_schedule_ids.add(pipeline_schedule_id)
+            else:
+                self.landing_time_schedule_ids.discard(pipeline_schedule_id)
+
+    def __version(self, pipeline_schedule: PipelineSchedule) -> Tuple:
+        # updated_at alone can't tell apart the updates made in the same second on some DBs.
+        return tuple(
+            getattr(pipeline_schedule, column.key) for column in PipelineSchedule.__table__.columns
+        )
+
+    def __remove_schedule(self, pipeline_schedule_id: int) -> None:
+        # Entries left in the queue for removed schedules are skipped when popped.
+        self.active_schedule_ids.discard(pipeline_schedule_id)
+        self.dirty_schedule_ids.discard(pipeline_schedule_id)
+        self.landing_time_schedule_ids.discard(pipeline_schedule_id)
+        self.next_execution_times.pop(pipeline_schedule_id, None)
+
+    def __load_schedules(self, pipeline_schedule_ids: Set[int]) -> List[PipelineSchedule]:
+        if not pipeline_schedule_ids:
+            return []
+
+        pipeline_schedules = self.__query_schedules(PipelineSchedule.query.filter(
+            PipelineSchedule.id.in_(pipeline_schedule_ids),
+        ))
+
+        # Schedules deleted since they were indexed.
+        for pipeline_schedule_id in pipeline_schedule_ids - set(s.id for s in pipeline_schedules):
+            self.schedule_versions.pop(pipeline_schedule_id, None)
+            self.__remove_schedule(pipeline_schedule_id)
+
+        return [s for s in pipeline_schedules if s.status == ScheduleStatus.ACTIVE]
+
+    def __list_pipelines(self) -> Set[str]:
+        return set(Pipeline.get_all_pipelines_all_projects(
+            get_repo_path(),
+            disable_pipelines_folder_creation=True,
+        ))
+
+    @safe_db_query
+    def __diff_active_pipeline_runs(self) -> Set[int]:
+        rows = PipelineRun.select(
+            PipelineRun.id,
+            PipelineRun.pipeline_schedule_id,
+            PipelineRun.status,
+        ).filter(
+            PipelineRun.status.in_(ACTIVE_PIPELINE_RUN_STATUSES),
+        ).all()
+
+        active_pipeline_runs = dict()
+        initial_schedule_ids = set()
+        changed_pipeline_run_ids = []
+        for pipeline_run_id, pipeline_schedule_id, status in rows:
+            if pipeline_schedule_id not in self.active_schedule_ids:
+                continue
+
+            active_pipeline_runs[pipeline_run_id] = (pipeline_schedule_id, status)
+            if status == PipelineRun.PipelineRunStatus.INITIAL:
+                initial_schedule_ids.add(pipeline_schedule_id)
+            if self.active_pipeline_runs.get(pipeline_run_id) != (pipeline_schedule_id, status):
+                changed_pipeline_run_ids.append(pipeline_run_id)
+                self.mark_dirty(pipeline_schedule_id)
+
+        for pipeline_run_id, pair in self.active_pipeline_runs.items():
+            # A pipeline run that is no longer active finished, failed or was cancelled.
+            if pipeline_run_id not in active_pipeline_runs:
+                changed_pipeline_run_ids.append(pipeline_run_id)
+                self.mark_dirty(pair[0])
+
+        self.active_pipeline_runs = active_pipeline_runs
+        self.__expire_pipeline_runs(changed_pipeline_run_ids)
+
+        return initial_schedule_ids
+
+    def __expire_pipeline_runs(self, pipeline_run_ids: List[int]) -> None:
+        # Pipeline runs already loaded in the session (e.g. through the pipeline_runs of a
+        # schedule) are reloaded the next time they are accessed.
+        session = db_connection.session
+        for pipeline_run_id in pipeline_run_ids:
+            pipeline_run = session.identity_map.get(identity_key(PipelineRun, pipeline_run_id))
+            if pipeline_run is not None:
+                session.expire(pipeline_run)
+
+    def __pop_due_schedule_ids(self, now: float) -> Set[int]:
+        due_schedule_ids = set()
+        while self.next_execution_queue and self.next_execution_queue[0][0] <= now:
+            timestamp, pipeline_schedule_id = heapq.heappop(self.next_execution_queue)
+            if self.next_execution_times.get(pipeline_schedule_id) != timestamp:
+                continue
+            self.next_execution_times.pop(pipeline_schedule_id, None)
+            due_schedule_ids.add(pipeline_schedule_id)
+        return due_schedule_ids
+
+    def __next_execution_date(self, pipeline_schedule: PipelineSchedule) -> Optional[datetime]:
+        # @once and @always_on schedules, as well as API and event triggers, only need to be
+        # evaluated again when they change or when one of their pipeline runs changes status.
+        if pipeline_schedule.schedule_type != ScheduleType.TIME or \
+                pipeline_schedule.schedule_interval in [
+                    None,
+                    ScheduleInterval.ONCE,
+                    ScheduleInterval.ALWAYS_ON,
+                ]:
+            return None
+
+        try:
+            return pipeline_schedule.next_execution_date()
+        except Exception:
+            logger.exception(
+                f'Failed to compute next execution date for pipeline schedule '
+                f'{pipeline_schedule.id}',
+            )
+            return None
+
+
+scheduler_index = SchedulerIndex()
+register_triggers_file_listener(scheduler_index.mark_triggers_changed)
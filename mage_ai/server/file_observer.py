@@ -1,6 +1,18 @@
+import os
+from typing import List
+
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers.api import BaseObserver
 
+from mage_ai.data_preparation.models.constants import PIPELINES_FOLDER
+from mage_ai.data_preparation.models.pipelines.index import (
+    PipelineIndex,
+    get_pipeline_index,
+)
 from mage_ai.data_preparation.repo_manager import update_settings_on_metadata_change
+from mage_ai.settings.platform import build_repo_path_for_all_projects
+from mage_ai.settings.platform.constants import project_platform_activated
+from mage_ai.settings.repo import get_repo_path
 
 
 class MetadataEventHandler(FileSystemEventHandler):
@@ -8,3 +20,56 @@ class MetadataEventHandler(FileSystemEventHandler):
         super().on_modified(event)
 
         update_settings_on_metadata_change()
+
+
+class PipelineIndexEventHandler(FileSystemEventHandler):
+    """
+    Update the pipeline index of a project when the metadata.yaml or triggers.yaml file of one
+    of its pipelines is created, modified, moved or deleted, so that listing the pipelines
+    doesn't check the files of every pipeline.
+    """
+
+    def __init__(self, index: PipelineIndex):
+        super().__init__()
+        self.index = index
+
+    def start(self) -> None:
+        """
+        Sync the index with the files once the observer is started; from then on, the index
+        trusts the file events.
+        """
+        self.index.sync(force=True)
+        self.index.watched = True
+
+    def on_any_event(self, event: FileSystemEvent):
+        super().on_any_event(event)
+
+        try:
+            for path in [event.src_path, getattr(event, 'dest_path', None)]:
+                self.index.refresh_path(path)
+        except Exception as err:
+            print(f'[WARNING] PipelineIndexEventHandler: {err}')
+
+
+def schedule_pipeline_index_handlers(observer: BaseObserver) -> List[PipelineIndexEventHandler]:
+    """
+    Watch the pipelines folder of every project with a handler updating its pipeline index.
+    Call the start method of the handlers after starting the observer.
+    """
+    repo_paths = [get_repo_path(root_project=True)]
+    if project_platform_activated():
+        repo_paths.extend([
+            d.get('full_path')
+            for d in build_repo_path_for_all_projects(mage_projects_only=True).values()
+        ])
+
+    handlers = []
+    for repo_path in set(p for p in repo_paths if p):
+        pipelines_folder = os.path.join(repo_path, PIPELINES_FOLDER)
+        if not os.path.isdir(pipelines_folder):
+            continue
+        handler = PipelineIndexEventHandler(get_pipeline_index(repo_path))
+        observer.schedule(handler, path=pipelines_folder, recursive=True)
+        handlers.append(handler)
+
+    return handlers
@@ -67,7 +67,10 @@ from mage_ai.server.api.v1 import (
 )
 from mage_ai.server.constants import DATA_PREP_SERVER_PORT
 from mage_ai.server.docs_server import run_docs_server
-from mage_ai.server.file_observer import MetadataEventHandler
+from mage_ai.server.file_observer import (
+    MetadataEventHandler,
+    schedule_pipeline_index_handlers,
+)
 from mage_ai.server.kernel_output_parser import parse_output_message
 from mage_ai.server.kernels import DEFAULT_KERNEL_NAME
 from mage_ai.server.logger import Logger
@@ -92,6 +95,7 @@ from mage_ai.settings import (
     ENABLE_PROMETHEUS,
     OAUTH2_APPLICATION_CLIENT_ID,
     OTEL_EXPORTER_OTLP_ENDPOINT,
+    PIPELINE_INDEX,
     REDIS_URL,
     REQUESTS_BASE_PATH,
     REQUIRE_USER_AUTHENTICATION,
@@ -702,7 +706,12 @@ async def main(
         with open(metadata_file, 'w') as f:
             f.write('')
     observer.schedule(event_handler, path=metadata_file)
+    pipeline_index_handlers = []
+    if PIPELINE_INDEX:
+        pipeline_index_handlers = schedule_pipeline_index_handlers(observer)
     observer.start()
+    for handler in pipeline_index_handlers:
+        handler.start()
 
     get_messages(
         lambda content: WebSocketServer.send_message(
@@ -2,6 +2,11 @@ import boto3
 import boto3.s3.transfer as s3transfer
 import botocore
 
+from mage_ai.settings.server import (
+    REMOTE_STORAGE_CHUNK_SIZE_MB,
+    REMOTE_STORAGE_MAX_CONCURRENCY,
+)
+
 MAX_POOL_CONNECTIONS = 100
 MAX_KEYS = 10000
 
@@ -19,9 +24,13 @@ class Client:
                 endpoint_url=kwargs.get('endpoint_url'),
             ),
         )
+        # Objects larger than a chunk are downloaded and uploaded in parts in parallel.
+        chunk_size = max(int(REMOTE_STORAGE_CHUNK_SIZE_MB * 1024 * 1024), 5 * 1024 * 1024)
         self.transfer_config = s3transfer.TransferConfig(
+            multipart_chunksize=chunk_size,
+            multipart_threshold=chunk_size,
             use_threads=True,
-            max_concurrency=MAX_POOL_CONNECTIONS,
+            max_concurrency=min(max(REMOTE_STORAGE_MAX_CONCURRENCY, 1), MAX_POOL_CONNECTIONS),
         )
 
     def download_file(self, object_key: str, filename_destination):
@@ -36,6 +45,27 @@ class Client:
     def get_object(self, object_key: str):
         return self.client.get_object(Bucket=self.bucket, Key=object_key)['Body']
 
+    def get_object_size(self, object_key: str) -> int:
+        return self.client.head_object(Bucket=self.bucket, Key=object_key)['ContentLength']
+
+    def read_range(self, object_key: str, start: int, end: int) -> bytes:
+        """
+        Read the bytes of an object from the start offset to the end offset, excluded.
+        """
+        return self.client.get_object(
+            Bucket=self.bucket,
+            Key=object_key,
+            Range=f'bytes={start}-{end - 1}',
+        )['Body'].read()
+
+    def download_fileobj(self, object_key: str, file):
+        return self.client.download_fileobj(
+            Bucket=self.bucket,
+            Key=object_key,
+            Fileobj=file,
+            Config=self.transfer_config,
+        )
+
     def delete_objects(self, prefix: str):
         keys = self.list_objects(prefix)
         self.client.delete_objects(
@@ -85,4 +115,9 @@ class Client:
         )
 
     def upload_object(self, object_key: str, file):
-        return self.client.upload_fileobj(file, Bucket=self.bucket, Key=object_key)
+        return self.client.upload_fileobj(
+            file,
+            Bucket=self.bucket,
+            Key=object_key,
+            Config=self.transfer_config,
+        )
@@ -196,6 +196,109 @@ try:
 except ValueError:
     SCHEDULER_TRIGGER_INTERVAL = 10
 
+# If enabled, the scheduler keeps an in-memory index of pipeline schedules, their next
+# execution dates and active pipeline runs, and only re-evaluates the schedules that changed
+# or are due on each tick instead of rescanning every pipeline.
+SCHEDULER_INCREMENTAL_MODE = get_bool_value(os.getenv('SCHEDULER_INCREMENTAL_MODE', 'False'))
+# How often, in seconds, the incremental scheduler rebuilds its index from scratch to pick up any
+# change it missed. Changed trigger files are synced on the next tick.
+try:
+    SCHEDULER_FULL_RESYNC_INTERVAL = float(os.getenv('SCHEDULER_FULL_RESYNC_INTERVAL', '300'))
+except ValueError:
+    SCHEDULER_FULL_RESYNC_INTERVAL = 300
+# The maximum number of block runs of a dynamic child block that are created and not finished
+# at the same time. The other block runs are created as these finish. Defaults to 0, which
+# creates all of them when the dynamic child block runs.
+try:
+    DYNAMIC_CHILD_BLOCK_RUN_WINDOW = int(os.getenv('DYNAMIC_CHILD_BLOCK_RUN_WINDOW', '0'))
+except ValueError:
+    DYNAMIC_CHILD_BLOCK_RUN_WINDOW = 0
+
+# -------------------------
+# Streaming Settings
+# -------------------------
+
+# When the messages buffered by streaming sinks are flushed to disk: after each write
+# (always), at most once every STREAMING_BUFFER_FSYNC_INTERVAL seconds (interval) or when
+# the OS decides to (never).
+STREAMING_BUFFER_FSYNC_POLICY = os.getenv('STREAMING_BUFFER_FSYNC_POLICY', 'interval')
+try:
+    STREAMING_BUFFER_FSYNC_INTERVAL = float(os.getenv('STREAMING_BUFFER_FSYNC_INTERVAL', '1'))
+except ValueError:
+    STREAMING_BUFFER_FSYNC_INTERVAL = 1
+# The size, in MB, after which the streaming sink buffer starts a new segment file.
+try:
+    STREAMING_BUFFER_SEGMENT_SIZE_MB = float(os.getenv('STREAMING_BUFFER_SEGMENT_SIZE_MB', '64'))
+except ValueError:
+    STREAMING_BUFFER_SEGMENT_SIZE_MB = 64
+
+# -------------------------
+# Data Cleaner Settings
+# -------------------------
+
+# The row count above which the statistics of a dataframe (e.g. the summary of a block output)
+# are estimated with sketches (HyperLogLog and t-digest) instead of calculated exactly. 0 always
+# calculates exact statistics.
+try:
+    DATA_CLEANER_APPROXIMATE_THRESHOLD = int(
+        os.getenv('DATA_CLEANER_APPROXIMATE_THRESHOLD', '0')
+    )
+except ValueError:
+    DATA_CLEANER_APPROXIMATE_THRESHOLD = 0
+
+# -------------------------
+# Variable Settings
+# -------------------------
+
+# If enabled, dataframe block outputs on the local disk are written as uncompressed Arrow IPC
+# files instead of parquet files, and downstream blocks memory-map them instead of decoding them.
+VARIABLE_ARROW_HANDOFF = get_bool_value(os.getenv('VARIABLE_ARROW_HANDOFF', 'False'))
+# The maximum size, in MB, of the dataframe block outputs kept in memory for the downstream
+# blocks running in the same process. 0 disables the cache.
+try:
+    VARIABLE_MEMORY_CACHE_SIZE_MB = float(os.getenv('VARIABLE_MEMORY_CACHE_SIZE_MB', '0'))
+except ValueError:
+    VARIABLE_MEMORY_CACHE_SIZE_MB = 0
+# If enabled, the outputs of transformer and custom blocks are cached by the code of the block,
+# its global variables and the outputs of its upstream blocks; a block whose inputs didn't change
+# since it was cached isn't executed again. Blocks opt in or out with the output_cache setting of
+# their configuration; data loaders and data exporters are only cached when they opt in.
+BLOCK_OUTPUT_CACHE = get_bool_value(os.getenv('BLOCK_OUTPUT_CACHE', 'False'))
+# The maximum size, in MB, of the cached block outputs. The least recently used outputs are
+# evicted first.
+try:
+    BLOCK_OUTPUT_CACHE_MAX_SIZE_MB = float(os.getenv('BLOCK_OUTPUT_CACHE_MAX_SIZE_MB', '1024'))
+except ValueError:
+    BLOCK_OUTPUT_CACHE_MAX_SIZE_MB = 1024
+# The number of seconds after which a cached block output expires, counted from when it was
+# cached. 0 keeps them until the cache is full.
+try:
+    BLOCK_OUTPUT_CACHE_MAX_AGE_SECONDS = int(
+        os.getenv('BLOCK_OUTPUT_CACHE_MAX_AGE_SECONDS', str(7 * 24 * 60 * 60))
+    )
+except ValueError:
+    BLOCK_OUTPUT_CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+# The maximum number of requests to the remote storage of the variables (S3, GCS) run at the
+# same time by the async reads and writes, and by each parallel download or upload.
+try:
+    REMOTE_STORAGE_MAX_CONCURRENCY = int(os.getenv('REMOTE_STORAGE_MAX_CONCURRENCY', '16'))
+except ValueError:
+    REMOTE_STORAGE_MAX_CONCURRENCY = 16
+# The size, in MB, of the parts of the files downloaded or uploaded in parallel.
+try:
+    REMOTE_STORAGE_CHUNK_SIZE_MB = float(os.getenv('REMOTE_STORAGE_CHUNK_SIZE_MB', '8'))
+except ValueError:
+    REMOTE_STORAGE_CHUNK_SIZE_MB = 8
+# If enabled, the pipelines of a project are listed from a persistent index of their
+# metadata.yaml and triggers.yaml files; only the files that changed are read again.
+PIPELINE_INDEX = get_bool_value(os.getenv('PIPELINE_INDEX', 'False'))
+# The maximum number of parsed pipeline and trigger YAML files kept in memory by each process.
+# A file is only parsed again when its mtime or size changes. 0 disables the cache.
+try:
+    YAML_PARSE_CACHE_SIZE = int(os.getenv('YAML_PARSE_CACHE_SIZE', '4096'))
+except ValueError:
+    YAML_PARSE_CACHE_SIZE = 4096
+
 # -------------------------
 # System level features
 # -------------------------
@@ -239,6 +342,22 @@ MAGE_SETTINGS_ENVIRONMENT_VARIABLES = [
     'SENTRY_TRACES_SAMPLE_RATE',
     'MAGE_PUBLIC_HOST',
     'SCHEDULER_TRIGGER_INTERVAL',
+    'SCHEDULER_INCREMENTAL_MODE',
+    'SCHEDULER_FULL_RESYNC_INTERVAL',
+    'DYNAMIC_CHILD_BLOCK_RUN_WINDOW',
+    'STREAMING_BUFFER_FSYNC_POLICY',
+    'STREAMING_BUFFER_FSYNC_INTERVAL',
+    'STREAMING_BUFFER_SEGMENT_SIZE_MB',
+    'DATA_CLEANER_APPROXIMATE_THRESHOLD',
+    'VARIABLE_ARROW_HANDOFF',
+    'VARIABLE_MEMORY_CACHE_SIZE_MB',
+    'REMOTE_STORAGE_MAX_CONCURRENCY',
+    'REMOTE_STORAGE_CHUNK_SIZE_MB',
+    'BLOCK_OUTPUT_CACHE',
+    'BLOCK_OUTPUT_CACHE_MAX_SIZE_MB',
+    'BLOCK_OUTPUT_CACHE_MAX_AGE_SECONDS',
+    'PIPELINE_INDEX',
+    'YAML_PARSE_CACHE_SIZE',
     'REQUIRE_USER_PERMISSIONS',
     'ENABLE_PROMETHEUS',
     'OTEL_EXPORTER_OTLP_ENDPOINT',
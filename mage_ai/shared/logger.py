@@ -161,6 +161,16 @@ class VerbosePrintHandler:
             print('DONE', end='')
             self.exists_previous_message = True
 
+    def print_info(self, msg):
+        """
+        Prints a message that doesn't wrap an operation, e.g. the stats of the previous one.
+        """
+        if self.verbose:
+            if self.exists_previous_message:
+                print('\r├─ ')
+            print(f'└─ {msg}', end='')
+            self.exists_previous_message = True
+
 
 class BlockFunctionExec:
     def __init__(
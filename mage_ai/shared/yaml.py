@@ -1,4 +1,22 @@
-from typing import Dict, List, Union
+import copy
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple, Union
+
+import aiofiles
+import yaml
+
+from mage_ai.settings.server import YAML_PARSE_CACHE_SIZE
+
+# Use the libyaml parser when PyYAML was built with it; it parses several times faster than
+# the pure Python parser.
+if yaml.__with_libyaml__:
+    FullLoader = yaml.CFullLoader
+    SafeLoader = yaml.CSafeLoader
+else:
+    FullLoader = yaml.FullLoader
+    SafeLoader = yaml.SafeLoader
 
 
 def trim_strings(data: Union[Dict, List, str]) -> Union[Dict, List, str]:
@@ -10,3 +28,113 @@ def trim_strings(data: Union[Dict, List, str]) -> Union[Dict, List, str]:
         return data.rstrip()  # Remove trailing whitespace and newlines
     else:
         return data
+
+
+def load_yaml(content: str, safe: bool = False) -> Any:
+    return yaml.load(content, Loader=SafeLoader if safe else FullLoader)
+
+
+class YAMLParseCache:
+    """
+    LRU cache of parsed YAML files keyed by their path and the loader used to parse them.
+
+    Each file is stored with its mtime and size when it was parsed; it's parsed again when
+    either changed. Writers of the files invalidate them explicitly as well, in case a file
+    is rewritten with the same size within the resolution of the mtime.
+    """
+
+    def __init__(self, max_size: int = 0):
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.max_size = max_size
+
+    def load(self, path: str, safe: bool = False) -> Any:
+        fingerprint = self.__fingerprint(path)
+        data = self.__get(path, safe, fingerprint)
+        if data is not None:
+            return data
+
+        with open(path, encoding='utf-8') as fp:
+            content = fp.read()
+
+        return self.__put(path, safe, fingerprint, load_yaml(content, safe=safe))
+
+    async def load_async(self, path: str, safe: bool = False) -> Any:
+        fingerprint = self.__fingerprint(path)
+        data = self.__get(path, safe, fingerprint)
+        if data is not None:
+            return data
+
+        async with aiofiles.open(path, mode='r', encoding='utf-8') as fp:
+            content = await fp.read()
+
+        return self.__put(path, safe, fingerprint, load_yaml(content, safe=safe))
+
+    def invalidate(self, path: str) -> None:
+        path = os.path.abspath(path)
+        with self.lock:
+            for safe in [False, True]:
+                self.entries.pop((path, safe), None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def __get(self, path: str, safe: bool, fingerprint: Tuple[int, int]) -> Any:
+        if self.max_size <= 0:
+            return None
+
+        key = (os.path.abspath(path), safe)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != fingerprint:
+                self.entries.pop(key, None)
+                return None
+            self.entries.move_to_end(key)
+
+        # Callers modify the configs they load.
+        return copy.deepcopy(entry[1])
+
+    def __put(self, path: str, safe: bool, fingerprint: Tuple[int, int], data: Any) -> Any:
+        if self.max_size <= 0 or data is None:
+            return data
+
+        key = (os.path.abspath(path), safe)
+        with self.lock:
+            self.entries[key] = (fingerprint, data)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+        return copy.deepcopy(data)
+
+    def __fingerprint(self, path: str) -> Tuple[int, int]:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+yaml_parse_cache = YAMLParseCache(max_size=YAML_PARSE_CACHE_SIZE)
+
+
+def load_yaml_file(path: str, safe: bool = False) -> Any:
+    """
+    Parse a YAML file, reusing the result of the last parse if the file didn't change since.
+
+    Args:
+        path (str): The path of the file.
+        safe (bool): Parse the file with the safe loader instead of the full loader.
+
+    Returns:
+        Any: A copy of the parsed content of the file.
+    """
+    return yaml_parse_cache.load(path, safe=safe)
+
+
+async def load_yaml_file_async(path: str, safe: bool = False) -> Any:
+    return await yaml_parse_cache.load_async(path, safe=safe)
+
+
+def invalidate_yaml_file(path: str) -> None:
+    yaml_parse_cache.invalidate(path)
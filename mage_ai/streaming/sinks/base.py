@@ -1,15 +1,28 @@
-import json
 import os
 import traceback
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import Dict, List
 
+from mage_ai.settings.server import (
+    STREAMING_BUFFER_FSYNC_INTERVAL,
+    STREAMING_BUFFER_FSYNC_POLICY,
+    STREAMING_BUFFER_SEGMENT_SIZE_MB,
+)
+from mage_ai.streaming.sinks.write_ahead_log import (
+    FsyncPolicy,
+    WriteAheadLog,
+    read_legacy_buffer,
+)
+
 MESSAGE_FORMAT_V2_KEYS = frozenset(['data', 'metadata'])
 
 
 class BaseSink(ABC):
     config_class = None
+    # Whether batch_write modifies the messages passed to it. When the streaming pipeline shares
+    # block outputs across branches (copy on write mode), such sinks still get their own copy.
+    mutates_messages = False
 
     def __init__(self, config: Dict, **kwargs):
         self.connector_type = config.get('connector_type')
@@ -18,6 +31,7 @@ class BaseSink(ABC):
                 config.pop('connector_type')
             self.config = self.config_class.load(config=config)
         self.buffer_path = kwargs.get('buffer_path')
+        self.write_ahead_log = None
         self.buffer = self.read_buffer() or []
         self.buffer_start_time = None
         try:
@@ -52,16 +66,25 @@ class BaseSink(ABC):
 
     def clear_buffer(self):
         self.buffer = []
-        if not self.buffer_path:
+        if self.write_ahead_log is None:
             return
-        with open(self.buffer_path, 'w'):
-            pass
+        self.write_ahead_log.acknowledge()
 
-    def destroy(self):  # noqa: B027
+    def destroy(self):
         """
         Close connections and destroy threads
         """
-        pass
+        self.close_buffer()
+
+    def close_buffer(self):
+        # The sink may be destroyed before the buffer is read (e.g. an invalid config).
+        if getattr(self, 'write_ahead_log', None) is None:
+            return
+        try:
+            self.write_ahead_log.close()
+        except Exception:
+            traceback.print_exc()
+        self.write_ahead_log = None
 
     def has_buffer_timed_out(self, buffer_timeout_seconds):
         if self.buffer_start_time is None:
@@ -72,13 +95,30 @@ class BaseSink(ABC):
                 self.buffer_start_time).total_seconds() >= buffer_timeout_seconds
 
     def read_buffer(self):
+        """
+        Open the write-ahead log the buffered messages are persisted in and return the messages
+        that weren't written to the sink yet.
+        """
         buffer = []
-        if not self.buffer_path or not os.path.exists(self.buffer_path):
+        if not self.buffer_path:
             return buffer
+        # An invalid policy is a configuration error, it's not swallowed below.
+        fsync_policy = FsyncPolicy.parse(STREAMING_BUFFER_FSYNC_POLICY)
         try:
-            with open(self.buffer_path) as fp:
-                for line in fp:
-                    buffer.append(json.loads(line))
+            self.write_ahead_log = WriteAheadLog(
+                f'{self.buffer_path}.wal',
+                fsync_interval=STREAMING_BUFFER_FSYNC_INTERVAL,
+                fsync_policy=fsync_policy,
+                segment_max_bytes=int(STREAMING_BUFFER_SEGMENT_SIZE_MB * 1024 * 1024),
+            )
+            buffer = self.write_ahead_log.read()
+
+            # Move the messages buffered in the JSON lines file used in previous versions
+            legacy_buffer = read_legacy_buffer(self.buffer_path)
+            if legacy_buffer:
+                self.write_ahead_log.append(legacy_buffer)
+                os.remove(self.buffer_path)
+                buffer = legacy_buffer + buffer
         except Exception:
             traceback.print_exc()
             pass
@@ -93,11 +133,9 @@ class BaseSink(ABC):
         if not self.buffer:
             self.buffer_start_time = datetime.now(timezone.utc)
         self.buffer += data
-        if not self.buffer_path or not data:
+        if self.write_ahead_log is None:
             return
-        with open(self.buffer_path, 'a') as fp:
-            for record in data:
-                fp.write(json.dumps(record) + '\n')
+        self.write_ahead_log.append(data)
 
     def _is_message_format_v2(self, message: Dict):
         """
@@ -70,6 +70,7 @@ class BaseObjectStorageSink(BaseSink):
             self.timer.cancel()
         except Exception:
             traceback.print_exc()
+        super().destroy()
 
     def write(self, message: Dict):
         self._print(f'Ingest data {message}, time={time.time()}')
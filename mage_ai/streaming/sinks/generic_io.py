@@ -81,6 +81,7 @@ class GenericIOSink(BaseSink):
                 self.io_client.close()
         except Exception:
             traceback.print_exc()
+        super().destroy()
 
     def __io_class(self):
         io_class_config = IO_CLASS_MAP.get(self.connector_type, {})
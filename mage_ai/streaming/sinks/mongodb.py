@@ -18,6 +18,8 @@ class MongoDbConfig(BaseConfig):
 
 class MongoDbSink(BaseSink):
     config_class = MongoDbConfig
+    # insert_many adds the generated _id to the inserted documents.
+    mutates_messages = True
 
     def init_client(self):
         self.client = MongoClient(self.config.connection_string)
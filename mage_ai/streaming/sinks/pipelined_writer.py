@@ -0,0 +1,139 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+
+from mage_ai.streaming.sinks.base import BaseSink
+
+DEFAULT_MAX_IN_FLIGHT_BATCHES = 4
+
+
+class InFlightBatch:
+    def __init__(self, writes: List[Tuple[str, List]]):
+        self.future = Future()
+        self.pending_sinks = len(writes)
+
+
+class PipelinedSinkWriter:
+    """
+    Writes batches to the sinks of a streaming pipeline on background threads, so that the
+    source can keep consuming messages while the sinks are flushing.
+
+    Each sink has its own worker thread that writes the batches in the order they were
+    submitted. At most `max_in_flight_batches` batches can be in flight at a time: submitting a
+    batch blocks until the oldest batch is written to all the sinks, which applies backpressure
+    to the source.
+
+    Each submitted batch returns a future that is resolved once all the sinks acknowledged the
+    batch, in submission order. Sources use it to commit the offsets of a batch only after it
+    was written, which keeps the at-least-once delivery guarantee.
+    """
+
+    def __init__(
+        self,
+        sinks_by_uuid: Dict[str, BaseSink],
+        max_in_flight_batches: int = DEFAULT_MAX_IN_FLIGHT_BATCHES,
+    ):
+        self.error = None
+        self.in_flight_batches = deque()
+        self.lock = threading.Lock()
+        self.semaphore = threading.BoundedSemaphore(
+            max(max_in_flight_batches or DEFAULT_MAX_IN_FLIGHT_BATCHES, 1),
+        )
+        self.sinks_by_uuid = sinks_by_uuid
+
+        self.queues = dict()
+        self.workers = []
+        for sink_uuid in sinks_by_uuid:
+            self.queues[sink_uuid] = queue.Queue()
+            worker = threading.Thread(
+                target=self.__run_worker,
+                args=(sink_uuid,),
+                daemon=True,
+                name=f'mage_sink_writer_{sink_uuid}',
+            )
+            worker.start()
+            self.workers.append(worker)
+
+    def submit(self, writes: List[Tuple[str, List]]) -> Future:
+        """
+        Queue the writes of a batch.
+
+        Args:
+            writes (List[Tuple[str, List]]): The UUID of the sink and the messages to write to
+                it, for each sink the batch is written to.
+
+        Returns:
+            Future: Resolved when all the sinks acknowledged the batch.
+        """
+        self.raise_error()
+        self.semaphore.acquire()
+        self.raise_error()
+
+        batch = InFlightBatch(writes)
+        with self.lock:
+            self.in_flight_batches.append(batch)
+        if not writes:
+            self.__resolve_batches()
+        for sink_uuid, messages in writes:
+            self.queues[sink_uuid].put((batch, messages))
+
+        return batch.future
+
+    def flush(self) -> None:
+        """
+        Block until all the batches in flight are written, then raise the first write error.
+        """
+        with self.lock:
+            futures = [batch.future for batch in self.in_flight_batches]
+        for future in futures:
+            try:
+                future.result()
+            except Exception:
+                break
+        self.raise_error()
+
+    def close(self, wait: bool = True) -> None:
+        for q in self.queues.values():
+            q.put(None)
+        if wait:
+            for worker in self.workers:
+                worker.join()
+
+    def raise_error(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    def __run_worker(self, sink_uuid: str) -> None:
+        sink = self.sinks_by_uuid[sink_uuid]
+        q = self.queues[sink_uuid]
+        while True:
+            item = q.get()
+            if item is None:
+                return
+            batch, messages = item
+            try:
+                if self.error is None:
+                    sink.batch_write(messages)
+            except Exception as err:
+                with self.lock:
+                    if self.error is None:
+                        self.error = err
+            with self.lock:
+                batch.pending_sinks -= 1
+            self.__resolve_batches()
+
+    def __resolve_batches(self) -> None:
+        # Resolve the futures in submission order, so that the source never acknowledges a
+        # batch before all the batches preceding it.
+        with self.lock:
+            while self.in_flight_batches and (
+                self.in_flight_batches[0].pending_sinks <= 0 or self.error is not None
+            ):
+                batch = self.in_flight_batches.popleft()
+                if self.error is not None:
+                    batch.future.set_exception(self.error)
+                else:
+                    batch.future.set_result(True)
+                self.semaphore.release()
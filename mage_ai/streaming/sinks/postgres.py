@@ -23,6 +23,7 @@ class PostgresConfig(BaseConfig):
     port: int = 5432
     unique_conflict_method: str = UNIQUE_CONFLICT_METHOD_IGNORE
     unique_constraints: List = field(default_factory=list)
+    upsert_with_staging_table: bool = False
 
 
 class PostgresSink(BaseSink):
@@ -57,6 +58,7 @@ class PostgresSink(BaseSink):
             if_exists=ExportWritePolicy.APPEND,
             unique_conflict_method=self.config.unique_conflict_method,
             unique_constraints=self.config.unique_constraints,
+            upsert_with_staging_table=self.config.upsert_with_staging_table,
         )
 
     def destroy(self):
@@ -64,3 +66,4 @@ class PostgresSink(BaseSink):
             self.postgres_client.close()
         except Exception:
             traceback.print_exc()
+        super().destroy()
@@ -0,0 +1,246 @@
+import json
+import os
+import re
+import struct
+import time
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum, IntEnum
+from typing import Any, List, Optional
+
+import msgpack
+
+from mage_ai.shared.parsers import encode_complex
+
+CHECKPOINT_FILE_NAME = 'checkpoint'
+# Length and CRC32 checksum of the payload, followed by the payload.
+FRAME_HEADER = struct.Struct('>II')
+# Frames written before the records were encoded with MessagePack start with the JSON array.
+JSON_FRAME_PREFIX = b'['
+SEGMENT_FILE_NAME_REGEX = re.compile(r'^segment_(\d+)\.wal$')
+
+
+class FsyncPolicy(str, Enum):
+    # fsync the segment after each append: no acknowledged write is lost if the host crashes.
+    ALWAYS = 'always'
+    # fsync the segment at most once every fsync_interval seconds.
+    INTERVAL = 'interval'
+    # Leave flushing the segments to disk to the OS.
+    NEVER = 'never'
+
+    @classmethod
+    def parse(cls, value: str) -> 'FsyncPolicy':
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(str(value).lower())
+        except ValueError:
+            raise ValueError(
+                f'Invalid fsync policy {value}, it must be one of: '
+                f'{", ".join(policy.value for policy in cls)}.',
+            )
+
+
+class ExtType(IntEnum):
+    DATE = 1
+    DATETIME = 2
+    DECIMAL = 3
+
+
+def encode_ext(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return msgpack.ExtType(ExtType.DATETIME, value.isoformat().encode())
+    elif isinstance(value, date):
+        return msgpack.ExtType(ExtType.DATE, value.isoformat().encode())
+    elif isinstance(value, Decimal):
+        return msgpack.ExtType(ExtType.DECIMAL, str(value).encode())
+
+    encoded = encode_complex(value)
+    if encoded is value:
+        raise TypeError(f'Object of type {type(value).__name__} can\'t be written to the log.')
+    return encoded
+
+
+def decode_ext(code: int, data: bytes) -> Any:
+    if code == ExtType.DATETIME:
+        return datetime.fromisoformat(data.decode())
+    elif code == ExtType.DATE:
+        return date.fromisoformat(data.decode())
+    elif code == ExtType.DECIMAL:
+        return Decimal(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def encode_records(records: List[Any]) -> bytes:
+    return msgpack.packb(records, default=encode_ext, use_bin_type=True, datetime=False)
+
+
+def decode_records(payload: bytes) -> List[Any]:
+    if payload[:1] == JSON_FRAME_PREFIX:
+        return json.loads(payload)
+    return msgpack.unpackb(payload, ext_hook=decode_ext, raw=False, strict_map_key=False)
+
+
+class WriteAheadLog:
+    """
+    Segmented, append-only log used by streaming sinks to buffer messages on disk until they're
+    written to the destination.
+
+    Each append writes one binary frame (length, checksum, MessagePack encoded records) to the
+    active segment, so dates, datetimes, decimals and bytes are read back with their type. Once
+    the active segment reaches `segment_max_bytes`, a new segment is started. `acknowledge`
+    checkpoints everything appended so far and deletes the acknowledged segments, so recovering
+    after a crash only replays the segments after the checkpoint. A frame that was only
+    partially written when the process crashed is detected with its checksum and skipped.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fsync_interval: float = 1,
+        fsync_policy: FsyncPolicy = FsyncPolicy.INTERVAL,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.fsync_policy = FsyncPolicy.parse(fsync_policy)
+        self.segment_max_bytes = segment_max_bytes
+
+        self.active_segment = None
+        self.active_segment_size = 0
+        self.last_fsync_at = time.monotonic()
+
+        os.makedirs(self.path, exist_ok=True)
+        self.checkpoint = self.__read_checkpoint()
+        segment_ids = self.__segment_ids()
+        self.next_segment_id = max(segment_ids + [self.checkpoint - 1]) + 1
+
+    def append(self, records: List[Any]) -> None:
+        if not records:
+            return
+
+        payload = encode_records(records)
+        if self.active_segment is None or \
+                self.active_segment_size >= self.segment_max_bytes:
+            self.__rotate()
+
+        self.active_segment.write(FRAME_HEADER.pack(len(payload), zlib.crc32(payload)))
+        self.active_segment.write(payload)
+        self.active_segment_size += FRAME_HEADER.size + len(payload)
+        self.active_segment.flush()
+
+        if self.fsync_policy == FsyncPolicy.ALWAYS or (
+            self.fsync_policy == FsyncPolicy.INTERVAL and
+            time.monotonic() - self.last_fsync_at >= self.fsync_interval
+        ):
+            self.__fsync()
+
+    def read(self) -> List[Any]:
+        """
+        Returns:
+            List[Any]: The records appended after the last checkpoint, in order.
+        """
+        records = []
+        for segment_id in self.__segment_ids():
+            if segment_id < self.checkpoint:
+                continue
+            records.extend(self.__read_segment(self.__segment_path(segment_id)))
+        return records
+
+    def acknowledge(self) -> None:
+        """
+        Checkpoint all the records appended so far and delete the segments they're in.
+        """
+        self.__close_active_segment()
+        self.checkpoint = self.next_segment_id
+        self.__write_checkpoint()
+
+        for segment_id in self.__segment_ids():
+            if segment_id < self.checkpoint:
+                try:
+                    os.remove(self.__segment_path(segment_id))
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        self.__close_active_segment()
+
+    def __rotate(self) -> None:
+        self.__close_active_segment()
+        self.active_segment = open(self.__segment_path(self.next_segment_id), 'ab')
+        self.active_segment_size = 0
+        self.next_segment_id += 1
+
+    def __close_active_segment(self) -> None:
+        if self.active_segment is None:
+            return
+        if self.fsync_policy != FsyncPolicy.NEVER:
+            self.__fsync()
+        self.active_segment.close()
+        self.active_segment = None
+
+    def __fsync(self) -> None:
+        os.fsync(self.active_segment.fileno())
+        self.last_fsync_at = time.monotonic()
+
+    def __read_segment(self, segment_path: str) -> List[Any]:
+        records = []
+        with open(segment_path, 'rb') as fp:
+            while True:
+                header = fp.read(FRAME_HEADER.size)
+                if len(header) < FRAME_HEADER.size:
+                    break
+                length, checksum = FRAME_HEADER.unpack(header)
+                payload = fp.read(length)
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    # Torn write at the end of the segment
+                    break
+                try:
+                    records.extend(decode_records(payload))
+                except ValueError:
+                    # Frame written in another format
+                    break
+        return records
+
+    def __read_checkpoint(self) -> int:
+        try:
+            with open(os.path.join(self.path, CHECKPOINT_FILE_NAME)) as fp:
+                return int(json.load(fp).get('segment_id', 0))
+        except (OSError, ValueError):
+            return 0
+
+    def __write_checkpoint(self) -> None:
+        checkpoint_path = os.path.join(self.path, CHECKPOINT_FILE_NAME)
+        tmp_path = f'{checkpoint_path}.tmp'
+        with open(tmp_path, 'w') as fp:
+            json.dump(dict(segment_id=self.checkpoint), fp)
+            fp.flush()
+            if self.fsync_policy != FsyncPolicy.NEVER:
+                os.fsync(fp.fileno())
+        os.replace(tmp_path, checkpoint_path)
+
+    def __segment_ids(self) -> List[int]:
+        segment_ids = []
+        for file_name in os.listdir(self.path):
+            match = SEGMENT_FILE_NAME_REGEX.match(file_name)
+            if match:
+                segment_ids.append(int(match.group(1)))
+        return sorted(segment_ids)
+
+    def __segment_path(self, segment_id: int) -> str:
+        return os.path.join(self.path, f'segment_{segment_id:020d}.wal')
+
+
+def read_legacy_buffer(buffer_path: Optional[str]) -> List[Any]:
+    """
+    Read the messages buffered in the JSON lines file used before the write-ahead log.
+    """
+    buffer = []
+    if not buffer_path or not os.path.isfile(buffer_path):
+        return buffer
+    with open(buffer_path) as fp:
+        for line in fp:
+            if line.strip():
+                buffer.append(json.loads(line))
+    return buffer
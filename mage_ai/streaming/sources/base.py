@@ -15,6 +15,7 @@ class SourceConsumeMethod(str, Enum):
 class BaseSource(ABC):
     config_class = None
     consume_method = SourceConsumeMethod.BATCH_READ
+    supports_commit_offsets_on_ack = False
 
     def __init__(self, config: Dict, **kwargs):
         if self.config_class is not None:
@@ -22,6 +23,10 @@ class BaseSource(ABC):
                 config.pop('connector_type')
             self.config = self.config_class.load(config=config)
         self.checkpoint_path = kwargs.get('checkpoint_path')
+        # When enabled, the handler returns a future per batch (or None once the batch is
+        # processed) and the source only commits the offsets of the batches whose future is
+        # resolved. Used when the sinks are written asynchronously.
+        self.commit_offsets_on_ack = kwargs.get('commit_offsets_on_ack', False)
         self.checkpoint = self.read_checkpoint()
         self.init_client()
         if not is_test():
@@ -1,11 +1,13 @@
 import importlib
 import json
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Dict, List
 
 from kafka import KafkaConsumer, TopicPartition
+from kafka.structs import OffsetAndMetadata
 
 from mage_ai.shared.config import BaseConfig
 from mage_ai.streaming.constants import DEFAULT_BATCH_SIZE, DEFAULT_TIMEOUT_MS
@@ -69,6 +71,7 @@ class KafkaConfig(BaseConfig):
 
 class KafkaSource(BaseSource):
     config_class = KafkaConfig
+    supports_commit_offsets_on_ack = True
 
     def init_client(self):
         if not self.config.topic and not self.config.topics:
@@ -85,7 +88,7 @@ class KafkaSource(BaseSource):
             api_version=self.config.api_version,
             auto_offset_reset=self.config.auto_offset_reset,
             max_partition_fetch_bytes=self.config.max_partition_fetch_bytes,
-            enable_auto_commit=True,
+            enable_auto_commit=not self.commit_offsets_on_ack,
         )
         if self.config.security_protocol == SecurityProtocol.SSL:
             consumer_kwargs['security_protocol'] = SecurityProtocol.SSL
@@ -116,6 +119,7 @@ class KafkaSource(BaseSource):
             topics = self.config.topics
 
         self.consumer = KafkaConsumer(*topics, **consumer_kwargs)
+        self.pending_commits = deque()
         self._print('Finish initializing consumer.')
 
         self.schema_class = None
@@ -206,8 +210,11 @@ class KafkaSource(BaseSource):
         self._print('Start consuming single messages.')
         for message in self.consumer:
             self.__print_message(message)
+            offsets = self.__build_offsets({
+                TopicPartition(message.topic, message.partition): [message],
+            })
             message = self._convert_message(message)
-            handler(message)
+            self.__track_offsets(handler(message), offsets)
 
     async def read_async(self, handler: Callable):
         if self.config.offset:
@@ -215,8 +222,11 @@ class KafkaSource(BaseSource):
         self._print('Start consuming messages asynchronously.')
         for message in self.consumer:
             self.__print_message(message)
+            offsets = self.__build_offsets({
+                TopicPartition(message.topic, message.partition): [message],
+            })
             message = self._convert_message(message)
-            await handler(message)
+            self.__track_offsets(await handler(message), offsets)
 
     def batch_read(self, handler: Callable):
         if self.config.offset:
@@ -253,12 +263,49 @@ class KafkaSource(BaseSource):
                     message = self._convert_message(message)
                     message_values.append(message)
             if len(message_values) > 0:
-                handler(message_values)
+                self.__track_offsets(handler(message_values), self.__build_offsets(msg_pack))
+            elif self.commit_offsets_on_ack:
+                self.__commit_acknowledged_offsets()
+
+    def destroy(self):
+        if self.commit_offsets_on_ack and getattr(self, 'consumer', None) is not None:
+            try:
+                self.__commit_acknowledged_offsets()
+            except Exception as err:
+                self._print(f'Failed to commit offsets: {err}')
 
     def test_connection(self):
         self.consumer._client.check_version(timeout=5)
         self._print('Test connection successfully.')
 
+    def __build_offsets(self, msg_pack: Dict) -> Dict:
+        if not self.commit_offsets_on_ack:
+            return None
+        # The committed offset is the offset of the next message to consume.
+        return {
+            tp: OffsetAndMetadata(messages[-1].offset + 1, None)
+            for tp, messages in msg_pack.items() if messages
+        }
+
+    def __track_offsets(self, ack, offsets: Dict) -> None:
+        if not self.commit_offsets_on_ack:
+            return
+        self.pending_commits.append((ack, offsets))
+        self.__commit_acknowledged_offsets()
+
+    def __commit_acknowledged_offsets(self) -> None:
+        # Commit the offsets of the batches that were processed, in order. A batch that failed
+        # blocks the commits of all the batches after it so that they are consumed again.
+        offsets = dict()
+        while self.pending_commits:
+            ack, batch_offsets = self.pending_commits[0]
+            if ack is not None and (not ack.done() or ack.exception() is not None):
+                break
+            offsets.update(batch_offsets)
+            self.pending_commits.popleft()
+        if offsets:
+            self.consumer.commit(offsets)
+
     def __deserialize_message(self, message):
         if self.config.serde_config is None:
             return self.__deserialize_json(message)
@@ -1,11 +1,12 @@
 from random import shuffle
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 from faker import Faker
 
 from mage_ai.data_cleaner.column_types.column_type_detector import infer_column_types
-from mage_ai.data_cleaner.statistics.calculator import StatisticsCalculator
+from mage_ai.data_cleaner.statistics.calculator import StatisticsCalculator, get_process_pool
 from mage_ai.tests.base_test import TestCase
 
 
@@ -494,3 +495,103 @@ class StatisticsCalculatorTest(TestCase):
 
         self.assertEqual(expected_box_plot_no_users, data['number_of_users/box_plot_data'])
         self.assertEqual(expected_box_plot_views, data['views/box_plot_data'])
+
+    def test_calculate_statistics_numeric_columns_with_different_dtypes(self):
+        df = pd.DataFrame(
+            dict(
+                integers=[1, 2, 3, 4, 100],
+                floats=[1.5, np.nan, np.nan, 2.5, 3.5],
+                constant=[7.0, 7.0, 7.0, 7.0, 7.0],
+                empty=[np.nan, np.nan, np.nan, np.nan, np.nan],
+            ),
+        )
+        column_types = dict(
+            integers='number',
+            floats='number_with_decimals',
+            constant='number',
+            empty='number',
+        )
+        calculator = StatisticsCalculator(column_types=column_types)
+        data = calculator.calculate_statistics_overview(df, is_clean=True)
+
+        for col in ['integers', 'floats']:
+            series = df[col].dropna()
+            self.assertEqual(data[f'{col}/average'], series.mean())
+            self.assertEqual(data[f'{col}/max'], series.max())
+            self.assertEqual(data[f'{col}/median'], series.median())
+            self.assertEqual(data[f'{col}/min'], series.min())
+            self.assertEqual(data[f'{col}/sum'], series.sum())
+            self.assertAlmostEqual(data[f'{col}/skew'], series.skew())
+            self.assertAlmostEqual(data[f'{col}/std'], series.std())
+        self.assertEqual(data['integers/box_plot_data'], {
+            'outliers': [100],
+            'min': 1,
+            'first_quartile': 2.0,
+            'median': 3.0,
+            'third_quartile': 4.0,
+            'max': 4,
+        })
+        self.assertEqual(data['floats/max_null_seq'], 2)
+        self.assertEqual(data['constant/outlier_count'], 0)
+        self.assertEqual(data['constant/skew'], 0)
+        self.assertEqual(data['empty/count'], 0)
+        self.assertNotIn('empty/average', data)
+
+    def test_calculate_statistics_approximate(self):
+        df = pd.DataFrame(
+            dict(
+                number=np.arange(10000, dtype=np.float64),
+                category=[f'category_{i % 500}' for i in range(10000)],
+            ),
+        )
+        calculator = StatisticsCalculator(
+            column_types=dict(number='number', category='category'),
+            approximate_threshold=1000,
+        )
+        data = calculator.calculate_statistics_overview(df, is_clean=True)
+
+        self.assertTrue(data['number/is_approximate'])
+        self.assertEqual(data['number/sum'], df['number'].sum())
+        self.assertAlmostEqual(data['number/median'], 4999.5, delta=50)
+        self.assertAlmostEqual(data['number/box_plot_data']['first_quartile'], 2499.75, delta=50)
+        self.assertAlmostEqual(data['number/count_distinct'], 10000, delta=300)
+        self.assertAlmostEqual(data['category/count_distinct'], 500, delta=15)
+        self.assertEqual(data['category/null_value_count'], 0)
+        self.assertEqual(len(data['category/value_counts']), 20)
+
+    def test_calculate_statistics_parallel(self):
+        df = pd.DataFrame(
+            dict(
+                email=['abc@xyz.com', 'test', 'abc@test.net', None] * 25,
+                text=['cute animal #1', 'intro to regression', 'daily news #1', ''] * 25,
+            ),
+        )
+        column_types = dict(email='email', text='text')
+        data_serial = StatisticsCalculator(
+            column_types=column_types,
+        ).calculate_statistics_overview(df, is_clean=True)
+        with patch(
+            'mage_ai.data_cleaner.statistics.calculator.PARALLEL_MIN_CELL_COUNT',
+            0,
+        ):
+            data_parallel = StatisticsCalculator(
+                column_types=column_types,
+                max_workers=2,
+            ).calculate_statistics_overview(df, is_clean=True)
+
+        self.assertEqual(data_parallel['email/domain_distribution'], {
+            'xyz.com': 25,
+            'test.net': 25,
+        })
+        self.assertEqual(data_parallel['text/word_distribution'], data_serial[
+            'text/word_distribution'
+        ])
+        self.assertEqual(data_parallel['text/avg_word_count'], data_serial['text/avg_word_count'])
+        self.assertEqual(
+            data_parallel['email/invalid_value_count'],
+            data_serial['email/invalid_value_count'],
+        )
+
+        process_pool = get_process_pool(2)
+        self.assertIs(get_process_pool(2), process_pool)
+        self.assertEqual(process_pool._mp_context.get_start_method(), 'spawn')
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from mage_ai.data_cleaner.statistics.sketches import HyperLogLog, TDigest, bit_length
+from mage_ai.tests.base_test import TestCase
+
+
+class SketchesTest(TestCase):
+    def test_bit_length(self):
+        values = np.array([0, 1, 2, 3, 255, 256, 2 ** 40, 2 ** 64 - 1], dtype=np.uint64)
+        self.assertEqual(
+            bit_length(values).tolist(),
+            [int(v).bit_length() for v in values],
+        )
+
+    def test_hyperloglog(self):
+        series = pd.Series(np.arange(100000) % 20000)
+        self.assertAlmostEqual(HyperLogLog().update(series).count(), 20000, delta=400)
+        self.assertEqual(HyperLogLog().update(pd.Series(['a', 'b', 'c', 'a'])).count(), 3)
+        self.assertEqual(HyperLogLog().count(), 0)
+
+    def test_hyperloglog_merge(self):
+        sketch1 = HyperLogLog().update(pd.Series(np.arange(0, 6000)))
+        sketch2 = HyperLogLog().update(pd.Series(np.arange(4000, 10000)))
+        self.assertAlmostEqual(sketch1.merge(sketch2).count(), 10000, delta=200)
+
+    def test_tdigest(self):
+        values = np.random.default_rng(0).normal(size=100000)
+        digest = TDigest().update(values)
+        self.assertLessEqual(len(digest.means), digest.compression)
+        self.assertEqual(digest.count, 100000)
+        for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+            self.assertAlmostEqual(digest.quantile(q), np.quantile(values, q), delta=0.02)
+        self.assertEqual(digest.quantile(0), values.min())
+        self.assertEqual(digest.quantile(1), values.max())
+
+    def test_tdigest_merge(self):
+        values = np.random.default_rng(0).exponential(size=20000)
+        digest = TDigest().update(values[:10000]).merge(TDigest().update(values[10000:]))
+        self.assertAlmostEqual(digest.quantile(0.5), np.median(values), delta=0.02)
+        self.assertTrue(np.isnan(TDigest().quantile(0.5)))
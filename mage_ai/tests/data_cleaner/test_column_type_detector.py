@@ -1,13 +1,19 @@
 from faker import Faker
 from mage_ai.data_cleaner.column_types.column_type_detector import (
+    COLUMN_TYPES_CACHE,
     MAXIMUM_WORD_LENGTH_FOR_CATEGORY_FEATURES,
+    REGEX_EMAIL,
+    REGEX_NUMBER,
+    StringMatcher,
     find_syntax_errors,
+    dataframe_fingerprint,
     infer_column_types,
-    REGEX_NUMBER,
+    strip_values,
 )
 from mage_ai.data_cleaner.column_types.constants import ColumnType
 from mage_ai.shared.hash import merge_dict
 from mage_ai.tests.base_test import TestCase
+from unittest.mock import patch
 import pandas as pd
 import numpy as np
 
@@ -560,3 +566,54 @@ class ColumnTypeDetectorTests(TestCase):
             not_a_list=ColumnType.TEXT,
         )
         self.assertEqual(ctypes, expected_ctypes)
+
+    def test_strip_values(self):
+        self.assertEqual(
+            strip_values(pd.Series([' "a" ', None, "'b'", '', ' ', np.nan])).tolist(),
+            ['a', 'b'],
+        )
+        self.assertEqual(
+            strip_values(pd.Series([1, ' a ', None, '""'])).tolist(),
+            [1, 'a'],
+        )
+
+    def test_string_matcher(self):
+        values = [self.fake.email() for _ in range(900)] + ['not an email'] * 100
+        matcher = StringMatcher(pd.Series(values))
+        self.assertEqual(matcher.count_matches(REGEX_EMAIL), 900)
+        self.assertFalse(matcher.all_match(REGEX_EMAIL))
+        self.assertTrue(matcher.match_rate_at_least(REGEX_EMAIL, 0.9))
+        self.assertFalse(matcher.match_rate_at_least(REGEX_EMAIL, 0.91))
+        self.assertEqual(StringMatcher(pd.Series(['a b', 'a b c', 'a'])).max_word_count(), 3)
+
+    def test_string_matcher_stops_early(self):
+        matcher = StringMatcher(pd.Series(['1.5'] * 100000))
+        with patch.object(
+            StringMatcher,
+            '_StringMatcher__count_matches',
+            side_effect=lambda pattern, start, end: end - start,
+        ) as count_matches:
+            self.assertTrue(matcher.match_rate_at_least(REGEX_NUMBER, 0.8))
+        count_matches.assert_called_once_with(REGEX_NUMBER, 0, 1000)
+
+    def test_infer_column_types_with_cache_key(self):
+        COLUMN_TYPES_CACHE.clear()
+        df = pd.DataFrame(dict(email=['abc@xyz.com', 'def@xyz.com', 'ghi@xyz.com'], id=[1, 2, 3]))
+        cache_key = f'block:output_0:{dataframe_fingerprint(df)}'
+
+        ctypes = infer_column_types(df, cache_key=cache_key)
+        self.assertEqual(ctypes, dict(email=ColumnType.EMAIL, id=ColumnType.NUMBER))
+        with patch(
+            'mage_ai.data_cleaner.column_types.column_type_detector.infer_column_type',
+        ) as mock_infer_column_type:
+            self.assertEqual(infer_column_types(df, cache_key=cache_key), ctypes)
+            mock_infer_column_type.assert_not_called()
+
+        fingerprint = dataframe_fingerprint(df)
+        self.assertEqual(dataframe_fingerprint(df.copy()), fingerprint)
+        df2 = df.copy()
+        df2.iloc[0, 0] = 'changed@xyz.com'
+        self.assertNotEqual(dataframe_fingerprint(df2), fingerprint)
+        self.assertNotEqual(dataframe_fingerprint(df.astype(dict(id=float))), fingerprint)
+        self.assertNotEqual(dataframe_fingerprint(df.iloc[:2]), fingerprint)
+        self.assertIsNotNone(dataframe_fingerprint(pd.DataFrame(dict(col=[dict(id=1), [1, 2]]))))
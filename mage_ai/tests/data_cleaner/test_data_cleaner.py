@@ -0,0 +1,26 @@
+from unittest.mock import patch
+
+import pandas as pd
+
+from mage_ai.data_cleaner.data_cleaner import DataCleaner
+from mage_ai.data_cleaner.statistics.calculator import StatisticsCalculator
+from mage_ai.tests.base_test import TestCase
+
+
+class DataCleanerTests(TestCase):
+    def test_approximate_threshold_from_settings(self):
+        df = pd.DataFrame(dict(id=list(range(100)), amount=[1.5, 2.5] * 50))
+
+        with patch('mage_ai.data_cleaner.data_cleaner.DATA_CLEANER_APPROXIMATE_THRESHOLD', 10):
+            cleaner = DataCleaner()
+            self.assertIsNone(DataCleaner(approximate_threshold=0).approximate_threshold)
+
+        with patch(
+            'mage_ai.data_cleaner.data_cleaner.StatisticsCalculator',
+            wraps=StatisticsCalculator,
+        ) as mock_calculator:
+            result = cleaner.clean(df, transform=False)
+
+        self.assertEqual(mock_calculator.call_args.kwargs['approximate_threshold'], 10)
+        self.assertEqual(result['pipeline'].approximate_threshold, 10)
+        self.assertEqual(result['statistics']['count'], 100)
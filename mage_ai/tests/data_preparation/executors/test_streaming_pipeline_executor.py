@@ -0,0 +1,133 @@
+from unittest.mock import MagicMock, patch
+
+from mage_ai.data_preparation.executors.streaming_pipeline_executor import (
+    StreamingPipelineExecutor,
+)
+from mage_ai.data_preparation.models.block import Block
+from mage_ai.data_preparation.models.constants import PipelineType
+from mage_ai.data_preparation.models.pipeline import Pipeline
+from mage_ai.data_preparation.models.pipelines.models import (
+    PipelineSettings,
+    PipelineSettingsStreaming,
+)
+from mage_ai.streaming.sources.base import SourceConsumeMethod
+from mage_ai.tests.base_test import DBTestCase
+
+
+class StreamingPipelineExecutorTest(DBTestCase):
+    def setUp(self):
+        super().setUp()
+        self.pipeline = Pipeline.create(
+            self.faker.unique.name(),
+            pipeline_type=PipelineType.STREAMING,
+            repo_path=self.repo_path,
+        )
+        source = Block.create(
+            self.faker.unique.name(), 'data_loader', self.repo_path, language='yaml',
+        )
+        transformer = Block.create(
+            self.faker.unique.name(), 'transformer', self.repo_path, language='python',
+        )
+        with open(transformer.file_path, 'w') as file:
+            file.write('''
+@transformer
+def transform(messages, *args, **kwargs):
+    return messages
+''')
+        self.sink1 = Block.create(
+            self.faker.unique.name(), 'data_exporter', self.repo_path, language='yaml',
+        )
+        self.sink2 = Block.create(
+            self.faker.unique.name(), 'data_exporter', self.repo_path, language='yaml',
+        )
+        for block in [source, self.sink1, self.sink2]:
+            with open(block.file_path, 'w') as file:
+                file.write('connector_type: dummy\n')
+
+        self.pipeline.add_block(source)
+        self.pipeline.add_block(transformer, upstream_block_uuids=[source.uuid])
+        self.pipeline.add_block(self.sink1, upstream_block_uuids=[source.uuid])
+        self.pipeline.add_block(self.sink2, upstream_block_uuids=[transformer.uuid])
+        self.transformer = self.pipeline.get_block(transformer.uuid)
+
+        self.messages = [dict(id=1, nested=dict(value='a')), dict(id=2, nested=dict(value='b'))]
+        self.sinks = dict()
+
+    def __execute(self, copy_on_write: bool = False, pipelined_sink_writes: bool = False):
+        self.pipeline.settings = PipelineSettings(
+            streaming=PipelineSettingsStreaming(
+                copy_on_write=copy_on_write,
+                pipelined_sink_writes=pipelined_sink_writes,
+            ),
+        )
+
+        self.acks = []
+        source = MagicMock()
+        source.consume_method = SourceConsumeMethod.BATCH_READ
+        source.supports_commit_offsets_on_ack = True
+        source.batch_read.side_effect = lambda handler: self.acks.append(handler(self.messages))
+
+        def __get_sink(*args, **kwargs):
+            sink = MagicMock()
+            sink.mutates_messages = False
+            self.sinks[len(self.sinks)] = sink
+            return sink
+
+        executor = StreamingPipelineExecutor(self.pipeline)
+        with patch(
+            'mage_ai.streaming.sources.source_factory.SourceFactory.get_source',
+            return_value=source,
+        ) as mock_get_source:
+            self.mock_get_source = mock_get_source
+            with patch(
+                'mage_ai.streaming.sinks.sink_factory.SinkFactory.get_sink',
+                side_effect=__get_sink,
+            ):
+                executor.execute()
+
+        return executor
+
+    def __written_messages(self):
+        return [sink.batch_write.call_args[0][0] for sink in self.sinks.values()]
+
+    def test_execute_deep_copies_block_inputs(self):
+        executor = self.__execute()
+
+        for messages in self.__written_messages():
+            self.assertEqual(messages, self.messages)
+            self.assertIsNot(messages, self.messages)
+            self.assertIsNot(messages[0]['nested'], self.messages[0]['nested'])
+
+        self.assertEqual(
+            set(executor.copy_metrics.keys()),
+            set([self.transformer.uuid, self.sink1.uuid, self.sink2.uuid]),
+        )
+        self.assertEqual(executor.copy_metrics[self.sink1.uuid]['copied_messages'], 2)
+
+    def test_execute_with_copy_on_write_shares_input_of_readonly_blocks(self):
+        self.transformer.configuration = dict(readonly_input=True)
+        executor = self.__execute(copy_on_write=True)
+
+        for messages in self.__written_messages():
+            self.assertIs(messages, self.messages)
+        self.assertEqual(executor.copy_metrics, dict())
+
+    def test_execute_with_copy_on_write_copies_input_by_default(self):
+        executor = self.__execute(copy_on_write=True)
+
+        written_messages = self.__written_messages()
+        self.assertEqual(len(written_messages), 2)
+        self.assertEqual(
+            len([messages for messages in written_messages if messages is self.messages]),
+            1,
+        )
+        self.assertEqual(list(executor.copy_metrics.keys()), [self.transformer.uuid])
+
+    def test_execute_with_pipelined_sink_writes(self):
+        self.__execute(pipelined_sink_writes=True)
+
+        self.assertTrue(self.mock_get_source.call_args[1]['commit_offsets_on_ack'])
+        self.assertEqual(len(self.acks), 1)
+        self.assertTrue(self.acks[0].result(timeout=5))
+        for messages in self.__written_messages():
+            self.assertEqual(messages, self.messages)
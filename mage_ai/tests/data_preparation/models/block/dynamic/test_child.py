@@ -0,0 +1,139 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from mage_ai.data_preparation.models.block.dynamic.child import (
+    DynamicChildController,
+    create_next_dynamic_child_block_runs,
+)
+from mage_ai.data_preparation.models.block.dynamic.utils import (
+    count_combinations,
+    create_combinations,
+    iter_combinations_for_dynamic_child,
+)
+from mage_ai.orchestration.db.models.schedules import BlockRun, PipelineRun
+from mage_ai.tests.api.operations.test_base import BaseApiTestCase
+from mage_ai.tests.factory import create_pipeline_with_blocks
+
+
+class DynamicChildControllerTest(BaseApiTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.pipeline, blocks = create_pipeline_with_blocks(
+            self.faker.unique.name(),
+            self.repo_path,
+            return_blocks=True,
+        )
+        self.block1 = blocks[0]
+        self.block1.configuration = dict(dynamic=True)
+        self.pipeline.add_block(self.block1)
+        self.block2 = blocks[1]
+
+        self.pipeline_run = PipelineRun.create(
+            execution_date=datetime.utcnow(),
+            pipeline_schedule_id=0,
+            pipeline_uuid=self.pipeline.uuid,
+        )
+        BlockRun.create(
+            block_uuid=self.block1.uuid,
+            pipeline_run_id=self.pipeline_run.id,
+            status=BlockRun.BlockRunStatus.COMPLETED,
+        )
+        self.block_run = BlockRun.create(
+            block_uuid=self.block2.uuid,
+            pipeline_run_id=self.pipeline_run.id,
+        )
+
+    def tearDown(self):
+        BlockRun.query.delete()
+        PipelineRun.query.delete()
+        super().tearDown()
+
+    def test_iter_combinations_for_dynamic_child(self):
+        dynamic_counts = [3, 1, 2]
+        self.assertEqual(
+            count_combinations(dynamic_counts),
+            len(create_combinations([list(range(count)) for count in dynamic_counts])),
+        )
+        self.assertEqual(count_combinations([]), 0)
+
+        settings = list(iter_combinations_for_dynamic_child(
+            self.block2,
+            dynamic_counts=[5],
+            start=3,
+        ))
+        self.assertEqual(settings, [
+            dict(dynamic_block_index=3, dynamic_block_indexes={self.block1.uuid: 3}),
+            dict(dynamic_block_index=4, dynamic_block_indexes={self.block1.uuid: 4}),
+        ])
+
+    @patch('mage_ai.data_preparation.models.block.dynamic.child.DYNAMIC_CHILD_BLOCK_RUN_WINDOW', 2)
+    @patch('mage_ai.data_preparation.models.block.dynamic.utils.get_dynamic_children_count')
+    @patch('mage_ai.data_preparation.models.block.dynamic.child.get_outputs_for_dynamic_block')
+    def test_execute_sync_creates_block_runs_in_windows(
+        self,
+        mock_get_outputs_for_dynamic_block,
+        mock_get_dynamic_children_count,
+    ):
+        mock_get_outputs_for_dynamic_block.return_value = (list(range(5)), None)
+        mock_get_dynamic_children_count.return_value = (5, True)
+
+        def __block_uuids():
+            return sorted(
+                br.block_uuid for br in self.pipeline_run.block_runs
+                if br.block_uuid.startswith(f'{self.block2.uuid}:')
+            )
+
+        controller = DynamicChildController(self.block2, block_run_id=self.block_run.id)
+        block_runs = controller.execute_sync(
+            execution_partition=self.pipeline_run.execution_partition,
+        )
+
+        self.assertEqual(
+            [br.block_uuid for br in block_runs],
+            [f'{self.block2.uuid}:0', f'{self.block2.uuid}:1'],
+        )
+        self.assertEqual(block_runs[1].metrics['dynamic_block_index'], 1)
+        self.assertEqual(self.block_run.dynamic_children_pending, 3)
+        self.assertEqual(
+            self.block_run.metrics['dynamic_children'],
+            dict(created=2, dynamic_counts=[5], total=5),
+        )
+
+        self.block_run.update(status=BlockRun.BlockRunStatus.COMPLETED)
+
+        # The window is full.
+        self.assertEqual(create_next_dynamic_child_block_runs(
+            self.pipeline,
+            self.pipeline_run.block_runs,
+        ), [])
+
+        block_runs[0].update(status=BlockRun.BlockRunStatus.COMPLETED)
+        block_runs = create_next_dynamic_child_block_runs(
+            self.pipeline,
+            self.pipeline_run.block_runs,
+        )
+        self.assertEqual([br.block_uuid for br in block_runs], [f'{self.block2.uuid}:2'])
+        self.assertEqual(__block_uuids(), [f'{self.block2.uuid}:{i}' for i in range(3)])
+
+        for br in self.pipeline_run.block_runs:
+            br.update(status=BlockRun.BlockRunStatus.COMPLETED)
+        self.assertFalse(self.pipeline_run.all_blocks_completed())
+
+        block_runs = create_next_dynamic_child_block_runs(
+            self.pipeline,
+            self.pipeline_run.block_runs,
+        )
+        self.assertEqual(
+            [br.block_uuid for br in block_runs],
+            [f'{self.block2.uuid}:3', f'{self.block2.uuid}:4'],
+        )
+        self.assertEqual(self.block_run.dynamic_children_pending, 0)
+
+        for br in block_runs:
+            br.update(status=BlockRun.BlockRunStatus.COMPLETED)
+        self.assertTrue(self.pipeline_run.all_blocks_completed())
+        self.assertEqual(create_next_dynamic_child_block_runs(
+            self.pipeline,
+            self.pipeline_run.block_runs,
+        ), [])
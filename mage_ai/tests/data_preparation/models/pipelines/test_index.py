@@ -0,0 +1,178 @@
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import patch
+
+import yaml
+
+from mage_ai.data_preparation.models.block import Block
+from mage_ai.data_preparation.models.pipeline import Pipeline
+from mage_ai.data_preparation.models.pipelines.index import (
+    PipelineIndex,
+    get_pipeline_index,
+)
+from mage_ai.server.file_observer import PipelineIndexEventHandler
+from mage_ai.tests.base_test import DBTestCase
+
+
+class PipelineIndexTest(DBTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'cache', 'pipeline_index.sqlite3')
+        self.index_repo_path = os.path.join(self.tmp_dir, 'repo')
+        os.makedirs(os.path.join(self.index_repo_path, 'pipelines'))
+
+        self.__write_pipeline('pipeline_a', blocks=['load', 'transform'], triggers=['daily'])
+        self.__write_pipeline('pipeline_b', blocks=['load'], widgets=['chart'])
+        os.makedirs(os.path.join(self.index_repo_path, 'pipelines', 'not_a_pipeline'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        super().tearDown()
+
+    def test_sync(self):
+        index = self.__build_index()
+        with patch('yaml.full_load', wraps=yaml.full_load) as mock_load:
+            self.assertEqual(sorted(index.pipeline_uuids()), ['pipeline_a', 'pipeline_b'])
+            self.assertEqual(mock_load.call_count, 3)
+
+            entry = index.get('pipeline_a')
+            self.assertEqual(entry.name, 'Pipeline A')
+            self.assertEqual(entry.type, 'python')
+            self.assertEqual(entry.block_uuids, ['load', 'transform'])
+            self.assertEqual(entry.trigger_names, ['daily'])
+            self.assertEqual(
+                sorted(index.pipeline_uuids_by_block('load')),
+                ['pipeline_a', 'pipeline_b'],
+            )
+            self.assertEqual(index.pipeline_uuids_by_block('chart', widget=True), ['pipeline_b'])
+
+            # Unchanged files aren't read again.
+            index.sync()
+            self.assertEqual(mock_load.call_count, 3)
+
+            # Files rewritten with the same content aren't parsed again.
+            self.__write_pipeline('pipeline_b', blocks=['load'], widgets=['chart'], mtime=1)
+            index.sync()
+            self.assertEqual(mock_load.call_count, 3)
+
+            self.__write_pipeline('pipeline_b', blocks=['load', 'export'])
+            self.__write_pipeline('pipeline_c')
+            shutil.rmtree(os.path.join(self.index_repo_path, 'pipelines', 'pipeline_a'))
+            self.assertEqual(sorted(index.pipeline_uuids()), ['pipeline_b', 'pipeline_c'])
+            self.assertEqual(index.pipeline_uuids_by_block('export'), ['pipeline_b'])
+            self.assertEqual(mock_load.call_count, 5)
+
+    def test_persisted_entries(self):
+        self.__build_index().sync()
+
+        index = self.__build_index()
+        with patch('yaml.full_load', wraps=yaml.full_load) as mock_load:
+            self.assertEqual(sorted(index.pipeline_uuids()), ['pipeline_a', 'pipeline_b'])
+            self.assertEqual(index.get('pipeline_a').trigger_names, ['daily'])
+            mock_load.assert_not_called()
+
+        index.clear()
+        self.assertEqual(self.__build_index().entries, None)
+
+    def test_watched_index_updated_by_file_events(self):
+        index = self.__build_index()
+        handler = PipelineIndexEventHandler(index)
+        handler.start()
+        self.assertTrue(index.watched)
+
+        # The files of the pipelines aren't checked while the pipelines folder didn't change.
+        self.__write_pipeline('pipeline_a', blocks=['load', 'export'], triggers=['daily'])
+        self.assertEqual(index.get('pipeline_a').block_uuids, ['load', 'transform'])
+
+        metadata_path = os.path.join(
+            self.index_repo_path,
+            'pipelines',
+            'pipeline_a',
+            'metadata.yaml',
+        )
+        self.assertTrue(index.refresh_path(metadata_path))
+        self.assertEqual(index.get('pipeline_a').block_uuids, ['load', 'export'])
+        self.assertFalse(index.refresh_path(os.path.join(self.tmp_dir, 'metadata.yaml')))
+        self.assertFalse(index.refresh_path(
+            os.path.join(self.index_repo_path, 'pipelines', 'pipeline_a', '__init__.py'),
+        ))
+
+        # Adding a pipeline changes the pipelines folder.
+        self.__write_pipeline('pipeline_c')
+        self.assertEqual(
+            sorted(index.pipeline_uuids()),
+            ['pipeline_a', 'pipeline_b', 'pipeline_c'],
+        )
+
+    def test_pipeline_methods_use_index(self):
+        pipeline = Pipeline.create(
+            f'test pipeline index {time.time_ns()}',
+            repo_path=self.repo_path,
+        )
+        block = Block.create(
+            f'{pipeline.uuid}_block',
+            'data_loader',
+            self.repo_path,
+            pipeline=pipeline,
+        )
+
+        with patch('mage_ai.data_preparation.models.pipeline.PIPELINE_INDEX', True):
+            index = get_pipeline_index(self.repo_path)
+            index._db_path = self.db_path
+            index.sync(force=True)
+            index.watched = True
+            self.addCleanup(setattr, index, 'watched', False)
+
+            self.assertIn(pipeline.uuid, Pipeline.get_all_pipelines(self.repo_path))
+            self.assertEqual(
+                [p.uuid for p in Pipeline.get_pipelines_by_block(block, self.repo_path)],
+                [pipeline.uuid],
+            )
+
+            # Saving a pipeline updates the index without waiting for file events.
+            block2 = Block.create(
+                f'{pipeline.uuid}_block2',
+                'data_loader',
+                self.repo_path,
+                pipeline=pipeline,
+            )
+            self.assertEqual(
+                [p.uuid for p in Pipeline.get_pipelines_by_block(block2, self.repo_path)],
+                [pipeline.uuid],
+            )
+
+            pipeline.delete()
+            self.assertNotIn(pipeline.uuid, Pipeline.get_all_pipelines(self.repo_path))
+
+    def __build_index(self) -> PipelineIndex:
+        index = PipelineIndex(self.index_repo_path)
+        index._db_path = self.db_path
+        return index
+
+    def __write_pipeline(
+        self,
+        uuid: str,
+        blocks=None,
+        triggers=None,
+        widgets=None,
+        mtime: int = None,
+    ) -> None:
+        pipeline_path = os.path.join(self.index_repo_path, 'pipelines', uuid)
+        os.makedirs(pipeline_path, exist_ok=True)
+        metadata_path = os.path.join(pipeline_path, 'metadata.yaml')
+        with open(metadata_path, 'w') as f:
+            yaml.dump(dict(
+                blocks=[dict(uuid=b) for b in blocks or []],
+                name=uuid.replace('_', ' ').title(),
+                type='python',
+                uuid=uuid,
+                widgets=[dict(uuid=w) for w in widgets or []],
+            ), f)
+        if mtime is not None:
+            os.utime(metadata_path, ns=(mtime, mtime))
+        if triggers:
+            with open(os.path.join(pipeline_path, 'triggers.yaml'), 'w') as f:
+                yaml.dump(dict(triggers=[dict(name=t) for t in triggers]), f)
@@ -127,7 +127,7 @@ class PipelineTest(AsyncDBTestCase):
             ],
             callbacks=[],
             conditionals=[],
-            settings=dict(triggers=None),
+            settings=dict(streaming=None, triggers=None),
             created_at='2023-08-01 08:08:24+00:00',
             widgets=[
                 dict(
@@ -275,7 +275,7 @@ class PipelineTest(AsyncDBTestCase):
             ],
             callbacks=[],
             conditionals=[],
-            settings=dict(triggers=None),
+            settings=dict(streaming=None, triggers=None),
             created_at='2023-08-01 08:08:24+00:00',
             widgets=[],
         ))
@@ -385,7 +385,7 @@ class PipelineTest(AsyncDBTestCase):
             ],
             callbacks=[],
             conditionals=[],
-            settings=dict(triggers=None),
+            settings=dict(streaming=None, triggers=None),
             created_at='2023-08-01 08:08:24+00:00',
             widgets=[],
         ))
@@ -552,7 +552,7 @@ class PipelineTest(AsyncDBTestCase):
             ],
             callbacks=[],
             conditionals=[],
-            settings=dict(triggers=None),
+            settings=dict(streaming=None, triggers=None),
             created_at='2023-08-01 08:08:24+00:00',
             widgets=[],
         ))
@@ -721,7 +721,7 @@ class PipelineTest(AsyncDBTestCase):
                     ],
                     callbacks=[],
                     conditionals=[],
-                    settings=dict(triggers=None),
+                    settings=dict(streaming=None, triggers=None),
                     widgets=[],
                 ),
             )
@@ -1,4 +1,5 @@
 import os
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -10,6 +11,9 @@ from mage_ai.data_preparation.models.block import Block
 from mage_ai.data_preparation.models.pipeline import Pipeline
 from mage_ai.data_preparation.models.variable import Variable
 from mage_ai.data_preparation.models.variables.constants import VariableType
+from mage_ai.data_preparation.models.variables.memory_cache import (
+    variable_memory_cache,
+)
 from mage_ai.tests.base_test import DBTestCase
 
 
@@ -89,6 +93,171 @@ class VariableTest(DBTestCase):
             variable2.read_data(sample=True, sample_count=1), df2.iloc[:1]
         )
 
+    def test_read_dataframe_sample_without_sample_file(self):
+        pipeline = self.__create_pipeline("test pipeline sample")
+        variable = Variable(
+            "var1",
+            pipeline.dir_path,
+            "block1",
+            variable_type=VariableType.DATAFRAME,
+        )
+        df = pd.DataFrame(
+            dict(
+                col1=list(range(1000)),
+                col2=[dict(id=i) for i in range(1000)],
+                col3=[[i, i + 1] for i in range(1000)],
+                col4=[i % 2 == 0 for i in range(1000)],
+            ),
+        )
+        variable.write_data(df)
+        os.remove(os.path.join(variable.variable_path, "sample_data.parquet"))
+
+        with patch.object(
+            variable.storage,
+            "read_parquet",
+            wraps=variable.storage.read_parquet,
+        ) as mock_read_parquet:
+            df_sample = variable.read_data(sample=True, sample_count=3)
+            mock_read_parquet.assert_not_called()
+
+        assert_frame_equal(df_sample, df.iloc[:3])
+        self.assertEqual(df_sample["col2"].tolist(), [dict(id=0), dict(id=1), dict(id=2)])
+        self.assertEqual(df_sample["col3"].tolist(), [[0, 1], [1, 2], [2, 3]])
+        assert_frame_equal(variable.read_data(), df)
+
+    @patch("mage_ai.data_preparation.models.variable.VARIABLE_ARROW_HANDOFF", True)
+    def test_write_and_read_dataframe_arrow_handoff(self):
+        pipeline = self.__create_pipeline("test pipeline arrow")
+        variable1 = Variable(
+            "var1",
+            pipeline.dir_path,
+            "block1",
+            variable_type=VariableType.DATAFRAME,
+        )
+        variable2 = Variable("var2", pipeline.dir_path, "block2")
+        df = pd.DataFrame(
+            dict(
+                col1=[1, 2, 3],
+                col2=["a", "b", None],
+                col3=[dict(id=1), dict(id=2), dict(id=3)],
+            ),
+            index=[3, 4, 5],
+        )
+        df_polars = pl.DataFrame(dict(col1=[1, 2, 3], col2=["a", "b", None]))
+        variable1.write_data(df)
+        variable2.write_data(df_polars)
+
+        # The Arrow files replace the parquet files.
+        for variable in [variable1, variable2]:
+            self.assertTrue(os.path.exists(os.path.join(variable.variable_path, "data.arrow")))
+            self.assertFalse(os.path.exists(os.path.join(variable.variable_path, "data.parquet")))
+
+        with patch.object(
+            variable1.storage,
+            "read_parquet",
+            wraps=variable1.storage.read_parquet,
+        ) as mock_read_parquet:
+            df_read = variable1.read_data()
+            mock_read_parquet.assert_not_called()
+        assert_frame_equal(df_read, df)
+
+        # The dataframe read from the mapped file can be modified.
+        df_read.loc[3, "col1"] = 10
+        self.assertEqual(df_read.loc[3, "col1"], 10)
+
+        with patch.object(
+            variable2.storage,
+            "read_polars_parquet",
+            wraps=variable2.storage.read_polars_parquet,
+        ) as mock_read_polars_parquet:
+            assert_polars_frame_equal(variable2.read_data(), df_polars)
+            mock_read_polars_parquet.assert_not_called()
+
+        with patch(
+            "mage_ai.data_preparation.models.variable.VARIABLE_ARROW_HANDOFF",
+            False,
+        ):
+            variable1.write_data(df.iloc[:1])
+        self.assertFalse(os.path.exists(os.path.join(variable1.variable_path, "data.arrow")))
+        self.assertTrue(os.path.exists(os.path.join(variable1.variable_path, "data.parquet")))
+        assert_frame_equal(variable1.read_data(), df.iloc[:1])
+
+    def test_read_dataframe_from_memory_cache(self):
+        pipeline = self.__create_pipeline("test pipeline memory cache")
+        variable = Variable(
+            "var1",
+            pipeline.dir_path,
+            "block1",
+            variable_type=VariableType.DATAFRAME,
+        )
+        df = pd.DataFrame(dict(col1=[1, 2, 3], col2=["a", "b", "c"]))
+
+        with patch.object(variable_memory_cache, "max_bytes", 1024 * 1024):
+            try:
+                variable.write_data(df)
+
+                with patch.object(
+                    variable.storage,
+                    "read_parquet",
+                    wraps=variable.storage.read_parquet,
+                ) as mock_read_parquet:
+                    df_read = variable.read_data()
+                    mock_read_parquet.assert_not_called()
+                assert_frame_equal(df_read, df)
+
+                # The cached dataframe isn't modified by the block reading it.
+                df_read.loc[0, "col1"] = 10
+                assert_frame_equal(variable.read_data(), df)
+
+                # The variable is read from the file once another process rewrote it.
+                df2 = pd.DataFrame(dict(col1=[4, 5], col2=["d", "e"]))
+                df2.to_parquet(os.path.join(variable.variable_path, "data.parquet"))
+                assert_frame_equal(variable.read_data(), df2)
+
+                variable.write_data(df2)
+                self.assertIn(variable.variable_path, variable_memory_cache.entries)
+                variable.delete()
+                self.assertNotIn(variable.variable_path, variable_memory_cache.entries)
+            finally:
+                variable_memory_cache.clear()
+
+    def test_read_serialized_dataframe_from_memory_cache(self):
+        pipeline = self.__create_pipeline("test pipeline memory cache serialized")
+        variable = Variable(
+            "var1",
+            pipeline.dir_path,
+            "block1",
+            variable_type=VariableType.DATAFRAME,
+        )
+        df = pd.DataFrame(
+            dict(
+                col1=[1, 2, 3],
+                col2=[dict(id=1), dict(id=2), dict(id=3)],
+            ),
+            index=[3, 4, 5],
+        )
+
+        variable.write_data(df)
+        df_from_file = variable.read_data()
+
+        with patch.object(variable_memory_cache, "max_bytes", 1024 * 1024):
+            try:
+                variable.write_data(df)
+                self.assertIn(variable.variable_path, variable_memory_cache.entries)
+
+                # The dataframe read from the cache has the same values and types as the
+                # dataframe read from the file.
+                with patch.object(
+                    variable.storage,
+                    "read_parquet",
+                    wraps=variable.storage.read_parquet,
+                ) as mock_read_parquet:
+                    df_read = variable.read_data()
+                    mock_read_parquet.assert_not_called()
+                assert_frame_equal(df_read, df_from_file)
+            finally:
+                variable_memory_cache.clear()
+
     def test_write_and_read_dataframe_analysis(self):
         pipeline = self.__create_pipeline("test pipeline 3")
         variable = Variable(
@@ -0,0 +1,64 @@
+import pandas as pd
+import polars as pl
+from pandas.testing import assert_frame_equal
+from polars.testing import assert_frame_equal as assert_polars_frame_equal
+
+from mage_ai.data_preparation.models.variables.memory_cache import (
+    VariableMemoryCache,
+    estimate_size,
+)
+from mage_ai.tests.base_test import TestCase
+
+
+class VariableMemoryCacheTest(TestCase):
+    def test_get_and_put(self):
+        cache = VariableMemoryCache(max_bytes=1024 * 1024)
+        df = pd.DataFrame(dict(col1=[1, 2, 3], col2=['a', 'b', 'c']))
+        df_polars = pl.DataFrame(dict(col1=[1, 2, 3]))
+
+        self.assertTrue(cache.put('var1', df, 1))
+        self.assertTrue(cache.put('var2', df_polars, 1))
+        assert_frame_equal(cache.get('var1', 1), df)
+        assert_polars_frame_equal(cache.get('var2', 1), df_polars)
+
+        # The dataframe is cached without a copy; the cached dataframe isn't modified with the
+        # dataframes returned.
+        self.assertIs(cache.entries['var1'][0], df)
+        cache.get('var1', 1).loc[1, 'col1'] = 20
+        self.assertEqual(cache.get('var1', 1)['col1'].tolist(), [1, 2, 3])
+
+    def test_get_with_another_version(self):
+        cache = VariableMemoryCache(max_bytes=1024 * 1024)
+        cache.put('var1', pd.DataFrame(dict(col1=[1, 2, 3])), 1)
+
+        self.assertIsNone(cache.get('var1', 2))
+        self.assertIsNone(cache.get('var1', 1))
+        self.assertEqual(cache.size, 0)
+
+    def test_put_evicts_least_recently_used(self):
+        df = pd.DataFrame(dict(col1=list(range(100))))
+        size = estimate_size(df)
+        cache = VariableMemoryCache(max_bytes=size * 2)
+
+        cache.put('var1', df, 1)
+        cache.put('var2', df, 1)
+        cache.get('var1', 1)
+        cache.put('var3', df, 1)
+
+        self.assertEqual(list(cache.entries.keys()), ['var1', 'var3'])
+        self.assertEqual(cache.size, size * 2)
+
+    def test_put_larger_than_budget(self):
+        df = pd.DataFrame(dict(col1=list(range(100))))
+        cache = VariableMemoryCache(max_bytes=estimate_size(df) - 1)
+
+        self.assertFalse(cache.put('var1', df, 1))
+        self.assertFalse(cache.put('var2', dict(col1=[1]), 1))
+        self.assertEqual(len(cache.entries), 0)
+
+    def test_disabled(self):
+        cache = VariableMemoryCache()
+        df = pd.DataFrame(dict(col1=[1, 2, 3]))
+
+        self.assertFalse(cache.put('var1', df, 1))
+        self.assertIsNone(cache.get('var1', 1))
@@ -1,6 +1,10 @@
+import io
 from unittest import mock
 from unittest.mock import MagicMock
 
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
 from mage_ai.data_preparation.storage.gcs_storage import GCSStorage
 from mage_ai.tests.base_test import TestCase
 
@@ -62,3 +66,32 @@ class TestGCSStorage(TestCase):
             f.write('test2')
 
         self.gcs_bucket_mock.blob.assert_called_with('test_dir/test_file')
+
+    def test_read_parquet_sample(self):
+        df = pd.DataFrame(dict(col1=list(range(100000))))
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, row_group_size=1000)
+        content = buffer.getvalue()
+
+        blob = MagicMock()
+        blob.size = len(content)
+        blob.download_as_bytes.side_effect = \
+            lambda start, end, **kwargs: content[start:end + 1]
+        self.gcs_bucket_mock.get_blob.return_value = blob
+
+        assert_frame_equal(self.storage.read_parquet_sample('dir/data.parquet', 10), df.iloc[:10])
+        bytes_read = sum(
+            call.kwargs['end'] + 1 - call.kwargs['start']
+            for call in blob.download_as_bytes.call_args_list
+        )
+        self.assertLess(bytes_read, len(content) / 2)
+
+    def test_write_parquet(self):
+        df = pd.DataFrame(dict(col1=list(range(100))))
+        self.storage.write_parquet(df, 'dir/data.parquet')
+
+        blob = self.gcs_bucket_mock.blob.return_value
+        blob.upload_from_file.assert_called_once()
+        self.assertEqual(blob.upload_from_file.call_args.kwargs['size'], len(
+            blob.upload_from_file.call_args.args[0].getvalue(),
+        ))
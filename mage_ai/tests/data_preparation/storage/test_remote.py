@@ -0,0 +1,40 @@
+import io
+
+from mage_ai.data_preparation.storage.remote import (
+    RangeReader,
+    read_ranges_concurrently,
+)
+from mage_ai.tests.base_test import TestCase
+
+
+class RemoteStorageTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.content = bytes(range(256)) * 100
+        self.ranges = []
+
+    def read_range(self, start: int, end: int) -> bytes:
+        self.ranges.append((start, end))
+        return self.content[start:end]
+
+    def test_range_reader(self):
+        reader = RangeReader(self.read_range, len(self.content), footer_read_size=1000)
+
+        self.assertEqual(reader.read(10), self.content[:10])
+        reader.seek(-8, io.SEEK_END)
+        self.assertEqual(reader.read(4), self.content[-8:-4])
+        self.assertEqual(reader.tell(), len(self.content) - 4)
+        reader.seek(-100, io.SEEK_CUR)
+        self.assertEqual(reader.read(), self.content[-104:])
+        self.assertEqual(reader.read(), b'')
+
+        # The end of the object is only read once.
+        self.assertEqual(self.ranges, [(0, 10), (len(self.content) - 1000, len(self.content))])
+
+    def test_read_ranges_concurrently(self):
+        self.assertEqual(
+            read_ranges_concurrently(self.read_range, len(self.content), chunk_size=1000),
+            self.content,
+        )
+        self.assertEqual(len(self.ranges), 26)
+        self.assertEqual(sorted(self.ranges)[-1], (25000, 25600))
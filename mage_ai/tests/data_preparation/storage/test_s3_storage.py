@@ -1,5 +1,10 @@
+import asyncio
+import io
 from unittest.mock import MagicMock
 
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
 from mage_ai.data_preparation.storage.s3_storage import S3Storage
 from mage_ai.tests.base_test import TestCase
 
@@ -42,3 +47,41 @@ class TestS3Storage(TestCase):
             'test_dir/test_file',
             'test1\ntest2'
         )
+
+    def test_read_parquet(self):
+        df = pd.DataFrame(dict(col1=list(range(100))))
+        buffer = io.BytesIO()
+        df.to_parquet(buffer)
+        self.s3_client_mock.download_fileobj.side_effect = \
+            lambda object_key, file: file.write(buffer.getvalue())
+
+        assert_frame_equal(self.storage.read_parquet('dir/data.parquet'), df)
+        self.s3_client_mock.download_fileobj.assert_called_once()
+        self.s3_client_mock.get_object.assert_not_called()
+
+    def test_read_parquet_sample(self):
+        df = pd.DataFrame(dict(col1=list(range(100000))))
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, row_group_size=1000)
+        content = buffer.getvalue()
+        self.s3_client_mock.get_object_size.return_value = len(content)
+        self.s3_client_mock.read_range.side_effect = \
+            lambda object_key, start, end: content[start:end]
+
+        assert_frame_equal(self.storage.read_parquet_sample('dir/data.parquet', 10), df.iloc[:10])
+        bytes_read = sum(
+            call.args[2] - call.args[1]
+            for call in self.s3_client_mock.read_range.call_args_list
+        )
+        self.assertLess(bytes_read, len(content) / 2)
+        self.s3_client_mock.get_object.assert_not_called()
+
+    def test_read_and_write_json_file_async(self):
+        self.s3_client_mock.read.return_value = '{"key": "value"}'
+
+        self.assertEqual(
+            asyncio.run(self.storage.read_json_file_async('dir/data.json')),
+            dict(key='value'),
+        )
+        asyncio.run(self.storage.write_json_file_async('dir/data.json', dict(key='value')))
+        self.s3_client_mock.upload.assert_called_with('dir/data.json', '{"key": "value"}')
@@ -0,0 +1,214 @@
+import os
+import time
+from unittest.mock import patch
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from mage_ai.data_preparation.block_output_cache import (
+    BlockOutputCache,
+    block_output_cache_stats,
+)
+from mage_ai.data_preparation.models.block import Block
+from mage_ai.data_preparation.models.pipeline import Pipeline
+from mage_ai.tests.base_test import DBTestCase
+
+LOADER_CODE = """import pandas as pd
+@data_loader
+def load_data(*args, **kwargs):
+    with open('{counter_path}', 'a') as f:
+        f.write('x')
+    return pd.DataFrame(dict(col1=[1, 1, 3], col2=[2, 2, kwargs.get('value', 4)]))
+"""
+TRANSFORMER_CODE = """@transformer
+def transform(df, *args, **kwargs):
+    with open('{counter_path}', 'a') as f:
+        f.write('x')
+    return df.drop_duplicates()
+"""
+
+
+class BlockOutputCacheTest(DBTestCase):
+    def setUp(self):
+        super().setUp()
+        self.pipeline = Pipeline.create(
+            f'test output cache {time.time_ns()}',
+            repo_path=self.repo_path,
+        )
+        self.loader_counter_path = os.path.join(self.repo_path, f'{self.pipeline.uuid}_loader')
+        self.transformer_counter_path = os.path.join(
+            self.repo_path,
+            f'{self.pipeline.uuid}_transformer',
+        )
+        self.loader = Block.create(
+            f'{self.pipeline.uuid}_loader',
+            'data_loader',
+            self.repo_path,
+            configuration=dict(output_cache=True),
+            pipeline=self.pipeline,
+        )
+        self.transformer = Block.create(
+            f'{self.pipeline.uuid}_transformer',
+            'transformer',
+            self.repo_path,
+            configuration=dict(output_cache=True),
+            pipeline=self.pipeline,
+            upstream_block_uuids=[self.loader.uuid],
+        )
+        self.__write_code(self.loader, LOADER_CODE, self.loader_counter_path)
+        self.__write_code(self.transformer, TRANSFORMER_CODE, self.transformer_counter_path)
+
+    def tearDown(self):
+        self.pipeline.variable_manager.block_output_cache.max_size_bytes = 0
+        self.pipeline.variable_manager.block_output_cache.evict()
+        super().tearDown()
+
+    def test_execute_restores_cached_outputs(self):
+        hits = block_output_cache_stats.hits
+        df_expected = pd.DataFrame(dict(col1=[1, 3], col2=[2, 4]), index=[0, 2])
+
+        for _ in range(2):
+            self.loader.execute_sync()
+            output = self.transformer.execute_sync()
+            assert_frame_equal(output['output'][0], df_expected)
+
+        self.assertEqual(self.__count(self.loader_counter_path), 1)
+        self.assertEqual(self.__count(self.transformer_counter_path), 1)
+        self.assertEqual(block_output_cache_stats.hits, hits + 2)
+        assert_frame_equal(
+            self.pipeline.variable_manager.get_variable(
+                self.pipeline.uuid,
+                self.transformer.uuid,
+                'output_0',
+            ),
+            df_expected,
+        )
+
+        # The loader is executed again after its code changed, but its output didn't change, so
+        # the output of the transformer is restored.
+        self.loader.update_content(
+            LOADER_CODE.format(counter_path=self.loader_counter_path) + '\n',
+        )
+        self.loader.execute_sync()
+        self.transformer.execute_sync()
+        self.assertEqual(self.__count(self.loader_counter_path), 2)
+        self.assertEqual(self.__count(self.transformer_counter_path), 1)
+
+        # Different global variables change the output of the loader.
+        self.loader.execute_sync(global_vars=dict(value=5))
+        output = self.transformer.execute_sync(global_vars=dict(value=5))
+        self.assertEqual(self.__count(self.loader_counter_path), 3)
+        self.assertEqual(self.__count(self.transformer_counter_path), 2)
+        self.assertEqual(output['output'][0]['col2'].tolist(), [2, 5])
+
+    def test_upstream_executed_again_with_the_same_output(self):
+        self.loader.configuration = dict(output_cache=False)
+        hits = block_output_cache_stats.hits
+
+        outputs = []
+        for _ in range(2):
+            self.loader.execute_sync()
+            outputs.append(self.transformer.execute_sync()['output'])
+
+        # The loader wrote its output files again, but their content didn't change.
+        self.assertEqual(self.__count(self.loader_counter_path), 2)
+        self.assertEqual(self.__count(self.transformer_counter_path), 1)
+        self.assertEqual(block_output_cache_stats.hits, hits + 1)
+
+        # The restored outputs are the data of the outputs, like the outputs of the execution.
+        self.assertEqual(len(outputs[1]), len(outputs[0]))
+        self.assertIsInstance(outputs[1][0], pd.DataFrame)
+        assert_frame_equal(outputs[1][0], outputs[0][0])
+
+    def test_data_loader_is_only_cached_when_it_opts_in(self):
+        self.loader.configuration = dict()
+        with patch('mage_ai.data_preparation.block_output_cache.BLOCK_OUTPUT_CACHE', True):
+            cache = self.pipeline.variable_manager.block_output_cache
+            self.assertFalse(cache.should_cache(self.loader))
+            self.assertTrue(cache.should_cache(self.transformer))
+
+            for _ in range(2):
+                self.loader.execute_sync()
+
+        self.assertEqual(self.__count(self.loader_counter_path), 2)
+
+    def test_store_only_caches_the_variables_written(self):
+        cache = self.pipeline.variable_manager.block_output_cache
+        self.loader.execute_sync()
+
+        # A variable left over by an earlier run isn't cached with the outputs.
+        variables_dir = cache.block_variables_dir(self.loader)
+        os.makedirs(os.path.join(variables_dir, 'output_1'))
+        with open(os.path.join(variables_dir, 'output_1', 'data.json'), 'w') as f:
+            f.write('1')
+
+        key = cache.build_key(self.loader, global_vars=dict(value=6))
+        self.assertTrue(cache.store(self.loader, key, ['output_0']))
+        self.assertEqual(
+            os.listdir(os.path.join(cache.cache_dir, key, 'variables')),
+            ['output_0'],
+        )
+        self.assertEqual(cache.restore(self.loader, key), ['output_0'])
+        self.assertEqual(os.listdir(variables_dir), ['output_0'])
+
+    def test_entries_expire_from_when_they_were_cached(self):
+        cache = self.pipeline.variable_manager.block_output_cache
+        cache.max_age_seconds = 60
+        self.loader.execute_sync()
+        key = os.listdir(cache.cache_dir)[0]
+
+        # Restoring the entry doesn't extend its life.
+        with patch('mage_ai.data_preparation.block_output_cache.datetime') as mock_datetime:
+            mock_datetime.utcnow.return_value.timestamp.return_value = time.time() + 50
+            self.assertIsNotNone(cache.restore(self.loader, key))
+        with patch('mage_ai.data_preparation.block_output_cache.datetime') as mock_datetime:
+            mock_datetime.utcnow.return_value.timestamp.return_value = time.time() + 70
+            self.assertIsNone(cache.restore(self.loader, key))
+
+    def test_execute_without_opt_in(self):
+        self.transformer.configuration = dict(output_cache=False)
+        with patch('mage_ai.data_preparation.block_output_cache.BLOCK_OUTPUT_CACHE', True):
+            for _ in range(2):
+                self.loader.execute_sync()
+                self.transformer.execute_sync()
+
+        self.assertEqual(self.__count(self.loader_counter_path), 1)
+        self.assertEqual(self.__count(self.transformer_counter_path), 2)
+
+    def test_evict(self):
+        self.loader.execute_sync()
+        self.loader.execute_sync(global_vars=dict(value=5))
+        self.transformer.execute_sync(global_vars=dict(value=5))
+
+        cache = self.pipeline.variable_manager.block_output_cache
+        self.assertEqual(len(os.listdir(cache.cache_dir)), 3)
+
+        # Entries are evicted while the cache is larger than its maximum size.
+        cache.max_size_bytes = 1
+        self.assertEqual(cache.evict(), 3)
+        self.assertEqual(os.listdir(cache.cache_dir), [])
+
+        cache.max_size_bytes = 1024 * 1024
+        cache.max_age_seconds = 60
+        self.loader.execute_sync()
+        with patch('mage_ai.data_preparation.block_output_cache.datetime') as mock_datetime:
+            mock_datetime.utcnow.return_value.timestamp.return_value = time.time() + 120
+            self.assertEqual(cache.evict(), 1)
+
+    def test_build_key_with_unhashable_global_variable(self):
+        cache = BlockOutputCache(self.pipeline.variable_manager)
+        self.assertIsNone(cache.build_key(self.loader, global_vars=dict(value=object())))
+        self.assertEqual(
+            cache.build_key(self.loader, global_vars=dict(pipeline_run_id=1)),
+            cache.build_key(self.loader, global_vars=dict(pipeline_run_id=2)),
+        )
+
+    def __count(self, counter_path: str) -> int:
+        if not os.path.exists(counter_path):
+            return 0
+        with open(counter_path) as f:
+            return len(f.read())
+
+    def __write_code(self, block: Block, code: str, counter_path: str) -> None:
+        with open(block.file_path, 'w') as f:
+            f.write(code.format(counter_path=counter_path))
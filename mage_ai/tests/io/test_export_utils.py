@@ -4,7 +4,7 @@ import faker
 import numpy as np
 import pandas as pd
 
-from mage_ai.io.export_utils import infer_dtypes
+from mage_ai.io.export_utils import infer_dtypes, serialize_columns
 from mage_ai.io.postgres import Postgres
 from mage_ai.tests.base_test import TestCase
 
@@ -75,3 +75,47 @@ class TypeConversionTests(TestCase):
             dtype = self.dtypes[column]
             psql_type = psql.get_type(self.data[column], dtype)
             self.assertEqual(psql_type, expected_dtype)
+
+
+class SerializeColumnsTests(TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(dict(
+            id=[1, 2, 3],
+            score=[0.5, np.nan, 1.5],
+            name=['"a"', 'b', None],
+            payload=[dict(a=1), None, dict(b=np.nan)],
+            tags=[[1, 2], [dict(x=1)], None],
+        ))
+        return super().setUp()
+
+    def test_serialize_columns(self):
+        df = serialize_columns(self.df)
+        self.assertEqual(df['payload'].tolist(), ['{"a": 1}', None, '{"b": null}'])
+        self.assertEqual(df['tags'].tolist(), [[1, 2], '[{"x": 1}]', None])
+        self.assertEqual(df['name'].tolist(), ['"a"', 'b', None])
+        self.assertTrue(np.shares_memory(df['id'].to_numpy(), self.df['id'].to_numpy()))
+        self.assertEqual(self.df['payload'].tolist()[0], dict(a=1))
+
+    def test_serialize_columns_with_options(self):
+        df = serialize_columns(
+            self.df,
+            list_serializer=lambda value: ','.join(str(v) for v in value),
+            null_to_none=True,
+            strip_quotes=True,
+        )
+        self.assertEqual(df['score'].tolist(), [0.5, None, 1.5])
+        self.assertEqual(df['name'].tolist(), ['a', 'b', None])
+        self.assertEqual(df['tags'].tolist(), ['1,2', '[{"x": 1}]', None])
+        self.assertEqual(df['id'].tolist(), [1, 2, 3])
+
+    def test_serialize_columns_with_complex_numbers(self):
+        df = pd.DataFrame(dict(id=[1, 2], value=[1 + 2j, 3 - 1j]))
+        self.assertIs(serialize_columns(df), df)
+
+        df_serialized = serialize_columns(df, complex_to_string=True, null_to_none=True)
+        self.assertEqual(df_serialized['value'].tolist(), ['(1+2j)', '(3-1j)'])
+        self.assertEqual(df_serialized['id'].tolist(), [1, 2])
+
+    def test_serialize_columns_without_changes(self):
+        df = self.df[['id']]
+        self.assertIs(serialize_columns(df), df)
@@ -0,0 +1,25 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from mage_ai.io.export_utils import infer_dtypes
+from mage_ai.io.mysql import MySQL
+from mage_ai.tests.base_test import TestCase
+
+
+class MySQLTests(TestCase):
+    def test_upload_dataframe_with_complex_column(self):
+        mysql = MySQL('test', 'test', 'test', 'test')
+        df = pd.DataFrame(dict(id=[1, 2], value=[1 + 2j, 3 - 1j]))
+        dtypes = infer_dtypes(df)
+        cursor = MagicMock()
+
+        mysql.upload_dataframe(
+            cursor,
+            df,
+            {col: mysql.get_type(df[col], dtypes[col]) for col in dtypes},
+            dtypes,
+            'test_table',
+        )
+
+        self.assertEqual(cursor.executemany.call_args.args[1], [(1, '(1+2j)'), (2, '(3-1j)')])
@@ -0,0 +1,287 @@
+import os
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from mage_ai.io.export_utils import infer_dtypes
+from mage_ai.io.postgres import Postgres
+from mage_ai.tests.base_test import TestCase
+
+
+class PostgresTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.postgres = Postgres('test', 'test', 'test', 'test', '123')
+        self.df = pd.DataFrame([
+            dict(id=1, label='a', tags=['x']),
+            dict(id=2, label='b', tags=['y']),
+            dict(id=1, label='c', tags=['z']),
+        ])
+        self.dtypes = infer_dtypes(self.df)
+        self.db_dtypes = {
+            col: self.postgres.get_type(self.df[col], self.dtypes[col]) for col in self.dtypes
+        }
+
+    def test_upload_dataframe_with_unique_constraints(self):
+        cursor = MagicMock()
+        self.postgres.upload_dataframe(
+            cursor,
+            self.df,
+            self.db_dtypes,
+            self.dtypes,
+            'test_schema.test_table',
+            buffer=StringIO(),
+            unique_conflict_method='UPDATE',
+            unique_constraints=['id'],
+        )
+
+        cursor.executemany.assert_called_once()
+        cursor.copy_expert.assert_not_called()
+        self.assertEqual(len(cursor.executemany.call_args[0][1]), 3)
+
+    def test_upload_dataframe_with_staging_table(self):
+        cursor = MagicMock()
+        copied_data = []
+        cursor.copy_expert.side_effect = lambda _, buffer: copied_data.append(buffer.read())
+
+        self.postgres.upload_dataframe(
+            cursor,
+            self.df,
+            self.db_dtypes,
+            self.dtypes,
+            'test_schema.test_table',
+            buffer=StringIO(),
+            staging_table_chunk_size=2,
+            unique_conflict_method='UPDATE',
+            unique_constraints=['id'],
+            upsert_with_staging_table=True,
+        )
+
+        cursor.executemany.assert_not_called()
+        self.assertEqual(copied_data, [
+            '1,a,"{""x""}"\n2,b,"{""y""}"\n',
+            '1,c,"{""z""}"\n',
+        ])
+
+        queries = [c[0][0] for c in cursor.execute.call_args_list]
+        self.assertTrue(queries[0].startswith('CREATE TEMPORARY TABLE mage_staging_'))
+        self.assertIn('ON COMMIT DROP', queries[0])
+        self.assertIn('FROM test_schema.test_table WITH NO DATA', queries[0])
+
+        merge_queries = [q for q in queries if q.startswith('INSERT INTO')]
+        self.assertEqual(len(merge_queries), 2)
+        self.assertIn('SELECT DISTINCT ON ("id")', merge_queries[0])
+        self.assertIn('"_mage_staging_row_number" DESC', merge_queries[0])
+        self.assertIn('ON CONFLICT ("id")', merge_queries[0])
+        self.assertIn(
+            'DO UPDATE SET "id" = EXCLUDED."id", "label" = EXCLUDED."label", '
+            '"tags" = EXCLUDED."tags"',
+            merge_queries[0],
+        )
+        self.assertEqual(len([q for q in queries if q.startswith('TRUNCATE')]), 1)
+        staging_table_name = queries[0].split()[3]
+        self.assertEqual(queries[-1], f'DROP TABLE {staging_table_name}')
+
+    def test_upload_dataframe_with_staging_table_ignore_conflicts(self):
+        cursor = MagicMock()
+        self.postgres.upload_dataframe(
+            cursor,
+            self.df,
+            self.db_dtypes,
+            self.dtypes,
+            'test_table',
+            buffer=StringIO(),
+            unique_conflict_method='IGNORE',
+            unique_constraints=['id'],
+            upsert_with_staging_table=True,
+        )
+
+        merge_queries = [
+            c[0][0] for c in cursor.execute.call_args_list if c[0][0].startswith('INSERT INTO')
+        ]
+        self.assertEqual(len(merge_queries), 1)
+        self.assertIn('"_mage_staging_row_number" ASC', merge_queries[0])
+        self.assertTrue(merge_queries[0].endswith('DO NOTHING'))
+
+    def test_export_batches(self):
+        cursor = MagicMock()
+        copied_data = []
+        cursor.copy_expert.side_effect = lambda _, buffer: copied_data.append(buffer.read())
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        self.postgres._ctx = conn
+
+        def __batches():
+            yield pd.DataFrame([dict(id=1, label='a'), dict(id=2, label='b')])
+            yield pa.RecordBatch.from_pandas(pd.DataFrame([dict(id=3, label='c')]))
+
+        with patch.object(self.postgres, 'table_exists', return_value=True):
+            self.postgres.export(
+                __batches(),
+                schema_name='test_schema',
+                table_name='test_table',
+                verbose=False,
+            )
+
+        queries = [c[0][0] for c in cursor.execute.call_args_list]
+        self.assertEqual(len(queries), 2)
+        self.assertIn('CREATE SCHEMA test_schema', queries[0])
+        self.assertEqual(queries[1], 'DELETE FROM test_schema.test_table')
+        self.assertEqual(copied_data, ['1,a\n2,b\n', '3,c\n'])
+        conn.commit.assert_called_once()
+
+    def test_export_batches_with_empty_chunks(self):
+        cursor = MagicMock()
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        self.postgres._ctx = conn
+
+        with patch.object(self.postgres, 'table_exists', return_value=True):
+            with self.assertRaises(ValueError):
+                self.postgres.export_batches(
+                    iter([pd.DataFrame()]),
+                    table_name='test_table',
+                    if_exists='fail',
+                    verbose=False,
+                )
+
+            self.postgres.export_batches(iter([]), table_name='test_table', verbose=False)
+            self.assertEqual(cursor.execute.call_args[0][0], 'DELETE FROM test_table')
+
+        cursor.reset_mock()
+        with patch.object(self.postgres, 'table_exists', return_value=False):
+            num_rows = self.postgres.export_batches(
+                iter([pd.DataFrame(columns=['id', 'label'])]),
+                table_name='test_table',
+                verbose=False,
+            )
+
+        self.assertEqual(num_rows, 0)
+        self.assertIn('CREATE TABLE', cursor.execute.call_args[0][0])
+        cursor.copy_expert.assert_not_called()
+
+    def test_export_batches_rolls_back_on_error(self):
+        cursor = MagicMock()
+        cursor.copy_expert.side_effect = Exception('Failed to copy')
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        self.postgres._ctx = conn
+
+        with patch.object(self.postgres, 'table_exists', return_value=False):
+            with self.assertRaises(Exception):
+                self.postgres.export_batches(
+                    iter([pd.DataFrame([dict(id=1)])]),
+                    table_name='test_table',
+                    verbose=False,
+                )
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+
+    def test_load_batches(self):
+        rows = [(1, 'a'), (2, 'b'), (3, 'c')]
+        cursor = MagicMock()
+        cursor.description = [('id',), ('label',)]
+        cursor.fetchmany.side_effect = [rows[:2], rows[2:], []]
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        self.postgres._ctx = conn
+
+        batches = list(self.postgres.load_batches(
+            'SELECT id, label FROM test_table WHERE id > %s;',
+            batch_size=2,
+            verbose=False,
+            params=[0],
+        ))
+
+        self.assertTrue(conn.cursor.call_args[1]['name'].startswith('mage_cursor_'))
+        self.assertEqual(cursor.itersize, 2)
+        cursor.execute.assert_called_once_with(
+            'SELECT id, label FROM test_table WHERE id > %s',
+            [0],
+        )
+        self.assertEqual([len(df.index) for df in batches], [2, 1])
+        self.assertEqual(batches[1].to_dict(orient='records'), [dict(id=3, label='c')])
+        cursor.close.assert_called_once()
+        conn.commit.assert_called_once()
+        conn.rollback.assert_not_called()
+
+    def test_load_batches_keeps_integer_type_with_nulls(self):
+        cursor = MagicMock()
+        cursor.description = [('id',)]
+        cursor.fetchmany.side_effect = [[(1,), (2,)], [(None,), (2 ** 60 + 1,)], []]
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        self.postgres._ctx = conn
+
+        batches = list(self.postgres.load_batches(
+            'SELECT id FROM test_table',
+            batch_size=2,
+            verbose=False,
+        ))
+
+        self.assertEqual([str(df['id'].dtype) for df in batches], ['Int64', 'Int64'])
+        self.assertEqual(batches[1]['id'].tolist(), [pd.NA, 2 ** 60 + 1])
+
+    def test_load_batches_closed_early(self):
+        cursor = MagicMock()
+        cursor.description = [('id',)]
+        cursor.fetchmany.side_effect = [[(1,)], [(2,)], []]
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        self.postgres._ctx = conn
+
+        batches = self.postgres.load_batches('SELECT id FROM test_table', batch_size=1)
+        next(batches)
+        batches.close()
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        cursor.close.assert_called_once()
+
+    def test_load_to_parquet(self):
+        cursor = MagicMock()
+        cursor.description = [('id',), ('label',)]
+        cursor.fetchmany.side_effect = [[(1, None), (2, None)], [(None, 'c')], []]
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        self.postgres._ctx = conn
+
+        file_path = os.path.join(self.repo_path, 'test_load_to_parquet.parquet')
+        num_rows = self.postgres.load_to_parquet(
+            'SELECT id, label FROM test_table',
+            file_path,
+            batch_size=2,
+            verbose=False,
+        )
+
+        self.assertEqual(num_rows, 3)
+        parquet_file = pq.ParquetFile(file_path)
+        self.assertEqual(parquet_file.num_row_groups, 2)
+        self.assertEqual(parquet_file.read().to_pydict(), dict(
+            id=[1, 2, None],
+            label=[None, None, 'c'],
+        ))
+
+    def test_load_to_parquet_empty_result(self):
+        cursor = MagicMock()
+        cursor.description = [('id',), ('label',)]
+        cursor.fetchmany.side_effect = [[]]
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        self.postgres._ctx = conn
+
+        file_path = os.path.join(self.repo_path, 'test_load_to_parquet_empty.parquet')
+        num_rows = self.postgres.load_to_parquet(
+            'SELECT id, label FROM test_table',
+            file_path,
+            verbose=False,
+        )
+
+        self.assertEqual(num_rows, 0)
+        table = pq.read_table(file_path)
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.column_names, ['id', 'label'])
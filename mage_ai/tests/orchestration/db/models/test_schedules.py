@@ -5,6 +5,7 @@ from uuid import uuid4
 
 from croniter import croniter
 from freezegun import freeze_time
+from sqlalchemy import event
 
 from mage_ai.data_preparation.models.block import Block
 from mage_ai.data_preparation.models.constants import PipelineType
@@ -16,8 +17,10 @@ from mage_ai.data_preparation.models.triggers import (
     Trigger,
 )
 from mage_ai.data_preparation.repo_manager import get_repo_config
+from mage_ai.orchestration.db import db_connection
 from mage_ai.orchestration.db.models.schedules import (
     BlockRun,
+    BlockRunUnitOfWork,
     PipelineRun,
     PipelineSchedule,
 )
@@ -1734,6 +1737,58 @@ class BlockRunTests(DBTestCase):
             )
             self.assertEqual(b.logs.get('path'), expected_file_path)
 
+    def test_unit_of_work(self):
+        pipeline_run = create_pipeline_run_with_schedule(pipeline_uuid='test_pipeline')
+        block_runs = pipeline_run.refresh_block_runs()
+        self.assertEqual(
+            [b.block_uuid for b in block_runs],
+            [b.uuid for b in self.pipeline.get_executable_blocks()],
+        )
+
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement.split()[0])
+
+        engine = db_connection.session.get_bind()
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            with BlockRunUnitOfWork() as unit_of_work:
+                for b in block_runs[:2]:
+                    unit_of_work.update(b, status=BlockRun.BlockRunStatus.QUEUED)
+                unit_of_work.update(block_runs[2], status=BlockRun.BlockRunStatus.QUEUED)
+                unit_of_work.update(
+                    block_runs[2],
+                    metrics=dict(error='error'),
+                    status=BlockRun.BlockRunStatus.FAILED,
+                )
+                for i in range(3):
+                    unit_of_work.create(pipeline_run.id, f'dynamic_block:{i}')
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+        # One UPDATE per set of values, one INSERT and one SELECT for the created block runs.
+        self.assertEqual(statements, ['UPDATE', 'UPDATE', 'INSERT', 'SELECT'])
+        self.assertEqual(
+            [b.block_uuid for b in unit_of_work.created_block_runs],
+            [f'dynamic_block:{i}' for i in range(3)],
+        )
+        for b in unit_of_work.created_block_runs:
+            self.assertEqual(b.status, BlockRun.BlockRunStatus.INITIAL)
+
+        block_runs_by_uuid = {b.block_uuid: b for b in pipeline_run.refresh_block_runs()}
+        self.assertEqual(len(block_runs_by_uuid), len(block_runs) + 3)
+        for b in block_runs[:2]:
+            self.assertEqual(
+                block_runs_by_uuid[b.block_uuid].status,
+                BlockRun.BlockRunStatus.QUEUED,
+            )
+        self.assertEqual(
+            block_runs_by_uuid[block_runs[2].block_uuid].status,
+            BlockRun.BlockRunStatus.FAILED,
+        )
+        self.assertEqual(block_runs_by_uuid[block_runs[2].block_uuid].metrics['error'], 'error')
+
 
 @patch(
     'mage_ai.orchestration.db.models.schedules.project_platform_activated',
@@ -0,0 +1,247 @@
+import copy
+import threading
+import time
+from collections import deque
+
+from redis.exceptions import WatchError
+
+
+class LocalRedis:
+    """
+    In-memory stand-in for the subset of the Redis client used by the queues, with
+    decode_responses=True semantics.
+    """
+
+    def __init__(self):
+        self.data = dict()
+        self.condition = threading.Condition(threading.RLock())
+
+    def pipeline(self, transaction: bool = True):
+        return LocalRedisPipeline(self)
+
+    def ping(self):
+        return True
+
+    # Strings
+
+    def get(self, key):
+        with self.condition:
+            return self.data.get(key)
+
+    def mget(self, keys):
+        with self.condition:
+            return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None):
+        with self.condition:
+            self.data[key] = str(value)
+            return True
+
+    def exists(self, key):
+        with self.condition:
+            return int(key in self.data)
+
+    def delete(self, *keys):
+        with self.condition:
+            return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def expire(self, key, seconds):
+        return int(key in self.data)
+
+    # Lists; the head of the list is on the left.
+
+    def lpush(self, key, *values):
+        with self.condition:
+            items = self.data.setdefault(key, deque())
+            for value in values:
+                items.appendleft(str(value))
+            self.condition.notify_all()
+            return len(items)
+
+    def rpush(self, key, *values):
+        with self.condition:
+            items = self.data.setdefault(key, deque())
+            for value in values:
+                items.append(str(value))
+            self.condition.notify_all()
+            return len(items)
+
+    def rpop(self, key):
+        with self.condition:
+            items = self.data.get(key)
+            if not items:
+                return None
+            value = items.pop()
+            if not items:
+                del self.data[key]
+            return value
+
+    def lindex(self, key, index):
+        with self.condition:
+            items = self.data.get(key, [])
+            if -len(items) <= index < len(items):
+                return items[index]
+            return None
+
+    def rpoplpush(self, src, dst):
+        with self.condition:
+            items = self.data.get(src)
+            if not items:
+                return None
+            value = items.pop()
+            if not items:
+                del self.data[src]
+            self.data.setdefault(dst, deque()).appendleft(value)
+            return value
+
+    def brpoplpush(self, src, dst, timeout=0):
+        deadline = time.time() + timeout
+        with self.condition:
+            while True:
+                value = self.rpoplpush(src, dst)
+                if value is not None:
+                    return value
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self.condition.wait(remaining)
+
+    def lrem(self, key, count, value):
+        with self.condition:
+            items = self.data.get(key)
+            if not items:
+                return 0
+            kept = deque(item for item in items if item != value)
+            removed = len(items) - len(kept)
+            if kept:
+                self.data[key] = kept
+            else:
+                del self.data[key]
+            return removed
+
+    def lrange(self, key, start, end):
+        with self.condition:
+            items = list(self.data.get(key, []))
+            return items[start:] if end == -1 else items[start:end + 1]
+
+    # Hashes
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        with self.condition:
+            fields = self.data.setdefault(key, dict())
+            updates = dict(mapping or dict())
+            if field is not None:
+                updates[field] = value
+            added = len([f for f in updates if f not in fields])
+            fields.update({f: str(v) for f, v in updates.items()})
+            return added
+
+    def hget(self, key, field):
+        with self.condition:
+            return self.data.get(key, dict()).get(field)
+
+    def hgetall(self, key):
+        with self.condition:
+            return dict(self.data.get(key, dict()))
+
+    def hdel(self, key, *fields):
+        with self.condition:
+            hash_fields = self.data.get(key, dict())
+            return sum(1 for f in fields if hash_fields.pop(f, None) is not None)
+
+    def hincrby(self, key, field, amount=1):
+        with self.condition:
+            fields = self.data.setdefault(key, dict())
+            fields[field] = str(int(fields.get(field, 0)) + amount)
+            return int(fields[field])
+
+    # Sorted sets
+
+    def zadd(self, key, mapping, xx=False):
+        with self.condition:
+            members = self.data.setdefault(key, dict())
+            added = 0
+            for member, score in mapping.items():
+                if xx and member not in members:
+                    continue
+                if member not in members:
+                    added += 1
+                members[member] = float(score)
+            if not members:
+                del self.data[key]
+            return added
+
+    def zrem(self, key, *members):
+        with self.condition:
+            scores = self.data.get(key, dict())
+            return sum(1 for m in members if scores.pop(m, None) is not None)
+
+    def zscore(self, key, member):
+        with self.condition:
+            return self.data.get(key, dict()).get(member)
+
+    def zcard(self, key):
+        with self.condition:
+            return len(self.data.get(key, dict()))
+
+    def zrangebyscore(self, key, min_score, max_score):
+        min_score, max_score = float(min_score), float(max_score)
+        with self.condition:
+            items = sorted(self.data.get(key, dict()).items(), key=lambda item: item[1])
+            return [m for m, score in items if min_score <= score <= max_score]
+
+
+class LocalRedisPipeline:
+    """
+    Queues commands until execute. After watch, commands run immediately until multi, and
+    execute raises WatchError if a watched key changed in the meantime.
+    """
+
+    def __init__(self, redis_client: LocalRedis):
+        self.redis_client = redis_client
+        self.commands = []
+        self.watching = False
+        self.watched = dict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.reset()
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            if self.watching:
+                return getattr(self.redis_client, name)(*args, **kwargs)
+            self.commands.append((name, args, kwargs))
+            return self
+        return command
+
+    def watch(self, *keys):
+        with self.redis_client.condition:
+            self.watched.update({
+                key: copy.deepcopy(self.redis_client.data.get(key)) for key in keys
+            })
+        self.watching = True
+
+    def multi(self):
+        self.watching = False
+
+    def reset(self):
+        self.commands = []
+        self.watching = False
+        self.watched = dict()
+
+    def execute(self):
+        try:
+            with self.redis_client.condition:
+                for key, value in self.watched.items():
+                    if self.redis_client.data.get(key) != value:
+                        raise WatchError(f'Watched variable {key} changed.')
+                results = [
+                    getattr(self.redis_client, name)(*args, **kwargs)
+                    for name, args, kwargs in self.commands
+                ]
+        finally:
+            self.reset()
+        return results
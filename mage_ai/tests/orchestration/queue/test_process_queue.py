@@ -1,14 +1,22 @@
-from unittest.mock import patch
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
 
 from mage_ai.orchestration.queue.config import QueueConfig
 from mage_ai.orchestration.queue.process_queue import JobStatus, ProcessQueue
 from mage_ai.tests.base_test import TestCase
+from mage_ai.tests.orchestration.queue.local_redis import LocalRedis
 
 
 def run_block():
     print('test run block')
 
 
+def write_pid(file_path: str):
+    with open(file_path, 'a') as f:
+        f.write(f'{os.getpid()}\n')
+
+
 class ProcessQueueTests(TestCase):
     def setUp(self):
         queue_config = QueueConfig.load(config=dict(concurrency=100))
@@ -58,3 +66,88 @@ class ProcessQueueTests(TestCase):
         mock_pid_exists.return_value = False
         self.assertTrue(self.queue.has_job('block_run_1'))
         self.assertFalse(self.queue.has_job('block_run_2'))
+
+    @patch('mage_ai.orchestration.queue.process_queue.psutil.pid_exists')
+    def test_has_jobs(self, mock_pid_exists):
+        mock_pid_exists.side_effect = lambda pid: pid == 100
+
+        redis_client = LocalRedis()
+        redis_client.mget = MagicMock(wraps=redis_client.mget)
+        self.queue.redis_client = redis_client
+        self.queue.start_worker_pool = MagicMock()
+
+        # Jobs of another replica whose worker pool is alive or dead.
+        redis_client.set('block_run_1', 'HOST_other_PID_1')
+        redis_client.set('HOST_other_PID_1', '1')
+        redis_client.set('block_run_2', 'HOST_other_PID_2')
+        # Jobs of this replica.
+        self.queue.enqueue('block_run_3', run_block)
+        for job_id, job in [('block_run_4', 100), ('block_run_5', 200)]:
+            redis_client.set(job_id, self.queue.client_id)
+            self.queue.job_dict[job_id] = job
+        redis_client.set('block_run_6', self.queue.client_id)
+        self.queue.job_dict['block_run_6'] = JobStatus.COMPLETED
+        redis_client.mget.reset_mock()
+
+        job_ids = [f'block_run_{i}' for i in range(8)]
+        self.assertEqual(self.queue.has_jobs(job_ids), dict(
+            block_run_0=False,
+            block_run_1=True,
+            block_run_2=False,
+            block_run_3=True,
+            block_run_4=True,
+            block_run_5=False,
+            block_run_6=False,
+            block_run_7=False,
+        ))
+        # The jobs and the replicas are each fetched with a single call.
+        self.assertEqual(redis_client.mget.call_count, 2)
+
+        # Finished jobs are removed and the jobs flagged by other replicas are killed.
+        redis_client.set('kill_job_block_run_4', '1')
+        with patch('mage_ai.orchestration.queue.process_queue.os.kill') as mock_kill:
+            self.queue.clean_up_jobs()
+            mock_kill.assert_called_once()
+        self.assertEqual(
+            sorted(self.queue.job_dict.keys()),
+            ['block_run_3', 'block_run_4'],
+        )
+        self.assertEqual(self.queue.job_dict['block_run_4'], JobStatus.CANCELLED)
+        self.assertIsNone(redis_client.get('kill_job_block_run_4'))
+
+    def test_prefork_worker_pool(self):
+        for process_queue_config, expected_workers_count in [
+            # Workers are recycled after running 3 jobs.
+            (dict(max_jobs_per_worker=3), 2),
+            # Workers are recycled after each job when they use too much memory.
+            (dict(max_jobs_per_worker=0, max_worker_memory_mb=1), 6),
+        ]:
+            queue_config = QueueConfig.load(config=dict(
+                concurrency=1,
+                process_queue_config=dict(
+                    worker_mode='prefork',
+                    worker_idle_timeout=1,
+                    **process_queue_config,
+                ),
+            ))
+            queue = ProcessQueue(queue_config=queue_config)
+            queue.start()
+
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                file_path = os.path.join(tmp_dir, 'pids')
+                for i in range(6):
+                    queue.enqueue(f'block_run_{i}', write_pid, file_path)
+
+                # The pool exits once its workers were idle for a second.
+                queue.worker_pool_proc.join(timeout=60)
+                self.assertFalse(queue.is_worker_pool_alive())
+
+                with open(file_path) as f:
+                    pids = f.read().split()
+
+            self.assertEqual(len(pids), 6)
+            self.assertEqual(len(set(pids)), expected_workers_count)
+            self.assertNotIn(str(os.getpid()), pids)
+            for i in range(6):
+                self.assertEqual(queue.job_dict[f'block_run_{i}'], JobStatus.COMPLETED)
+            self.assertFalse(queue.has_job('block_run_0'))
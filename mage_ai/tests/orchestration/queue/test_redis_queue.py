@@ -0,0 +1,213 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+from mage_ai.orchestration.queue.config import QueueConfig
+from mage_ai.orchestration.queue.redis_queue import (
+    QueueWorker,
+    RedisJobStatus,
+    RedisQueue,
+    RedisQueueBroker,
+    encode_job,
+    execute_job,
+    register_job_target,
+)
+from mage_ai.tests.base_test import TestCase
+from mage_ai.tests.orchestration.queue.local_redis import LocalRedis
+
+
+def write_pid(file_path: str, sleep_seconds: float = 0):
+    with open(file_path, 'a') as f:
+        f.write(f'{os.getpid()}\n')
+    time.sleep(sleep_seconds)
+
+
+def write_args(file_path: str, *args, **kwargs):
+    with open(file_path, 'w') as f:
+        f.write(repr((args, kwargs)))
+
+
+register_job_target(write_pid)
+register_job_target(write_args)
+
+
+class RedisQueueTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.queue_config = QueueConfig.load(config=dict(
+            concurrency=2,
+            queue_type='redis',
+            redis_queue_config=dict(
+                heartbeat_interval=1,
+                max_running_jobs=1,
+                run_local_worker=False,
+                visibility_timeout=30,
+                worker_timeout=5,
+            ),
+        ))
+        self.broker = RedisQueueBroker(LocalRedis())
+        self.queue = RedisQueue(self.queue_config, broker=self.broker)
+        self.queue.start()
+        self.file_path = os.path.join(tempfile.mkdtemp(), 'pids')
+        self.worker = None
+
+    def tearDown(self):
+        if self.worker is not None:
+            self.worker.stop()
+            self.worker_thread.join(timeout=10)
+        self.queue.stop()
+        super().tearDown()
+
+    def test_enqueue_and_run(self):
+        for i in range(3):
+            self.queue.enqueue(f'block_run_{i}', write_pid, self.file_path)
+        self.assertTrue(self.queue.has_job('block_run_0'))
+        # Jobs already in the queue aren't enqueued twice.
+        self.queue.enqueue('block_run_0', write_pid, self.file_path)
+        self.assertEqual(len(self.broker.redis_client.lrange(self.broker.pending_key, 0, -1)), 3)
+
+        self.__start_worker()
+        for i in range(3):
+            self.__wait_for_status(f'block_run_{i}', RedisJobStatus.COMPLETED)
+            self.assertFalse(self.queue.has_job(f'block_run_{i}'))
+
+        with open(self.file_path) as f:
+            self.assertEqual(len(f.read().split()), 3)
+        self.assertEqual(self.broker.running_count(), 0)
+        self.assertEqual(self.broker.workers(), [self.worker.worker_id])
+
+    def test_max_running_jobs(self):
+        for i in range(2):
+            self.queue.enqueue(f'block_run_{i}', write_pid, self.file_path, 1)
+        self.__start_worker()
+
+        self.__wait_for_status('block_run_0', RedisJobStatus.RUNNING)
+        time.sleep(0.5)
+        # The worker has capacity for 2 jobs but only 1 job runs across all workers.
+        self.assertEqual(self.broker.running_count(), 1)
+        self.assertTrue(self.queue.has_job('block_run_1'))
+        self.__wait_for_status('block_run_1', RedisJobStatus.COMPLETED)
+
+    def test_kill_job(self):
+        self.queue.enqueue('block_run_1', write_pid, self.file_path, 60)
+        self.queue.enqueue('block_run_2', write_pid, self.file_path)
+
+        # Queued jobs are removed from the queue.
+        self.queue.kill_job('block_run_2')
+        self.assertFalse(self.queue.has_job('block_run_2'))
+        self.assertEqual(
+            self.broker.get_job('block_run_2')['status'],
+            RedisJobStatus.CANCELLED,
+        )
+
+        # Running jobs are killed by their worker.
+        self.__start_worker()
+        self.__wait_for_status('block_run_1', RedisJobStatus.RUNNING)
+        self.queue.kill_job('block_run_1')
+        self.__wait_for_status('block_run_1', RedisJobStatus.CANCELLED)
+        self.assertFalse(self.queue.has_job('block_run_1'))
+
+    def test_clean_up_jobs(self):
+        self.queue.enqueue('block_run_1', write_pid, self.file_path)
+        self.queue.enqueue('block_run_2', write_pid, self.file_path)
+
+        # A worker that died after claiming a job.
+        self.broker.register_worker('dead_worker', dict(pid=1))
+        self.broker.redis_client.zadd(self.broker.workers_key, {'dead_worker': 0})
+        self.assertEqual(self.broker.claim('dead_worker', 30), 'block_run_1')
+        # A job whose lease expired.
+        self.assertEqual(self.broker.claim('slow_worker', -1), 'block_run_2')
+        self.assertTrue(self.queue.has_job('block_run_1'))
+        self.assertFalse(self.queue.has_job('block_run_2'))
+
+        self.queue.clean_up_jobs()
+        self.assertEqual(self.broker.workers(), [])
+        self.assertEqual(
+            sorted(self.broker.redis_client.lrange(self.broker.pending_key, 0, -1)),
+            ['block_run_1', 'block_run_2'],
+        )
+        for job_id in ['block_run_1', 'block_run_2']:
+            self.assertEqual(self.broker.get_job(job_id)['status'], RedisJobStatus.QUEUED)
+            self.assertTrue(self.queue.has_job(job_id))
+
+        # Jobs are given up after max_attempts runs.
+        self.queue.kill_job('block_run_2')
+        for status in [RedisJobStatus.QUEUED, RedisJobStatus.FAILED]:
+            self.assertEqual(self.broker.claim('slow_worker', -1), 'block_run_1')
+            self.queue.clean_up_jobs()
+            self.assertEqual(self.broker.get_job('block_run_1')['status'], status)
+        self.assertEqual(self.broker.get_job('block_run_1')['attempts'], '3')
+        self.assertFalse(self.queue.has_job('block_run_1'))
+
+    def test_encode_and_execute_job(self):
+        execution_date = datetime(2024, 1, 2, 3, 4, 5)
+        payload = encode_job(
+            write_args,
+            [self.file_path, {1, 2}],
+            dict(variables=dict(execution_date=execution_date)),
+        )
+        self.assertEqual(
+            json.loads(payload)['target'],
+            'mage_ai.tests.orchestration.queue.test_redis_queue.write_args',
+        )
+
+        with patch(
+            'mage_ai.orchestration.queue.redis_queue.start_session_and_run',
+            side_effect=lambda target, *args, **kwargs: target(*args, **kwargs),
+        ):
+            execute_job(payload)
+        with open(self.file_path) as f:
+            self.assertEqual(
+                f.read(),
+                repr((({1, 2},), dict(variables=dict(execution_date=execution_date)))),
+            )
+
+        # Only the whitelisted functions can be run.
+        with self.assertRaises(ValueError):
+            encode_job(os.remove, [self.file_path], dict())
+        with self.assertRaises(ValueError):
+            execute_job(json.dumps(dict(args=[self.file_path], kwargs=dict(), target='os.remove')))
+        self.assertTrue(os.path.exists(self.file_path))
+
+    def test_claim_within_max_running_jobs(self):
+        for i in range(3):
+            self.queue.enqueue(f'block_run_{i}', write_pid, self.file_path)
+
+        job_ids = []
+
+        def __claim(worker_id):
+            job_ids.append(self.broker.claim(worker_id, 30, max_running_jobs=2))
+
+        threads = [threading.Thread(target=__claim, args=(f'worker_{i}',)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(sorted(job_id for job_id in job_ids if job_id), [
+            'block_run_0',
+            'block_run_1',
+        ])
+        self.assertEqual(self.broker.running_count(), 2)
+        self.assertTrue(self.queue.has_job('block_run_2'))
+
+    def __start_worker(self):
+        self.worker = QueueWorker(
+            self.broker,
+            concurrency=self.queue_config.concurrency,
+            redis_queue_config=self.queue_config.redis_queue_config,
+        )
+        self.worker_thread = threading.Thread(target=self.worker.run)
+        self.worker_thread.start()
+
+    def __wait_for_status(self, job_id: str, status: RedisJobStatus, timeout: int = 30):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.broker.get_job(job_id).get('status') == status:
+                return
+            time.sleep(0.05)
+        self.fail(f'Job {job_id} is not {status}: {self.broker.get_job(job_id)}')
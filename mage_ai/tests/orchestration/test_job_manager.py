@@ -36,6 +36,19 @@ class JobManagerTests(TestCase):
             logging_tags=None,
         )
 
+    def test_has_block_run_jobs(self):
+        self.mock_queue.has_jobs.return_value = dict(block_run_2=True, block_run_3=False)
+        self.assertEqual(self.job_manager.has_block_run_jobs(
+            [2, 3],
+            logging_tags_by_block_run_id={3: dict(block_run_id=3)},
+        ), {2: True, 3: False})
+        self.mock_queue.has_jobs.assert_called_once_with(
+            ['block_run_2', 'block_run_3'],
+            logger=None,
+            logging_tags=None,
+            logging_tags_by_job_id=dict(block_run_3=dict(block_run_id=3)),
+        )
+
     def test_has_pipeline_run_job(self):
         self.job_manager.has_pipeline_run_job(3)
         self.mock_queue.has_job.assert_called_once_with(
@@ -0,0 +1,177 @@
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+from freezegun import freeze_time
+
+from mage_ai.data_preparation.models.triggers import (
+    ScheduleInterval,
+    ScheduleStatus,
+    ScheduleType,
+    get_triggers_file_path,
+    invalidate_triggers_file,
+    register_triggers_file_listener,
+    triggers_file_listeners,
+)
+from mage_ai.orchestration.db.models.schedules import PipelineRun, PipelineSchedule
+from mage_ai.orchestration.scheduler_index import SchedulerIndex
+from mage_ai.tests.base_test import DBTestCase
+from mage_ai.tests.factory import create_pipeline_with_blocks
+
+
+class SchedulerIndexTests(DBTestCase):
+    @classmethod
+    def setUpClass(self):
+        super().setUpClass()
+        self.pipeline = create_pipeline_with_blocks(
+            'test scheduler index pipeline',
+            self.repo_path,
+        )
+
+    def setUp(self):
+        super().setUp()
+        PipelineRun.query.delete()
+        PipelineSchedule.query.delete()
+
+    def __create_schedule(self, **kwargs) -> PipelineSchedule:
+        return PipelineSchedule.create(**{
+            **dict(
+                name=self.faker.unique.name(),
+                pipeline_uuid=self.pipeline.uuid,
+                schedule_interval=ScheduleInterval.HOURLY,
+                schedule_type=ScheduleType.TIME,
+                start_time=datetime(2023, 10, 10, 13, 13, 20),
+                status=ScheduleStatus.ACTIVE,
+            ),
+            **kwargs,
+        })
+
+    def test_refresh_only_returns_due_or_changed_schedules(self):
+        index = SchedulerIndex(full_resync_interval=24 * 60 * 60)
+        pipeline_schedule = self.__create_schedule()
+
+        with freeze_time('2023-10-11 12:13:14'):
+            repo_pipelines, candidates = index.refresh()
+            self.assertIn(self.pipeline.uuid, repo_pipelines)
+            self.assertEqual([s.id for s in candidates], [pipeline_schedule.id])
+            index.update_next_execution_date(pipeline_schedule)
+            index.finish_tick()
+
+            _, candidates = index.refresh()
+            self.assertEqual(candidates, [])
+            index.finish_tick()
+
+        with freeze_time('2023-10-11 13:00:01'):
+            _, candidates = index.refresh()
+            self.assertEqual([s.id for s in candidates], [pipeline_schedule.id])
+
+    def test_refresh_marks_schedule_dirty_when_pipeline_run_finishes(self):
+        index = SchedulerIndex(full_resync_interval=24 * 60 * 60)
+        pipeline_schedule = self.__create_schedule(schedule_interval=ScheduleInterval.ALWAYS_ON)
+
+        with freeze_time('2023-10-11 12:13:14'):
+            _, candidates = index.refresh()
+            index.update_next_execution_date(pipeline_schedule)
+            index.finish_tick()
+
+            pipeline_run = PipelineRun.create(
+                pipeline_schedule_id=pipeline_schedule.id,
+                pipeline_uuid=self.pipeline.uuid,
+                status=PipelineRun.PipelineRunStatus.RUNNING,
+            )
+            _, candidates = index.refresh()
+            self.assertEqual([s.id for s in candidates], [pipeline_schedule.id])
+            index.update_next_execution_date(pipeline_schedule)
+            index.finish_tick()
+
+            _, candidates = index.refresh()
+            self.assertEqual(candidates, [])
+            index.finish_tick()
+
+            pipeline_run.update(status=PipelineRun.PipelineRunStatus.COMPLETED)
+            _, candidates = index.refresh()
+            self.assertEqual([s.id for s in candidates], [pipeline_schedule.id])
+
+    def test_refresh_retries_schedules_that_were_not_evaluated(self):
+        index = SchedulerIndex(full_resync_interval=24 * 60 * 60)
+        pipeline_schedule = self.__create_schedule()
+
+        with freeze_time('2023-10-11 12:13:14'):
+            index.refresh()
+            index.finish_tick()
+
+            _, candidates = index.refresh()
+            self.assertEqual([s.id for s in candidates], [pipeline_schedule.id])
+
+    def test_refresh_only_syncs_changed_trigger_files(self):
+        index = SchedulerIndex(full_resync_interval=24 * 60 * 60)
+        register_triggers_file_listener(index.mark_triggers_changed)
+
+        with patch(
+            'mage_ai.orchestration.pipeline_scheduler_original.sync_schedules',
+        ) as mock_sync_schedules:
+            index.refresh()
+            mock_sync_schedules.assert_called_once()
+            self.assertIn(self.pipeline.uuid, mock_sync_schedules.call_args[0][0])
+
+            mock_sync_schedules.reset_mock()
+            index.refresh()
+            mock_sync_schedules.assert_not_called()
+
+            invalidate_triggers_file(self.pipeline.uuid)
+            index.refresh()
+            mock_sync_schedules.assert_called_once_with([self.pipeline.uuid])
+
+        triggers_file_listeners.remove(index.mark_triggers_changed)
+
+    def test_refresh_syncs_trigger_files_written_outside_of_the_index(self):
+        index = SchedulerIndex(full_resync_interval=24 * 60 * 60)
+        trigger_file_path = get_triggers_file_path(self.pipeline.uuid)
+
+        with patch(
+            'mage_ai.orchestration.pipeline_scheduler_original.sync_schedules',
+        ) as mock_sync_schedules:
+            index.refresh()
+            mock_sync_schedules.reset_mock()
+
+            # E.g. written by the file editor or git sync in another process.
+            with open(trigger_file_path, 'w') as f:
+                f.write('triggers: []\n')
+            try:
+                index.refresh()
+                mock_sync_schedules.assert_called_once_with([self.pipeline.uuid])
+
+                mock_sync_schedules.reset_mock()
+                index.refresh()
+                mock_sync_schedules.assert_not_called()
+            finally:
+                os.remove(trigger_file_path)
+
+            index.refresh()
+            mock_sync_schedules.assert_called_once_with([self.pipeline.uuid])
+
+    def test_refresh_applies_updated_and_inactive_schedules(self):
+        index = SchedulerIndex(full_resync_interval=24 * 60 * 60)
+        pipeline_schedule = self.__create_schedule(schedule_interval=ScheduleInterval.ALWAYS_ON)
+
+        with freeze_time('2023-10-11 12:13:14'):
+            _, candidates = index.refresh()
+            self.assertEqual([s.id for s in candidates], [pipeline_schedule.id])
+            index.update_next_execution_date(pipeline_schedule)
+            index.finish_tick()
+
+        with freeze_time('2023-10-11 12:14:14'):
+            pipeline_schedule2 = self.__create_schedule(
+                schedule_interval=ScheduleInterval.ALWAYS_ON,
+            )
+            _, candidates = index.refresh()
+            self.assertEqual([s.id for s in candidates], [pipeline_schedule2.id])
+            index.update_next_execution_date(pipeline_schedule2)
+            index.finish_tick()
+
+        with freeze_time('2023-10-11 12:15:14'):
+            pipeline_schedule.update(status=ScheduleStatus.INACTIVE)
+            _, candidates = index.refresh()
+            self.assertEqual(candidates, [])
+            self.assertNotIn(pipeline_schedule.id, index.active_schedule_ids)
+            self.assertIn(pipeline_schedule2.id, index.active_schedule_ids)
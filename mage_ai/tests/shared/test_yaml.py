@@ -0,0 +1,82 @@
+import asyncio
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from mage_ai.shared.yaml import YAMLParseCache, load_yaml, trim_strings
+from mage_ai.tests.base_test import TestCase
+
+
+class YAMLTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.tmp_dir, 'metadata.yaml')
+        self.cache = YAMLParseCache(max_size=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        super().tearDown()
+
+    def test_trim_strings(self):
+        self.assertEqual(
+            trim_strings(dict(a=['b \n', dict(c='d\n')], e=1)),
+            dict(a=['b', dict(c='d')], e=1),
+        )
+
+    def test_load(self):
+        self.__write(self.file_path, 'blocks:\n- uuid: load\n', mtime=1)
+
+        with patch('mage_ai.shared.yaml.load_yaml', wraps=load_yaml) as mock_load:
+            config = self.cache.load(self.file_path)
+            self.assertEqual(config, dict(blocks=[dict(uuid='load')]))
+
+            # The cached config isn't modified by the callers.
+            config['blocks'].append(dict(uuid='transform'))
+            self.assertEqual(self.cache.load(self.file_path), dict(blocks=[dict(uuid='load')]))
+            self.assertEqual(mock_load.call_count, 1)
+
+            # Files are parsed again when their mtime or size changed.
+            self.__write(self.file_path, 'blocks:\n- uuid: export\n', mtime=2)
+            self.assertEqual(self.cache.load(self.file_path), dict(blocks=[dict(uuid='export')]))
+            self.assertEqual(mock_load.call_count, 2)
+
+            # Files rewritten with the same mtime and size are parsed again after invalidating
+            # them.
+            self.__write(self.file_path, 'blocks:\n- uuid: reload\n', mtime=2)
+            self.assertEqual(self.cache.load(self.file_path), dict(blocks=[dict(uuid='export')]))
+            self.cache.invalidate(self.file_path)
+            self.assertEqual(self.cache.load(self.file_path), dict(blocks=[dict(uuid='reload')]))
+
+            # The safe loader has its own entries.
+            self.assertEqual(
+                asyncio.run(self.cache.load_async(self.file_path, safe=True)),
+                dict(blocks=[dict(uuid='reload')]),
+            )
+            self.assertEqual(mock_load.call_count, 4)
+            self.assertEqual(len(self.cache.entries), 2)
+
+            # The least recently used files are evicted.
+            file_path2 = os.path.join(self.tmp_dir, 'triggers.yaml')
+            self.__write(file_path2, 'triggers: []\n')
+            self.assertEqual(self.cache.load(file_path2), dict(triggers=[]))
+            self.assertEqual(
+                list(self.cache.entries.keys()),
+                [(self.file_path, True), (file_path2, False)],
+            )
+
+    def test_load_disabled(self):
+        cache = YAMLParseCache(max_size=0)
+        self.__write(self.file_path, 'name: test\n')
+        with patch('mage_ai.shared.yaml.load_yaml', wraps=load_yaml) as mock_load:
+            for _ in range(2):
+                self.assertEqual(cache.load(self.file_path), dict(name='test'))
+            self.assertEqual(mock_load.call_count, 2)
+        self.assertEqual(len(cache.entries), 0)
+
+    def __write(self, file_path: str, content: str, mtime: int = None) -> None:
+        with open(file_path, 'w') as f:
+            f.write(content)
+        if mtime is not None:
+            os.utime(file_path, ns=(mtime, mtime))
@@ -0,0 +1,64 @@
+import threading
+from unittest.mock import MagicMock
+
+from mage_ai.streaming.sinks.pipelined_writer import PipelinedSinkWriter
+from mage_ai.tests.base_test import TestCase
+
+
+class PipelinedSinkWriterTests(TestCase):
+    def test_submit(self):
+        sink1 = MagicMock()
+        sink2 = MagicMock()
+        writer = PipelinedSinkWriter(dict(sink1=sink1, sink2=sink2))
+
+        futures = [
+            writer.submit([('sink1', [1, 2]), ('sink2', [1])]),
+            writer.submit([('sink1', [3])]),
+            writer.submit([]),
+        ]
+        writer.flush()
+        writer.close()
+
+        self.assertEqual([f.result(timeout=1) for f in futures], [True, True, True])
+        self.assertEqual([c[0][0] for c in sink1.batch_write.call_args_list], [[1, 2], [3]])
+        self.assertEqual([c[0][0] for c in sink2.batch_write.call_args_list], [[1]])
+
+    def test_submit_blocks_when_max_in_flight_batches_reached(self):
+        release = threading.Event()
+        sink = MagicMock()
+        sink.batch_write.side_effect = lambda _: release.wait(timeout=5)
+        writer = PipelinedSinkWriter(dict(sink=sink), max_in_flight_batches=1)
+
+        future1 = writer.submit([('sink', [1])])
+        submitted = threading.Event()
+
+        def __submit():
+            writer.submit([('sink', [2])])
+            submitted.set()
+
+        thread = threading.Thread(target=__submit)
+        thread.start()
+        self.assertFalse(submitted.wait(timeout=0.2))
+        self.assertFalse(future1.done())
+
+        release.set()
+        self.assertTrue(submitted.wait(timeout=5))
+        thread.join()
+        writer.flush()
+        writer.close()
+        self.assertEqual(sink.batch_write.call_count, 2)
+
+    def test_submit_raises_write_error(self):
+        sink1 = MagicMock()
+        sink1.batch_write.side_effect = Exception('Failed to write')
+        sink2 = MagicMock()
+        writer = PipelinedSinkWriter(dict(sink1=sink1, sink2=sink2))
+
+        future = writer.submit([('sink1', [1]), ('sink2', [1])])
+        with self.assertRaises(Exception):
+            future.result(timeout=5)
+        with self.assertRaisesRegex(Exception, 'Failed to write'):
+            writer.submit([('sink2', [2])])
+        writer.close()
+
+        self.assertNotIn([2], [c[0][0] for c in sink2.batch_write.call_args_list])
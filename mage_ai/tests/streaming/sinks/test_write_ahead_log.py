@@ -0,0 +1,125 @@
+import json
+import os
+import shutil
+import struct
+import zlib
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from mage_ai.streaming.sinks.dummy import DummySink
+from mage_ai.streaming.sinks.write_ahead_log import FsyncPolicy, WriteAheadLog
+from mage_ai.tests.base_test import TestCase
+
+
+class WriteAheadLogTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.repo_path, 'test_write_ahead_log')
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+        super().tearDown()
+
+    def test_append_and_read(self):
+        wal = WriteAheadLog(self.path, fsync_policy=FsyncPolicy.ALWAYS, segment_max_bytes=1)
+        wal.append([dict(id=1), dict(id=2)])
+        wal.append([])
+        wal.append(['3'])
+        wal.close()
+
+        self.assertEqual(len(os.listdir(self.path)), 2)
+        self.assertEqual(WriteAheadLog(self.path).read(), [dict(id=1), dict(id=2), '3'])
+
+    def test_append_and_read_non_json_types(self):
+        records = [
+            dict(
+                amount=Decimal('12.30'),
+                created_at=datetime(2024, 1, 2, 3, 4, 5, 678),
+                payload=b'\x00\x01',
+                updated_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            ),
+            dict(day=date(2024, 1, 2), values={1: 'a'}),
+        ]
+        wal = WriteAheadLog(self.path)
+        wal.append(records)
+        wal.close()
+
+        self.assertEqual(WriteAheadLog(self.path).read(), records)
+
+    def test_read_json_frames(self):
+        os.makedirs(self.path, exist_ok=True)
+        payload = json.dumps([dict(id=1)]).encode()
+        with open(os.path.join(self.path, 'segment_00000000000000000000.wal'), 'wb') as fp:
+            fp.write(struct.pack('>II', len(payload), zlib.crc32(payload)))
+            fp.write(payload)
+
+        wal = WriteAheadLog(self.path)
+        wal.append([dict(id=2)])
+        wal.close()
+        self.assertEqual(WriteAheadLog(self.path).read(), [dict(id=1), dict(id=2)])
+
+    def test_acknowledge(self):
+        wal = WriteAheadLog(self.path, segment_max_bytes=1)
+        wal.append([dict(id=1)])
+        wal.append([dict(id=2)])
+        wal.acknowledge()
+        wal.append([dict(id=3)])
+        wal.close()
+
+        self.assertEqual(
+            sorted(os.listdir(self.path)),
+            ['checkpoint', 'segment_00000000000000000002.wal'],
+        )
+        self.assertEqual(WriteAheadLog(self.path).read(), [dict(id=3)])
+
+    def test_read_skips_torn_write(self):
+        wal = WriteAheadLog(self.path)
+        wal.append([dict(id=1)])
+        wal.append([dict(id=2)])
+        wal.close()
+
+        segment_path = os.path.join(self.path, os.listdir(self.path)[0])
+        with open(segment_path, 'rb+') as fp:
+            fp.truncate(os.path.getsize(segment_path) - 1)
+
+        wal = WriteAheadLog(self.path)
+        self.assertEqual(wal.read(), [dict(id=1)])
+        wal.append([dict(id=3)])
+        wal.close()
+        self.assertEqual(WriteAheadLog(self.path).read(), [dict(id=1), dict(id=3)])
+
+    def test_sink_buffer(self):
+        with open(self.path, 'w') as fp:
+            fp.write(json.dumps(dict(id=1)) + '\n')
+
+        sink = DummySink(dict(connector_type='dummy'), buffer_path=self.path)
+        self.assertEqual(sink.buffer, [dict(id=1)])
+        self.assertFalse(os.path.exists(self.path))
+
+        sink.write_buffer([dict(id=2)])
+        sink = DummySink(dict(connector_type='dummy'), buffer_path=self.path)
+        self.assertEqual(sink.buffer, [dict(id=1), dict(id=2)])
+
+        sink.clear_buffer()
+        sink = DummySink(dict(connector_type='dummy'), buffer_path=self.path)
+        self.assertEqual(sink.buffer, [])
+
+        shutil.rmtree(f'{self.path}.wal', ignore_errors=True)
+
+    def test_sink_destroy_closes_write_ahead_log(self):
+        sink = DummySink(dict(connector_type='dummy'), buffer_path=self.path)
+        sink.write_buffer([dict(id=1)])
+        segment = sink.write_ahead_log.active_segment
+
+        sink.destroy()
+        self.assertTrue(segment.closed)
+        self.assertIsNone(sink.write_ahead_log)
+
+        shutil.rmtree(f'{self.path}.wal', ignore_errors=True)
+
+    def test_sink_invalid_fsync_policy(self):
+        with patch('mage_ai.streaming.sinks.base.STREAMING_BUFFER_FSYNC_POLICY', 'sometimes'):
+            with self.assertRaises(ValueError):
+                DummySink(dict(connector_type='dummy'), buffer_path=self.path)
@@ -1,4 +1,9 @@
-from unittest.mock import patch
+import json
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+from kafka import TopicPartition
+from kafka.structs import OffsetAndMetadata
 
 from mage_ai.streaming.sources.kafka import KafkaSource
 from mage_ai.tests.base_test import TestCase
@@ -109,3 +114,53 @@ class KafkaTests(TestCase):
             self.assertEqual(source.config.serde_config.serialization_method, 'PROTOBUF')
             self.assertEqual(
                 source.config.serde_config.schema_classpath, 'mage_ai.tests.base_test.TestCase')
+
+    def test_batch_read_commits_offsets_on_ack(self):
+        kafka_config = dict(
+            connector_type='kafka',
+            bootstrap_server='test_server',
+            consumer_group='test_group',
+            topic='test_topic',
+        )
+        tp = TopicPartition('test_topic', 0)
+
+        def __message(offset):
+            message = MagicMock()
+            message.offset = offset
+            message.value = json.dumps(dict(offset=offset)).encode('utf-8')
+            return message
+
+        future1 = Future()
+        future2 = Future()
+        future2.set_result(True)
+        acks = [future1, future2]
+        commits = []
+
+        def __poll(**kwargs):
+            if len(commits) == 0 and consumer.poll.call_count == 3:
+                future1.set_result(True)
+            return [
+                {tp: [__message(0), __message(1)]},
+                {tp: [__message(2)]},
+                {},
+            ][consumer.poll.call_count - 1]
+
+        with patch('mage_ai.streaming.sources.kafka.KafkaConsumer') as mock_consumer:
+            consumer = mock_consumer.return_value
+            consumer.poll.side_effect = __poll
+            consumer.commit.side_effect = lambda offsets: commits.append(offsets)
+            source = KafkaSource(kafka_config, commit_offsets_on_ack=True)
+
+            self.assertFalse(mock_consumer.call_args[1]['enable_auto_commit'])
+
+            handled_messages = []
+
+            def __handler(messages):
+                handled_messages.append(messages)
+                return acks[len(handled_messages) - 1]
+
+            with self.assertRaises(IndexError):
+                source.batch_read(handler=__handler)
+
+        self.assertEqual(handled_messages, [[dict(offset=0), dict(offset=1)], [dict(offset=2)]])
+        self.assertEqual(commits, [{tp: OffsetAndMetadata(3, None)}])
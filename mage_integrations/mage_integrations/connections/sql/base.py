@@ -8,6 +8,9 @@ from mage_integrations.utils.dictionary import merge_dict
 
 
 class Connection(BaseConnection):
+    # Set by sources that sync streams at the same time to reuse open connections.
+    connection_pool = None
+
     def close_connection(self, connection):
         connection.close()
 
@@ -38,6 +41,17 @@ class Connection(BaseConnection):
         Raises:
             Any exceptions raised during the execution process may propagate upward.
         """
+        if connection is None and self.connection_pool is not None:
+            with self.connection_pool.connection(
+                self.build_connection,
+                self.close_connection,
+            ) as pooled_connection:
+                data = self.execute_with_connection(pooled_connection, query_strings)
+                if commit:
+                    pooled_connection.commit()
+
+            return data
+
         new_connection_created = False
         if connection is None:
             connection = self.build_connection()
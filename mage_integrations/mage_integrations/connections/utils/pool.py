@@ -0,0 +1,71 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, List, Tuple
+
+
+class ConnectionPool:
+    """
+    Pool of open database connections shared by the threads of a source, so that the streams
+    synced at the same time reuse connections instead of opening one for every query.
+
+    A connection is only used by one thread at a time. At most max_size idle connections are
+    kept open; the other connections are closed when they're released.
+    """
+
+    def __init__(self, max_size: int = 1):
+        self.closed = False
+        self.idle_connections: List[Tuple[Any, Callable]] = []
+        self.lock = threading.Lock()
+        self.max_size = max_size
+
+    @contextmanager
+    def connection(self, build_connection: Callable, close_connection: Callable):
+        connection = None
+        with self.lock:
+            if self.idle_connections:
+                connection, close_connection = self.idle_connections.pop()
+        if connection is None:
+            connection = build_connection()
+
+        try:
+            yield connection
+        except Exception:
+            self.__close(connection, close_connection)
+            raise
+
+        try:
+            # End the transaction the queries started before another thread uses it.
+            if hasattr(connection, 'rollback'):
+                connection.rollback()
+        except Exception:
+            self.__close(connection, close_connection)
+            return
+
+        with self.lock:
+            if not self.closed and len(self.idle_connections) < self.max_size:
+                self.idle_connections.append((connection, close_connection))
+                return
+        self.__close(connection, close_connection)
+
+    def reserve(self, size: int) -> None:
+        """
+        Keeps at least size idle connections open, e.g. for the partitions of a stream that are
+        read at the same time.
+        """
+        with self.lock:
+            self.max_size = max(self.max_size, size)
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+            idle_connections = self.idle_connections
+            self.idle_connections = []
+
+        for connection, close_connection in idle_connections:
+            self.__close(connection, close_connection)
+
+    def __close(self, connection, close_connection: Callable) -> None:
+        try:
+            close_connection(connection)
+        except Exception:
+            pass
@@ -1,4 +1,3 @@
-import ast
 import inspect
 import io
 import json
@@ -9,20 +8,22 @@ from abc import ABC, abstractmethod
 from os.path import isfile
 from typing import Dict, List
 
+import pyarrow as pa
 import singer
 import yaml
 from jsonschema.validators import Draft4Validator
 
 from mage_integrations.destinations.constants import (
-    COLUMN_TYPE_ARRAY,
-    COLUMN_TYPE_OBJECT,
     COLUMN_TYPE_STRING,
     INTERNAL_COLUMN_SCHEMA,
     KEY_BOOKMARK_PROPERTIES,
+    KEY_DATA,
     KEY_DISABLE_COLUMN_TYPE_CHECK,
+    KEY_FORMAT,
     KEY_KEY_PROPERTIES,
     KEY_PARTITION_KEYS,
     KEY_RECORD,
+    KEY_RECORD_BATCH,
     KEY_REPLICATION_METHOD,
     KEY_SCHEMA,
     KEY_STREAM,
@@ -35,22 +36,36 @@ from mage_integrations.destinations.constants import (
     STREAM_OVERRIDE_SETTINGS_KEY,
     STREAM_OVERRIDE_SETTINGS_PARTITION_KEYS_KEY,
 )
-from mage_integrations.utils.dictionary import extract, merge_dict
+from mage_integrations.destinations.record_plan import RecordPlan
+from mage_integrations.utils.dictionary import merge_dict
 from mage_integrations.utils.files import get_abs_path
 from mage_integrations.utils.logger import Logger
 from mage_integrations.utils.logger.constants import (
     TYPE_ACTIVATE_VERSION,
     TYPE_LOG,
     TYPE_RECORD,
+    TYPE_RECORD_BATCH,
     TYPE_SCHEMA,
     TYPE_STATE,
 )
+from mage_integrations.utils.record_batch import (
+    RECORD_BATCH_FORMATS,
+    get_json_columns,
+    read_record_batch,
+    record_batch_to_records,
+)
 
 LOGGER = singer.get_logger()
 MAXIMUM_BATCH_SIZE_MB = 100
 
 
 class Destination(ABC):
+    # Formats of the RECORD_BATCH messages the destination can read.
+    record_batch_formats = RECORD_BATCH_FORMATS
+    # If True, batch processing exports the records of RECORD_BATCH messages by columns with
+    # export_batch_dataframe instead of building a dict for each record.
+    batch_dataframe_export = False
+
     def __init__(
         self,
         argument_parser=None,
@@ -114,6 +129,7 @@ class Destination(ABC):
         self.input_file_path = input_file_path
         self.logger = Logger(caller=self, log_to_stdout=log_to_stdout, logger=logger)
         self.partition_keys = None
+        self.record_plans = {}
         self.replication_methods = None
         self.schemas = None
         self.settings_file_path = settings_file_path
@@ -192,6 +208,12 @@ class Destination(ABC):
     def export_batch_data(self, record_data: List[Dict], stream: str, tags: Dict = None) -> None:
         raise NotImplementedError('Subclasses must implement the export_batch_data method.')
 
+    def export_batch_dataframe(self, df, stream: str, tags: Dict = None) -> None:
+        raise NotImplementedError(
+            'Subclasses with batch_dataframe_export must implement the export_batch_dataframe '
+            'method.',
+        )
+
     def export_data(
         self,
         stream: str,
@@ -246,9 +268,9 @@ class Destination(ABC):
             tags = {}
 
         batch_data = [dict(
-            record=self.__validate_and_prepare_record(**rd),
+            record=record,
             stream=stream,
-        ) for rd in record_data]
+        ) for record in self.__validate_and_prepare_records(record_data, stream)]
 
         tags = merge_dict(
             tags,
@@ -280,6 +302,65 @@ class Destination(ABC):
                 tags=tags,
             )
 
+    def process_record_batches(
+        self,
+        record_batch_data: List[Dict],
+        stream: str,
+        tags: Dict = None,
+    ) -> None:
+        """
+        Prepare, validate and export the records of RECORD_BATCH messages by columns. The
+        consecutive record batches with the same schema are exported together.
+        """
+        if tags is None:
+            tags = {}
+
+        should_validate = not self.disable_column_type_check.get(stream, False)
+
+        groups = []
+        for batch_data in record_batch_data:
+            table = batch_data[KEY_RECORD_BATCH]
+            json_columns = get_json_columns(table)
+            if groups and groups[-1]['schema'] is batch_data.get('schema') and \
+                    groups[-1]['json_columns'] == json_columns:
+                groups[-1]['tables'].append(table)
+            else:
+                groups.append(dict(
+                    json_columns=json_columns,
+                    schema=batch_data.get('schema'),
+                    tables=[table],
+                    tags=batch_data.get('tags'),
+                ))
+
+        for group in groups:
+            record_plan = self.__get_record_plan(stream, group['schema'], tags=group['tags'])
+
+            tables = group['tables']
+            try:
+                # Columns with only nulls in a record batch are promoted to the type of the
+                # column in the other record batches.
+                tables = [pa.concat_tables(tables, promote_options='default')]
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                pass
+
+            for table in tables:
+                df = record_plan.prepare_record_batch(table, group['json_columns'])
+                if should_validate:
+                    record_plan.validate_record_batch(table, group['json_columns'], df)
+
+                batch_tags = merge_dict(tags, dict(records=len(df), stream=stream))
+                self.logger.info(
+                    f'{self.__class__.__name__} process record batch for stream {stream} '
+                    'started.',
+                    tags=batch_tags,
+                )
+                self.export_batch_dataframe(df, stream, tags=batch_tags)
+                self.logger.info(
+                    f'{self.__class__.__name__} process record batch for stream {stream} '
+                    'completed.',
+                    tags=batch_tags,
+                )
+
     def process_schema(
         self,
         stream: str,
@@ -319,6 +400,7 @@ class Destination(ABC):
         self.unique_conflict_methods[stream] = row.get(KEY_UNIQUE_CONFLICT_METHOD)
         self.unique_constraints[stream] = row.get(KEY_UNIQUE_CONSTRAINTS)
         self.validators[stream] = Draft4Validator(schema)
+        self.record_plans[stream] = self.__build_record_plan(stream, schema)
 
     def process_state(self, row: Dict, tags: Dict = None) -> None:
         if not tags:
@@ -342,6 +424,7 @@ class Destination(ABC):
         self.disable_column_type_check = {}
         self.key_properties = {}
         self.partition_keys = {}
+        self.record_plans = {}
         self.replication_methods = {}
         self.schemas = {}
         self.unique_conflict_methods = {}
@@ -473,6 +556,26 @@ class Destination(ABC):
                 else:
                     self.process_record(**record_data)
                     final_record_data = record_data
+            elif TYPE_RECORD_BATCH == row_type:
+                record_batch_format = row.get(KEY_FORMAT)
+                if record_batch_format not in self.record_batch_formats:
+                    message = f'Record batch format {record_batch_format} is not supported.'
+                    self.logger.exception(message, tags=tags)
+                    raise Exception(message)
+
+                record_batch_data = {
+                    KEY_RECORD_BATCH: read_record_batch(row[KEY_DATA]),
+                    'schema': schema,
+                    'stream': stream,
+                    'tags': tags,
+                }
+
+                if self.batch_processing:
+                    batches_by_stream[stream]['record_data'].append(record_batch_data)
+                else:
+                    for record_data_item in self.__expand_record_batches([record_batch_data]):
+                        self.process_record(**record_data_item)
+                        final_record_data = record_data_item
             elif TYPE_STATE == row_type:
                 state_data = dict(row=row, tags=tags)
 
@@ -493,8 +596,11 @@ class Destination(ABC):
                 raise Exception(message)
 
             if self.batch_processing:
-                if record_data:
-                    current_byte_size += sys.getsizeof(json.dumps(record_data))
+                if record_data or TYPE_RECORD_BATCH == row_type:
+                    if record_data:
+                        current_byte_size += sys.getsizeof(json.dumps(record_data))
+                    else:
+                        current_byte_size += sys.getsizeof(line)
 
                     if current_byte_size >= self.config.get(
                             'maximum_batch_size_mb', MAXIMUM_BATCH_SIZE_MB) * 1024 * 1024:
@@ -537,19 +643,34 @@ class Destination(ABC):
         for stream, batches in batches_by_stream.items():
             record_data = batches['record_data']
 
-            if len(record_data) >= 1:
-                record_data = self.remove_duplicate_rows(record_data, stream)
+            # The records of a stream only sent in RECORD_BATCH messages are exported by
+            # columns if the destination supports it.
+            export_record_batches = self.batch_dataframe_export and \
+                len(record_data) >= 1 and \
+                all(KEY_RECORD_BATCH in rd for rd in record_data)
+
+            if not export_record_batches:
+                record_data = self.__expand_record_batches(record_data)
+                if len(record_data) >= 1:
+                    record_data = self.remove_duplicate_rows(record_data, stream)
 
             if len(record_data) >= 1:
                 # If there is an error with a stream, catch error so that state can still
                 # be persisted for previously successfully streams
                 try:
-                    self.process_record_data(
-                        record_data,
-                        stream,
-                        tags=tags,
-                    )
-                    final_record_data = record_data[-1]
+                    if export_record_batches:
+                        self.process_record_batches(
+                            record_data,
+                            stream,
+                            tags=tags,
+                        )
+                    else:
+                        self.process_record_data(
+                            record_data,
+                            stream,
+                            tags=tags,
+                        )
+                        final_record_data = record_data[-1]
 
                     states = batches['state_data']
                     if len(states) >= 1:
@@ -606,87 +727,76 @@ class Destination(ABC):
                 sys.stdout.write(text)
                 sys.stdout.flush()
 
-    def __prepare_record(
-        self,
-        stream: str,
-        schema: dict,
-        row: dict,
-        tags: dict = None,
-    ) -> Dict:
-        if not tags:
-            tags = {}
+    def __expand_record_batches(self, record_data: List[Dict]) -> List[Dict]:
+        """
+        Replace the record batches in the record data with their records, each as if it was
+        sent in a RECORD message.
+        """
+        if not any(KEY_RECORD_BATCH in rd for rd in record_data):
+            return record_data
+
+        record_data_expanded = []
+        for rd in record_data:
+            if KEY_RECORD_BATCH not in rd:
+                record_data_expanded.append(rd)
+                continue
 
+            record_data_expanded += [
+                dict(
+                    row={
+                        KEY_RECORD: record,
+                        KEY_STREAM: rd['stream'],
+                        KEY_TYPE: TYPE_RECORD,
+                    },
+                    schema=rd['schema'],
+                    stream=rd['stream'],
+                    tags=rd['tags'],
+                )
+                for record in record_batch_to_records(rd[KEY_RECORD_BATCH])
+            ]
+
+        return record_data_expanded
+
+    def __build_record_plan(self, stream: str, schema: Dict) -> RecordPlan:
+        return RecordPlan(
+            schema,
+            self.validators.get(stream) if self.validators else None,
+            columns_override=self.streams_override_settings.get(
+                STREAM_OVERRIDE_SETTINGS_COLUMNS_KEY,
+            ),
+            extract_columns=bool(
+                self.streams_from_catalog and stream in self.streams_from_catalog,
+            ),
+        )
+
+    def __get_record_plan(self, stream: str, schema: Dict, tags: Dict = None) -> RecordPlan:
         if not stream:
             message = f'Required key {KEY_STREAM} is missing from row.'
-            self.logger.exception(message, tags=tags)
+            self.logger.exception(message, tags=tags or {})
             raise Exception(message)
 
         if not schema:
             message = f'A record for stream {stream} was encountered before a corresponding schema.'
-            self.logger.exception(message, tags=tags)
+            self.logger.exception(message, tags=tags or {})
             raise Exception(message)
 
-        record = row.get(KEY_RECORD)
-
-        record_adjusted = record.copy()
-        if self.streams_from_catalog and stream in self.streams_from_catalog:
-            record_adjusted = extract(record_adjusted, schema['properties'].keys())
-
-        for k in record.keys():
-            if k not in schema['properties']:
-                continue
-
-            prop_k = schema['properties'][k]
-            prop_types = []
-
-            if 'type' in prop_k:
-                prop_types.append(prop_k['type'])
-
-            if 'anyOf' in prop_k:
-                for any_of in prop_k['anyOf']:
-                    any_of_type = any_of.get('type')
-                    if any_of_type is not None:
-                        if type(any_of_type) is list:
-                            prop_types += any_of_type
-                        else:
-                            prop_types.append(any_of_type)
-
-            if COLUMN_TYPE_ARRAY not in prop_types:
-                continue
-
-            v1 = record[k]
-            if not v1:
-                continue
-
-            if type(v1) is list and schema['properties'][k].get('items'):
-                items_dict = schema['properties'][k]['items']
-                item_types = []
+        record_plan = self.record_plans.get(stream)
+        if record_plan is None or record_plan.schema is not schema:
+            record_plan = self.__build_record_plan(stream, schema)
+            self.record_plans[stream] = record_plan
 
-                if 'type' in items_dict:
-                    item_types.append(items_dict['type'])
+        return record_plan
 
-                if 'anyOf' in items_dict:
-                    for any_of in items_dict['anyOf']:
-                        any_of_type = any_of['type']
-                        if type(any_of_type) is list:
-                            item_types += any_of_type
-                        else:
-                            item_types.append(any_of_type)
-
-                if COLUMN_TYPE_OBJECT in item_types:
-                    record_adjusted[k] = [json.loads(s) if type(s) is str else s for s in v1]
-            elif type(v1) is str:
-                try:
-                    record_adjusted[k] = json.loads(v1)
-                except json.decoder.JSONDecodeError:
-                    record_adjusted[k] = ast.literal_eval(v1)
-
-        if STREAM_OVERRIDE_SETTINGS_COLUMNS_KEY in self.streams_override_settings:
-            for k, v in self.streams_override_settings[
-                    STREAM_OVERRIDE_SETTINGS_COLUMNS_KEY].items():
-                record_adjusted[k] = v
+    def __prepare_record(
+        self,
+        stream: str,
+        schema: dict,
+        row: dict,
+        tags: dict = None,
+    ) -> Dict:
+        record_plan = self.__get_record_plan(stream, schema, tags=tags)
 
-        return record_adjusted
+        return record_plan.prepare_record(row.get(KEY_RECORD))
 
     def __text_input(self, input_buffer):
         if self.input_file_path:
@@ -710,26 +820,43 @@ class Destination(ABC):
         row: dict,
         tags: dict = None,
     ) -> Dict:
-        record_adjusted = self.__prepare_record(stream, schema, row, tags or {})
-        schema_properties = schema['properties']
-
-        if not self.disable_column_type_check.get(stream, False):
-            for col, value in record_adjusted.items():
-                column_properties = schema_properties[col]
-                column_types = column_properties.get('type', [])
-
-                valid = False
-                if COLUMN_TYPE_OBJECT in column_types:
-                    valid = type(value) is dict or type(value) is list
-                elif COLUMN_TYPE_ARRAY in column_types:
-                    valid = type(value) is list
-
-                if not valid:
-                    self.validators[stream].validate({
-                        col: value,
-                    })
-
-        return record_adjusted
+        return self.__validate_and_prepare_records(
+            [dict(row=row, schema=schema, stream=stream, tags=tags)],
+            stream,
+        )[0]
+
+    def __validate_and_prepare_records(
+        self,
+        record_data: List[Dict],
+        stream: str,
+    ) -> List[Dict]:
+        should_validate = not self.disable_column_type_check.get(stream, False)
+        records = []
+
+        # Records are prepared and validated in bulk for each run of records with the same
+        # schema; the schema only changes when a new SCHEMA message is received for the stream.
+        start = 0
+        while start < len(record_data):
+            schema = record_data[start].get('schema')
+            end = start + 1
+            while end < len(record_data) and record_data[end].get('schema') is schema:
+                end += 1
+
+            record_plan = self.__get_record_plan(
+                stream,
+                schema,
+                tags=record_data[start].get('tags'),
+            )
+            records_prepared = record_plan.prepare_records(
+                [rd['row'].get(KEY_RECORD) for rd in record_data[start:end]],
+            )
+            if should_validate:
+                record_plan.validate_records(records_prepared)
+
+            records += records_prepared
+            start = end
+
+        return records
 
     @classmethod
     def templates(cls) -> List[Dict]:
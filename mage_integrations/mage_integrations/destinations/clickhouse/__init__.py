@@ -12,6 +12,9 @@ from mage_integrations.destinations.clickhouse.target_clickhouse.target import (
 
 
 class Clickhouse(Destination):
+    # The Singer target reads the input file directly and only supports RECORD messages.
+    record_batch_formats = []
+
     def _process(self, input_buffer) -> None:
         self.config['state_path'] = self.state_file_path
         self.config['load_method'] = TargetLoadMethods.APPEND_ONLY
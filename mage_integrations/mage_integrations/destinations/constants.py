@@ -26,10 +26,13 @@ INTERNAL_COLUMN_SCHEMA = {
 }
 
 KEY_BOOKMARK_PROPERTIES = 'bookmark_properties'
+KEY_DATA = 'data'
 KEY_DISABLE_COLUMN_TYPE_CHECK = 'disable_column_type_check'
+KEY_FORMAT = 'format'
 KEY_KEY_PROPERTIES = 'key_properties'
 KEY_PARTITION_KEYS = 'partition_keys'
 KEY_RECORD = 'record'
+KEY_RECORD_BATCH = 'record_batch'
 KEY_REPLICATION_METHOD = 'replication_method'
 KEY_SCHEMA = 'schema'
 KEY_STREAM = 'stream'
@@ -11,6 +11,9 @@ from mage_integrations.destinations.elasticsearch.target_elasticsearch.target im
 
 
 class Elasticsearch(Destination):
+    # The Singer target reads the input file directly and only supports RECORD messages.
+    record_batch_formats = []
+
     def _process(self, input_buffer) -> None:
         self.config['state_path'] = self.state_file_path
         TargetElasticsearch(config=self.config, logger=self.logger).listen_override(
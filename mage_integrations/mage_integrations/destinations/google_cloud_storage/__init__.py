@@ -9,10 +9,12 @@ import pandas as pd
 from google.cloud.storage import Client
 
 from mage_integrations.destinations.base import Destination
-from mage_integrations.destinations.utils import update_record_with_internal_columns
+from mage_integrations.destinations.utils import update_dataframe_with_internal_columns
 
 
 class GoogleCloudStorage(Destination):
+    batch_dataframe_export = True
+
     @property
     def bucket(self) -> str:
         return self.config['bucket']
@@ -34,12 +36,19 @@ class GoogleCloudStorage(Destination):
         return Client()
 
     def export_batch_data(self, record_data: List[Dict], stream: str, tags: Dict = None) -> None:
+        self.export_batch_dataframe(
+            pd.DataFrame([d['record'] for d in record_data]),
+            stream,
+            tags=tags,
+        )
+
+    def export_batch_dataframe(self, df: pd.DataFrame, stream: str, tags: Dict = None) -> None:
         client = self.build_client()
 
         table_name = self.config.get('table')
 
         tags = dict(
-            records=len(record_data),
+            records=len(df),
             stream=stream,
             table_name=table_name,
         )
@@ -47,10 +56,7 @@ class GoogleCloudStorage(Destination):
         self.logger.info('Export data started', tags=tags)
 
         # Add _mage_created_at and _mage_updated_at columns
-        for r in record_data:
-            r['record'] = update_record_with_internal_columns(r['record'])
-
-        df = pd.DataFrame([d['record'] for d in record_data])
+        df = update_dataframe_with_internal_columns(df)
 
         buffer = BytesIO()
         if self.file_type == 'parquet':
@@ -84,7 +90,7 @@ class GoogleCloudStorage(Destination):
         blob.upload_from_file(buffer)
 
         tags.update(
-            records_inserted=len(record_data),
+            records_inserted=len(df),
         )
 
         self.logger.info('Export data completed.', tags=tags)
@@ -8,6 +8,9 @@ from mage_integrations.destinations.mongodb.target_mongodb.target import TargetM
 
 
 class MongoDb(Destination):
+    # The Singer target reads the input file directly and only supports RECORD messages.
+    record_batch_formats = []
+
     def _process(self, input_buffer) -> None:
         self.config['state_path'] = self.state_file_path
         TargetMongoDb(config=self.config, logger=self.logger).listen_override(
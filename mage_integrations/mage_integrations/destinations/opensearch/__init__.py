@@ -9,6 +9,9 @@ from mage_integrations.destinations.opensearch.target_opensearch.target import (
 
 
 class Opensearch(Destination):
+    # The Singer target reads the input file directly and only supports RECORD messages.
+    record_batch_formats = []
+
     def _process(self, input_buffer) -> None:
         self.config['state_path'] = self.state_file_path
         TargetOpensearch(config=self.config,
@@ -0,0 +1,272 @@
+import ast
+import json
+from typing import Dict, List
+
+import pyarrow as pa
+from jsonschema.validators import Draft4Validator
+
+from mage_integrations.destinations.constants import (
+    COLUMN_TYPE_ARRAY,
+    COLUMN_TYPE_BOOLEAN,
+    COLUMN_TYPE_INTEGER,
+    COLUMN_TYPE_NULL,
+    COLUMN_TYPE_NUMBER,
+    COLUMN_TYPE_OBJECT,
+    COLUMN_TYPE_STRING,
+)
+from mage_integrations.utils.dictionary import extract
+
+# Python types that always pass the JSON schema type check of a column with this type.
+PYTHON_TYPES_BY_COLUMN_TYPE = {
+    COLUMN_TYPE_BOOLEAN: [bool],
+    COLUMN_TYPE_INTEGER: [int],
+    COLUMN_TYPE_NULL: [type(None)],
+    COLUMN_TYPE_NUMBER: [float, int],
+    COLUMN_TYPE_STRING: [str],
+}
+# A record is validated one column at a time, e.g. {col: value}. When neither the top level of
+# the schema nor the column schema has a keyword other than these, only the type of the value
+# decides whether it passes the validator. Draft4Validator doesn't check formats unless it has
+# a format checker.
+COLUMN_SCHEMA_TYPE_KEYWORDS = frozenset(['format', 'type'])
+SCHEMA_TYPE_KEYWORDS = frozenset(['additionalProperties', 'format', 'properties', 'type'])
+VALIDATION_KEYWORDS = frozenset(Draft4Validator.VALIDATORS.keys())
+
+# Scalar values that passed the validator are remembered, up to this number of values, so that
+# repeated values of a column (e.g. null or an enum) are only validated once.
+MAX_VALID_VALUES = 100000
+SCALAR_TYPES = frozenset([bool, float, int, str, type(None)])
+
+
+def _types_from_schema(schema: Dict) -> List:
+    types = []
+
+    if 'type' in schema:
+        types.append(schema['type'])
+
+    if 'anyOf' in schema:
+        for any_of in schema['anyOf']:
+            any_of_type = any_of.get('type')
+            if any_of_type is not None:
+                if type(any_of_type) is list:
+                    types += any_of_type
+                else:
+                    types.append(any_of_type)
+
+    return types
+
+
+def _parse_array_string(value: str):
+    try:
+        return json.loads(value)
+    except json.decoder.JSONDecodeError:
+        return ast.literal_eval(value)
+
+
+def _prepare_array_value(value, parse_items: bool):
+    value_type = type(value)
+    if value and value_type is list:
+        if parse_items:
+            return [json.loads(s) if type(s) is str else s for s in value]
+    elif value and value_type is str:
+        return _parse_array_string(value)
+    return value
+
+
+def _python_types_of_array(array: pa.ChunkedArray) -> frozenset:
+    """
+    The Python types of the values of an Arrow column, or None if they can only be known by
+    converting the values.
+    """
+    arrow_type = array.type
+    if pa.types.is_null(arrow_type):
+        return frozenset([type(None)])
+
+    if pa.types.is_boolean(arrow_type):
+        python_type = bool
+    elif pa.types.is_integer(arrow_type):
+        python_type = int
+    elif pa.types.is_floating(arrow_type):
+        python_type = float
+    elif pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        python_type = str
+    else:
+        return None
+
+    if array.null_count:
+        return frozenset([python_type, type(None)])
+    return frozenset([python_type])
+
+
+class RecordPlan:
+    """
+    Plan compiled once from the schema of a stream to prepare and validate its records.
+
+    Preparing and validating a record used to walk the schema of every column of every record.
+    The plan walks the schema once and records:
+        - the columns whose values are JSON strings to parse,
+        - the Python types that pass the type check of each column without running the JSON
+          schema validator,
+        - the column values overridden by the stream settings.
+    Values that still need the validator are only validated once when they're scalars.
+    """
+
+    def __init__(
+        self,
+        schema: Dict,
+        validator,
+        columns_override: Dict = None,
+        extract_columns: bool = False,
+    ):
+        self.schema = schema
+        self.validator = validator
+        self.columns_override = columns_override or {}
+        self.valid_values = set()
+
+        properties = schema['properties']
+        self.properties_keys = list(properties.keys()) if extract_columns else None
+
+        # Columns with an array type, and whether the objects in their arrays are JSON strings
+        # to parse.
+        self.array_columns = []
+        for col, col_properties in properties.items():
+            if COLUMN_TYPE_ARRAY not in _types_from_schema(col_properties):
+                continue
+
+            items = col_properties.get('items')
+            parse_items = bool(items) and COLUMN_TYPE_OBJECT in _types_from_schema(items)
+            self.array_columns.append((col, parse_items))
+
+        is_simple_schema = not (
+            set(schema.keys()) & (VALIDATION_KEYWORDS - SCHEMA_TYPE_KEYWORDS)
+        ) and COLUMN_TYPE_OBJECT in schema.get('type', COLUMN_TYPE_OBJECT)
+        self.valid_types_by_column = {
+            col: self.__build_valid_types(col_properties, is_simple_schema)
+            for col, col_properties in properties.items()
+        }
+
+    def prepare_record(self, record: Dict) -> Dict:
+        if self.properties_keys is not None:
+            record_adjusted = extract(record, self.properties_keys)
+        else:
+            record_adjusted = record.copy()
+
+        for col, parse_items in self.array_columns:
+            value = record.get(col)
+            if value:
+                record_adjusted[col] = _prepare_array_value(value, parse_items)
+
+        if self.columns_override:
+            record_adjusted.update(self.columns_override)
+
+        return record_adjusted
+
+    def prepare_records(self, records: List[Dict]) -> List[Dict]:
+        return [self.prepare_record(record) for record in records]
+
+    def prepare_record_batch(self, table: pa.Table, json_columns: List[str]):
+        """
+        Prepare the records of a record batch by columns, the same way as prepare_records
+        prepares them one by one.
+
+        Args:
+            table (pa.Table): The columns of the record batch.
+            json_columns (List[str]): The columns whose values are JSON strings.
+
+        Returns:
+            pandas.DataFrame: The prepared records.
+        """
+        if self.properties_keys is not None:
+            table = table.select([col for col in self.properties_keys if col in table.column_names])
+
+        df = table.to_pandas()
+        for col in json_columns:
+            if col in df.columns:
+                df[col] = [
+                    None if v is None else json.loads(v) for v in table.column(col).to_pylist()
+                ]
+
+        for col, parse_items in self.array_columns:
+            if col in df.columns:
+                df[col] = [_prepare_array_value(v, parse_items) for v in df[col].tolist()]
+
+        for col, value in self.columns_override.items():
+            df[col] = [value] * len(df)
+
+        return df
+
+    def validate_record_batch(self, table: pa.Table, json_columns: List[str], df) -> None:
+        """
+        Validate the records of a record batch by columns, the same way as validate_records
+        validates them one by one. The values of a column are only converted when its Arrow
+        type doesn't tell whether they pass the type check.
+
+        Args:
+            table (pa.Table): The columns of the record batch.
+            json_columns (List[str]): The columns whose values are JSON strings.
+            df (pandas.DataFrame): The records prepared with prepare_record_batch.
+        """
+        prepared_columns = set(json_columns) | set(self.columns_override.keys()) | \
+            set(col for col, _ in self.array_columns)
+
+        for col in df.columns:
+            # Raises a KeyError for a column that isn't in the schema.
+            valid_types = self.valid_types_by_column[col]
+
+            if col in prepared_columns:
+                values = df[col].tolist()
+            else:
+                array = table.column(col)
+                python_types = _python_types_of_array(array)
+                if python_types is not None and python_types <= valid_types:
+                    continue
+                values = array.to_pylist()
+
+            invalid_records = [{col: v} for v in values if type(v) not in valid_types]
+            if invalid_records:
+                self.validate_records(invalid_records)
+
+    def validate_records(self, records: List[Dict]) -> None:
+        valid_types_by_column = self.valid_types_by_column
+        valid_values = self.valid_values
+        validate = self.validator.validate
+
+        for record in records:
+            for col, value in record.items():
+                # Raises a KeyError for a column that isn't in the schema.
+                value_type = type(value)
+                if value_type in valid_types_by_column[col]:
+                    continue
+
+                if value_type in SCALAR_TYPES:
+                    # The type is part of the key because True == 1 == 1.0.
+                    key = (col, value_type, value)
+                    if key in valid_values:
+                        continue
+                    validate({col: value})
+                    if len(valid_values) < MAX_VALID_VALUES:
+                        valid_values.add(key)
+                else:
+                    validate({col: value})
+
+    def __build_valid_types(self, col_properties: Dict, is_simple_schema: bool) -> frozenset:
+        column_types = col_properties.get('type', [])
+
+        # Object and array values are accepted without running the validator.
+        if COLUMN_TYPE_OBJECT in column_types:
+            return frozenset([dict, list])
+        elif COLUMN_TYPE_ARRAY in column_types:
+            return frozenset([list])
+
+        if not is_simple_schema or \
+                set(col_properties.keys()) & (VALIDATION_KEYWORDS - COLUMN_SCHEMA_TYPE_KEYWORDS):
+            return frozenset()
+
+        if type(column_types) is not list:
+            column_types = [column_types]
+
+        valid_types = []
+        for column_type in column_types:
+            valid_types += PYTHON_TYPES_BY_COLUMN_TYPE.get(column_type, [])
+
+        return frozenset(valid_types)
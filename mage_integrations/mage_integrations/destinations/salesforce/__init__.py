@@ -15,6 +15,9 @@ from mage_integrations.destinations.salesforce.target_salesforce.target import (
 
 
 class Salesforce(Destination):
+    # The Singer target reads the input file directly and only supports RECORD messages.
+    record_batch_formats = []
+
     def _process(self, input_buffer) -> None:
         self.config['state_path'] = self.state_file_path
         TargetSalesforce(config=self.config, logger=self.logger).listen_override(
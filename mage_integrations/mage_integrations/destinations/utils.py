@@ -38,6 +38,13 @@ def update_record_with_internal_columns(record):
     return record
 
 
+def update_dataframe_with_internal_columns(df):
+    curr_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S.%f')
+    df[INTERNAL_COLUMN_CREATED_AT] = curr_time
+    df[INTERNAL_COLUMN_UPDATED_AT] = curr_time
+    return df
+
+
 def update_destination_state_bookmarks(
     absolute_path_to_destination_state: str,
     stream: str,
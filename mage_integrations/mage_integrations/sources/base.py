@@ -3,6 +3,7 @@ import json
 import os
 import sys
 import traceback
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import datetime
 from os.path import isfile
 from typing import Dict, Generator, List
@@ -16,18 +17,26 @@ from singer.schema import Schema
 
 from mage_integrations.sources.catalog import Catalog, CatalogEntry
 from mage_integrations.sources.constants import (
+    MAX_STREAM_WORKERS_KEY,
     REPLICATION_METHOD_FULL_TABLE,
     REPLICATION_METHOD_INCREMENTAL,
     REPLICATION_METHOD_LOG_BASED,
 )
-from mage_integrations.sources.messages import write_records, write_schema, write_state
+from mage_integrations.sources.messages import (
+    write_record_batch,
+    write_records,
+    write_schema,
+    write_state,
+)
 from mage_integrations.sources.utils import get_standard_metadata, parse_args
 from mage_integrations.utils.array import find_index
 from mage_integrations.utils.dictionary import extract, group_by, merge_dict
 from mage_integrations.utils.files import get_abs_path
 from mage_integrations.utils.logger import Logger
 from mage_integrations.utils.logger.constants import TYPE_SAMPLE_DATA
+from mage_integrations.utils.record_batch import RECORD_BATCH_FORMATS
 from mage_integrations.utils.schema_helpers import extract_selected_columns
+from mage_integrations.utils.stdout import thread_safe_stdout
 
 LOGGER = singer.get_logger()
 
@@ -46,6 +55,7 @@ class Source:
         log_to_stdout: bool = False,
         logger=LOGGER,
         query: Dict = None,
+        record_batch_format: str = None,
         schemas_folder: str = 'schemas',
         selected_streams: List[str] = None,
         settings: Dict = None,
@@ -82,6 +92,8 @@ class Source:
                 test_connection = args.test_connection
             if args.load_sample_data:
                 load_sample_data = args.load_sample_data
+            if args.record_batch_format:
+                record_batch_format = args.record_batch_format
 
         self.catalog = catalog
         self.config = config
@@ -97,6 +109,15 @@ class Source:
             logger=logger,
             verbose=verbose,
         )
+        self.record_batch_format = None
+        if record_batch_format:
+            if record_batch_format in RECORD_BATCH_FORMATS:
+                self.record_batch_format = record_batch_format
+            else:
+                self.logger.info(
+                    f'Record batch format {record_batch_format} is not supported, '
+                    'writing RECORD messages instead.',
+                )
         self.schemas_folder = schemas_folder
         self.selected_streams = selected_streams
         self.settings = settings
@@ -473,47 +494,78 @@ class Source:
             columns = list(properties.keys())
         columns += self.internal_column_schema(stream, bookmarks=bookmarks).keys()
 
-        final_record = None
-        for row in rows:
-            tap_stream_id = stream.tap_stream_id
-            record = {col: row.get(col) for col in columns}
-            write_records(
-                tap_stream_id,
-                [
-                    record,
-                ],
-            )
-            final_record = record
+        tap_stream_id = stream.tap_stream_id
+        is_incremental = stream.replication_method in [
+            REPLICATION_METHOD_INCREMENTAL,
+            REPLICATION_METHOD_LOG_BASED,
+        ] and bookmark_properties
 
-            if (stream.replication_method in [
-                    REPLICATION_METHOD_INCREMENTAL,
-                    REPLICATION_METHOD_LOG_BASED,
-                ]
-                    and bookmark_properties):
+        final_record = None
+        if self.record_batch_format:
+            rows = list(rows)
+            records = [{col: row.get(col) for col in columns} for row in rows]
+            if records:
+                write_record_batch(tap_stream_id, records, columns, self.record_batch_format)
+                final_record = records[-1]
+
+            if is_incremental and rows:
                 if self.is_sorted:
-                    state = {}
-
-                    for _, col in enumerate(bookmark_properties):
-                        singer.write_bookmark(
-                            state,
-                            tap_stream_id,
-                            col,
-                            row.get(col),
-                        )
-
-                    write_state(state)
+                    # All the records are in a single message, so only the bookmark of the
+                    # last row needs to be written.
+                    self.__write_bookmark_state(tap_stream_id, bookmark_properties, rows[-1])
                 else:
-                    # If data unsorted, save max value until end of writes
                     max_bookmark = max(
-                        max_bookmark,
-                        [row.get(col) for col in bookmark_properties],
+                        [max_bookmark] +
+                        [[row.get(col) for col in bookmark_properties] for row in rows],
                     )
+        else:
+            for row in rows:
+                record = {col: row.get(col) for col in columns}
+                write_records(
+                    tap_stream_id,
+                    [
+                        record,
+                    ],
+                )
+                final_record = record
+
+                if is_incremental:
+                    if self.is_sorted:
+                        self.__write_bookmark_state(tap_stream_id, bookmark_properties, row)
+                    else:
+                        # If data unsorted, save max value until end of writes
+                        max_bookmark = max(
+                            max_bookmark,
+                            [row.get(col) for col in bookmark_properties],
+                        )
 
         return dict(
             final_record=final_record,
             max_bookmark=max_bookmark,
         )
 
+    def __write_bookmark_state(
+        self,
+        tap_stream_id: str,
+        bookmark_properties: List[str],
+        row: Dict,
+    ) -> None:
+        state = {}
+
+        for col in bookmark_properties:
+            singer.write_bookmark(
+                state,
+                tap_stream_id,
+                col,
+                row.get(col),
+            )
+
+        write_state(state)
+
+    @property
+    def max_stream_workers(self) -> int:
+        return int((self.config or {}).get(MAX_STREAM_WORKERS_KEY) or 1)
+
     def sync(self, catalog: Catalog, properties: Dict = None) -> None:
         """
         Main method to sync the data.
@@ -522,27 +574,71 @@ class Source:
             1. Process stream: write SCHEMA message.
             2. Sync stream: load data, write RECORD messages and STATE messages.
 
+        When the config has more than 1 max_stream_workers, that many streams are synced at the
+        same time in threads. The messages of each stream are written in order, and each STATE
+        message only has the bookmarks of its own stream.
+
         Args:
             catalog (Catalog): The catalog of streams
             properties (Dict): Optional argument to overwrite stream schema properties
         """
         self.logger.info('Sync started.')
 
-        for stream in catalog.get_selected_streams(self.state or {}):
-            tap_stream_id = stream.tap_stream_id
-            tags = dict(stream=tap_stream_id)
-            self.logger.info(f'Sync for stream {tap_stream_id} started.', tags=tags)
-
-            self.process_stream(stream, properties)
-            record_count = self.sync_stream(stream, properties)
+        streams = list(catalog.get_selected_streams(self.state or {}))
+        max_workers = min(self.max_stream_workers, len(streams))
 
-            self.logger.info(
-                f'Sync for stream {tap_stream_id} completed.',
-                tags=merge_dict(tags, dict(records=record_count)),
-            )
+        if max_workers > 1:
+            self.sync_streams_concurrently(streams, max_workers, properties)
+        else:
+            for stream in streams:
+                self.sync_stream_with_schema(stream, properties)
 
         self.logger.info('Sync completed.')
 
+    def sync_streams_concurrently(
+        self,
+        streams: List,
+        max_workers: int,
+        properties: Dict = None,
+    ) -> None:
+        self.logger.info(
+            f'Sync {len(streams)} streams with {max_workers} workers.',
+            tags=dict(streams=[stream.tap_stream_id for stream in streams]),
+        )
+
+        with thread_safe_stdout(), ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='mage_source_stream',
+        ) as executor:
+            futures = [
+                executor.submit(self.sync_stream_with_schema, stream, properties)
+                for stream in streams
+            ]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+
+            # Stop syncing the streams that haven't started when a stream fails.
+            for future in not_done:
+                future.cancel()
+
+            for future in futures:
+                if future.done() and not future.cancelled() and future.exception():
+                    raise future.exception()
+
+    def sync_stream_with_schema(self, stream, properties: Dict = None) -> int:
+        tap_stream_id = stream.tap_stream_id
+        tags = dict(stream=tap_stream_id)
+        self.logger.info(f'Sync for stream {tap_stream_id} started.', tags=tags)
+
+        self.process_stream(stream, properties)
+        record_count = self.sync_stream(stream, properties)
+
+        self.logger.info(
+            f'Sync for stream {tap_stream_id} completed.',
+            tags=merge_dict(tags, dict(records=record_count)),
+        )
+
+        return record_count
+
     def build_catalog_entry(
         self,
         stream_id: str,
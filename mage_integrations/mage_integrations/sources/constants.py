@@ -44,3 +44,12 @@ BATCH_FETCH_LIMIT = 50000
 SUBBATCH_FETCH_LIMIT = 10000
 BATCH_FETCH_LIMIT_KEY = 'batch_fetch_limit'
 SUBBATCH_FETCH_LIMIT_KEY = 'subbatch_fetch_limit'
+# Number of streams synced at the same time by a source.
+MAX_STREAM_WORKERS_KEY = 'max_stream_workers'
+# Read the tables of SQL sources in pages that start after the key of the last row read,
+# instead of with an offset.
+KEYSET_PAGINATION_KEY = 'keyset_pagination'
+# Number of key ranges of a full table read at the same time with keyset pagination.
+KEYSET_PARTITIONS_KEY = 'keyset_partitions'
+# Bookmark with the key ranges left to read by a full table sync with keyset pagination.
+BOOKMARK_KEY_KEYSET = 'keyset'
@@ -1,4 +1,6 @@
+from mage_integrations.utils.logger.constants import TYPE_RECORD_BATCH
 from mage_integrations.utils.parsers import encode_complex
+from mage_integrations.utils.record_batch import encode_record_batch
 from singer.messages import (
     RecordMessage,
     SchemaMessage as SchemaMessageOriginal,
@@ -120,6 +122,23 @@ def write_records(stream_name, records):
         write_record(stream_name, record)
 
 
+def write_record_batch(stream_name, records, columns, record_batch_format):
+    """Write the records for the given stream as a single RECORD_BATCH message.
+
+    The RECORD_BATCH message has the same effect as a RECORD message for each record.
+    Destinations that don't support the record batch format can only read RECORD messages.
+
+    write_record_batch("users", [chris, mike], ["id", "email"], "arrow")
+    """
+    sys.stdout.write(simplejson.dumps(dict(
+        data=encode_record_batch(records, columns),
+        format=record_batch_format,
+        stream=stream_name,
+        type=TYPE_RECORD_BATCH,
+    )) + '\n')
+    sys.stdout.flush()
+
+
 def write_state(value):
     """Write a state message.
 
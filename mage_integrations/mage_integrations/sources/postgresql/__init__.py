@@ -158,7 +158,7 @@ WHERE
 
     def get_columns(self, table_name: str) -> List[str]:
         schema_name = self.config['schema']
-        results = self.build_connection().load(f"""
+        results = self._build_pooled_connection().load(f"""
 SELECT
     column_name
     , data_type
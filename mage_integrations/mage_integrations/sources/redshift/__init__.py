@@ -66,7 +66,7 @@ WHERE schemaname = '{schema}'
             table_names = ', '.join([f"'{n}'" for n in streams])
             query = f'{query}\nAND tablename IN ({table_names})'
 
-        rows = self.build_connection().execute([
+        rows = self._build_pooled_connection().execute([
             f'SET search_path TO {schema}',
             query,
         ])
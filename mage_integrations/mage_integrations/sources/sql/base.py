@@ -1,13 +1,19 @@
+import math
+import queue
+import threading
 from time import sleep
 from typing import Any, Dict, Generator, List, Tuple
 
+import singer
 from singer.schema import Schema
 
+from mage_integrations.connections.utils.pool import ConnectionPool
 from mage_integrations.sources.base import Source as BaseSource
 from mage_integrations.sources.catalog import Catalog, CatalogEntry
 from mage_integrations.sources.constants import (
     BATCH_FETCH_LIMIT,
     BATCH_FETCH_LIMIT_KEY,
+    BOOKMARK_KEY_KEYSET,
     COLUMN_FORMAT_DATETIME,
     COLUMN_FORMAT_UUID,
     COLUMN_TYPE_BOOLEAN,
@@ -16,11 +22,14 @@ from mage_integrations.sources.constants import (
     COLUMN_TYPE_NUMBER,
     COLUMN_TYPE_OBJECT,
     COLUMN_TYPE_STRING,
+    KEYSET_PAGINATION_KEY,
+    KEYSET_PARTITIONS_KEY,
     REPLICATION_METHOD_FULL_TABLE,
     REPLICATION_METHOD_LOG_BASED,
     SUBBATCH_FETCH_LIMIT_KEY,
     UNIQUE_CONFLICT_METHOD_UPDATE,
 )
+from mage_integrations.sources.messages import write_state
 from mage_integrations.sources.sql.utils import (
     build_comparison_statement,
     column_type_mapping,
@@ -38,6 +47,8 @@ from mage_integrations.utils.schema_helpers import (
 
 
 class Source(BaseSource):
+    connection_pool = None
+
     @property
     def fetch_limit(self):
         config = self.config or dict()
@@ -47,6 +58,14 @@ class Source(BaseSource):
             BATCH_FETCH_LIMIT
         )
 
+    @property
+    def keyset_pagination(self) -> bool:
+        return bool((self.config or {}).get(KEYSET_PAGINATION_KEY))
+
+    @property
+    def keyset_partitions(self) -> int:
+        return int((self.config or {}).get(KEYSET_PARTITIONS_KEY) or 1)
+
     @property
     def table_prefix(self):
         return ''
@@ -57,7 +76,7 @@ class Source(BaseSource):
     def discover(self, streams: List[str] = None) -> Catalog:
         query = self.build_discover_query(streams=streams)
 
-        rows = self.build_connection().load(query)
+        rows = self._build_pooled_connection().load(query)
         groups = group_by(lambda t: t[0], rows)
 
         streams = []
@@ -171,6 +190,15 @@ class Source(BaseSource):
         )
         return rows[0]['number_of_records']
 
+    def process(self) -> None:
+        # The queries to discover, count and sync the streams reuse the open connections.
+        self.connection_pool = ConnectionPool(max_size=self.max_stream_workers)
+        try:
+            super().process()
+        finally:
+            self.connection_pool.close()
+            self.connection_pool = None
+
     def load_data(
         self,
         stream,
@@ -190,6 +218,18 @@ class Source(BaseSource):
                 yield data
             return
 
+        keyset_columns = self._get_keyset_columns(stream, query=query)
+        if keyset_columns:
+            for rows in self.load_data_with_keyset(
+                stream,
+                keyset_columns,
+                bookmarks=bookmarks,
+                query=query,
+            ):
+                yield rows
+            self._after_load_data(stream)
+            return
+
         rows_temp = None
         loops = 0
 
@@ -220,6 +260,86 @@ class Source(BaseSource):
         if not query.get('_limit'):
             self._after_load_data(stream)
 
+    def load_data_with_keyset(
+        self,
+        stream,
+        keyset_columns: List[str],
+        bookmarks: Dict = None,
+        query: Dict = None,
+    ) -> Generator[List[Dict], None, None]:
+        """
+        Load the rows of a stream in pages ordered by the keyset columns, where each page starts
+        after the keyset values of the last row of the previous page. Unlike an offset, the
+        database doesn't scan the rows of the previous pages to find where a page starts.
+
+        A full table sync writes a STATE message with the position of the sync after each page,
+        so that a sync that fails is resumed from the last page written. When the config has more
+        than 1 keyset_partitions and the first keyset column is an integer, the table is split
+        into that many key ranges read at the same time.
+
+        Args:
+            stream (TYPE): The stream object.
+            keyset_columns (List[str]): Columns that order and uniquely identify the rows.
+            bookmarks (Dict, optional): Bookmarks for the stream id.
+            query (Dict, optional): Column values to filter the rows with.
+        """
+        tap_stream_id = stream.tap_stream_id
+        is_full_table = REPLICATION_METHOD_FULL_TABLE == self._replication_method(
+            stream,
+            bookmarks=bookmarks,
+        )
+
+        partitions = self.__get_keyset_partitions_from_state(stream) if is_full_table else None
+        if partitions is None:
+            partitions = [dict(after=None, start=None, stop=None)]
+            if is_full_table and self.keyset_partitions > 1 and self.__is_integer_column(
+                stream,
+                keyset_columns[0],
+            ):
+                partitions = self.__build_keyset_partitions(
+                    stream,
+                    keyset_columns[0],
+                    bookmarks=bookmarks,
+                    query=query,
+                )
+
+        self.logger.info(
+            f'Load data for stream {tap_stream_id} with keyset pagination.',
+            tags=dict(
+                keyset_columns=keyset_columns,
+                partitions=len(partitions),
+                stream=tap_stream_id,
+            ),
+        )
+
+        if len(partitions) >= 2:
+            pages = self.__load_keyset_partitions_concurrently(
+                stream,
+                partitions,
+                bookmarks=bookmarks,
+                query=query,
+            )
+        else:
+            pages = (
+                (0, rows, after) for rows, after in self.__load_keyset_partition(
+                    stream,
+                    partitions[0],
+                    bookmarks=bookmarks,
+                    query=query,
+                )
+            )
+
+        for index, rows, after in pages:
+            yield rows
+
+            # The rows of the page have been written, the next sync can start after them.
+            partitions[index]['after'] = after
+            if is_full_table:
+                self.__write_keyset_state(tap_stream_id, partitions)
+
+        if is_full_table:
+            self.__write_keyset_state(tap_stream_id, None)
+
     def load_data_from_logs(
         self,
         stream,
@@ -270,6 +390,52 @@ WHERE table_schema = '{schema}'
     def _after_load_data(self, stream):
         pass
 
+    def _get_keyset_columns(self, stream, query: Dict = None) -> List[str]:
+        """
+        Columns to paginate the rows of the stream with, or None when the rows are paginated with
+        an offset. Keyset pagination is used when it's enabled in the config, the query doesn't
+        have its own limit or offset, and the ordered columns include a unique key of the stream.
+
+        A row with a null keyset value is never after the keyset values of a page, so it would be
+        skipped. Only the key properties and the columns that can't be null are used as keyset
+        columns; otherwise the rows are paginated with an offset.
+        """
+        if not self.keyset_pagination or query and (
+            query.get('_limit') is not None or query.get('_offset') is not None
+        ):
+            return None
+
+        if not stream.key_properties and not stream.unique_constraints:
+            return None
+
+        columns = extract_selected_columns(stream.metadata)
+        order_by_columns = self.__get_order_by_columns(stream, columns)
+        if not order_by_columns or any(col not in columns for col in order_by_columns):
+            self.logger.info(
+                f'Keyset pagination requires the columns {order_by_columns} to be selected, '
+                f'stream {stream.tap_stream_id} is read with an offset instead.',
+            )
+            return None
+
+        key_properties = stream.key_properties or []
+        nullable_columns = [
+            col for col in order_by_columns
+            if col not in key_properties and self.__is_nullable_column(stream, col)
+        ]
+        if nullable_columns:
+            self.logger.info(
+                f'Keyset pagination requires the columns {nullable_columns} to not be null, '
+                f'stream {stream.tap_stream_id} is read with an offset instead.',
+            )
+            return None
+
+        return order_by_columns
+
+    def _build_pooled_connection(self, connection_pool: ConnectionPool = None):
+        connection = self.build_connection()
+        connection.connection_pool = connection_pool or self.connection_pool
+        return connection
+
     def _limit_query_string(self, limit, offset):
         return f'LIMIT {limit} OFFSET {offset}'
 
@@ -292,6 +458,8 @@ WHERE table_schema = '{schema}'
         count_records: bool = False,
         limit: int = None,
         offset: int = 0,
+        keyset_partition: Dict = None,
+        connection_pool: ConnectionPool = None,
     ) -> Tuple[List[Dict], List[Any]]:
         if query is None:
             query = {}
@@ -301,10 +469,73 @@ WHERE table_schema = '{schema}'
 
         table_name = stream.tap_stream_id
 
+        columns = extract_selected_columns(stream.metadata)
+        clean_columns = self.update_column_names(columns)
+
+        order_by_columns = self.__get_order_by_columns(stream, columns)
+        clean_order_by_columns = self.update_column_names(order_by_columns)
+
+        if clean_order_by_columns and not count_records:
+            order_by_statement = f"ORDER BY {', '.join(clean_order_by_columns)}"
+        else:
+            order_by_statement = ''
+
+        if count_records:
+            columns_statement = 'COUNT(*) AS number_of_records'
+        else:
+            columns_statement = '\n, '.join(clean_columns)
+
+        query_string = '\n'.join([
+            'SELECT',
+            columns_statement,
+            f'FROM {self.build_table_name(stream)}',
+        ])
+
+        where_statements = self.__build_where_statements(stream, columns, bookmarks, query)
+        if keyset_partition:
+            where_statements += self.__build_keyset_statements(
+                stream,
+                order_by_columns,
+                keyset_partition,
+            )
+
+        if where_statements:
+            where_statement = ' AND '.join(where_statements)
+            query_string = f"{query_string}\nWHERE {where_statement}"
+
+        with_limit_query_string = [
+            query_string,
+            order_by_statement,
+        ]
+
+        if count_records:
+            self.logger.info(f'Counting records for {table_name} started.', tags=dict(
+                stream=table_name,
+            ))
+        else:
+            with_limit_query_string += [
+                self._limit_query_string(limit, offset),
+            ]
+        with_limit_query_string = '\n'.join(with_limit_query_string)
+
+        connection = self._build_pooled_connection(connection_pool)
+        rows_temp = connection.load(with_limit_query_string)
+        if count_records:
+            rows = [dict(number_of_records=row[0]) for row in rows_temp]
+            self.logger.info(f'Counting records for {table_name} completed.', tags=dict(
+                query=with_limit_query_string,
+                records=rows[0]['number_of_records'],
+                stream=table_name,
+            ))
+        else:
+            rows = self._convert_to_rows(columns, rows_temp)
+
+        return rows, rows_temp
+
+    def __get_order_by_columns(self, stream, columns: List[str]) -> List[str]:
         key_properties = stream.key_properties
         unique_constraints = stream.unique_constraints
         bookmark_properties = self._get_bookmark_properties_for_stream(stream)
-        bookmark_property_operators = stream.bookmark_property_operators
 
         # Don’t use a Set; they are unordered
         order_by_columns = []
@@ -322,9 +553,6 @@ WHERE table_schema = '{schema}'
                 if col not in order_by_columns:
                     order_by_columns.append(col)
 
-        columns = extract_selected_columns(stream.metadata)
-        clean_columns = self.update_column_names(columns)
-
         if not order_by_columns:
             order_by_columns = filter_columns(
                 columns,
@@ -336,23 +564,19 @@ WHERE table_schema = '{schema}'
                     COLUMN_TYPE_STRING,
                 ],
             )
-        order_by_columns = self.update_column_names(order_by_columns)
-
-        if order_by_columns and not count_records:
-            order_by_statement = f"ORDER BY {', '.join(order_by_columns)}"
-        else:
-            order_by_statement = ''
 
-        if count_records:
-            columns_statement = 'COUNT(*) AS number_of_records'
-        else:
-            columns_statement = '\n, '.join(clean_columns)
+        return order_by_columns
 
-        query_string = '\n'.join([
-            'SELECT',
-            columns_statement,
-            f'FROM {self.build_table_name(stream)}',
-        ])
+    def __build_where_statements(
+        self,
+        stream,
+        columns: List[str],
+        bookmarks: Dict = None,
+        query: Dict = None,
+    ) -> List[str]:
+        unique_constraints = stream.unique_constraints
+        bookmark_properties = self._get_bookmark_properties_for_stream(stream)
+        bookmark_property_operators = stream.bookmark_property_operators
 
         where_statements = []
         if bookmarks:
@@ -392,37 +616,248 @@ WHERE table_schema = '{schema}'
                         )
                     )
 
-        if where_statements:
-            where_statement = ' AND '.join(where_statements)
-            query_string = f"{query_string}\nWHERE {where_statement}"
+        return where_statements
 
-        with_limit_query_string = [
-            query_string,
-            order_by_statement,
-        ]
-
-        if count_records:
-            self.logger.info(f'Counting records for {table_name} started.', tags=dict(
-                stream=table_name,
+    def __build_keyset_statements(
+        self,
+        stream,
+        keyset_columns: List[str],
+        keyset_partition: Dict,
+    ) -> List[str]:
+        properties = stream.schema.to_dict()['properties']
+        statements = []
+
+        start = keyset_partition.get('start')
+        if start is not None:
+            statements.append(self._build_comparison_statement(
+                keyset_columns[0],
+                start,
+                properties,
+                operator='>=',
             ))
-        else:
-            with_limit_query_string += [
-                self._limit_query_string(limit, offset),
-            ]
-        with_limit_query_string = '\n'.join(with_limit_query_string)
 
-        rows_temp = self.build_connection().load(with_limit_query_string)
-        if count_records:
-            rows = [dict(number_of_records=row[0]) for row in rows_temp]
-            self.logger.info(f'Counting records for {table_name} completed.', tags=dict(
-                query=with_limit_query_string,
-                records=rows[0]['number_of_records'],
-                stream=table_name,
+        stop = keyset_partition.get('stop')
+        if stop is not None:
+            statements.append(self._build_comparison_statement(
+                keyset_columns[0],
+                stop,
+                properties,
+                operator='<',
             ))
+
+        after = keyset_partition.get('after')
+        if after:
+            # (a, b) > (1, 2) is written as a > 1 OR (a = 1 AND b > 2), because not all the
+            # databases support comparing row values.
+            or_statements = []
+            for idx, col in enumerate(keyset_columns):
+                and_statements = [
+                    self._build_comparison_statement(c, after.get(c), properties)
+                    for c in keyset_columns[:idx]
+                ]
+                and_statements.append(self._build_comparison_statement(
+                    col,
+                    after.get(col),
+                    properties,
+                    operator='>',
+                ))
+                or_statements.append(f"({' AND '.join(and_statements)})")
+            statements.append(f"({' OR '.join(or_statements)})")
+
+        return statements
+
+    def __load_keyset_partition(
+        self,
+        stream,
+        keyset_partition: Dict,
+        bookmarks: Dict = None,
+        query: Dict = None,
+        connection_pool: ConnectionPool = None,
+    ) -> Generator[Tuple[List[Dict], Dict], None, None]:
+        keyset_columns = self.__get_order_by_columns(
+            stream,
+            extract_selected_columns(stream.metadata),
+        )
+        keyset_partition = keyset_partition.copy()
+        limit = self.fetch_limit
+        loops = 0
+
+        while True:
+            if loops >= 1:
+                sleep(1)
+
+            rows, rows_temp = self.__fetch_rows(
+                stream,
+                bookmarks,
+                query,
+                limit=limit,
+                keyset_partition=keyset_partition,
+                connection_pool=connection_pool,
+            )
+            if not rows:
+                break
+
+            keyset_partition['after'] = {col: rows[-1].get(col) for col in keyset_columns}
+            yield rows, keyset_partition['after']
+
+            loops += 1
+
+            if len(rows_temp) < limit:
+                break
+
+    def __load_keyset_partitions_concurrently(
+        self,
+        stream,
+        keyset_partitions: List[Dict],
+        bookmarks: Dict = None,
+        query: Dict = None,
+    ) -> Generator[Tuple[int, List[Dict], Dict], None, None]:
+        # At most 1 page per partition waits to be written, so that the memory used is bounded.
+        pages = queue.Queue(maxsize=len(keyset_partitions))
+        stopped = threading.Event()
+
+        def put(item) -> bool:
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def load_partition(index: int, keyset_partition: Dict, connection_pool) -> None:
+            try:
+                for rows, after in self.__load_keyset_partition(
+                    stream,
+                    keyset_partition,
+                    bookmarks=bookmarks,
+                    query=query,
+                    connection_pool=connection_pool,
+                ):
+                    if not put((index, rows, after, None)):
+                        return
+                put((index, None, None, None))
+            except Exception as err:
+                put((index, None, None, err))
+
+        connection_pool = self.connection_pool
+        if connection_pool is None:
+            connection_pool = ConnectionPool(max_size=len(keyset_partitions))
         else:
-            rows = self._convert_to_rows(columns, rows_temp)
+            connection_pool.reserve(len(keyset_partitions))
+
+        threads = [
+            threading.Thread(
+                args=(index, keyset_partition, connection_pool),
+                daemon=True,
+                name=f'mage_source_keyset_partition_{index}',
+                target=load_partition,
+            )
+            for index, keyset_partition in enumerate(keyset_partitions)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            partitions_loading = len(threads)
+            while partitions_loading >= 1:
+                index, rows, after, err = pages.get()
+                if err is not None:
+                    raise err
+                elif rows is None:
+                    partitions_loading -= 1
+                else:
+                    yield index, rows, after
+        finally:
+            stopped.set()
+            for thread in threads:
+                thread.join()
+            if connection_pool is not self.connection_pool:
+                connection_pool.close()
+
+    def __build_keyset_partitions(
+        self,
+        stream,
+        column: str,
+        bookmarks: Dict = None,
+        query: Dict = None,
+    ) -> List[Dict]:
+        columns = extract_selected_columns(stream.metadata)
+        clean_column = self.update_column_names([column])[0]
 
-        return rows, rows_temp
+        query_string = '\n'.join([
+            'SELECT',
+            f'MIN({clean_column})',
+            f', MAX({clean_column})',
+            f'FROM {self.build_table_name(stream)}',
+        ])
+        where_statements = self.__build_where_statements(stream, columns, bookmarks, query)
+        if where_statements:
+            query_string = f"{query_string}\nWHERE {' AND '.join(where_statements)}"
+
+        rows = self._build_pooled_connection().load(query_string)
+        min_value, max_value = rows[0] if rows else (None, None)
+
+        if min_value is None or max_value is None:
+            return [dict(after=None, start=None, stop=None)]
+
+        min_value = int(min_value)
+        max_value = int(max_value)
+        step = max(math.ceil((max_value - min_value + 1) / self.keyset_partitions), 1)
+
+        # The first and last partitions are unbounded, so that the rows added outside of the
+        # range while the table is read are still read.
+        partitions = []
+        for start in range(min_value, max_value + 1, step):
+            partitions.append(dict(after=None, start=start, stop=start + step))
+        partitions[0]['start'] = None
+        partitions[-1]['stop'] = None
+
+        return partitions
+
+    def __get_keyset_partitions_from_state(self, stream) -> List[Dict]:
+        bookmarks = ((self.state or {}).get('bookmarks') or {}).get(stream.tap_stream_id) or {}
+        partitions = bookmarks.get(BOOKMARK_KEY_KEYSET)
+
+        if not partitions or type(partitions) is not list or \
+                any(type(partition) is not dict for partition in partitions):
+            return None
+
+        return [
+            dict(
+                after=partition.get('after'),
+                start=partition.get('start'),
+                stop=partition.get('stop'),
+            )
+            for partition in partitions
+        ]
+
+    def __is_integer_column(self, stream, column: str) -> bool:
+        column_properties = stream.schema.to_dict()['properties'].get(column) or {}
+        column_types = column_properties.get('type') or []
+        if type(column_types) is not list:
+            column_types = [column_types]
+
+        return COLUMN_TYPE_INTEGER in column_types
+
+    def __is_nullable_column(self, stream, column: str) -> bool:
+        column_properties = stream.schema.to_dict()['properties'].get(column) or {}
+        column_types = column_properties.get('type')
+        if not column_types:
+            return True
+        if type(column_types) is not list:
+            column_types = [column_types]
+
+        return COLUMN_TYPE_NULL in column_types or None in column_types
+
+    def __write_keyset_state(self, tap_stream_id: str, keyset_partitions: List[Dict]) -> None:
+        state = singer.write_bookmark(
+            {},
+            tap_stream_id,
+            BOOKMARK_KEY_KEYSET,
+            keyset_partitions,
+        )
+        write_state(state)
 
     def _build_comparison_statement(
         self,
@@ -259,6 +259,13 @@ def parse_args(required_config_keys):
         help='Set this flag to True to load sample data from the provided config.'
     )
 
+    parser.add_argument(
+        '--record_batch_format',
+        help='Write the records of each batch in a single RECORD_BATCH message using this '
+             'format (e.g. arrow) instead of one RECORD message per record. Only set it when '
+             'the destination supports the format.',
+    )
+
     args, _ = parser.parse_known_args()
 
     if args.state:
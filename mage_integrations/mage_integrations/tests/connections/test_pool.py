@@ -0,0 +1,58 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from mage_integrations.connections.utils.pool import ConnectionPool
+
+
+class ConnectionPoolTests(unittest.TestCase):
+    def test_connection_is_reused(self):
+        pool = ConnectionPool(max_size=1)
+        build_connection = MagicMock(side_effect=lambda: MagicMock())
+        close_connection = MagicMock()
+
+        with pool.connection(build_connection, close_connection) as connection1:
+            pass
+        with pool.connection(build_connection, close_connection) as connection2:
+            pass
+
+        self.assertIs(connection1, connection2)
+        build_connection.assert_called_once()
+        connection1.rollback.assert_called()
+        close_connection.assert_not_called()
+
+        pool.close()
+        close_connection.assert_called_once_with(connection1)
+
+    def test_connection_is_closed_after_error(self):
+        pool = ConnectionPool(max_size=1)
+        close_connection = MagicMock()
+
+        with self.assertRaises(Exception):
+            with pool.connection(MagicMock, close_connection) as connection:
+                raise Exception('Query failed')
+
+        close_connection.assert_called_once_with(connection)
+        self.assertEqual(pool.idle_connections, [])
+
+    def test_connections_used_at_the_same_time(self):
+        pool = ConnectionPool(max_size=1)
+        build_connection = MagicMock(side_effect=lambda: MagicMock())
+        close_connection = MagicMock()
+        barrier = threading.Barrier(2)
+        connections = []
+
+        def _use_connection():
+            with pool.connection(build_connection, close_connection) as connection:
+                connections.append(connection)
+                barrier.wait()
+
+        threads = [threading.Thread(target=_use_connection) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIsNot(connections[0], connections[1])
+        self.assertEqual(len(pool.idle_connections), 1)
+        close_connection.assert_called_once()
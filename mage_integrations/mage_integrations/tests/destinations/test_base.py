@@ -1,10 +1,12 @@
 import io
+import json
 import unittest
 from abc import ABC, abstractmethod
 from typing import Dict, List
 from unittest.mock import MagicMock, patch
 
 from mage_integrations.destinations.base import Destination
+from mage_integrations.utils.record_batch import encode_record_batch
 
 SAMPLE_RECORD = {
     'id': 2,
@@ -209,3 +211,90 @@ class DestinationTests(unittest.TestCase):
             mock_process.assert_called_once_with(input_buffer)
             destination.before_process.assert_called_once()
             destination.after_process.assert_called_once()
+
+    def test__process_record_batch(self):
+        destination = build_test_destination()
+        destination.batch_processing = True
+        records = [
+            SAMPLE_RECORD,
+            dict(SAMPLE_RECORD, id=3, first_name='kimberly', power_level=None),
+        ]
+        record_batch_row = dict(
+            data=encode_record_batch(records, list(SAMPLE_RECORD.keys())),
+            format='arrow',
+            stream=SAMPLE_STREAM_NAME,
+            type='RECORD_BATCH',
+        )
+        input_buffer = io.BytesIO('\n'.join([
+            json.dumps(SAMPLE_SCHEMA_ROW),
+            json.dumps(record_batch_row),
+        ]).encode())
+
+        with patch.object(destination, 'process_record_data') as mock_process_record_data:
+            destination._process(input_buffer)
+
+            mock_process_record_data.assert_called_once()
+            record_data = mock_process_record_data.call_args[0][0]
+            self.assertEqual(
+                [d['row'] for d in record_data],
+                [dict(record=r, stream=SAMPLE_STREAM_NAME, type='RECORD') for r in records],
+            )
+
+    def test__process_record_batch_by_columns(self):
+        destination = build_test_destination()
+        destination.batch_processing = True
+        destination.batch_dataframe_export = True
+        destination.export_batch_dataframe = MagicMock()
+        records = [
+            dict(SAMPLE_RECORD, id='2'),
+            dict(SAMPLE_RECORD, id='3', first_name='kimberly', power_level=None),
+        ]
+        lines = [json.dumps(dict(SAMPLE_SCHEMA_ROW, disable_column_type_check=False))]
+        for record in records:
+            lines.append(json.dumps(dict(
+                data=encode_record_batch([record], list(SAMPLE_RECORD.keys())),
+                format='arrow',
+                stream=SAMPLE_STREAM_NAME,
+                type='RECORD_BATCH',
+            )))
+
+        with patch.object(destination, 'process_record_data') as mock_process_record_data:
+            destination._process(io.BytesIO('\n'.join(lines).encode()))
+            mock_process_record_data.assert_not_called()
+
+        # The record batches are exported together.
+        destination.export_batch_dataframe.assert_called_once()
+        df = destination.export_batch_dataframe.call_args[0][0]
+        self.assertEqual(df['id'].tolist(), ['2', '3'])
+        self.assertEqual(df['first_name'].tolist(), ['jason', 'kimberly'])
+
+        # The records are validated.
+        destination.export_batch_dataframe.reset_mock()
+        lines[1] = json.dumps(dict(
+            data=encode_record_batch(
+                [dict(SAMPLE_RECORD, id='2', morphed='yes')],
+                list(SAMPLE_RECORD.keys()),
+            ),
+            format='arrow',
+            stream=SAMPLE_STREAM_NAME,
+            type='RECORD_BATCH',
+        ))
+        with self.assertRaises(Exception):
+            destination._process(io.BytesIO('\n'.join(lines).encode()))
+        destination.export_batch_dataframe.assert_not_called()
+
+    def test__process_record_batch_unsupported_format(self):
+        destination = build_test_destination()
+        destination.record_batch_formats = []
+        input_buffer = io.BytesIO('\n'.join([
+            json.dumps(SAMPLE_SCHEMA_ROW),
+            json.dumps(dict(
+                data=encode_record_batch([SAMPLE_RECORD], list(SAMPLE_RECORD.keys())),
+                format='arrow',
+                stream=SAMPLE_STREAM_NAME,
+                type='RECORD_BATCH',
+            )),
+        ]).encode())
+
+        with self.assertRaises(Exception):
+            destination._process(input_buffer)
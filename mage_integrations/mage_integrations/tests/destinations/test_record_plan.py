@@ -0,0 +1,135 @@
+import unittest
+
+import pyarrow as pa
+from jsonschema.exceptions import ValidationError
+from jsonschema.validators import Draft4Validator
+
+from mage_integrations.destinations.record_plan import RecordPlan
+
+SAMPLE_SCHEMA = {
+    'properties': {
+        'id': {'type': ['null', 'integer']},
+        'color': {'type': ['null', 'string'], 'maxLength': 5},
+        'date_joined': {'format': 'date-time', 'type': ['string']},
+        'friends': {
+            'items': {'anyOf': [{'type': ['object']}]},
+            'type': 'array',
+        },
+        'power_level': {'type': ['null', 'number']},
+        'settings': {'type': ['null', 'object']},
+        'tags': {'type': 'array'},
+    },
+    'type': 'object',
+}
+
+
+def build_record_plan(schema=None, **kwargs):
+    schema = schema or SAMPLE_SCHEMA
+    return RecordPlan(schema, Draft4Validator(schema), **kwargs)
+
+
+class RecordPlanTests(unittest.TestCase):
+    def test_prepare_record(self):
+        record_plan = build_record_plan(columns_override=dict(color='blue'))
+        record = dict(
+            id=1,
+            color='red',
+            friends=['{"id": 2}', dict(id=3)],
+            tags="['a', 'b']",
+        )
+
+        self.assertEqual(
+            record_plan.prepare_records([record]),
+            [dict(
+                id=1,
+                color='blue',
+                friends=[dict(id=2), dict(id=3)],
+                tags=['a', 'b'],
+            )],
+        )
+        self.assertEqual(record['tags'], "['a', 'b']")
+
+    def test_prepare_record_extract_columns(self):
+        record_plan = build_record_plan(extract_columns=True)
+
+        self.assertEqual(
+            record_plan.prepare_record(dict(id=1, color=None, unknown='a', tags='["a"]')),
+            dict(id=1, tags=['a']),
+        )
+
+    def test_valid_types_by_column(self):
+        record_plan = build_record_plan()
+
+        self.assertEqual(record_plan.valid_types_by_column['id'], frozenset([int, type(None)]))
+        self.assertEqual(record_plan.valid_types_by_column['color'], frozenset())
+        self.assertEqual(record_plan.valid_types_by_column['date_joined'], frozenset([str]))
+        self.assertEqual(record_plan.valid_types_by_column['power_level'], frozenset([
+            float,
+            int,
+            type(None),
+        ]))
+        self.assertEqual(record_plan.valid_types_by_column['settings'], frozenset([dict, list]))
+
+    def test_valid_types_by_column_with_schema_constraints(self):
+        schema = dict(SAMPLE_SCHEMA, required=['id'])
+        record_plan = build_record_plan(schema)
+
+        self.assertEqual(record_plan.valid_types_by_column['id'], frozenset())
+        with self.assertRaises(ValidationError):
+            record_plan.validate_records([dict(power_level=1)])
+
+    def test_validate_records(self):
+        record_plan = build_record_plan()
+        record_plan.validate_records([
+            dict(id=1, color='red', date_joined='2023-01-01', power_level=1.5, settings=[]),
+            dict(id=None, color='red', power_level=None, settings=None),
+        ])
+        self.assertIn(('color', str, 'red'), record_plan.valid_values)
+
+        for record in [
+            dict(id=True),
+            dict(id=1.5),
+            dict(color='purple'),
+            dict(date_joined=None),
+            dict(power_level='1'),
+        ]:
+            with self.assertRaises(ValidationError):
+                record_plan.validate_records([record])
+
+        with self.assertRaises(KeyError):
+            record_plan.validate_records([dict(unknown=1)])
+
+    def test_prepare_and_validate_record_batch(self):
+        record_plan = build_record_plan(columns_override=dict(power_level=1.5))
+        table = pa.table(dict(
+            id=[1, None],
+            color=['red', 'blue'],
+            settings=['{"a": 1}', None],
+            tags=["['a', 'b']", '[]'],
+        ))
+
+        df = record_plan.prepare_record_batch(table, ['settings'])
+        self.assertEqual(df['settings'].tolist(), [dict(a=1), None])
+        self.assertEqual(df['tags'].tolist(), [['a', 'b'], []])
+        self.assertEqual(df['power_level'].tolist(), [1.5, 1.5])
+        record_plan.validate_record_batch(table, ['settings'], df)
+        # The column with an Arrow type that passes the type check isn't converted.
+        self.assertEqual([key for key in record_plan.valid_values if key[0] == 'id'], [])
+        self.assertIn(('color', str, 'red'), record_plan.valid_values)
+
+        for invalid_table in [
+            pa.table(dict(id=[1.5])),
+            pa.table(dict(color=['purple'])),
+            pa.table(dict(date_joined=[None], id=[1])),
+        ]:
+            with self.assertRaises(ValidationError):
+                record_plan.validate_record_batch(
+                    invalid_table,
+                    [],
+                    record_plan.prepare_record_batch(invalid_table, []),
+                )
+
+        with self.assertRaises(KeyError):
+            table = pa.table(dict(unknown=[1]))
+            df = record_plan.prepare_record_batch(table, [])
+            record_plan.validate_record_batch(table, [], df)
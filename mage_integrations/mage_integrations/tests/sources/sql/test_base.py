@@ -1,9 +1,15 @@
+import copy
+import io
 import unittest
 from unittest.mock import MagicMock, patch
 
-from mage_integrations.sources.catalog import CatalogEntry
+from mage_integrations.connections.utils.pool import ConnectionPool
+from mage_integrations.sources.catalog import Catalog, CatalogEntry
 from mage_integrations.sources.sql.base import Source
-from mage_integrations.tests.sources.test_base import build_sample_streams_catalog
+from mage_integrations.tests.sources.test_base import (
+    build_sample_streams_catalog,
+    build_sample_streams_list,
+)
 
 
 def build_sample_postgres_rows():
@@ -26,6 +32,19 @@ def build_log_based_sample_catalog_entry():
     )
 
 
+def build_keyset_sample_stream():
+    stream = build_sample_streams_list()[1]
+    stream['bookmark_properties'] = []
+    stream['key_properties'] = ['age']
+    stream['replication_method'] = 'FULL_TABLE'
+    stream['schema']['properties']['age']['type'] = ['null', 'integer']
+    return Catalog.from_dict(dict(streams=[stream])).streams[0]
+
+
+def build_sample_user_rows(ages):
+    return [(age, str(age), 'scott', 'jason', 'red') for age in ages]
+
+
 class BaseSQLSourceTests(unittest.TestCase):
     maxDiff = None
 
@@ -142,6 +161,26 @@ class BaseSQLSourceTests(unittest.TestCase):
                         },
                     )
 
+    def test_discover_in_process_uses_connection_pool(self):
+        source = Source(discover_mode=True)
+        connection = MagicMock()
+        connection_pools = []
+
+        def _load(query):
+            connection_pools.append(connection.connection_pool)
+            return build_sample_postgres_rows()
+
+        connection.load.side_effect = _load
+        with patch.object(source, 'build_discover_query'):
+            with patch.object(source, 'build_connection', return_value=connection):
+                with patch('sys.stdout', new_callable=io.StringIO):
+                    source.process()
+
+        self.assertEqual(len(connection_pools), 1)
+        self.assertIsInstance(connection_pools[0], ConnectionPool)
+        self.assertTrue(connection_pools[0].closed)
+        self.assertIsNone(source.connection_pool)
+
     def test_count_records_log_based(self):
         source = Source()
         stream = build_log_based_sample_catalog_entry()
@@ -213,3 +252,144 @@ class BaseSQLSourceTests(unittest.TestCase):
                             },
                         ],
                     )
+
+    def test_load_data_with_keyset_pagination(self):
+        source = Source(config=dict(batch_fetch_limit=2, keyset_pagination=True))
+        states = []
+        stream = build_keyset_sample_stream()
+        build_connection_result = MagicMock()
+        build_connection_result.load.side_effect = [
+            build_sample_user_rows([1, 2]),
+            build_sample_user_rows([3]),
+        ]
+        with patch.object(source, 'build_connection', return_value=build_connection_result):
+            with patch(
+                'mage_integrations.sources.sql.base.write_state',
+                side_effect=lambda state: states.append(copy.deepcopy(state)),
+            ):
+                with patch('mage_integrations.sources.sql.base.sleep'):
+                    results = list(source.load_data(stream))
+
+        self.assertEqual(
+            [[row['age'] for row in rows] for rows in results],
+            [[1, 2], [3]],
+        )
+
+        queries = [c.args[0] for c in build_connection_result.load.call_args_list]
+        self.assertNotIn('WHERE', queries[0])
+        self.assertIn('LIMIT 2 OFFSET 0', queries[0])
+        self.assertIn('WHERE (("age" > CAST(\'2\' AS BIGINT)))', queries[1])
+        self.assertIn('LIMIT 2 OFFSET 0', queries[1])
+
+        self.assertEqual(
+            states,
+            [
+                {
+                    'bookmarks': {
+                        'demo_users': {
+                            'keyset': [dict(after=dict(age=2), start=None, stop=None)],
+                        },
+                    },
+                },
+                {
+                    'bookmarks': {
+                        'demo_users': {
+                            'keyset': [dict(after=dict(age=3), start=None, stop=None)],
+                        },
+                    },
+                },
+                {'bookmarks': {'demo_users': {'keyset': None}}},
+            ],
+        )
+
+    def test_load_data_with_keyset_pagination_resumes_from_state(self):
+        source = Source(
+            config=dict(batch_fetch_limit=2, keyset_pagination=True),
+            state=dict(bookmarks=dict(demo_users=dict(
+                keyset=[dict(after=dict(age=2), start=None, stop=None)],
+            ))),
+        )
+        stream = build_keyset_sample_stream()
+        build_connection_result = MagicMock()
+        build_connection_result.load.return_value = build_sample_user_rows([3])
+        with patch.object(source, 'build_connection', return_value=build_connection_result):
+            with patch('mage_integrations.sources.sql.base.write_state'):
+                results = list(source.load_data(stream))
+
+        self.assertEqual([[row['age'] for row in rows] for rows in results], [[3]])
+        build_connection_result.load.assert_called_once()
+        self.assertIn(
+            'WHERE (("age" > CAST(\'2\' AS BIGINT)))',
+            build_connection_result.load.call_args.args[0],
+        )
+
+    def test_get_keyset_columns_with_nullable_unique_constraints(self):
+        source = Source(config=dict(batch_fetch_limit=2, keyset_pagination=True))
+        stream = build_keyset_sample_stream()
+        stream.key_properties = []
+        stream.unique_constraints = ['age']
+        self.assertIsNone(source._get_keyset_columns(stream))
+
+        stream.schema.properties['age'].type = 'integer'
+        self.assertEqual(source._get_keyset_columns(stream), ['age'])
+
+    def test_load_data_with_keyset_pagination_and_offset_query(self):
+        source = Source(config=dict(batch_fetch_limit=2, keyset_pagination=True))
+        stream = build_keyset_sample_stream()
+        build_connection_result = MagicMock()
+        build_connection_result.load.return_value = build_sample_user_rows([5])
+        with patch.object(source, 'build_connection', return_value=build_connection_result):
+            with patch('mage_integrations.sources.sql.base.write_state') as mock_write_state:
+                list(source.load_data(stream, query=dict(_limit=2, _offset=4)))
+
+        self.assertIn('LIMIT 2 OFFSET 4', build_connection_result.load.call_args.args[0])
+        mock_write_state.assert_not_called()
+
+    def test_load_data_with_keyset_partitions(self):
+        source = Source(config=dict(
+            batch_fetch_limit=2,
+            keyset_pagination=True,
+            keyset_partitions=2,
+        ))
+        stream = build_keyset_sample_stream()
+        ages = list(range(1, 8))
+        states = []
+
+        def load(query_string):
+            if 'MIN(age)' in query_string:
+                return [(1, 7)]
+
+            lower = 0
+            upper = 100
+            after = 0
+            for statement in query_string.split('WHERE ')[1].split('\n')[0].split(' AND '):
+                value = int(statement.split("CAST('")[1].split("'")[0])
+                if '"age" >=' in statement:
+                    lower = value
+                elif '"age" <' in statement:
+                    upper = value
+                elif '"age" >' in statement:
+                    after = value
+            return build_sample_user_rows(
+                [age for age in ages if lower <= age < upper and age > after][:2],
+            )
+
+        build_connection_result = MagicMock()
+        build_connection_result.load.side_effect = load
+        with patch.object(source, 'build_connection', return_value=build_connection_result):
+            with patch(
+                'mage_integrations.sources.sql.base.write_state',
+                side_effect=lambda state: states.append(copy.deepcopy(state)),
+            ):
+                with patch('mage_integrations.sources.sql.base.sleep'):
+                    results = list(source.load_data(stream))
+
+        self.assertEqual(sorted(row['age'] for rows in results for row in rows), ages)
+        self.assertTrue(all(len(rows) <= 2 for rows in results))
+
+        self.assertEqual(len(states), len(results) + 1)
+        self.assertEqual(states[-2]['bookmarks']['demo_users']['keyset'], [
+            dict(after=dict(age=4), start=None, stop=5),
+            dict(after=dict(age=7), start=5, stop=None),
+        ])
+        self.assertEqual(states[-1], {'bookmarks': {'demo_users': {'keyset': None}}})
@@ -294,6 +294,38 @@ class BaseSourceTests(unittest.TestCase):
                 ),
             )
 
+    def test_write_records_with_record_batch_format(self):
+        source = Source(
+            is_sorted=True,
+            record_batch_format='arrow',
+        )
+        stream = build_sample_streams_catalog().streams[1]
+        rows = [
+            dict(age=18, color='red', first_name='jason', id=2, last_name='scott'),
+            dict(age=17, color='pink', first_name='kimberly', id=3, last_name='hart'),
+        ]
+        with patch.object(
+            source,
+            '_get_bookmark_properties_for_stream',
+            return_value=['id'],
+        ):
+            with patch('mage_integrations.sources.base.write_record_batch') as mock_write_batch, \
+                    patch('mage_integrations.sources.base.write_records') as mock_write_records, \
+                    patch('mage_integrations.sources.base.write_state') as mock_write_state:
+                result = source.write_records(stream, rows)
+
+                mock_write_records.assert_not_called()
+                mock_write_batch.assert_called_once()
+                stream_name, records, _columns, record_batch_format = \
+                    mock_write_batch.call_args[0]
+                self.assertEqual(stream_name, 'demo_users')
+                self.assertEqual(records, rows)
+                self.assertEqual(record_batch_format, 'arrow')
+                mock_write_state.assert_called_once_with(
+                    dict(bookmarks=dict(demo_users=dict(id=3))),
+                )
+                self.assertEqual(result['final_record'], rows[-1])
+
     def test_sync(self):
         catalog = build_sample_streams_catalog()
         catalog.get_selected_streams = MagicMock()
@@ -305,6 +337,42 @@ class BaseSourceTests(unittest.TestCase):
                 self.assertEqual(mock_process_stream.call_count, 2)
                 self.assertEqual(mock_sync_stream.call_count, 2)
 
+    def test_sync_streams_concurrently(self):
+        catalog = build_sample_streams_catalog()
+        catalog.get_selected_streams = MagicMock()
+        catalog.get_selected_streams.return_value = build_sample_streams_catalog_entries()
+        source = Source(config=dict(max_stream_workers=2))
+        synced_streams = []
+
+        def _sync_stream(stream, properties):
+            synced_streams.append(stream.tap_stream_id)
+            return 1
+
+        with patch.object(source, 'process_stream', return_value=None) as mock_process_stream:
+            with patch.object(source, 'sync_stream', side_effect=_sync_stream):
+                with patch.object(
+                    source,
+                    'sync_streams_concurrently',
+                    wraps=source.sync_streams_concurrently,
+                ) as mock_sync_streams_concurrently:
+                    source.sync(catalog)
+
+                    mock_sync_streams_concurrently.assert_called_once()
+                    self.assertEqual(mock_process_stream.call_count, 2)
+                    self.assertEqual(sorted(synced_streams), ['demo_table', 'demo_users'])
+
+    def test_sync_streams_concurrently_with_error(self):
+        catalog = build_sample_streams_catalog()
+        catalog.get_selected_streams = MagicMock()
+        catalog.get_selected_streams.return_value = build_sample_streams_catalog_entries()
+        source = Source(config=dict(max_stream_workers=2))
+
+        with patch.object(source, 'process_stream', return_value=None):
+            with patch.object(source, 'sync_stream', side_effect=Exception('Failed to sync')):
+                with self.assertRaises(Exception) as context:
+                    source.sync(catalog)
+                self.assertEqual(str(context.exception), 'Failed to sync')
+
     def test_build_catalog_entry(self):
         source = Source()
         catalog_entry = source.build_catalog_entry(
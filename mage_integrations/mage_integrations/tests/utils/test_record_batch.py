@@ -0,0 +1,78 @@
+import json
+import unittest
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import simplejson
+
+from mage_integrations.utils.parsers import encode_complex
+from mage_integrations.utils.record_batch import (
+    decode_record_batch,
+    encode_record_batch,
+)
+
+
+def build_record_messages_records(records):
+    return [json.loads(simplejson.dumps(
+        record,
+        default=encode_complex,
+        ignore_nan=True,
+        use_decimal=True,
+    )) for record in records]
+
+
+class RecordBatchTests(unittest.TestCase):
+    def test_encode_and_decode_record_batch(self):
+        records = [
+            dict(
+                id=1,
+                amount=Decimal('1.10'),
+                created_at=datetime(2023, 1, 2, 3, 4, 5),
+                is_active=True,
+                name='jason',
+                power_level=99.99,
+                settings=dict(colors=['red']),
+                uuid=uuid.UUID(int=1),
+            ),
+            dict(
+                id=2,
+                amount=None,
+                created_at=None,
+                is_active=None,
+                name=None,
+                power_level=None,
+                settings=None,
+                uuid=None,
+            ),
+        ]
+
+        self.assertEqual(
+            decode_record_batch(encode_record_batch(records, list(records[0].keys()))),
+            build_record_messages_records(records),
+        )
+
+    def test_encode_and_decode_record_batch_with_mixed_types(self):
+        records = [
+            dict(big_number=2 ** 70, mixed=1, score=float('nan'), value='a'),
+            dict(big_number=1, mixed=2.5, score=float('inf'), value=1),
+            dict(big_number=None, mixed=None, score=1.5, value=None),
+        ]
+        decoded_records = decode_record_batch(
+            encode_record_batch(records, list(records[0].keys())),
+        )
+
+        self.assertEqual(decoded_records, build_record_messages_records(records))
+        self.assertEqual(type(decoded_records[0]['mixed']), int)
+        self.assertEqual(type(decoded_records[1]['mixed']), float)
+
+    def test_encode_and_decode_empty_record_batch(self):
+        self.assertEqual(decode_record_batch(encode_record_batch([], ['id'])), [])
+
+    def test_encode_record_batch_compresses_stream(self):
+        records = [dict(id=i, name='name' * 10) for i in range(1000)]
+        data = encode_record_batch(records, ['id', 'name'])
+
+        self.assertEqual(decode_record_batch(data), records)
+        # The base64 encoded stream is smaller than the uncompressed values.
+        self.assertLess(len(data), 1000 * len('name' * 10))
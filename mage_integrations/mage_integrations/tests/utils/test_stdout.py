@@ -0,0 +1,65 @@
+import io
+import threading
+import unittest
+
+from mage_integrations.utils.stdout import ThreadSafeLineWriter
+
+
+class ThreadSafeLineWriterTests(unittest.TestCase):
+    def test_write_lines_from_threads(self):
+        stream = io.StringIO()
+        writer = ThreadSafeLineWriter(stream)
+
+        def _write(name):
+            for i in range(200):
+                # Each line is written in parts, like print does.
+                writer.write(f'{name}:')
+                writer.write(f'{i}')
+                writer.write('\n')
+
+        threads = [threading.Thread(target=_write, args=(name,)) for name in ['a', 'b', 'c']]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 600)
+        for name in ['a', 'b', 'c']:
+            self.assertEqual(
+                [line for line in lines if line.startswith(f'{name}:')],
+                [f'{name}:{i}' for i in range(200)],
+            )
+
+    def test_flush_partial_line(self):
+        stream = io.StringIO()
+        writer = ThreadSafeLineWriter(stream)
+        writer.write('partial')
+        self.assertEqual(stream.getvalue(), '')
+
+        writer.flush()
+        self.assertEqual(stream.getvalue(), '')
+
+        writer.write(' line\nnext')
+        writer.flush()
+        self.assertEqual(stream.getvalue(), 'partial line\n')
+
+        writer.close()
+        self.assertEqual(stream.getvalue(), 'partial line\nnext\n')
+        self.assertFalse(stream.closed)
+
+    def test_close_writes_partial_lines_of_all_threads(self):
+        stream = io.StringIO()
+        writer = ThreadSafeLineWriter(stream)
+
+        thread = threading.Thread(target=writer.write, args=('worker line\nworker partial',))
+        thread.start()
+        thread.join()
+        writer.write('main partial')
+        self.assertEqual(stream.getvalue(), 'worker line\n')
+
+        writer.close()
+        self.assertEqual(
+            stream.getvalue().splitlines(),
+            ['worker line', 'worker partial', 'main partial'],
+        )
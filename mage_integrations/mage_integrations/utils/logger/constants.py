@@ -6,6 +6,7 @@ LOG_LEVEL_DEBUG = 'DEBUG'
 TYPE_ACTIVATE_VERSION = 'ACTIVATE_VERSION'
 TYPE_LOG = 'LOG'
 TYPE_RECORD = 'RECORD'
+TYPE_RECORD_BATCH = 'RECORD_BATCH'
 TYPE_SAMPLE_DATA = 'SAMPLE_DATA'
 TYPE_SCHEMA = 'SCHEMA'
 TYPE_STATE = 'STATE'
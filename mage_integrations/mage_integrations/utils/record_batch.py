@@ -0,0 +1,152 @@
+import base64
+import json
+import math
+from typing import Dict, List, Set
+
+import pyarrow as pa
+import simplejson
+
+from mage_integrations.utils.parsers import encode_complex
+
+RECORD_BATCH_FORMAT_ARROW = 'arrow'
+RECORD_BATCH_FORMATS = [
+    RECORD_BATCH_FORMAT_ARROW,
+]
+RECORD_BATCH_FORMAT_KEY = 'record_batch_format'
+
+# Columns whose values aren't all of the same JSON scalar type are stored as JSON strings and
+# parsed back when decoding, so that the records are the same as if they were sent as
+# RECORD messages.
+METADATA_KEY_JSON_COLUMNS = b'mage.json_columns'
+SCALAR_TYPES = (bool, float, int, str)
+
+# The IPC stream is compressed before it's base64 encoded, which more than makes up for the
+# third base64 adds to the size of the payload.
+IPC_COMPRESSION = next(
+    (codec for codec in ['zstd', 'lz4'] if pa.Codec.is_available(codec)),
+    None,
+)
+
+
+def _encode_json(value) -> str:
+    return simplejson.dumps(
+        value,
+        default=encode_complex,
+        ignore_nan=True,
+        use_decimal=True,
+    )
+
+
+def _build_array(values: List):
+    value_types = set(type(v) for v in values if v is not None)
+
+    if not value_types:
+        return pa.nulls(len(values)), False
+
+    if len(value_types) == 1:
+        value_type = value_types.pop()
+        if value_type is float:
+            # NaN and infinity are written as null in RECORD messages.
+            values = [None if v is None or not math.isfinite(v) else v for v in values]
+        elif value_type not in SCALAR_TYPES:
+            # Dates, times and UUIDs are written as strings in RECORD messages.
+            encoded_values = [None if v is None else encode_complex(v) for v in values]
+            if all(v is None or type(v) is str for v in encoded_values):
+                return pa.array(encoded_values, pa.string()), False
+
+        if value_type in SCALAR_TYPES:
+            try:
+                return pa.array(values), False
+            except (OverflowError, pa.ArrowInvalid, pa.ArrowTypeError):
+                pass
+
+    return pa.array([None if v is None else _encode_json(v) for v in values], pa.string()), True
+
+
+def encode_record_batch(records: List[Dict], columns: List[str]) -> str:
+    """
+    Encode records into a compressed, base64 encoded Arrow IPC stream.
+
+    Args:
+        records (List[Dict]): Records to encode, each with a value for every column.
+        columns (List[str]): Columns of the records.
+
+    Returns:
+        str: The encoded record batch.
+    """
+    columns = list(dict.fromkeys(columns))
+    arrays = []
+    json_columns = []
+    for column in columns:
+        array, is_json = _build_array([record.get(column) for record in records])
+        arrays.append(array)
+        if is_json:
+            json_columns.append(column)
+
+    table = pa.Table.from_arrays(
+        arrays,
+        names=columns,
+        metadata={METADATA_KEY_JSON_COLUMNS: json.dumps(json_columns)},
+    )
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(
+        sink,
+        table.schema,
+        options=pa.ipc.IpcWriteOptions(compression=IPC_COMPRESSION),
+    ) as writer:
+        writer.write_table(table)
+
+    return base64.b64encode(sink.getvalue().to_pybytes()).decode('ascii')
+
+
+def read_record_batch(data: str) -> pa.Table:
+    """
+    Read the columns of a record batch encoded with encode_record_batch. The values of the
+    columns returned by get_json_columns are JSON strings.
+
+    Args:
+        data (str): The encoded record batch.
+
+    Returns:
+        pa.Table: The columns of the record batch.
+    """
+    return pa.ipc.open_stream(base64.b64decode(data)).read_all()
+
+
+def get_json_columns(table: pa.Table) -> Set[str]:
+    """
+    The columns of a record batch whose values are JSON strings.
+    """
+    metadata = table.schema.metadata or {}
+    return set(json.loads(metadata.get(METADATA_KEY_JSON_COLUMNS, b'[]')))
+
+
+def record_batch_to_records(table: pa.Table) -> List[Dict]:
+    """
+    Convert the columns of a record batch to the records they were encoded from.
+    """
+    json_columns = get_json_columns(table)
+
+    columns = table.column_names
+    values_by_column = []
+    for column in columns:
+        values = table.column(column).to_pylist()
+        if column in json_columns:
+            values = [None if v is None else json.loads(v) for v in values]
+        values_by_column.append(values)
+
+    return [dict(zip(columns, row)) for row in zip(*values_by_column)]
+
+
+def decode_record_batch(data: str) -> List[Dict]:
+    """
+    Decode a record batch encoded with encode_record_batch.
+
+    Args:
+        data (str): The encoded record batch.
+
+    Returns:
+        List[Dict]: The records in the batch.
+    """
+    return record_batch_to_records(read_record_batch(data))
@@ -0,0 +1,66 @@
+import sys
+import threading
+from contextlib import contextmanager
+
+
+class ThreadSafeLineWriter:
+    """
+    Writes the lines written by each thread as whole lines, so that the messages written by
+    threads running at the same time are never interleaved within a line.
+
+    The text written by a thread is buffered until it ends with a new line, then written to the
+    stream and flushed while holding a lock. Flushing only flushes the stream; the partial line
+    a thread hasn't ended yet is kept until it's ended or the writer is closed, which writes the
+    partial line of every thread as a whole line.
+    """
+
+    def __init__(self, stream):
+        self.buffers = dict()
+        self.lock = threading.Lock()
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        thread_id = threading.get_ident()
+        with self.lock:
+            buffer = self.buffers.pop(thread_id, '') + text
+            index = buffer.rfind('\n')
+            if index == -1:
+                self.buffers[thread_id] = buffer
+            else:
+                if index + 1 < len(buffer):
+                    self.buffers[thread_id] = buffer[index + 1:]
+                self.stream.write(buffer[:index + 1])
+                self.stream.flush()
+
+        return len(text)
+
+    def flush(self) -> None:
+        with self.lock:
+            self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Writes the partial line of every thread, e.g. the last message of a worker thread that
+        doesn't end with a new line, ended with a new line so that the lines of the threads
+        aren't joined, and flushes the stream.
+        """
+        with self.lock:
+            buffers = self.buffers
+            self.buffers = dict()
+            for buffer in buffers.values():
+                self.stream.write(f'{buffer}\n')
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+@contextmanager
+def thread_safe_stdout():
+    stdout = sys.stdout
+    sys.stdout = ThreadSafeLineWriter(stdout)
+    try:
+        yield sys.stdout
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout